@@ -0,0 +1,350 @@
+import argparse
+import json
+import pathlib
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import regex
+
+import textmate
+from textmate.grammar import CompiledScanner
+from textmate.rules import END_RULE_ID, WHILE_RULE_ID, MatchRule
+
+from generate_corpus import ProjectWriter, parse_size
+from parallel import default_jobs, parallel_map
+from syntax_to_token_pattern import camelCase
+from tokenize_files import EXTENSION_SCOPES, find_files
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+# Bump this whenever the layout of the baseline changes.
+BASELINE_VERSION = 1
+
+# The corpora that are benchmarked when none are given. The grammar samples are
+# written to have every kind of statement, while the examples are closer to
+# what a game looks like.
+DEFAULT_CORPORA = {
+    "synthetic": ROOT / "tests" / "grammar",
+    "real": ROOT / "examples",
+}
+
+# The registry of each worker process, loaded by the first file it benchmarks.
+registries: dict[pathlib.Path, textmate.Registry] = {}
+
+
+@dataclass
+class RuleStats:
+    """
+    The searches of the regexes of one rule, and the time they took.
+    """
+
+    searches: int = 0
+    matches: int = 0
+    time: float = 0.0
+
+    def add(self, other: "RuleStats"):
+        self.searches += other.searches
+        self.matches += other.matches
+        self.time += other.time
+
+
+class ProfiledPattern:
+    """
+    Stands in for a compiled regex in a scanner, and adds every search of it
+    to `stats`.
+    """
+
+    __slots__ = ("pattern", "stats")
+
+    def __init__(self, pattern: regex.Pattern[str], stats: RuleStats):
+        self.pattern = pattern
+        self.stats = stats
+
+    def search(self, text: str, pos: int) -> regex.Match[str] | None:
+        start = time.perf_counter()
+        rv = self.pattern.search(text, pos)
+        self.stats.time += time.perf_counter() - start
+
+        self.stats.searches += 1
+        if rv is not None:
+            self.stats.matches += 1
+
+        return rv
+
+
+class ProfiledGrammar(textmate.Grammar):
+    """
+    A grammar whose scanners count the searches of each regex, and time them,
+    by the rule the regex belongs to and which of its regexes it is.
+    """
+
+    def __init__(self, registry: textmate.Registry, scope: str):
+        super().__init__(registry, scope)
+
+        self.stats: dict[tuple[int, str], RuleStats] = {}
+        self._profiled_scanners: dict[tuple[int, str | None, bool, bool, bool], CompiledScanner] = {}
+        self._profiled_patterns: dict[tuple[regex.Pattern[str], int, str], ProfiledPattern] = {}
+
+    def compiled_scanner(self, stack: textmate.RuleStack, allow_a: bool, allow_g: bool, while_: bool = False) -> CompiledScanner:
+        key = (stack.rule_id, stack.end_rule, allow_a, allow_g, while_)
+        rv = self._profiled_scanners.get(key)
+
+        if rv is None:
+            rv = []
+
+            for rule_id, pattern, cacheable in super().compiled_scanner(stack, allow_a, allow_g, while_):
+                if rule_id == END_RULE_ID:
+                    owner, kind = stack.rule_id, "end"
+                elif rule_id == WHILE_RULE_ID:
+                    owner, kind = stack.rule_id, "while"
+                else:
+                    owner, kind = rule_id, "match" if isinstance(self.rules[rule_id], MatchRule) else "begin"
+
+                profiled = self._profiled_patterns.get((pattern, owner, kind))
+
+                if profiled is None:
+                    stats = self.stats.setdefault((owner, kind), RuleStats())
+                    profiled = self._profiled_patterns[(pattern, owner, kind)] = ProfiledPattern(pattern, stats)
+
+                rv.append((rule_id, profiled, cacheable))  # type: ignore[arg-type]
+
+            self._profiled_scanners[key] = rv
+
+        return rv
+
+    def debug_name(self, rule_id: int) -> str:
+        """
+        Returns the name of a rule as "language debugName", with the debugName
+        of its token pattern, like "atl atlKeywords.patterns![0]".
+        """
+
+        scope, entry, path = self.rule_paths[rule_id]
+        language = scope.split(".")[-1]
+
+        return f"{language} {camelCase(entry) if entry is not None else language}{path}"
+
+
+@dataclass(frozen=True)
+class Job:
+    corpus: str
+    path: pathlib.Path
+    scope: str
+    syntaxes: pathlib.Path
+    repeat: int
+
+
+@dataclass
+class FileBenchmark:
+    corpus: str
+    path: pathlib.Path
+    lines: int = 0
+    tokens: int = 0
+
+    # The fastest time to tokenize the file, without profiling.
+    time: float = 0.0
+
+    # The searches of each regex, as "debugName (kind)".
+    rules: dict[str, RuleStats] = field(default_factory=dict[str, RuleStats])
+
+
+def get_registry(syntaxes: pathlib.Path) -> textmate.Registry:
+    rv = registries.get(syntaxes)
+
+    if rv is None:
+        rv = registries[syntaxes] = textmate.Registry.from_directory(syntaxes)
+
+    return rv
+
+
+def benchmark_file(job: Job) -> FileBenchmark:
+    registry = get_registry(job.syntaxes)
+    rv = FileBenchmark(job.corpus, job.path)
+
+    with open(job.path, "r", encoding="utf-8", errors="replace") as file:
+        lines = textmate.split_lines(file.read())
+
+    grammar = registry.grammar(job.scope)
+    times: list[float] = []
+
+    for _ in range(job.repeat):
+        start = time.process_time()
+        rv.tokens = sum(len(i) for i, _ in textmate.tokenize_lines(grammar, lines))
+        times.append(time.process_time() - start)
+
+    profiled = ProfiledGrammar(registry, job.scope)
+
+    for _ in textmate.tokenize_lines(profiled, lines):
+        pass
+
+    for (rule_id, kind), stats in profiled.stats.items():
+        rv.rules.setdefault(f"{profiled.debug_name(rule_id)} ({kind})", RuleStats()).add(stats)
+
+    # The first time includes compiling the regexes the file needs.
+    rv.time = min(times)
+    rv.lines = len(lines)
+
+    return rv
+
+
+def summarize(results: list[FileBenchmark]) -> dict[str, Any]:
+    """
+    Returns the totals of the files of a corpus, and the stats of each rule,
+    slowest first, as they are stored in the baseline.
+    """
+
+    rules: dict[str, RuleStats] = {}
+
+    for result in results:
+        for name, stats in result.rules.items():
+            rules.setdefault(name, RuleStats()).add(stats)
+
+    lines = sum(i.lines for i in results)
+    elapsed = sum(i.time for i in results)
+
+    return {
+        "files": len(results),
+        "lines": lines,
+        "tokens": sum(i.tokens for i in results),
+        "ms": round(elapsed * 1000, 3),
+        "lines_per_second": round(lines / max(elapsed, 1e-9)),
+        "rules": {
+            name: {"searches": stats.searches, "matches": stats.matches, "ms": round(stats.time * 1000, 3)}
+            for name, stats in sorted(rules.items(), key=lambda i: (-i[1].time, i[0]))
+        },
+    }
+
+
+def print_hotspots(name: str, corpus: dict[str, Any], top: int):
+    rules: dict[str, dict[str, Any]] = corpus["rules"]
+    profiled = sum(i["ms"] for i in rules.values()) or 1e-9
+
+    print(f"{name}: {corpus['files']} files, {corpus['lines']} lines, {corpus['tokens']} tokens, in {corpus['ms']:.1f}ms ({corpus['lines_per_second']} lines/s).")
+    print(f"{'ms':>9} {'%':>6} {'searches':>9} {'matches':>8}  rule")
+
+    for rule, stats in list(rules.items())[:top]:
+        print(f"{stats['ms']:>9.2f} {stats['ms'] / profiled * 100:>6.1f} {stats['searches']:>9} {stats['matches']:>8}  {rule}")
+
+    print()
+
+
+def compare(name: str, corpus: dict[str, Any], baseline: dict[str, Any], max_slowdown: float, top: int) -> bool:
+    """
+    Prints how a corpus changed since the baseline: its time, and the rules that
+    search more or less often, or got slower. Returns False if the corpus got
+    more than `max_slowdown` times slower.
+    """
+
+    ratio = corpus["ms"] / max(baseline["ms"], 1e-9)
+    passed = ratio <= max_slowdown
+
+    print(f"{name}: {corpus['ms']:.1f}ms, was {baseline['ms']:.1f}ms ({ratio:.2f}x){'' if passed else ' SLOWER'}.")
+
+    rules: dict[str, dict[str, Any]] = corpus["rules"]
+    old_rules: dict[str, dict[str, Any]] = baseline["rules"]
+    empty = {"searches": 0, "matches": 0, "ms": 0.0}
+
+    # The number of searches doesn't depend on the machine, so every change is
+    # shown, largest first.
+    changed = [
+        (rules.get(i, empty), old_rules.get(i, empty), i)
+        for i in sorted(rules.keys() | old_rules.keys())
+        if rules.get(i, empty)["searches"] != old_rules.get(i, empty)["searches"]
+    ]
+
+    changed.sort(key=lambda i: -abs(i[0]["searches"] - i[1]["searches"]))
+
+    if changed:
+        print(f"{'searches':>9} {'was':>9} {'ms':>9} {'was':>9}  rule")
+
+        for new, old, rule in changed[:top]:
+            print(f"{new['searches']:>9} {old['searches']:>9} {new['ms']:>9.2f} {old['ms']:>9.2f}  {rule}")
+
+        if len(changed) > top:
+            print(f"... and {len(changed) - top} more.")
+
+    print()
+
+    return passed
+
+
+def run(corpora: dict[str, pathlib.Path], args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Benchmarks the files of each corpus, and returns the report.
+    """
+
+    jobs: list[Job] = []
+
+    for name, path in corpora.items():
+        for i in find_files([path]):
+            jobs.append(Job(name, i, EXTENSION_SCOPES[i.suffix], args.syntaxes.resolve(), max(1, args.repeat)))
+
+    # Workers that share a core make each other slower, even in CPU time.
+    results = parallel_map(benchmark_file, jobs, min(args.jobs, default_jobs()))
+
+    return {
+        "version": BASELINE_VERSION,
+        "corpora": {name: summarize([i for i in results if i.corpus == name]) for name in corpora},
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark the TextMate grammars, and attribute the time to the rules that take it")
+    ap.add_argument("--corpus", action="append", metavar="NAME=PATH", help="A corpus to benchmark, as a name and a file or directory. Can be given more than once (default: synthetic=tests/grammar real=examples)")
+    ap.add_argument("--generate", type=parse_size, metavar="LINES", help="Also benchmark a project of about this many lines, like 100k, made by generate_corpus.py")
+    ap.add_argument("--seed", type=int, default=0, help="The seed of the generated project (default: %(default)s)")
+    ap.add_argument("-j", "--jobs", type=int, default=default_jobs(), help="The number of worker processes to use, at most one per core (default: %(default)s)")
+    ap.add_argument("--syntaxes", type=pathlib.Path, default=ROOT / "syntaxes", help="The directory of the .json grammars (default: %(default)s)")
+    ap.add_argument("--repeat", type=int, default=5, help="How many times to tokenize each file; the fastest time counts (default: %(default)s)")
+    ap.add_argument("--top", type=int, default=25, help="The number of rules to show for each corpus (default: %(default)s)")
+    ap.add_argument("--output", type=pathlib.Path, help="Write the results to this JSON file, to use as a baseline later")
+    ap.add_argument("--baseline", type=pathlib.Path, help="Compare the results to a JSON file written by --output")
+    ap.add_argument("--max-slowdown", type=float, default=1.25, help="Fail if a corpus gets this many times slower than the baseline (default: %(default)s)")
+    args = ap.parse_args()
+
+    corpora: dict[str, pathlib.Path] = {}
+
+    for i in args.corpus or []:
+        name, sep, path = i.partition("=")
+        if not sep:
+            ap.error(f"--corpus {i}: expected NAME=PATH")
+
+        corpora[name] = pathlib.Path(path)
+
+    if not corpora:
+        corpora = dict(DEFAULT_CORPORA)
+
+    with tempfile.TemporaryDirectory() as temporary:
+        if args.generate is not None:
+            ProjectWriter(pathlib.Path(temporary), args.seed, args.generate, 500).generate()
+            corpora["generated"] = pathlib.Path(temporary)
+
+        report = run(corpora, args)
+
+    for name, corpus in report["corpora"].items():
+        print_hotspots(name, corpus, args.top)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+
+        if baseline.get("version") != BASELINE_VERSION:
+            raise SystemExit(f"Error: {args.baseline} was written by a different version of this script.")
+
+        passed = True
+
+        for name, corpus in report["corpora"].items():
+            if name in baseline["corpora"]:
+                passed = compare(name, corpus, baseline["corpora"][name], args.max_slowdown, args.top) and passed
+            else:
+                print(f"{name}: not in the baseline.")
+
+        if not passed:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import json
+import pathlib
+import time
+
+import yaml_backend
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+
+def best_time(function, repeat: int) -> float:
+    """
+    Returns the fastest of `repeat` calls to `function`, in milliseconds.
+    """
+
+    rv = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        rv = min(rv, time.perf_counter() - start)
+
+    return rv * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare the libyaml and pure Python YAML backends on the grammars")
+    ap.add_argument("--repeat", type=int, default=5, help="The number of times to repeat each measurement (default: %(default)s)")
+    args = ap.parse_args()
+
+    if not yaml_backend.HAS_LIBYAML:
+        print("PyYAML was built without libyaml, so only the pure Python backend is available.")
+
+    backends = [("python", yaml_backend.PurePythonLoader, yaml_backend.PurePythonDumper)]
+    if yaml_backend.HAS_LIBYAML:
+        backends.append(("libyaml", yaml_backend.SafeLoader, yaml_backend.SafeDumper))
+
+    print(f"{'grammar':<32} {'backend':<8} {'parse ms':>9} {'dump ms':>9}")
+
+    failed = False
+
+    for filename in sorted(ROOT.glob("syntaxes/*.tmLanguage.yaml")):
+        text = filename.read_text()
+
+        loaded = []
+        dumped = []
+
+        for name, loader, dumper in backends:
+            data = yaml_backend.load(text, loader)
+
+            parse = best_time(lambda: yaml_backend.load(text, loader), args.repeat)
+            dump = best_time(lambda: yaml_backend.dump(data, dumper), args.repeat)
+
+            loaded.append(json.dumps(data))
+            dumped.append(yaml_backend.dump(data, dumper))
+
+            print(f"{filename.name:<32} {name:<8} {parse:>9.1f} {dump:>9.1f}")
+
+        if len(set(loaded)) > 1 or len(set(dumped)) > 1:
+            print(f"Error: the backends do not produce identical output for {filename.name}.")
+            failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import pathlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from build_manifest import BuildManifest
+from parallel import parallel_map
+
+# An action builds the output of a step. It's called with the step, and the data
+# recorded in the manifest for each of the step's inputs that is produced by
+# another step. It may return a dict of data to record with the output.
+BuildAction = Callable[["BuildStep", dict[str, dict[str, Any]]], dict[str, Any] | None]
+
+
+@dataclass
+class BuildStep:
+    output: pathlib.Path
+    inputs: list[pathlib.Path]
+    action: BuildAction
+
+    # Passed to the action, but not part of the content that decides if the step is stale.
+    options: dict[str, Any] = field(default_factory=dict[str, Any])
+
+    # Passed to the action like the options, but the step is also stale if they differ
+    # from the settings it was last run with.
+    settings: dict[str, Any] = field(default_factory=dict[str, Any])
+
+
+@dataclass
+class PlannedStep:
+    step: BuildStep
+
+    # Why the step has to run.
+    reason: str
+
+    # True if the step only runs if one of its upstream steps changes its output.
+    conditional: bool
+
+
+def run_step(job: tuple[BuildStep, dict[str, dict[str, Any]]]) -> tuple[dict[str, Any] | None, float]:
+    """
+    Runs the action of a step. Returns its data, and how many seconds it took.
+    """
+
+    step, input_data = job
+
+    start = time.perf_counter()
+    data = step.action(step, input_data)
+
+    return (data, time.perf_counter() - start)
+
+
+class BuildGraph:
+    """
+    A graph of build steps, where each step produces one output from a list of
+    input files. A step depends on another step if one of its inputs is that
+    step's output.
+
+    `obsolete` lists files that another configuration of the graph produces,
+    but this one doesn't, like the outputs of another pattern format. They are
+    removed when the graph runs, so they aren't left behind stale.
+    """
+
+    def __init__(self, steps: list[BuildStep], obsolete: list[pathlib.Path] | None = None):
+        self.steps = steps
+        self.producers: dict[pathlib.Path, BuildStep] = {}
+
+        for step in steps:
+            if step.output in self.producers:
+                raise ValueError(f"{step.output} is produced by more than one step.")
+
+            self.producers[step.output] = step
+
+        self.obsolete = [i for i in obsolete or [] if i not in self.producers]
+        self.stages = self.compute_stages()
+
+        # How many seconds each stage took in the last run of run(), including checking which steps are stale.
+        self.stage_times: list[float] = []
+
+    def upstream(self, step: BuildStep) -> list[BuildStep]:
+        return [self.producers[i] for i in step.inputs if i in self.producers]
+
+    def compute_stages(self) -> list[list[BuildStep]]:
+        """
+        Groups the steps into stages, such that every step only depends on steps
+        in earlier stages. Steps within a stage keep the order they were given in.
+        """
+
+        depth: dict[int, int] = {}
+        visiting: set[int] = set()
+
+        def visit(step: BuildStep) -> int:
+            key = id(step)
+
+            if key in depth:
+                return depth[key]
+
+            if key in visiting:
+                raise ValueError(f"The build graph has a cycle through {step.output}.")
+
+            visiting.add(key)
+            depth[key] = 1 + max((visit(i) for i in self.upstream(step)), default=-1)
+            visiting.remove(key)
+
+            return depth[key]
+
+        stages: list[list[BuildStep]] = []
+
+        for step in self.steps:
+            d = visit(step)
+
+            while len(stages) <= d:
+                stages.append([])
+
+            stages[d].append(step)
+
+        return stages
+
+    def stale_reason(self, step: BuildStep, manifest: BuildManifest) -> str | None:
+        """
+        Returns why the output of `step` is out of date, or None if it isn't.
+        """
+
+        if manifest.hash_file(step.output) is None:
+            return "output missing"
+
+        if manifest.get(step.output).get("settings", {}) != step.settings:
+            return "settings changed"
+
+        if manifest.is_fresh(step.output, step.inputs):
+            return None
+
+        recorded = manifest.entries.get(manifest.key(step.output))
+        if recorded is None:
+            return "not in the build manifest"
+
+        if recorded["output"] != manifest.hash_file(step.output):
+            return "output modified"
+
+        changed = [manifest.key(i) for i in step.inputs if recorded["inputs"].get(manifest.key(i)) != manifest.hash_file(i)]
+        if changed:
+            return "input changed: " + ", ".join(changed)
+
+        return "inputs changed"
+
+    def plan(self, manifest: BuildManifest) -> list[PlannedStep]:
+        """
+        Computes the steps that have to run, in the order they would run. Steps
+        whose own inputs are unchanged, but that are downstream of a step that
+        runs, are included as conditional, since they only run if that step
+        actually changes its output.
+        """
+
+        planned: dict[int, PlannedStep] = {}
+        rv: list[PlannedStep] = []
+
+        for stage in self.stages:
+            for step in stage:
+                reason = self.stale_reason(step, manifest)
+                conditional = False
+
+                if reason is None:
+                    upstream = [i for i in self.upstream(step) if id(i) in planned]
+                    if not upstream:
+                        continue
+
+                    reason = "if changed: " + ", ".join(manifest.key(i.output) for i in upstream)
+                    conditional = True
+
+                planned[id(step)] = PlannedStep(step, reason, conditional)
+                rv.append(planned[id(step)])
+
+        return rv
+
+    def existing_obsolete(self) -> list[pathlib.Path]:
+        return [i for i in self.obsolete if i.exists()]
+
+    def describe_plan(self, manifest: BuildManifest) -> str:
+        plan = self.plan(manifest)
+        obsolete = self.existing_obsolete()
+
+        if not plan and not obsolete:
+            return "Everything is up to date."
+
+        lines: list[str] = []
+
+        if plan:
+            lines.append(f"{len(plan)} of {len(self.steps)} steps would run:")
+            for i in plan:
+                lines.append(f"  {manifest.key(i.step.output)} ({i.reason})")
+
+        if obsolete:
+            lines.append(f"{len(obsolete)} obsolete files would be removed:")
+            for i in obsolete:
+                lines.append(f"  {manifest.key(i)}")
+
+        return "\n".join(lines)
+
+    def remove_obsolete(self, manifest: BuildManifest) -> list[pathlib.Path]:
+        """
+        Deletes the obsolete files that exist, and their manifest entries.
+        Returns the files that were deleted.
+        """
+
+        removed = self.existing_obsolete()
+
+        for i in removed:
+            i.unlink()
+
+        for i in self.obsolete:
+            manifest.forget(i)
+
+        return removed
+
+    def run(self, manifest: BuildManifest, jobs: int | None = None) -> list[BuildStep]:
+        """
+        Runs every stale step, stage by stage, with the steps of a stage running
+        in parallel. Since staleness is checked when a stage starts, a step whose
+        upstream step rewrote its output with the same content is skipped.
+        Returns the steps whose output changed. The time each step took is
+        recorded with its data, as "time".
+        """
+
+        changed: list[BuildStep] = []
+        self.stage_times = []
+
+        for stage in self.stages:
+            start = time.perf_counter()
+            stale = [i for i in stage if self.stale_reason(i, manifest) is not None]
+
+            jobs_list = [(i, {manifest.key(j.output): manifest.get(j.output) for j in self.upstream(i)}) for i in stale]
+
+            for step, (data, elapsed) in zip(stale, parallel_map(run_step, jobs_list, jobs)):
+                old_hash = manifest.hash_file(step.output)
+                manifest.record(step.output, step.inputs, settings=step.settings, time=elapsed, **(data or {}))
+
+                if manifest.hash_file(step.output) != old_hash:
+                    changed.append(step)
+
+            self.stage_times.append(time.perf_counter() - start)
+
+        return changed
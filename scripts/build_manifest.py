@@ -0,0 +1,140 @@
+import hashlib
+import json
+import pathlib
+from typing import Any
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+# Bump this whenever the layout of the manifest changes, to discard old manifests.
+MANIFEST_VERSION = 1
+
+DEFAULT_MANIFEST_PATH = ROOT / "scripts" / ".generate-manifest.json"
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BuildManifest:
+    """
+    A persistent record of the inputs that produced each generated file.
+
+    Every output is stored with the content hashes of the files it was built
+    from (and of the output itself), so a later run can tell that an output is
+    up to date without parsing any of its inputs.
+    """
+
+    def __init__(self, path: pathlib.Path = DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+
+        # Hashes are cached for the duration of a run, see invalidate().
+        self._hashes: dict[pathlib.Path, str | None] = {}
+
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data["entries"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    def key(self, path: pathlib.Path) -> str:
+        try:
+            return path.resolve().relative_to(ROOT.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def hash_file(self, path: pathlib.Path) -> str | None:
+        """
+        Returns the content hash of `path`, or None if it does not exist.
+        """
+
+        path = path.resolve()
+        if path not in self._hashes:
+            try:
+                self._hashes[path] = hash_bytes(path.read_bytes())
+            except FileNotFoundError:
+                self._hashes[path] = None
+
+        return self._hashes[path]
+
+    def invalidate(self, path: pathlib.Path | None = None):
+        """
+        Forgets cached hashes, for `path` or for every file if `path` is None.
+        """
+
+        if path is None:
+            self._hashes.clear()
+        else:
+            self._hashes.pop(path.resolve(), None)
+
+    def is_fresh(self, output: pathlib.Path, inputs: list[pathlib.Path]) -> bool:
+        """
+        Returns True if `output` exists, is unmodified since it was recorded, and
+        was built from exactly the current contents of `inputs`.
+        """
+
+        entry = self.entries.get(self.key(output))
+        if entry is None:
+            return False
+
+        output_hash = self.hash_file(output)
+        if output_hash is None or output_hash != entry["output"]:
+            return False
+
+        recorded: dict[str, str] = entry["inputs"]
+        if len(recorded) != len(inputs):
+            return False
+
+        for i in inputs:
+            input_hash = self.hash_file(i)
+            if input_hash is None or recorded.get(self.key(i)) != input_hash:
+                return False
+
+        return True
+
+    def record(self, output: pathlib.Path, inputs: list[pathlib.Path], **data: Any):
+        """
+        Records that `output` was just built from `inputs`. Any keyword arguments
+        are stored with the entry, and can be read back with get().
+        """
+
+        self.invalidate(output)
+
+        self.entries[self.key(output)] = {
+            "output": self.hash_file(output),
+            "inputs": {self.key(i): self.hash_file(i) for i in inputs},
+            "data": data,
+        }
+
+        self.dirty = True
+
+    def forget(self, output: pathlib.Path):
+        """
+        Removes the entry of `output`, after the file was deleted.
+        """
+
+        self.invalidate(output)
+
+        if self.entries.pop(self.key(output), None) is not None:
+            self.dirty = True
+
+    def get(self, output: pathlib.Path) -> dict[str, Any]:
+        entry = self.entries.get(self.key(output))
+        if entry is None:
+            return {}
+
+        return entry["data"]
+
+    def save(self):
+        if not self.dirty:
+            return
+
+        data = {
+            "version": MANIFEST_VERSION,
+            "entries": self.entries,
+        }
+
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True))
+        self.dirty = False
@@ -0,0 +1,233 @@
+import argparse
+import json
+import math
+import pathlib
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import regex_ast
+
+from syntax_to_token_pattern import ROOT, get_match_str
+from verify_fusion import split_literal
+
+# Times a regex on texts of growing length, the way the tokenizer runs it: a
+# search from the start of the text. Prints a line with the length and the
+# time of one exec in milliseconds for every length, so the lines printed
+# before a hang can still be read. Stops once an exec takes longer than the
+# budget.
+TIMING_SCRIPT = r"""
+const input = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const re = new RegExp(input.source, input.flags);
+
+for (const length of input.lengths) {
+    const text = input.prefix + input.pump.repeat(length) + input.suffix;
+    let runs = 0;
+    let elapsed = 0;
+
+    while (runs < 3 || elapsed < input.minTime) {
+        const start = performance.now();
+        re.lastIndex = 0;
+        re.exec(text);
+        elapsed += performance.now() - start;
+        runs++;
+    }
+
+    console.log(JSON.stringify([length, elapsed / runs]));
+
+    if (elapsed / runs > input.budget) {
+        break;
+    }
+}
+"""
+
+# The keys of a grammar that hold a regex.
+REGEX_KEYS = ("match", "begin", "end", "while")
+
+# The texts each hazard is tried with end with one of these, since a match has
+# to fail after the hazard to backtrack through it.
+SUFFIXES = ["", "!", "\n", "\x00"]
+
+# The lengths of the repeated part of the texts.
+LENGTHS = [2 ** i for i in range(3, 15)]
+
+
+@dataclass
+class GrammarRegex:
+    source: str
+    flags: str
+
+    # Where the regex is used, as "file key.path".
+    uses: list[str] = field(default_factory=list[str])
+
+    hazards: list[regex_ast.BacktrackingHazard] = field(default_factory=list[regex_ast.BacktrackingHazard])
+
+    # The growth rate of the slowest text, the time of its longest run, and the text it was.
+    exponent: float | None = None
+    time: float = 0.0
+    attack: str = ""
+    timed_out: bool = False
+
+
+def find_regexes(o: Any, path: str) -> Iterator[tuple[str, str, str]]:
+    """
+    Yields the key, the value and the path of every regex in a grammar.
+    """
+
+    if isinstance(o, dict):
+        for k, v in o.items():
+            if k in REGEX_KEYS and isinstance(v, str):
+                yield (k, v, f"{path}.{k}")
+            else:
+                yield from find_regexes(v, f"{path}.{k}")
+
+    elif isinstance(o, list):
+        for i, v in enumerate(o):
+            yield from find_regexes(v, f"{path}[{i}]")
+
+
+def growth_exponent(points: list[tuple[int, float]], min_time: float) -> float | None:
+    """
+    Returns k, where the time grows like length ** k, from the last two points
+    that took long enough to measure.
+    """
+
+    measured = [i for i in points if i[1] >= min_time]
+    if len(measured) < 2:
+        return None
+
+    (n1, t1), (n2, t2) = measured[-2:]
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def time_hazard(node: str, regex: GrammarRegex, hazard: regex_ast.BacktrackingHazard, suffix: str, args: argparse.Namespace) -> tuple[list[tuple[int, float]], bool]:
+    """
+    Times the regex on texts that pump the hazard. Returns the points, and True
+    if it timed out.
+    """
+
+    proc = subprocess.Popen([node, "-e", TIMING_SCRIPT], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    job = json.dumps({
+        "source": regex.source,
+        "flags": regex.flags,
+        "prefix": hazard.prefix,
+        "pump": hazard.pump,
+        "suffix": suffix,
+        "lengths": [i for i in LENGTHS if i <= args.max_length],
+        "minTime": args.min_time,
+        "budget": args.budget,
+    })
+
+    try:
+        stdout, _ = proc.communicate(job, timeout=args.timeout)
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        stdout, _ = proc.communicate()
+        timed_out = True
+
+    points: list[tuple[int, float]] = [(n, t) for n, t in (json.loads(i) for i in stdout.splitlines() if i)]
+    return (points, timed_out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Find the grammar regexes that can backtrack catastrophically")
+    ap.add_argument("grammars", nargs="*", type=pathlib.Path, help="The grammars to check (default: syntaxes/*.tmLanguage.json)")
+    ap.add_argument("--max-exponent", type=float, default=2.5, help="Fail if a regex takes longer than length ** this (default: %(default)s)")
+    ap.add_argument("--max-length", type=int, default=LENGTHS[-1], help="The longest repeated text to try (default: %(default)s)")
+    ap.add_argument("--budget", type=float, default=100.0, help="Stop trying longer texts once one exec takes this many milliseconds (default: %(default)s)")
+    ap.add_argument("--min-time", type=float, default=1.0, help="Repeat each exec until it took this many milliseconds in total (default: %(default)s)")
+    ap.add_argument("--timeout", type=float, default=10.0, help="Count a regex as hanging after this many seconds (default: %(default)s)")
+    ap.add_argument("--static", action="store_true", help="Only report the hazards, without timing them (doesn't need node)")
+    args = ap.parse_args()
+
+    node = shutil.which("node")
+    if node is None and not args.static:
+        raise SystemExit("Error: node is required to run the JavaScript regexes. Pass --static to skip timing them.")
+
+    grammars: list[pathlib.Path] = args.grammars or sorted(ROOT.glob("syntaxes/*.tmLanguage.json"))
+
+    regexes: dict[tuple[str, str], GrammarRegex] = {}
+    skipped = 0
+
+    for filename in grammars:
+        with open(filename, "r") as file:
+            grammar = json.load(file)
+
+        for key, value, path in find_regexes(grammar, ""):
+            literal, has_backrefs = get_match_str(value, None, is_end=key == "end")
+            split = split_literal(literal)
+
+            regex = regexes.setdefault((split["source"], split["flags"]), GrammarRegex(split["source"], split["flags"]))
+            regex.uses.append(f"{filename.name} {path[1:]}")
+
+            if len(regex.uses) > 1:
+                continue
+
+            parsed = regex_ast.parse_literal(literal)
+
+            # A back reference matches a single text, but is parsed as any text.
+            if parsed is None or has_backrefs or parsed.has_backrefs:
+                skipped += 1
+                continue
+
+            regex.hazards = regex_ast.backtracking_hazards(parsed)
+
+    hazardous = [i for i in regexes.values() if i.hazards]
+
+    print(f"{len(regexes)} regexes, {len(hazardous)} with hazards, {skipped} skipped (back references or unparsable).")
+
+    if not args.static:
+        assert node is not None
+
+        for regex in hazardous:
+            for hazard in regex.hazards:
+                for suffix in SUFFIXES:
+                    points, timed_out = time_hazard(node, regex, hazard, suffix, args)
+
+                    time = points[-1][1] if points else 0.0
+                    if timed_out or (not regex.timed_out and time > regex.time):
+                        regex.exponent = growth_exponent(points, args.min_time / 10)
+                        regex.time = time
+                        regex.attack = f"{hazard.prefix!r} + {hazard.pump!r} * {points[-1][0] if points else 0} + {suffix!r}"
+                        regex.timed_out = regex.timed_out or timed_out
+
+                    if timed_out:
+                        break
+
+                if regex.timed_out:
+                    break
+
+    failed = False
+
+    print()
+    print(f"{'growth':>7} {'time':>9}  {'hazard':<24} regex")
+
+    hazardous.sort(key=lambda i: (not i.timed_out, -(i.exponent or 0)))
+
+    for regex in hazardous:
+        if regex.timed_out:
+            growth = "hangs"
+            failed = True
+        elif regex.exponent is None:
+            growth = "-"
+        else:
+            growth = f"n^{regex.exponent:.1f}"
+            failed = failed or regex.exponent > args.max_exponent
+
+        kinds = ", ".join(sorted({i.kind for i in regex.hazards}))
+        print(f"{growth:>7} {regex.time:>7.1f}ms  {kinds:<24} /{regex.source}/{regex.flags}")
+
+        for use in regex.uses:
+            print(f"{'':>20}used by {use}")
+
+        if regex.attack:
+            print(f"{'':>20}slowest text: {regex.attack}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
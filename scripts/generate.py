@@ -1,89 +1,591 @@
+import argparse
+import importlib
 import pathlib
-import yaml
+import re
+import time
+import traceback
 import json
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
+import generator_metrics
+import pattern_table
 import syntax_to_token_pattern
 
 import keywords
+import property_factoring
+import reachability
+import regex_trie
+import yaml_backend
 
-def screen_automatic_properties():
+from build_graph import BuildGraph, BuildStep
+from build_manifest import BuildManifest, hash_bytes
+from parallel import default_jobs
+
+ROOT = pathlib.Path(__file__).parent.parent
+SCRIPTS = pathlib.Path(__file__).parent
+
+# Changes to these files invalidate every generated .tmLanguage.json file.
+GENERATOR_INPUTS = [
+    SCRIPTS / "generate.py",
+    SCRIPTS / "reachability.py",
+    SCRIPTS / "regex_trie.py",
+    SCRIPTS / "yaml_backend.py",
+]
+
+# Changes to these files invalidate the grammars that use a placeholder.
+KEYWORD_INPUTS = [
+    SCRIPTS / "keywords.py",
+    SCRIPTS / "property_factoring.py",
+]
+
+# Parsed .tmLanguage.yaml files, with the hash of the text they were parsed from.
+# In watch mode, this avoids parsing grammars again when only keywords.py changed.
+grammar_cache: dict[pathlib.Path, tuple[str, Any]] = {}
+
+# The placeholders that can be used in the grammars, and the functions that
+# generate their values from keywords.py. A placeholder is either used as
+# "(?:NAME)" inside a regex, which is replaced by the regex the function returns,
+# or as the whole value of a patterns list, which is replaced by the list of
+# patterns the function returns.
+PLACEHOLDERS: dict[str, Callable[[], Any]] = {}
+
+# Finds both kinds of placeholder in a single scan. Unknown names in the
+# "(?:NAME)" form are also matched, so that they can be reported. A whole value
+# is only a placeholder if its name is registered, since an all-caps string can
+# just as well be an ordinary value.
+PLACEHOLDER_RE = re.compile(r"^(?P<whole>[A-Z][A-Z0-9]*(?:_[A-Z0-9]+)*)$|\(\?:(?P<inline>[A-Z][A-Z0-9]*(?:_[A-Z0-9]+)*)\)")
+
+
+def placeholder(name: str):
     """
-    Generate a list of patterns for screen automatic properties.
+    Registers the decorated function as the generator of a placeholder.
     """
 
-    return [
-        {
-            "name": "support.constant.property-key.renpy entity.name.tag.css.style.renpy",
-            "match": rf"\b(?<!\.){prop}\b",
-        } for prop in keywords.property_regexes
-    ]
+    def register(f: Callable[[], Any]) -> Callable[[], Any]:
+        PLACEHOLDERS[name] = f
+        return f
+
+    return register
+
+
+@placeholder("STYLE_PROPERTIES")
+def style_properties() -> str:
+    return regex_trie.factor_regex(keywords.style_property_regex)
+
+
+@placeholder("ATL_PROPERTIES")
+def atl_properties() -> str:
+    return regex_trie.factor_regex(keywords.atl_property_regex)
+
+
+@placeholder("PROPERTIES")
+def properties() -> str:
+    return property_factoring.properties_regex()
+
+
+@dataclass
+class PlaceholderUsage:
+    used: set[str] = field(default_factory=set[str])
+    unknown: set[str] = field(default_factory=set[str])
+
+    # The generated value of each placeholder, so each is only generated once.
+    values: dict[str, Any] = field(default_factory=dict[str, Any])
 
+    def value(self, name: str) -> Any:
+        self.used.add(name)
 
-def apply_keywords(o):
+        if name not in self.values:
+            self.values[name] = PLACEHOLDERS[name]()
+
+        return self.values[name]
+
+
+def apply_keywords(o, usage: PlaceholderUsage | None = None):
     """
-    Recursively apply keywords to a data structure.
+    Recursively apply keywords to a data structure, by filling in the
+    placeholders. Parts of the structure that contain no placeholders are
+    returned as is, rather than copied.
     """
 
-    if o == "SCREEN_AUTOMATIC_PROPERTIES":
-        return screen_automatic_properties()
+    if usage is None:
+        usage = PlaceholderUsage()
 
     if isinstance(o, dict):
-        return {k: apply_keywords(v) for k, v in o.items()}
+        changed = False
+        rv = {}
+
+        for k, v in o.items():
+            rv[k] = apply_keywords(v, usage)
+            changed = changed or rv[k] is not v
+
+        return rv if changed else o
 
     elif isinstance(o, list):
-        return [apply_keywords(i) for i in o]
+        rv = [apply_keywords(i, usage) for i in o]
+        return rv if any(a is not b for a, b in zip(rv, o)) else o
 
     elif isinstance(o, str):
-        rv = o
-        rv = rv.replace("(?:STYLE_PROPERTIES)", keywords.style_property_regex)
-        rv = rv.replace("(?:ATL_PROPERTIES)", keywords.atl_property_regex)
-        return rv
+        m = PLACEHOLDER_RE.search(o)
+        if m is None:
+            return o
+
+        if m.group("whole") is not None:
+            if m.group("whole") in PLACEHOLDERS:
+                return usage.value(m.group("whole"))
+
+            return o
+
+        def replace(m: re.Match[str]) -> str:
+            name = m.group("inline")
+
+            if name is None:
+                return m.group(0)
+
+            if name not in PLACEHOLDERS:
+                usage.unknown.add(name)
+                return m.group(0)
+
+            return usage.value(name)
+
+        return PLACEHOLDER_RE.sub(replace, o)
 
     return o
 
-def convert_file(filename: pathlib.Path):
+def load_grammar(filename: pathlib.Path) -> Any:
+    """
+    Loads a .tmLanguage.yaml file, reusing the parsed data if the file did not
+    change since it was last loaded. The result must not be modified.
+    """
+
+    text = filename.read_text()
+    text_hash = hash_bytes(text.encode())
+
+    cached = grammar_cache.get(filename)
+    if cached is not None and cached[0] == text_hash:
+        return cached[1]
+
+    data = yaml_backend.load(text)
+    grammar_cache[filename] = (text_hash, data)
+    return data
+
+
+def get_grammar_sources() -> list[pathlib.Path]:
     """
-    Convert a .tmLanguage.yaml file to .tmLanguage.json
+    Returns the source of every grammar in syntaxes/: the .tmLanguage.yaml file
+    of the grammars that are generated, and the .json file of the others.
+    """
+
+    rv: list[pathlib.Path] = []
+
+    for i in reachability.find_grammar_files(ROOT / "syntaxes"):
+        source = i.with_suffix(".yaml")
+        rv.append(source if source.exists() else i)
+
+    return rv
+
+
+def load_source_grammars() -> dict[str, Any]:
+    """
+    Loads the source of every grammar in syntaxes/, by scope name. The
+    placeholders are not filled in, since they never contain includes.
+    """
+
+    rv: dict[str, Any] = {}
+
+    for i in get_grammar_sources():
+        if i.suffix == ".yaml":
+            data = load_grammar(i)
+            rv[data["scopeName"]] = data
+        else:
+            rv.update(reachability.load_grammars([i]))
+
+    return rv
+
+
+def convert_file(filename: pathlib.Path, usage: PlaceholderUsage | None = None, reachable: set[reachability.Rule] | None = None) -> bool:
+    """
+    Convert a .tmLanguage.yaml file to .tmLanguage.json. If `reachable` is given,
+    the repository entries that aren't in it are left out. Returns True if the
+    .json file was written.
     """
     destination = filename.with_suffix(".json")
 
-    with open(filename, "r") as f:
-        data = yaml.safe_load(f)
+    data = load_grammar(filename)
+
+    if reachable is not None:
+        data, _ = reachability.strip_unreachable(data, reachable)
 
-    data = apply_keywords(data)
+    data = apply_keywords(data, usage)
 
-    data["information_for_contributors"].insert(
-        0,
-        f"This file is generated from syntaxes/{filename.name}. Please edit that file instead.",
-    )
+    # The data may be shared with the grammar cache, so it's copied rather than modified.
+    data = {
+        **data,
+        "information_for_contributors": [
+            f"This file is generated from syntaxes/{filename.name}. Please edit that file instead.",
+            *data["information_for_contributors"],
+        ],
+    }
 
     output = json.dumps(data, indent=2)
 
+    written = True
+
     try:
         old_text = destination.read_text()
         if old_text == output:
-            return False
+            written = False
     except FileNotFoundError:
         pass
 
-    destination.write_text(output)
+    if written:
+        destination.write_text(output)
+
+    return written
+
+
+def convert_file_step(step: BuildStep, input_data: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    The build action for a single .tmLanguage.json file.
+    """
+
+    usage = PlaceholderUsage()
+    reachable = None
+
+    if step.settings.get("strip_unreachable", False):
+        reachable = reachability.find_reachability(load_source_grammars()).reachable
+
+    convert_file(step.options["source_file"], usage, reachable)
+
+    return {
+        "placeholders": sorted(usage.used),
+        "unknown_placeholders": sorted(usage.unknown),
+    }
+
+
+def uses_placeholders(text: str) -> bool:
+    return re.search(r"\b(?:" + "|".join(PLACEHOLDERS) + r")\b", text) is not None
+
+
+def report_placeholders(graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep]):
+    """
+    Reports the placeholders that are unknown, or that no grammar uses.
+    """
+
+    if not any(step.action is convert_file_step for step in changed):
+        return
+
+    used: set[str] = set()
+
+    for step in graph.steps:
+        if step.action is not convert_file_step:
+            continue
+
+        data = manifest.get(step.output)
+        used.update(data.get("placeholders", []))
+
+        for name in data.get("unknown_placeholders", []):
+            print(f"Warning: {manifest.key(step.options['source_file'])} uses the unknown placeholder {name}.")
+
+    unused = sorted(set(PLACEHOLDERS) - used)
+    if unused:
+        print(f"Note: no grammar uses the placeholders {', '.join(unused)}.")
+
+
+# The ways the token patterns can be written, by the name used for --format.
+PATTERN_FORMATS: dict[str, Callable[..., list[BuildStep]]] = {
+    "nested": syntax_to_token_pattern.create_build_steps,
+    "table": pattern_table.create_build_steps,
+}
+
+# Every file that any pattern format writes. The ones that the chosen format
+# doesn't write are removed, so switching formats doesn't leave stale files in
+# src/tokenizer/generated/.
+PATTERN_OUTPUTS = [
+    *(ROOT / output_file for _, _, output_file in syntax_to_token_pattern.TOKEN_PATTERN_SOURCES),
+    ROOT / syntax_to_token_pattern.SHARED_FILE,
+    ROOT / syntax_to_token_pattern.PATTERN_IDS_FILE,
+    ROOT / syntax_to_token_pattern.INDEX_FILE,
+    ROOT / pattern_table.TABLE_FILE,
+]
+
+
+def report_prefilter(graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep]):
+    """
+    Reports the share of the match and begin regexes that the tokenizer can skip
+    by the first character they can match, or by a literal they require, and
+    that could be run in sticky mode.
+    """
+
+    if not any("prefilter_count" in manifest.get(step.output) for step in changed):
+        return
+
+    regex_count = 0
+    prefilter_count = 0
+    literal_count = 0
+    sticky_count = 0
+
+    for step in graph.steps:
+        data = manifest.get(step.output)
+        regex_count += data.get("regex_count", 0)
+        prefilter_count += data.get("prefilter_count", 0)
+        literal_count += data.get("literal_count", 0)
+        sticky_count += data.get("sticky_count", 0)
+
+    print(f"Note: {prefilter_count} of {regex_count} regexes ({prefilter_count / max(regex_count, 1):.0%}) can only start with some characters.")
+    print(f"Note: {literal_count} of {regex_count} regexes ({literal_count / max(regex_count, 1):.0%}) require a literal text.")
+    print(f"Note: {sticky_count} of {regex_count} regexes ({sticky_count / max(regex_count, 1):.0%}) can only match at the start of a line.")
+
+
+def report_shared_patterns(graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep]):
+    """
+    Reports how many patterns are shared, and how many pattern ids and bytes
+    of generated code that saves.
+    """
+
+    if not any("shared_patterns" in manifest.get(step.output) for step in changed):
+        return
+
+    shared = next(manifest.get(step.output) for step in graph.steps if "shared_patterns" in manifest.get(step.output))
+
+    pattern_count = 0
+    size = 0
+
+    for step in graph.steps:
+        data = manifest.get(step.output)
+        pattern_count += data.get("state", {}).get("pattern_count", 0)
+        size += data.get("size", 0)
+
+    print(f"Note: {len(shared['shared_patterns'])} shared patterns are used in {shared['shared_uses']} places.")
+    print(f"Note: Pattern ids: {shared['unshared_pattern_count']} -> {pattern_count}, generated size: {shared['unshared_size'] / 1024:.0f} KB -> {size / 1024:.0f} KB.")
+
+
+def report_unreachable(graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep]):
+    """
+    Reports the repository entries that no grammar can reach, and the includes
+    of entries that don't exist.
+    """
+
+    if not changed:
+        return
+
+    result = reachability.find_reachability(load_source_grammars())
+
+    for rule, include in result.unresolved:
+        print(f"Warning: {reachability.format_rule(rule)} includes {include}, which doesn't exist.")
+
+    if not result.unreachable:
+        return
+
+    names = ", ".join(reachability.format_rule(i) for i in result.unreachable)
+
+    if any(step.settings.get("strip_unreachable", False) for step in graph.steps):
+        print(f"Note: Left out {len(result.unreachable)} unreachable grammar rules: {names}.")
+    else:
+        print(f"Note: {len(result.unreachable)} grammar rules can't be reached from any grammar: {names}. Pass --strip-unreachable to leave them out.")
+
+
+def create_build_graph(pattern_format: str = "nested", fuse_patterns: bool = False, share_patterns: bool = False, strip_unreachable: bool = False) -> BuildGraph:
+    """
+    Creates the graph of every generated file: each .tmLanguage.yaml is converted
+    to .tmLanguage.json, which is converted to token patterns in `pattern_format`.
+    If `strip_unreachable` is True, the repository entries that no grammar can
+    reach are left out of both, so every output depends on every grammar.
+    """
+
+    if fuse_patterns and pattern_format != "nested":
+        raise ValueError("Fusing patterns is only supported by the nested format.")
+
+    if share_patterns and pattern_format != "nested":
+        raise ValueError("Sharing patterns is only supported by the nested format.")
+
+    steps: list[BuildStep] = []
+    settings = {"strip_unreachable": strip_unreachable}
+
+    for filename in sorted(ROOT.glob("syntaxes/*.tmLanguage.yaml")):
+        inputs = [filename, *GENERATOR_INPUTS]
+
+        if strip_unreachable:
+            inputs.extend(i for i in get_grammar_sources() if i != filename)
+
+        if uses_placeholders(filename.read_text()):
+            inputs.extend(KEYWORD_INPUTS)
+
+        steps.append(BuildStep(
+            output=filename.with_suffix(".json"),
+            inputs=inputs,
+            action=convert_file_step,
+            options={"source_file": filename},
+            settings=settings,
+        ))
+
+    if fuse_patterns or share_patterns:
+        steps.extend(syntax_to_token_pattern.create_build_steps(fuse_patterns, share_patterns, strip_unreachable))
+    else:
+        steps.extend(PATTERN_FORMATS[pattern_format](strip_unreachable=strip_unreachable))
+
+    return BuildGraph(steps, obsolete=PATTERN_OUTPUTS)
+
+
+def get_watched_files() -> list[pathlib.Path]:
+    return [
+        *sorted(ROOT.glob("syntaxes/*.tmLanguage.yaml")),
+        ROOT / "syntaxes" / "renpy.python.tmLanguage.json",
+        SCRIPTS / "keywords.py",
+    ]
+
+
+def get_options(pattern_format: str, fuse_patterns: bool, share_patterns: bool, strip_unreachable: bool) -> dict[str, Any]:
+    return {
+        "format": pattern_format,
+        "fuse_patterns": fuse_patterns,
+        "share_patterns": share_patterns,
+        "strip_unreachable": strip_unreachable,
+    }
+
+
+def watch(manifest: BuildManifest, interval: float, pattern_format: str, fuse_patterns: bool, share_patterns: bool, strip_unreachable: bool, metrics: pathlib.Path | None, snapshots: bool):
+    """
+    Regenerates the outputs affected by every change to the grammars or to
+    keywords.py, until interrupted. Everything runs in this process, so parsed
+    grammars and the keywords module stay loaded between changes. If `metrics`
+    is given, the metrics report is written there after every rebuild. With
+    `snapshots`, the grammar samples are checked after every rebuild that
+    changed a grammar.
+    """
+
+    def snapshot() -> dict[pathlib.Path, tuple[int, int]]:
+        rv: dict[pathlib.Path, tuple[int, int]] = {}
+
+        for i in get_watched_files():
+            try:
+                st = i.stat()
+                rv[i] = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                pass
+
+        return rv
+
+    last: dict[pathlib.Path, tuple[int, int]] | None = None
+
+    print("Watching syntaxes/ and scripts/keywords.py for changes. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            current = snapshot()
+
+            if current != last:
+                if last is not None and last.get(SCRIPTS / "keywords.py") != current.get(SCRIPTS / "keywords.py"):
+                    importlib.reload(keywords)
+                    property_factoring.properties_regex.cache_clear()
+
+                last = current
+                manifest.invalidate()
+
+                start = time.perf_counter()
+
+                try:
+                    graph = create_build_graph(pattern_format, fuse_patterns, share_patterns, strip_unreachable)
+                    removed = graph.remove_obsolete(manifest)
+                    changed = graph.run(manifest, jobs=1)
+                    manifest.save()
+                    report_placeholders(graph, manifest, changed)
+                    report_prefilter(graph, manifest, changed)
+                    report_shared_patterns(graph, manifest, changed)
+                    report_unreachable(graph, manifest, changed)
+
+                    if metrics is not None:
+                        generator_metrics.write_report(metrics, graph, manifest, changed, get_options(pattern_format, fuse_patterns, share_patterns, strip_unreachable))
+
+                    if snapshots and any(i.output.suffix == ".json" for i in changed):
+                        # Imported here, since it needs the regex package, which generating doesn't.
+                        import grammar_snapshots
+
+                        grammar_snapshots.check_snapshots([grammar_snapshots.DEFAULT_CORPUS], jobs=1)
+                except Exception:
+                    # Keep watching, so a typo in a grammar can simply be fixed.
+                    traceback.print_exc()
+                    removed = []
+                    changed = []
+
+                elapsed = (time.perf_counter() - start) * 1000
+
+                for path in removed:
+                    print(f"Removed {manifest.key(path)}.")
+
+                for step in changed:
+                    print(f"Generated {manifest.key(step.output)}.")
+
+                print(f"Rebuilt in {elapsed:.0f}ms.")
+
+            time.sleep(interval)
+
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
+    ap = argparse.ArgumentParser(description="Generate the .tmLanguage.json grammars and token patterns")
+    ap.add_argument("--force", action="store_true", help="Ignore the build manifest and regenerate everything")
+    ap.add_argument("-j", "--jobs", type=int, default=default_jobs(), help="The number of worker processes to use (default: %(default)s)")
+    ap.add_argument("--dry-run", action="store_true", help="Print the steps that would run, without running them")
+    ap.add_argument("--watch", action="store_true", help="Keep running, and regenerate the affected files whenever a grammar or keywords.py changes")
+    ap.add_argument("--format", choices=sorted(PATTERN_FORMATS), default="nested", help="Write the token patterns as nested objects per grammar, or as one flat table (default: %(default)s)")
+    ap.add_argument("--fuse-patterns", action="store_true", help="Fuse runs of sibling match patterns into a single regex (nested format only)")
+    ap.add_argument("--share-patterns", action="store_true", help="Write the patterns that are the same in more than one place once, in a shared file (nested format only)")
+    ap.add_argument("--strip-unreachable", action="store_true", help="Leave the grammar rules that no grammar can reach out of the grammars and token patterns")
+    ap.add_argument("--metrics", type=pathlib.Path, help="Write the pattern counts, regex complexity, output sizes and times of the run to this JSON file")
+    ap.add_argument("--snapshots", action="store_true", help="Check the tokens of the samples in tests/grammar/ against their snapshots after generating")
+    ap.add_argument("--interval", type=float, default=0.1, help="How often to check for changes in watch mode, in seconds (default: %(default)s)")
+    args = ap.parse_args()
+
+    if args.fuse_patterns and args.format != "nested":
+        ap.error("--fuse-patterns is only supported with --format nested")
+
+    if args.share_patterns and args.format != "nested":
+        ap.error("--share-patterns is only supported with --format nested")
+
+    manifest = BuildManifest()
+    if args.force:
+        manifest.entries.clear()
+
+    if args.watch:
+        watch(manifest, args.interval, args.format, args.fuse_patterns, args.share_patterns, args.strip_unreachable, args.metrics, args.snapshots)
+        return
+
+    graph = create_build_graph(args.format, args.fuse_patterns, args.share_patterns, args.strip_unreachable)
+
+    if args.dry_run:
+        print(graph.describe_plan(manifest))
+        return
+
+    removed = graph.remove_obsolete(manifest)
+    changed = graph.run(manifest, args.jobs)
+    manifest.save()
+
+    report_placeholders(graph, manifest, changed)
+    report_prefilter(graph, manifest, changed)
+    report_shared_patterns(graph, manifest, changed)
+    report_unreachable(graph, manifest, changed)
 
-    ROOT = pathlib.Path(__file__).parent.parent
+    if args.metrics is not None:
+        generator_metrics.write_report(args.metrics, graph, manifest, changed, get_options(args.format, args.fuse_patterns, args.share_patterns, args.strip_unreachable))
 
-    generated = False
+    if not changed and not removed:
+        print("Everything is up to date.")
 
-    for filename in ROOT.glob("syntaxes/*.tmLanguage.yaml"):
-        generated = generated or convert_file(filename)
+    for path in removed:
+        print(f"Removed {manifest.key(path)}.")
 
-    print("Generated .tmLanguage.json files from .tmLanguage.yaml files.")
+    for step in changed:
+        print(f"Generated {manifest.key(step.output)}.")
 
-    if generated:
-        syntax_to_token_pattern.generate_token_patterns()
-        print("Generated token patterns.")
+    if args.snapshots:
+        # Imported here, since it needs the regex package, which generating doesn't.
+        import grammar_snapshots
 
+        if not grammar_snapshots.check_snapshots([grammar_snapshots.DEFAULT_CORPUS], jobs=args.jobs):
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
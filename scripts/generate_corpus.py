@@ -0,0 +1,658 @@
+import argparse
+import pathlib
+import random
+import shutil
+import time
+from typing import Callable
+
+import keywords
+
+# The kinds of .rpy file a project is made of, and the share of the lines of
+# the project each gets. Characters and options are written once, on top.
+FILE_KINDS = [
+    ("script", 70),
+    ("screens", 12),
+    ("styles", 6),
+    ("transforms", 6),
+    ("images", 6),
+]
+
+NAMES = [
+    "Eileen", "Lucy", "Sylvie", "Augustina", "Mary", "Ren", "Kiri", "Noor", "Tomas", "Aiko",
+    "Bruno", "Chiara", "Dmitri", "Esme", "Farah", "Gwen", "Hiro", "Ines", "Jonas", "Keiko",
+]
+
+PLACES = [
+    "room", "classroom", "library", "park", "street", "beach", "station", "cafe", "garden", "roof",
+    "hallway", "kitchen", "forest", "lake", "market", "office", "shrine", "studio", "bridge", "harbor",
+]
+
+EXPRESSIONS = ["happy", "sad", "angry", "surprised", "neutral", "thinking", "laughing", "worried", "blush", "sleepy"]
+
+OUTFITS = ["casual", "uniform", "formal", "swimsuit", "winter"]
+
+WORDS = (
+    "the a it we you they really just never always maybe tomorrow today here there again "
+    "time way day thing people world life hand part place case week point question work night "
+    "think know want see look find give tell feel leave call keep begin seem help show hear "
+    "good new first last long great little own other old right big high different small large "
+    "strange quiet bright warm cold late early ready sure enough"
+).split()
+
+TRANSITIONS = ["dissolve", "fade", "pixellate", "move", "moveinleft", "moveoutright", "ease", "zoomin", "vpunch", "hpunch"]
+
+POSITIONS = ["left", "right", "center", "truecenter", "topleft", "topright"]
+
+WARPERS = ["linear", "ease", "easein", "easeout", "ease_quad", "ease_cubic", "easein_back", "easeout_bounce", "ease_elastic"]
+
+TEXT_TAGS = [("b", None), ("i", None), ("u", None), ("color", "#{:06x}"), ("size", "+{}"), ("alpha", "0.{}"), ("cps", "{}0")]
+
+DISPLAYABLES = ["text", "textbutton", "imagebutton", "bar", "vbar", "add", "null", "label"]
+
+# The properties of keywords.py that are only used by Ren'Py itself, or by shaders.
+INTERNAL_PREFIXES = ("_", "gl_", "u_")
+
+
+def property_names(alternation: str) -> list[str]:
+    """
+    Returns the names in a regex of keywords.py like (?:align|alpha), leaving
+    out the ones that are only used internally.
+    """
+
+    return [i for i in alternation[3:-1].split("|") if not i.startswith(INTERNAL_PREFIXES)]
+
+
+def character_tags(names: list[str]) -> list[tuple[str, str]]:
+    """
+    Returns the image tag and variable of each of `names`, with the name. A tag
+    is the first letter of the name, with a number after it when a name before
+    it starts with the same letter, so every tag is different.
+    """
+
+    rv: list[tuple[str, str]] = []
+    used: set[str] = set()
+
+    for name in names:
+        tag = name[0].lower()
+        number = 1
+
+        while tag in used:
+            tag = f"{name[0].lower()}{number}"
+            number += 1
+
+        used.add(tag)
+        rv.append((tag, name))
+
+    return rv
+
+
+STYLE_PROPERTIES = property_names(keywords.style_property_regex)
+ATL_PROPERTIES = property_names(keywords.atl_property_regex)
+
+
+class ProjectWriter:
+    """
+    Writes the files of a synthetic Ren'Py project. Everything is drawn from a
+    single random generator, so the same seed and size always give the same
+    project.
+    """
+
+    def __init__(self, root: pathlib.Path, seed: int, lines: int, file_lines: int):
+        self.root = root
+        self.game = root / "game"
+        self.rng = random.Random(seed)
+        self.target_lines = lines
+        self.file_lines = file_lines
+
+        self.lines = 0
+        self.files = 0
+        self.assets = 0
+
+        # The assets and names the project has, scaled to its size, so that a
+        # larger project also has more of them.
+        scale = max(1, lines // 10000)
+
+        self.characters = character_tags(NAMES[:10 + min(10, scale)] * scale)
+        self.backgrounds = [f"{place}_{i}" if i else place for i in range(2 * scale) for place in PLACES]
+        self.music = [f"theme_{i:03}" for i in range(5 * scale)]
+        self.sounds = [f"sfx_{i:03}" for i in range(10 * scale)]
+        self.fonts = ["DejaVuSans", "Inter-Regular", "Inter-Bold", "NotoSerif-Italic"]
+
+        self.labels: list[str] = []
+        self.screens: list[str] = []
+        self.styles: list[str] = []
+        self.transforms: list[str] = []
+
+    def words(self, low: int, high: int) -> str:
+        rv = " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(low, high)))
+        return rv[0].upper() + rv[1:]
+
+    def dialogue(self) -> str:
+        """
+        Returns the text of a say statement, with some text tags and
+        interpolations.
+        """
+
+        parts = [self.words(2, 8)]
+
+        if self.rng.random() < 0.2:
+            tag, value = self.rng.choice(TEXT_TAGS)
+            argument = "" if value is None else "=" + value.format(self.rng.randint(1, 0xFFFFFF) if tag == "color" else self.rng.randint(1, 9))
+            parts.append(f"{{{tag}{argument}}}{self.words(1, 3)}{{/{tag}}}")
+
+        if self.rng.random() < 0.15:
+            parts.append(self.rng.choice(["[player_name]", "[points]", "[day!t]", "[persistent.route]"]))
+
+        if self.rng.random() < 0.1:
+            parts.append("{w=0.5}" + self.words(1, 4))
+
+        return " ".join(parts) + self.rng.choice([".", ".", "!", "?", "..."])
+
+    def color(self) -> str:
+        return f"\"#{self.rng.randint(0, 0xFFFFFF):06x}\""
+
+    def number(self) -> str:
+        return f"{self.rng.random():.2f}"
+
+    def property_value(self, name: str, atl: bool = False) -> str:
+        """
+        Returns a plausible value for a style property, or an ATL property if
+        `atl` is True, guessed from its name.
+        """
+
+        rng = self.rng
+
+        if name.endswith("color"):
+            return self.color()
+        if name.endswith("font"):
+            return f"\"fonts/{rng.choice(self.fonts)}.ttf\""
+        if name.endswith("sound"):
+            return f"\"audio/sfx/{rng.choice(self.sounds)}.ogg\""
+        if name in ("background", "foreground", "child", "thumb", "caret") or name.endswith(("_bar", "_gutter")):
+            return rng.choice([f"Solid({self.color()})", f"Frame(\"gui/frame_{rng.randint(1, 9)}.png\", 10, 10)", f"\"gui/bar/{name}.png\""])
+        if name in ("bold", "italic", "underline", "strikethrough", "antialias", "vertical", "modal", "subpixel", "mipmap", "xfill", "yfill", "nearest", "perspective", "show_cancels_hide") or name.endswith(("_reverse", "_invert", "_wrap", "_abortable")):
+            return rng.choice(["True", "False"])
+        if name in ("align", "anchor", "pos", "offset", "xycenter", "xysize", "maxsize", "around", "alignaround", "corner1", "corner2", "anchoraround") or (atl and name == "size"):
+            return f"({self.number()}, {self.number()})"
+        if name in ("area", "crop"):
+            return f"({rng.randint(0, 100)}, {rng.randint(0, 100)}, {rng.randint(100, 1280)}, {rng.randint(100, 720)})"
+        if name.endswith(("padding", "margin", "spacing", "indent", "size", "minimum", "maximum", "width", "leading", "cps", "offset", "gutter")):
+            return str(rng.randint(0, 60))
+        if name.endswith(("rotate", "angle")):
+            return str(rng.randint(0, 359))
+        if name == "outlines":
+            return f"[({rng.randint(1, 3)}, {self.color()}, 0, 0)]"
+        if name == "matrixcolor":
+            return rng.choice(["TintMatrix(\"#ffd\")", f"SaturationMatrix({self.number()})", "InvertMatrix(1.0) * BrightnessMatrix(0.1)"])
+        if name in ("language", "layout", "hinting", "box_layout", "shaper", "reading_order"):
+            return rng.choice(["\"auto\"", "\"subtitle\"", "\"greedy\"", "\"bytecode\"", "\"vertical\"", "0.5"])
+        if name in ("size_group", "altruby_style", "ruby_style", "instance", "group_alt", "alt", "extra_alt", "mouse"):
+            return f"\"{rng.choice(WORDS)}\""
+
+        return self.number()
+
+    def write(self, relative: str, lines: list[str]):
+        path = self.game / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        self.lines += len(lines)
+        self.files += 1
+
+    def write_assets(self):
+        """
+        Writes the image, audio and font files the scripts refer to. They are
+        empty, since only their paths matter to the tools.
+        """
+
+        paths = [f"images/bg/bg_{i}.png" for i in self.backgrounds]
+
+        for tag, name in self.characters:
+            paths.append(f"images/characters/{tag}/{tag}_base.png")
+            paths.extend(f"images/characters/{tag}/{tag}_{i}.png" for i in EXPRESSIONS)
+            paths.extend(f"images/characters/{tag}/outfit_{i}.png" for i in OUTFITS)
+
+        paths.extend(f"audio/music/{i}.ogg" for i in self.music)
+        paths.extend(f"audio/sfx/{i}.ogg" for i in self.sounds)
+        paths.extend(f"fonts/{i}.ttf" for i in self.fonts)
+        paths.extend(f"gui/frame_{i}.png" for i in range(1, 10))
+
+        for i in dict.fromkeys(paths):
+            path = self.game / i
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+            self.assets += 1
+
+    def options(self) -> list[str]:
+        rv = [
+            "## Options and characters.",
+            "",
+            "define config.name = _(\"Synthetic Project\")",
+            "define config.version = \"1.0\"",
+            "define config.window = \"auto\"",
+            "define config.rollback_enabled = True",
+            "define build.name = \"SyntheticProject\"",
+            "",
+            "default player_name = \"Player\"",
+            "default points = 0",
+            "default day = 1",
+            "default persistent.route = None",
+            "",
+            "init python:",
+            "    build.classify(\"**~\", None)",
+            "    build.classify(\"**.bak\", None)",
+            "    build.classify(\"game/**.png\", \"archive\")",
+            "    build.classify(\"game/**.ogg\", \"archive\")",
+            "",
+        ]
+
+        for tag, name in self.characters:
+            rv.append(f"define {tag} = Character(\"{name}\", color={self.color()}, image=\"{tag}\")")
+
+        rv.append("define narrator_nvl = Character(None, kind=nvl)")
+
+        return rv
+
+    def say_block(self, indent: str, count: int) -> list[str]:
+        """
+        Returns `count` simple statements, as a menu choice or if block would
+        have them.
+        """
+
+        rv: list[str] = []
+
+        for _ in range(count):
+            r = self.rng.random()
+
+            if r < 0.6:
+                tag, _ = self.rng.choice(self.characters)
+                rv.append(f"{indent}{tag} \"{self.dialogue()}\"")
+            elif r < 0.75:
+                rv.append(f"{indent}\"{self.dialogue()}\"")
+            elif r < 0.9:
+                rv.append(f"{indent}$ points += {self.rng.randint(1, 5)}")
+            elif self.labels:
+                rv.append(f"{indent}jump {self.rng.choice(self.labels)}")
+            else:
+                rv.append(f"{indent}pass")
+
+        return rv
+
+    def statement(self) -> list[str]:
+        rng = self.rng
+        r = rng.random()
+        tag, _ = rng.choice(self.characters)
+
+        if r < 0.45:
+            expression = f" {rng.choice(EXPRESSIONS)}" if rng.random() < 0.3 else ""
+            return [f"    {tag}{expression} \"{self.dialogue()}\""]
+
+        if r < 0.55:
+            return [f"    \"{self.dialogue()}\""]
+
+        if r < 0.62:
+            at = f" at {rng.choice(POSITIONS + self.transforms[:20])}" if rng.random() < 0.5 else ""
+            return [f"    show {tag} {rng.choice(EXPRESSIONS)}{at}", f"    with {rng.choice(TRANSITIONS)}"]
+
+        if r < 0.65:
+            return [f"    scene bg {rng.choice(self.backgrounds)}", f"    with {rng.choice(TRANSITIONS)}"]
+
+        if r < 0.67:
+            return [f"    hide {tag}"]
+
+        if r < 0.7:
+            fade = f" fadein {rng.randint(1, 3)}.0" if rng.random() < 0.5 else ""
+            return [f"    play music \"audio/music/{rng.choice(self.music)}.ogg\"{fade}"]
+
+        if r < 0.72:
+            return [f"    play sound \"audio/sfx/{rng.choice(self.sounds)}.ogg\""]
+
+        if r < 0.74:
+            return [f"    stop music fadeout {rng.randint(1, 3)}.0"]
+
+        if r < 0.8:
+            return [f"    $ {rng.choice(['points', 'day'])} {rng.choice(['+=', '-=', '='])} {rng.randint(1, 10)}"]
+
+        if r < 0.86:
+            rv = [f"    if points {rng.choice(['>', '<', '>=', '=='])} {rng.randint(0, 20)}:"]
+            rv.extend(self.say_block("        ", rng.randint(1, 3)))
+
+            if rng.random() < 0.5:
+                rv.append(f"    elif persistent.route == \"{rng.choice(NAMES).lower()}\":")
+                rv.extend(self.say_block("        ", rng.randint(1, 2)))
+
+            rv.append("    else:")
+            rv.extend(self.say_block("        ", rng.randint(1, 2)))
+            return rv
+
+        if r < 0.92:
+            rv = ["    menu:", f"        \"{self.words(3, 8)}?\"", ""]
+
+            for _ in range(rng.randint(2, 4)):
+                condition = f" if points > {rng.randint(0, 10)}" if rng.random() < 0.2 else ""
+                rv.append(f"        \"{self.words(2, 6)}\"{condition}:")
+                rv.extend(self.say_block("            ", rng.randint(1, 3)))
+                rv.append("")
+
+            return rv
+
+        if r < 0.94:
+            return [f"    pause {rng.randint(1, 20) / 10}"]
+
+        if r < 0.96:
+            return [f"    window {rng.choice(['show', 'hide', 'auto'])}"]
+
+        if r < 0.98:
+            return [
+                "    python:",
+                f"        {tag}_mood = renpy.random.choice([\"{rng.choice(EXPRESSIONS)}\", \"{rng.choice(EXPRESSIONS)}\"])",
+                f"        renpy.notify(\"{self.words(2, 5)}\")",
+            ]
+
+        if self.labels:
+            return [f"    call {rng.choice(self.labels)}"]
+
+        return ["    pass"]
+
+    def init_python(self, index: int) -> list[str]:
+        return [
+            f"init python in helpers_{index}:",
+            f"    def score_{index}(value, bonus={self.rng.randint(1, 5)}):",
+            "        \"\"\"",
+            f"        {self.words(4, 10)}.",
+            "        \"\"\"",
+            "",
+            f"        total = value * {self.rng.randint(2, 9)} + bonus",
+            "        if total > 100:",
+            "            return 100",
+            "        return max(0, total)",
+            "",
+            f"    CHOICES_{index} = {{",
+            *(f"        \"{i.lower()}\": {self.rng.randint(0, 10)}," for i in self.rng.sample(NAMES, 3)),
+            "    }",
+            "",
+        ]
+
+    def script(self, index: int) -> list[str]:
+        rv = [f"## Chapter {index}.", ""]
+
+        if self.rng.random() < 0.3:
+            rv.extend(self.init_python(index))
+
+        scene = 0
+
+        while len(rv) < self.file_lines:
+            label = f"chapter_{index}_{scene}" if index or scene else "start"
+            rv.append(f"label {label}:")
+
+            if self.rng.random() < 0.7:
+                rv.extend([f"    scene bg {self.rng.choice(self.backgrounds)}", "    with fade"])
+
+            for _ in range(self.rng.randint(10, 40)):
+                rv.extend(self.statement())
+
+            rv.extend([f"    jump chapter_{index}_{scene + 1}" if self.rng.random() < 0.5 else "    return", ""])
+
+            self.labels.append(label)
+            scene += 1
+
+        # The jump of the last label has to go somewhere.
+        rv.extend([f"label chapter_{index}_{scene}:", "    return", ""])
+
+        return rv
+
+    def screen(self, index: int) -> list[str]:
+        rng = self.rng
+        name = f"screen_{index}"
+
+        rv = [
+            f"screen {name}(items=None, title=\"{self.words(1, 3)}\"):",
+            "    tag menu",
+            f"    modal {rng.choice(['True', 'False'])}",
+            f"    zorder {rng.randint(0, 200)}",
+            "",
+            "    frame:",
+        ]
+
+        for i in rng.sample(STYLE_PROPERTIES, 4):
+            rv.append(f"        {i} {self.property_value(i)}")
+
+        rv.extend([
+            "",
+            f"        {rng.choice(['vbox', 'hbox'])}:",
+            f"            spacing {rng.randint(0, 20)}",
+            "            text title size 32",
+            "",
+        ])
+
+        for _ in range(rng.randint(4, 12)):
+            displayable = rng.choice(DISPLAYABLES)
+
+            if displayable == "textbutton":
+                label = self.words(1, 3)
+                action = rng.choice(["Return()", f'Hide("{name}")', 'SetVariable("points", 0)', 'Jump("start")'])
+                rv.append(f"            textbutton _(\"{label}\") action {action}")
+            elif displayable == "imagebutton":
+                rv.extend([
+                    "            imagebutton:",
+                    f"                idle \"gui/frame_{rng.randint(1, 9)}.png\"",
+                    f"                hover im.MatrixColor(\"gui/frame_{rng.randint(1, 9)}.png\", im.matrix.brightness(0.2))",
+                    f"                action Show(\"{rng.choice(self.screens or [name])}\")",
+                ])
+            elif displayable in ("bar", "vbar"):
+                value = rng.choice(['Preference("music volume")', 'VariableValue("points", 100)', "StaticValue(50, 100)"])
+                rv.append(f"            {displayable} value {value}")
+            elif displayable == "add":
+                rv.append(f"            add \"images/bg/bg_{rng.choice(self.backgrounds)}.png\" zoom {self.number()}")
+            elif displayable == "null":
+                rv.append(f"            null height {rng.randint(5, 40)}")
+            else:
+                rv.append(f"            {displayable} \"{self.dialogue()}\"")
+
+            # Some children get their own properties, and a transform.
+            if rng.random() < 0.3:
+                rv[-1] += ":"
+
+                for i in rng.sample(STYLE_PROPERTIES, 2):
+                    rv.append(f"                {i} {self.property_value(i)}")
+
+                if rng.random() < 0.5:
+                    rv.append("                at transform:")
+
+                    for i in rng.sample(ATL_PROPERTIES, 2):
+                        rv.append(f"                    {i} {self.property_value(i, True)}")
+
+                    rv.append(f"                    {rng.choice(WARPERS)} {rng.randint(1, 10) / 10} alpha 1.0")
+
+        rv.extend([
+            "",
+            "    if items:",
+            "        vpgrid:",
+            f"            cols {rng.randint(2, 6)}",
+            "            scrollbars \"vertical\"",
+            "            mousewheel True",
+            "",
+            "            for i in items:",
+            "                textbutton i.name action Return(i)",
+            "",
+            f"    key \"K_ESCAPE\" action Hide(\"{name}\")",
+            "",
+        ])
+
+        self.screens.append(name)
+
+        return rv
+
+    def style(self, index: int, number: int) -> list[str]:
+        name = f"style_{index}_{number}"
+        parent = f" is {self.rng.choice(self.styles)}" if self.styles and self.rng.random() < 0.4 else ""
+
+        rv = [f"style {name}{parent}:"]
+
+        for i in self.rng.sample(STYLE_PROPERTIES, self.rng.randint(2, 8)):
+            rv.append(f"    {i} {self.property_value(i)}")
+
+        rv.append("")
+        self.styles.append(name)
+
+        return rv
+
+    def transform(self, index: int, number: int) -> list[str]:
+        rng = self.rng
+        name = f"transform_{index}_{number}"
+        rv = [f"transform {name}(delay={rng.randint(1, 20) / 10}):"]
+
+        for i in rng.sample(ATL_PROPERTIES, rng.randint(1, 4)):
+            rv.append(f"    {i} {self.property_value(i, True)}")
+
+        for _ in range(rng.randint(1, 4)):
+            r = rng.random()
+            properties = " ".join(f"{i} {self.property_value(i, True)}" for i in rng.sample(ATL_PROPERTIES, rng.randint(1, 2)))
+
+            if r < 0.5:
+                rv.append(f"    {rng.choice(WARPERS)} delay {properties}")
+            elif r < 0.65:
+                rv.append(f"    pause {rng.randint(1, 10) / 10}")
+            elif r < 0.8:
+                rv.extend(["    parallel:", f"        {rng.choice(WARPERS)} delay {properties}", "    parallel:", f"        {rng.choice(WARPERS)} delay alpha {self.number()}"])
+            elif r < 0.9:
+                rv.extend(["    block:", f"        {rng.choice(WARPERS)} delay {properties}", f"        repeat {rng.randint(2, 5)}"])
+            else:
+                rv.extend(["    on show:", "        alpha 0.0", f"        {rng.choice(WARPERS)} delay alpha 1.0", "    on hide:", f"        {rng.choice(WARPERS)} delay alpha 0.0"])
+
+        if rng.random() < 0.3:
+            rv.append("    repeat")
+
+        rv.append("")
+        self.transforms.append(name)
+
+        return rv
+
+    def images(self, index: int) -> list[str]:
+        rv: list[str] = [f"## Images {index}.", ""]
+
+        if index == 0:
+            for i in self.backgrounds:
+                rv.append(f"image bg {i} = \"images/bg/bg_{i}.png\"")
+
+            rv.append("")
+
+        tag, _ = self.characters[index % len(self.characters)]
+        name = f"{tag}_layered_{index}" if index >= len(self.characters) else tag
+
+        rv.extend([
+            f"layeredimage {name}:",
+            "    always:",
+            f"        \"images/characters/{tag}/{tag}_base.png\"",
+            "",
+            "    group outfit:",
+        ])
+
+        for i, outfit in enumerate(OUTFITS):
+            rv.append(f"        attribute {outfit}{' default' if i == 0 else ''}:")
+            rv.append(f"            \"images/characters/{tag}/outfit_{outfit}.png\"")
+
+        rv.extend(["", "    group face auto:", f"        attribute {EXPRESSIONS[0]} default", ""])
+
+        for expression in EXPRESSIONS:
+            rv.append(f"    attribute {expression}_blush if_any [\"{expression}\"]:")
+            rv.append(f"        \"images/characters/{tag}/{tag}_{expression}.png\"")
+
+        rv.extend([
+            "",
+            f"image {name} blinking:",
+            f"    \"images/characters/{tag}/{tag}_{self.rng.choice(EXPRESSIONS)}.png\"",
+            f"    pause {self.rng.randint(20, 50) / 10}",
+            f"    \"images/characters/{tag}/{tag}_sleepy.png\"",
+            "    pause 0.1",
+            "    repeat",
+            "",
+        ])
+
+        return rv
+
+    def fill(self, block: Callable[[int], list[str]]) -> list[str]:
+        """
+        Returns the lines of a file of blocks, like screens, calling `block`
+        with the number of each block until the file is long enough.
+        """
+
+        rv: list[str] = []
+        number = 0
+
+        while len(rv) < self.file_lines:
+            rv.extend(block(number))
+            number += 1
+
+        return rv
+
+    def generate(self):
+        self.write("options.rpy", self.options())
+        self.write_assets()
+
+        # Each kind of file gets its share of the lines, written in turns,
+        # so a project of any size has every kind.
+        counts = {kind: 0 for kind, _ in FILE_KINDS}
+        written = {kind: 0 for kind, _ in FILE_KINDS}
+        total_weight = sum(weight for _, weight in FILE_KINDS)
+
+        while self.lines < self.target_lines:
+            # The kind that is furthest behind its share.
+            kind = min(FILE_KINDS, key=lambda i: written[i[0]] / i[1])[0]
+            index = counts[kind]
+            before = self.lines
+
+            if kind == "script":
+                self.write(f"script/chapter_{index:04}.rpy", self.script(index))
+            elif kind == "screens":
+                self.write(f"screens/screens_{index:04}.rpy", self.fill(lambda number: self.screen(len(self.screens))))
+            elif kind == "styles":
+                self.write(f"styles/styles_{index:04}.rpy", self.fill(lambda number: self.style(index, number)))
+            elif kind == "transforms":
+                self.write(f"transforms/transforms_{index:04}.rpy", self.fill(lambda number: self.transform(index, number)))
+            else:
+                self.write(f"images/images_{index:04}.rpy", self.images(index))
+
+            counts[kind] += 1
+            written[kind] += (self.lines - before) * total_weight
+
+
+def parse_size(text: str) -> int:
+    """
+    Parses a number of lines, like 10000, 100k or 1M.
+    """
+
+    multiplier = {"k": 1000, "m": 1000000}.get(text[-1:].lower(), 1)
+
+    try:
+        return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number of lines: {text!r}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate a synthetic Ren'Py project of a given size, for benchmarks")
+    ap.add_argument("output", type=pathlib.Path, help="The directory to write the project to")
+    ap.add_argument("--lines", type=parse_size, default=10000, help="About how many lines of .rpy files to write, like 10k, 100k or 1M (default: %(default)s)")
+    ap.add_argument("--seed", type=int, default=0, help="The seed of the random generator; the same seed gives the same project (default: %(default)s)")
+    ap.add_argument("--file-lines", type=int, default=500, help="About how many lines each .rpy file has (default: %(default)s)")
+    ap.add_argument("--force", action="store_true", help="Replace the output directory if it already exists")
+    args = ap.parse_args()
+
+    if args.output.exists() and any(args.output.iterdir()):
+        if not args.force:
+            raise SystemExit(f"Error: {args.output} isn't empty. Pass --force to replace it.")
+
+        shutil.rmtree(args.output)
+
+    start = time.perf_counter()
+
+    writer = ProjectWriter(args.output, args.seed, args.lines, args.file_lines)
+    writer.generate()
+
+    print(f"Wrote {writer.files} script files, {writer.lines} lines, and {writer.assets} asset files, to {args.output} in {time.perf_counter() - start:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import json
+import pathlib
+import re._constants as sre_constants
+import statistics
+from typing import Any
+
+import reachability
+import regex_ast
+
+from build_graph import BuildGraph, BuildStep
+from build_manifest import BuildManifest
+from syntax_to_token_pattern import ROOT, TOKEN_PATTERN_SOURCES, get_grammar_files, get_match_str
+
+# Bump this whenever the layout of the report changes, so reports of different
+# layouts aren't compared by mistake.
+METRICS_VERSION = 1
+
+# The keys of a pattern that hold a regex.
+REGEX_KEYS = ("match", "begin", "end", "while")
+
+
+def distribution(values: list[int]) -> dict[str, Any]:
+    """
+    Summarizes a list of values, like the lengths of the regexes of a grammar.
+    """
+
+    if not values:
+        return {"count": 0}
+
+    values = sorted(values)
+
+    return {
+        "count": len(values),
+        "min": values[0],
+        "median": statistics.median(values),
+        "p90": values[(len(values) - 1) * 9 // 10],
+        "max": values[-1],
+        "total": sum(values),
+    }
+
+
+def count_alternatives(regex: regex_ast.ParsedRegex) -> int:
+    """
+    Returns the number of paths through the alternations of a regex, counting
+    each alternation as one path per alternative. A regex without alternations
+    has one.
+    """
+
+    return 1 + sum(len(av[1]) - 1 for op, av in regex_ast.walk(regex.tree) if op is sre_constants.BRANCH)
+
+
+def max_include_depth(grammars: dict[str, dict[str, Any]], scope: str) -> int:
+    """
+    Returns how many includes it takes to reach the rule that is furthest from
+    the top-level patterns of a grammar, following includes across grammars.
+    """
+
+    depth: dict[reachability.Rule, int] = {(scope, None): 0}
+    pending: list[reachability.Rule] = [(scope, None)]
+
+    # Breadth first, so each rule gets the smallest number of includes it can be reached with.
+    while pending:
+        next_pending: list[reachability.Rule] = []
+
+        for rule in pending:
+            rule_scope, name = rule
+            grammar = grammars.get(rule_scope)
+
+            if grammar is None:
+                continue
+
+            value = grammar.get("patterns", []) if name is None else grammar.get("repository", {}).get(name)
+
+            for include in reachability.iter_includes(value):
+                for target in reachability.resolve_include(rule_scope, include):
+                    if target not in depth:
+                        depth[target] = depth[rule] + 1
+                        next_pending.append(target)
+
+        pending = next_pending
+
+    return max(depth.values())
+
+
+def grammar_metrics(grammars: dict[str, dict[str, Any]], scope: str) -> dict[str, Any]:
+    """
+    Returns the size and complexity of the grammar with `scope`.
+    """
+
+    grammar = grammars[scope]
+
+    counts = {"patterns": 0, "match_patterns": 0, "range_patterns": 0, "repo_patterns": 0, "includes": 0, "captures": 0}
+    regex_lengths: list[int] = []
+    regex_alternatives: list[int] = []
+
+    def visit(value: dict[str, Any]):
+        if "include" in value:
+            counts["includes"] += 1
+            return
+
+        counts["patterns"] += 1
+
+        if "begin" in value:
+            counts["range_patterns"] += 1
+        elif "match" in value:
+            counts["match_patterns"] += 1
+        else:
+            counts["repo_patterns"] += 1
+
+        for key in REGEX_KEYS:
+            if isinstance(value.get(key), str):
+                # Measured as the JavaScript regex the tokenizer runs.
+                literal, _ = get_match_str(value[key], None, is_end=key == "end")
+                regex_lengths.append(len(literal))
+
+                parsed = regex_ast.parse_literal(literal)
+                if parsed is not None:
+                    regex_alternatives.append(count_alternatives(parsed))
+
+        for captures_key in ("captures", "beginCaptures", "endCaptures"):
+            for capture in value.get(captures_key, {}).values():
+                counts["captures"] += 1
+
+                for pattern in capture.get("patterns", []):
+                    visit(pattern)
+
+        for pattern in value.get("patterns", []):
+            visit(pattern)
+
+    for pattern in grammar.get("patterns", []):
+        visit(pattern)
+
+    for value in grammar.get("repository", {}).values():
+        visit(value)
+
+    return {
+        "scope": scope,
+        "repository_entries": len(grammar.get("repository", {})),
+        **counts,
+        "max_include_depth": max_include_depth(grammars, scope),
+        "regex_length": distribution(regex_lengths),
+        "regex_alternatives": distribution(regex_alternatives),
+    }
+
+
+def file_size(path: pathlib.Path) -> int | None:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def create_report(graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep], options: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the metrics of every grammar that token patterns are generated for,
+    the size and generation time of every generated file, and the time of each
+    stage of the build graph. The time of a step that was up to date is the
+    time it took when it last ran. `options` are the options the graph was
+    created with, and are included as is.
+    """
+
+    grammars = reachability.load_grammars(get_grammar_files())
+
+    def step_time(path: pathlib.Path) -> float | None:
+        if path not in graph.producers:
+            return None
+
+        return manifest.get(path).get("time")
+
+    report_grammars: dict[str, Any] = {}
+
+    for language, source_file, output_file in TOKEN_PATTERN_SOURCES:
+        with open(ROOT / source_file, "r") as file:
+            scope = json.load(file)["scopeName"]
+
+        metrics = grammar_metrics(grammars, scope)
+
+        metrics["json_size"] = file_size(ROOT / source_file)
+        metrics["token_pattern_size"] = file_size(ROOT / output_file) if ROOT / output_file in graph.producers else None
+        metrics["time"] = {
+            "json": step_time(ROOT / source_file),
+            "token_patterns": step_time(ROOT / output_file),
+        }
+
+        report_grammars[language] = metrics
+
+    steps: list[dict[str, Any]] = []
+    stages: list[dict[str, Any]] = []
+
+    for i, stage in enumerate(graph.stages):
+        for step in stage:
+            steps.append({
+                "output": manifest.key(step.output),
+                "stage": i,
+                "size": file_size(step.output),
+                "time": manifest.get(step.output).get("time"),
+                "changed": step in changed,
+            })
+
+        stages.append({
+            "outputs": [manifest.key(step.output) for step in stage],
+            "time": graph.stage_times[i] if i < len(graph.stage_times) else None,
+        })
+
+    return {
+        "version": METRICS_VERSION,
+        "options": options,
+        "grammars": report_grammars,
+        "steps": steps,
+        "stages": stages,
+        "total": {
+            "patterns": sum(i["patterns"] for i in report_grammars.values()),
+            "regexes": sum(i["regex_length"]["count"] for i in report_grammars.values()),
+            "size": sum(i["size"] or 0 for i in steps),
+            "time": sum(graph.stage_times),
+        },
+    }
+
+
+def write_report(path: pathlib.Path, graph: BuildGraph, manifest: BuildManifest, changed: list[BuildStep], options: dict[str, Any]):
+    with open(path, "w") as file:
+        json.dump(create_report(graph, manifest, changed, options), file, indent=2)
+        file.write("\n")
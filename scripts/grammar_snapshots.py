@@ -0,0 +1,388 @@
+import argparse
+import difflib
+import json
+import pathlib
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import textmate
+
+from parallel import default_jobs, parallel_map
+from tokenize_files import EXTENSION_SCOPES, find_files
+
+ROOT = pathlib.Path(__file__).parent.parent
+SCRIPTS = pathlib.Path(__file__).parent
+
+DEFAULT_CORPUS = ROOT / "tests" / "grammar"
+
+# The time each sample took to tokenize when the baseline was recorded, as a
+# multiple of the time the calibration sample took in the same run, so it
+# doesn't depend on the machine and is checked in.
+DEFAULT_TIMINGS_PATH = DEFAULT_CORPUS / "timings.json"
+
+# A fixed grammar and sample that are tokenized along with the samples, to
+# measure how fast the machine is right now. They don't change with the
+# grammars, so a grammar that gets slower shows up as a sample that takes more
+# calibration times than it used to.
+CALIBRATION_SCOPE = "source.calibration"
+
+CALIBRATION_GRAMMAR = {
+    "scopeName": CALIBRATION_SCOPE,
+    "patterns": [{"include": "#statement"}],
+    "repository": {
+        "statement": {
+            "patterns": [
+                {"name": "comment.line.calibration", "match": r"#.*$"},
+                {
+                    "name": "string.quoted.double.calibration",
+                    "begin": r'"',
+                    "end": r'"',
+                    "patterns": [{"name": "constant.character.escape.calibration", "match": r"\\."}],
+                },
+                {
+                    "match": r"^\s*(label|show|jump|call)\s+(\w+)",
+                    "captures": {"1": {"name": "keyword.calibration"}, "2": {"name": "entity.name.calibration"}},
+                },
+                {"name": "constant.numeric.calibration", "match": r"\b\d+(?:\.\d+)?\b"},
+                {"begin": r"\(", "end": r"\)", "patterns": [{"include": "#statement"}]},
+                {"name": "keyword.operator.calibration", "match": r"[-+*/=<>]=?"},
+                {"name": "variable.calibration", "match": r"\b[a-z_]\w*\b"},
+            ],
+        },
+    },
+}
+
+CALIBRATION_LINES = [
+    "label start:",
+    "    # A comment, with \"quotes\" and (parentheses).",
+    "    show eileen happy at left",
+    "    e \"Hello, \\\"world\\\", it's day [day].\"",
+    "    $ points = max(points + 1, (day * 2) - 3.5)",
+    "    call chapter_2",
+    "    jump ending",
+] * 40
+
+# The registry of the calibration grammar, in each worker process.
+calibration_registry: textmate.Registry | None = None
+
+SNAPSHOT_SUFFIX = ".snap"
+
+# The registry of each worker process, with the modification times of the
+# grammars it was loaded from, so it is loaded again after a regeneration.
+registries: dict[pathlib.Path, tuple[tuple[int, ...], textmate.Registry]] = {}
+
+
+@dataclass(frozen=True)
+class Shard:
+    paths: list[pathlib.Path]
+    syntaxes: pathlib.Path
+    grammar_times: tuple[int, ...]
+
+    # How many times each file is tokenized. The fastest time counts.
+    repeat: int
+
+
+@dataclass
+class SnapshotResult:
+    path: pathlib.Path
+    snapshot: str = ""
+    time: float = 0.0
+
+    # The fastest time of the calibration sample, in the same rounds as `time`.
+    calibration: float = 0.0
+
+    # The grammar problems found while tokenizing, like includes that don't exist.
+    errors: list[str] = field(default_factory=list[str])
+
+
+def grammar_times(syntaxes: pathlib.Path) -> tuple[int, ...]:
+    return tuple(i.stat().st_mtime_ns for i in sorted(syntaxes.glob("*.json")))
+
+
+def get_registry(syntaxes: pathlib.Path, times: tuple[int, ...]) -> textmate.Registry:
+    cached = registries.get(syntaxes)
+
+    if cached is None or cached[0] != times:
+        cached = registries[syntaxes] = (times, textmate.Registry.from_directory(syntaxes))
+
+    return cached[1]
+
+
+def get_calibration_grammar() -> textmate.Grammar:
+    global calibration_registry
+
+    if calibration_registry is None:
+        calibration_registry = textmate.Registry({CALIBRATION_SCOPE: CALIBRATION_GRAMMAR})
+
+    return calibration_registry.grammar(CALIBRATION_SCOPE)
+
+
+def snapshot_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_name(path.name + SNAPSHOT_SUFFIX)
+
+
+def format_snapshot(lines: list[str], tokens: list[list[textmate.Token]], root: str) -> str:
+    """
+    Returns the snapshot of a tokenized file. Each line of the file is written
+    after a ">", followed by a line for each token that has a scope other than
+    `root`, with a "^" under each of its characters, and its scopes. Adjacent
+    tokens with the same scopes are written as one.
+    """
+
+    rv: list[str] = []
+
+    for line, line_tokens in zip(lines, tokens):
+        rv.append(f">{line}")
+
+        merged: list[list[Any]] = []
+
+        for token in line_tokens:
+            if merged and merged[-1][1] == token.start and merged[-1][2] == token.scopes:
+                merged[-1][1] = token.end
+            else:
+                merged.append([token.start, token.end, token.scopes])
+
+        for start, end, scopes in merged:
+            names = [i for i in scopes if i != root]
+
+            if names:
+                rv.append(f"#{' ' * start}{'^' * (end - start)} {' '.join(names)}")
+
+    return "\n".join(rv) + "\n"
+
+
+def snapshot_shard(shard: Shard) -> list[SnapshotResult]:
+    registry = get_registry(shard.syntaxes, shard.grammar_times)
+    rv = [SnapshotResult(i, time=float("inf")) for i in shard.paths]
+    files: list[tuple[list[str], str]] = []
+
+    for path in shard.paths:
+        with open(path, "r", encoding="utf-8") as file:
+            files.append((textmate.split_lines(file.read()), EXTENSION_SCOPES[path.suffix]))
+
+    calibration_grammar = get_calibration_grammar()
+    calibration = float("inf")
+
+    # Every file is tokenized once per round, rather than `repeat` times in a
+    # row, so a burst of load on the machine only slows down some of the times
+    # of each file, and the fastest is still a good one. The first time
+    # includes compiling the regexes the file needs. The calibration sample is
+    # part of every round, so it sees the same load as the files.
+    for _ in range(shard.repeat):
+        start = time.process_time()
+        for _ in textmate.tokenize_lines(calibration_grammar, CALIBRATION_LINES):
+            pass
+        calibration = min(calibration, time.process_time() - start)
+
+        for result, (lines, scope) in zip(rv, files):
+            grammar = registry.grammar(scope)
+
+            # CPU time, so workers that share a core don't slow each other down.
+            start = time.process_time()
+            tokens = [i for i, _ in textmate.tokenize_lines(grammar, lines)]
+            result.time = min(result.time, time.process_time() - start)
+
+            if not result.snapshot:
+                result.snapshot = format_snapshot(lines, tokens, scope)
+                result.errors = list(grammar.errors)
+
+    for result in rv:
+        result.calibration = calibration
+
+    return rv
+
+
+def make_shards(paths: list[pathlib.Path], count: int, syntaxes: pathlib.Path, repeat: int) -> list[Shard]:
+    """
+    Splits `paths` into up to `count` shards of about the same total size,
+    largest files first.
+    """
+
+    count = max(1, min(count, len(paths)))
+    groups: list[list[pathlib.Path]] = [[] for _ in range(count)]
+    sizes = [0] * count
+
+    for path in sorted(paths, key=lambda i: i.stat().st_size, reverse=True):
+        smallest = sizes.index(min(sizes))
+        groups[smallest].append(path)
+        sizes[smallest] += path.stat().st_size
+
+    times = grammar_times(syntaxes)
+    return [Shard(sorted(i), syntaxes, times, repeat) for i in groups if i]
+
+
+def load_timings(path: pathlib.Path) -> dict[str, float]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def relative(path: pathlib.Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def check_snapshots(
+    paths: list[pathlib.Path],
+    syntaxes: pathlib.Path = ROOT / "syntaxes",
+    jobs: int | None = None,
+    repeat: int = 10,
+    update: bool = False,
+    timings_path: pathlib.Path = DEFAULT_TIMINGS_PATH,
+    update_timings: bool = False,
+    max_slowdown: float = 1.5,
+    min_slowdown_ms: float = 2.0,
+) -> bool:
+    """
+    Tokenizes the samples in `paths` and compares them to their snapshots,
+    printing a diff for each that differs. With `update`, the snapshots are
+    written instead.
+
+    The time each sample took, in calibration times, is compared to the one in
+    `timings_path`. A sample that is more than `max_slowdown` times, and
+    `min_slowdown_ms`, slower than that predicts fails the check. Samples that
+    have no timing yet are reported, and added, and `update_timings` records
+    every time again. Returns True if the check passed.
+    """
+
+    files = find_files(paths)
+    if not files:
+        print("No samples to check.")
+        return True
+
+    # Workers that share a core make each other slower, even in CPU time, so
+    # there are never more than there are cores.
+    jobs = min(jobs or default_jobs(), default_jobs())
+
+    start = time.perf_counter()
+    results = [j for i in parallel_map(snapshot_shard, make_shards(files, jobs, syntaxes.resolve(), repeat), jobs) for j in i]
+
+    results.sort(key=lambda i: i.path)
+
+    timings = load_timings(timings_path)
+
+    def expected_ms(result: SnapshotResult) -> float | None:
+        """
+        Returns how long `result` should have taken on the machine as fast as
+        it was in this run, or None if it has no baseline.
+        """
+
+        baseline = timings.get(relative(result.path))
+        return None if baseline is None else baseline * result.calibration * 1000
+
+    def is_slower(result: SnapshotResult) -> bool:
+        expected = expected_ms(result)
+        ms = result.time * 1000
+
+        return expected is not None and not update_timings and ms > expected * max_slowdown and ms - expected > min_slowdown_ms
+
+    # A slowdown has to happen again to count, since the machine can simply
+    # have been busy.
+    slower = [i for i in results if is_slower(i)]
+
+    if slower:
+        again = {i.path: i for i in snapshot_shard(make_shards([i.path for i in slower], 1, syntaxes.resolve(), repeat * 2)[0])}
+
+        for i in slower:
+            if again[i.path].time / again[i.path].calibration < i.time / i.calibration:
+                i.time = again[i.path].time
+                i.calibration = again[i.path].calibration
+
+    elapsed = time.perf_counter() - start
+
+    passed = True
+    errors: list[str] = []
+    missing: list[str] = []
+
+    for result in results:
+        name = relative(result.path)
+        path = snapshot_path(result.path)
+        errors.extend(i for i in result.errors if i not in errors)
+
+        try:
+            expected = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            expected = None
+
+        if update:
+            if expected != result.snapshot:
+                path.write_text(result.snapshot, encoding="utf-8")
+                print(f"Wrote {relative(path)}.")
+
+        elif expected is None:
+            print(f"{name}: no snapshot. Run with --update to create it.")
+            passed = False
+
+        elif expected != result.snapshot:
+            diff = difflib.unified_diff(expected.splitlines(), result.snapshot.splitlines(), relative(path), "tokenized", lineterm="")
+            print("\n".join(diff))
+            passed = False
+
+        ms = result.time * 1000
+        expected = expected_ms(result)
+
+        if expected is None or update_timings:
+            timings[name] = round(result.time / result.calibration, 4)
+
+        if update_timings:
+            status = ""
+        elif expected is None:
+            status = " (no baseline)"
+            missing.append(name)
+        elif is_slower(result):
+            status = f" SLOWER than {expected:.1f}ms"
+            passed = False
+        else:
+            status = f" ({ms / expected:.2f}x)" if expected else ""
+
+        print(f"{name}: {ms:.1f}ms{status}")
+
+    for i in errors:
+        print(f"Warning: {i}")
+
+    if missing:
+        print(f"Warning: {len(missing)} samples have no baseline in {relative(timings_path)}, so their speed wasn't checked. The times of this run are recorded as their baseline if the check passes.")
+
+    if (passed and missing) or update_timings:
+        timings_path.write_text(json.dumps(timings, indent=2, sort_keys=True) + "\n")
+
+    print(f"{len(results)} samples {'passed' if passed else 'FAILED'}, in {elapsed:.2f}s.")
+
+    return passed
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compare the tokens of the grammar samples to their snapshots")
+    ap.add_argument("paths", nargs="*", type=pathlib.Path, help="The samples, or directories of samples, to check (default: tests/grammar/)")
+    ap.add_argument("-j", "--jobs", type=int, default=default_jobs(), help="The number of worker processes to use (default: %(default)s)")
+    ap.add_argument("--syntaxes", type=pathlib.Path, default=ROOT / "syntaxes", help="The directory of the .json grammars (default: %(default)s)")
+    ap.add_argument("--update", action="store_true", help="Write the snapshots that differ, instead of failing")
+    ap.add_argument("--repeat", type=int, default=10, help="How many times to tokenize each sample; the fastest time counts (default: %(default)s)")
+    ap.add_argument("--timings", type=pathlib.Path, default=DEFAULT_TIMINGS_PATH, help="The file the baseline times, in calibration times, are kept in (default: %(default)s)")
+    ap.add_argument("--update-timings", action="store_true", help="Record the times of this run as the baseline")
+    ap.add_argument("--max-slowdown", type=float, default=1.5, help="Fail if a sample gets this many times slower than its baseline (default: %(default)s)")
+    ap.add_argument("--min-slowdown-ms", type=float, default=2.0, help="Ignore slowdowns of fewer milliseconds than this, which are noise (default: %(default)s)")
+    args = ap.parse_args()
+
+    passed = check_snapshots(
+        args.paths or [DEFAULT_CORPUS],
+        args.syntaxes,
+        args.jobs,
+        max(1, args.repeat),
+        args.update,
+        args.timings,
+        args.update_timings,
+        args.max_slowdown,
+        args.min_slowdown_ms,
+    )
+
+    if not passed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 import argparse
 import json
-import yaml
 import pathlib
 
+import yaml_backend
+
 
 INTEGER_KEYS = {str(i): i for i in range(10)}
 
@@ -28,7 +29,7 @@ def main():
         destination = pathlib.Path(i).with_suffix(".yaml")
 
         data = update_object(data)
-        yaml_data = yaml.dump(data, indent=2, sort_keys=False)
+        yaml_data = yaml_backend.dump(data)
 
         destination = pathlib.Path(i).with_suffix(".yaml")
 
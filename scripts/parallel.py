@@ -0,0 +1,30 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def parallel_map(function: Callable[[T], R], items: Iterable[T], jobs: int | None = None) -> list[R]:
+    """
+    Calls `function` on each of `items` in a pool of worker processes, and
+    returns the results in the order of `items`, so the outcome does not depend
+    on which worker finished first.
+
+    `function` must be a module-level function, and its arguments and results
+    must be picklable. With one job or one item, this runs in-process.
+    """
+
+    items = list(items)
+    jobs = min(jobs or default_jobs(), len(items))
+
+    if jobs <= 1:
+        return [function(i) for i in items]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(function, items))
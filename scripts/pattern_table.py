@@ -0,0 +1,446 @@
+import json
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any
+
+import reachability
+
+from build_graph import BuildStep
+from syntax_to_token_pattern import (
+    INDEX_FILE,
+    PATTERN_STATE_VERSION,
+    ROOT,
+    TOKEN_PATTERN_SOURCES,
+    GeneratorState,
+    camelCase,
+    find_reachable_rules,
+    get_end_state,
+    get_grammar_files,
+    get_match_str,
+    get_regex_fields,
+    get_timestamp,
+    get_token_type,
+)
+
+SCRIPTS = pathlib.Path(__file__).parent
+
+TABLE_FILE = "src/tokenizer/generated/pattern-table.g.ts"
+
+# Changes to these files invalidate the pattern table.
+GENERATOR_INPUTS = [
+    pathlib.Path(__file__),
+    SCRIPTS / "syntax_to_token_pattern.py",
+    SCRIPTS / "reachability.py",
+    SCRIPTS / "regex_ast.py",
+]
+
+CAPTURE_KEYS = ("captures", "beginCaptures", "endCaptures")
+
+
+@dataclass(eq=False)
+class TableRow:
+    """
+    A pattern in the table. Rows refer to each other directly, and the
+    references become row indices when the table is written.
+    """
+
+    value: dict[str, Any]
+    debug_name: str
+
+    # The patterns of a repo pattern, with the includes resolved.
+    patterns: list["TableRow"] = field(default_factory=list["TableRow"])
+
+    # The repo pattern that holds the patterns of a range pattern.
+    patterns_repo: "TableRow | None" = None
+
+    # The rows of the captures, by capture key and group.
+    captures: dict[str, dict[str, "TableRow"]] = field(default_factory=dict[str, dict[str, "TableRow"]])
+
+    index: int = -1
+
+    def is_range(self) -> bool:
+        return "begin" in self.value
+
+    def is_repo(self) -> bool:
+        return "begin" not in self.value and "match" not in self.value
+
+
+class PatternTable:
+    """
+    Every pattern of every grammar in TOKEN_PATTERN_SOURCES as a flat list of
+    rows, with the includes resolved to the rows they refer to.
+
+    The rows are added depth first, starting at the base patterns of the renpy
+    grammar, so patterns are close to the patterns they include. Rows that can
+    be scanned come first, and are followed by the rows of captures without
+    patterns, which the tokenizer never scans, so they don't need a pattern id.
+    """
+
+    def __init__(self, grammars: dict[str, dict[str, Any]]):
+        # The repository of each language, by the camel case name of each entry.
+        self.repositories = {
+            language: {camelCase(k): v for k, v in grammar.get("repository", {}).items()}
+            for language, grammar in grammars.items()
+        }
+
+        self.rows: list[TableRow] = []
+        self.capture_rows: list[TableRow] = []
+        self.entries: dict[tuple[str, str], TableRow] = {}
+
+        # Includes that don't refer to an existing pattern.
+        self.unresolved: list[str] = []
+
+        base_patterns = self.entry("renpy", "basePatterns")
+        if base_patterns is None:
+            raise ValueError("The renpy grammar has no basePatterns.")
+
+        self.base_patterns = base_patterns
+
+        # Keep the patterns that nothing includes, like the other output format does.
+        for language, repository in self.repositories.items():
+            for name in repository:
+                self.entry(language, name)
+
+        for i, row in enumerate(self.rows + self.capture_rows):
+            row.index = i
+
+    @property
+    def pattern_count(self) -> int:
+        return len(self.rows)
+
+    def entry(self, language: str, name: str) -> TableRow | None:
+        key = (language, name)
+
+        if key not in self.entries:
+            repository = self.repositories.get(language, {})
+            if name not in repository:
+                return None
+
+            self.add_pattern(language, repository[name], name, key)
+
+        return self.entries[key]
+
+    def resolve(self, language: str, include: str) -> TableRow | None:
+        if include.startswith("#"):
+            return self.entry(language, camelCase(include[1:]))
+
+        source, _, reference = include.partition("#")
+        include_language = source.split(".")[-1]
+
+        # An include of a whole grammar refers to the entry named after the language, as it does in index.ts.
+        return self.entry(include_language, camelCase(reference) if reference else include_language)
+
+    def add_pattern(self, language: str, value: dict[str, Any], debug_name: str, key: tuple[str, str] | None = None) -> TableRow:
+        row = TableRow(value, debug_name)
+        self.rows.append(row)
+
+        # Register the entry before adding the patterns, so patterns that include it refer to this row.
+        if key is not None:
+            self.entries[key] = row
+
+        if row.is_range() and "patterns" in value:
+            row.patterns_repo = TableRow({"patterns": value["patterns"]}, f"{debug_name}.patterns")
+            self.rows.append(row.patterns_repo)
+
+        for captures_key in CAPTURE_KEYS:
+            for group, capture in value.get(captures_key, {}).items():
+                row.captures.setdefault(captures_key, {})[group] = self.add_capture(language, capture, f"{debug_name}.{captures_key}![{group}]")
+
+        if "patterns" in value:
+            (row.patterns_repo or row).patterns = self.add_patterns(language, value["patterns"], debug_name)
+
+        return row
+
+    def add_capture(self, language: str, value: dict[str, Any], debug_name: str) -> TableRow:
+        if "patterns" in value:
+            return self.add_pattern(language, value, debug_name)
+
+        row = TableRow(value, debug_name)
+        self.capture_rows.append(row)
+        return row
+
+    def add_patterns(self, language: str, patterns: list[dict[str, Any]], debug_name: str) -> list[TableRow]:
+        rv: list[TableRow] = []
+
+        for i, pattern in enumerate(patterns):
+            if "include" not in pattern:
+                rv.append(self.add_pattern(language, pattern, f"{debug_name}.patterns![{i}]"))
+                continue
+
+            target = self.resolve(language, pattern["include"])
+            if target is None:
+                self.unresolved.append(f"{pattern['include']} (in {debug_name}.patterns![{i}])")
+                continue
+
+            rv.append(target)
+
+        return rv
+
+
+def find_repo_cycles(rows: list[TableRow]) -> list[list[TableRow]]:
+    """
+    Sorts the repo patterns topologically by the repo patterns they include,
+    and returns the cycles that prevent that. Scanning a repo pattern scans the
+    patterns it includes without consuming any input, so a cycle of repo
+    patterns never ends. Cycles through range and match patterns are fine.
+    """
+
+    repos = [i for i in rows if i.is_repo()]
+
+    predecessors: dict[TableRow, list[TableRow]] = {i: [] for i in repos}
+    indegree: dict[TableRow, int] = {i: 0 for i in repos}
+
+    for row in repos:
+        for child in row.patterns:
+            if child.is_repo():
+                predecessors[child].append(row)
+                indegree[child] += 1
+
+    # Kahn's algorithm. The rows it can't remove are in a cycle, or only included by one.
+    def remove_sources(remaining: set[TableRow]):
+        queue = [i for i in remaining if indegree[i] == 0]
+        while queue:
+            row = queue.pop()
+            remaining.discard(row)
+
+            for child in row.patterns:
+                if child in remaining:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        queue.append(child)
+
+    remaining = set(repos)
+    remove_sources(remaining)
+
+    cycles: list[list[TableRow]] = []
+
+    # Every remaining row has a remaining predecessor, so walking back from one always ends up in a cycle.
+    while remaining:
+        path: list[TableRow] = []
+        row = min(remaining, key=lambda i: i.index)
+
+        while row not in path:
+            path.append(row)
+            row = next(i for i in predecessors[row] if i in remaining)
+
+        cycle = path[path.index(row):]
+        cycle.reverse()
+        cycles.append(cycle)
+
+        # Report each cycle once, and drop the rows that were only remaining because of it.
+        for i in cycle:
+            remaining.discard(i)
+            for child in i.patterns:
+                if child in remaining:
+                    indegree[child] -= 1
+
+        remove_sources(remaining)
+
+    return cycles
+
+
+def format_captures(captures: dict[str, TableRow]) -> str:
+    return "{ " + ", ".join(f"{group}: {row.index}" for group, row in captures.items()) + " }"
+
+
+def format_row(state: GeneratorState, row: TableRow, is_base: bool = False) -> list[str]:
+    """
+    Returns the lines of a single row of the table. Only rows with a regex
+    have a debug name, except the base patterns, where tokenizing starts.
+    """
+
+    value = row.value
+    fields: list[str] = []
+    lines: list[str] = []
+
+    if is_base or "match" in value or "begin" in value or "end" in value:
+        fields.append(f"debugName: \"{row.debug_name}\"")
+
+    if "name" in value:
+        fields.append(f"token: {get_token_type(state, value['name'], row.debug_name)}")
+
+    if "contentName" in value:
+        fields.append(f"contentToken: {get_token_type(state, value['contentName'], row.debug_name)}")
+
+    if "match" in value:
+        match = get_match_str(value["match"], value.get("captures"))[0]
+        fields.append(f"match: {match}")
+        fields.extend(get_regex_fields(state, match))
+
+    if "begin" in value:
+        begin = get_match_str(value["begin"], value.get("beginCaptures"))[0]
+        fields.append(f"begin: {begin}")
+        fields.extend(get_regex_fields(state, begin))
+
+    if "end" in value:
+        end, has_backrefs = get_match_str(value["end"], value.get("endCaptures"), is_end=True)
+        fields.append(f"end: {end}")
+
+        if has_backrefs:
+            lines.append("    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime")
+
+        has_backref, end_not_g = get_end_state(end)
+
+        if has_backref:
+            fields.append("hasBackref: true")
+
+        if end_not_g:
+            fields.append("endNotG: true")
+
+    for captures_key in CAPTURE_KEYS:
+        if captures_key in row.captures:
+            fields.append(f"{captures_key}: {format_captures(row.captures[captures_key])}")
+
+    if row.patterns_repo is not None:
+        fields.append(f"patternsRepo: {row.patterns_repo.index}")
+    elif "patterns" in value:
+        fields.append(f"patterns: [{', '.join(str(i.index) for i in row.patterns)}]")
+
+    lines.append(f"    /* {row.index} */ {{ {', '.join(fields)} }},")
+    return lines
+
+
+def load_grammars(reachable: set[reachability.Rule] | None = None) -> dict[str, dict[str, Any]]:
+    grammars: dict[str, dict[str, Any]] = {}
+
+    for language, source_file, _ in TOKEN_PATTERN_SOURCES:
+        with open(ROOT / source_file, "r") as file:
+            grammars[language] = json.load(file)
+
+        if reachable is not None:
+            grammars[language], _ = reachability.strip_unreachable(grammars[language], reachable)
+
+    return grammars
+
+
+def generate_table(timestamp: str | None = None, reachable: set[reachability.Rule] | None = None) -> tuple[PatternTable, GeneratorState]:
+    """
+    Writes the pattern table of every grammar in TOKEN_PATTERN_SOURCES. Raises a
+    ValueError if it has a cycle of repo patterns, or scopes that can't be
+    converted to a token type. Includes of patterns that don't exist are left
+    out, and reported as a warning. If `reachable` is given, the repository
+    entries that aren't in it are left out.
+    """
+
+    table = PatternTable(load_grammars(reachable))
+
+    cycles = find_repo_cycles(table.rows)
+    if cycles:
+        raise ValueError("The patterns include themselves without consuming any input:\n" + "\n".join(
+            "    " + " -> ".join(i.debug_name for i in cycle + cycle[:1]) for cycle in cycles
+        ))
+
+    for i in table.unresolved:
+        print(f"Warning: Leaving out the include of a pattern that doesn't exist: {i}")
+
+    state = GeneratorState()
+    rows: list[str] = []
+
+    for row in table.rows + table.capture_rows:
+        rows.extend(format_row(state, row, row is table.base_patterns))
+
+    if len(state.unmapped_scopes) > 0:
+        raise ValueError("The grammars use scopes that can't be converted to a token type:\n" + "\n".join(f"    {i}" for i in state.unmapped_scopes))
+
+    lines = [
+        "// THIS FILE HAS BEEN GENERATED BY THE `pattern_table.py` GENERATOR",
+        "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.",
+        "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.",
+        f"// Last generated: {timestamp or get_timestamp()} (UTC+0)",
+        "",
+        f"import {{ {', '.join(state.used_token_types)} }} from \"src/tokenizer/renpy-tokens\";",
+        "import { PatternTableRow } from \"src/tokenizer/pattern-table\";",
+        "",
+        f"export const PATTERN_STATE_VERSION = {PATTERN_STATE_VERSION};",
+        "",
+        "// The rows before this index are patterns that can be scanned, the rest are captures without patterns",
+        f"export const PATTERN_COUNT = {table.pattern_count};",
+        "",
+        f"export const BASE_PATTERNS = {table.base_patterns.index};",
+        "",
+        "export const PATTERN_TABLE: readonly PatternTableRow[] = [",
+        *rows,
+        "];",
+        "",
+    ]
+
+    with open(ROOT / TABLE_FILE, "w") as file:
+        file.write("\n".join(lines))
+
+    return (table, state)
+
+
+def generate_index(timestamp: str | None = None):
+    lines = [
+        "// THIS FILE HAS BEEN GENERATED BY THE `pattern_table.py` GENERATOR",
+        "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.",
+        "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.",
+        f"// Last generated: {timestamp or get_timestamp()} (UTC+0)",
+        "",
+        "import { hydratePatternTable } from \"src/tokenizer/pattern-table\";",
+        "",
+        "import { BASE_PATTERNS, PATTERN_COUNT, PATTERN_TABLE } from \"./pattern-table.g\";",
+        "",
+        "const patterns = hydratePatternTable(PATTERN_TABLE, PATTERN_COUNT);",
+        "",
+        "export { PATTERN_STATE_VERSION } from \"./pattern-table.g\";",
+        "export const UNIQUE_PATTERN_COUNT = PATTERN_COUNT;",
+        "export const RenpyPatterns = { basePatterns: patterns[BASE_PATTERNS] };",
+        "",
+    ]
+
+    with open(ROOT / INDEX_FILE, "w") as file:
+        file.write("\n".join(lines))
+
+
+def generate_table_step(step: BuildStep, input_data: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    The build action for the pattern table.
+    """
+
+    table, state = generate_table(step.options["timestamp"], find_reachable_rules(step))
+    return {
+        "pattern_count": table.pattern_count,
+        "row_count": len(table.rows) + len(table.capture_rows),
+        "regex_count": state.regex_count,
+        "prefilter_count": state.prefilter_count,
+        "literal_count": state.literal_count,
+        "sticky_count": state.sticky_count,
+    }
+
+
+def generate_index_step(step: BuildStep, input_data: dict[str, dict[str, Any]]):
+    """
+    The build action for the index.ts that loads the pattern table.
+    """
+
+    generate_index(step.options["timestamp"])
+
+
+def create_build_steps(strip_unreachable: bool = False) -> list[BuildStep]:
+    """
+    Returns the build steps that generate the pattern table from the
+    .tmLanguage.json grammars, and the index.ts that loads it. These replace
+    the steps of syntax_to_token_pattern.create_build_steps(). If
+    `strip_unreachable` is True, the repository entries that no grammar can
+    reach are left out.
+    """
+
+    timestamp = get_timestamp()
+    grammar_inputs = get_grammar_files() if strip_unreachable else [ROOT / source_file for _, source_file, _ in TOKEN_PATTERN_SOURCES]
+
+    return [
+        BuildStep(
+            output=ROOT / TABLE_FILE,
+            inputs=[*grammar_inputs, *GENERATOR_INPUTS],
+            action=generate_table_step,
+            options={"timestamp": timestamp},
+            settings={"strip_unreachable": strip_unreachable},
+        ),
+        BuildStep(
+            output=ROOT / INDEX_FILE,
+            inputs=[ROOT / TABLE_FILE, pathlib.Path(__file__)],
+            action=generate_index_step,
+            options={"timestamp": timestamp},
+        ),
+    ]
@@ -0,0 +1,151 @@
+import collections
+import functools
+import itertools
+import re
+from dataclasses import dataclass
+
+import keywords
+import regex_trie
+
+# A prefix is only factored out if at least this many of the words that follow
+# it are properties in their own right. This accepts state prefixes like "hover_"
+# and "text_hover_", but rejects ones like "box_" or "gl_", that are just part of
+# the property names.
+MIN_SHARED_SUFFIXES = 10
+
+
+@dataclass
+class PropertyGroup:
+    """
+    A set of properties that consists of every combination of one of the
+    prefixes (which may be empty) followed by one of the bases.
+    """
+
+    prefixes: list[str]
+    bases: list[str]
+
+    def words(self) -> list[str]:
+        return [p + b for p in self.prefixes for b in self.bases]
+
+    def to_regex(self) -> str:
+        return regex_trie.factor_words(self.prefixes) + regex_trie.factor_words(self.bases)
+
+
+def infer_prefixes(words: set[str]) -> set[str]:
+    """
+    Finds the prefixes (ending with an underscore) that are followed by at
+    least MIN_SHARED_SUFFIXES other words.
+    """
+
+    suffixes: dict[str, set[str]] = collections.defaultdict(set)
+
+    for w in words:
+        for i, c in enumerate(w):
+            if c == "_" and i > 0:
+                suffixes[w[:i + 1]].add(w[i + 1:])
+
+    return {p for p, s in suffixes.items() if len(s & words) >= MIN_SHARED_SUFFIXES}
+
+
+def factor_properties(properties: list[str]) -> list[PropertyGroup]:
+    """
+    Splits each property into its longest inferred prefix and a base, and groups
+    the bases that occur with exactly the same prefixes, so that the properties
+    are the union of prefixes × bases over the groups.
+    """
+
+    words = set(properties)
+    prefixes = infer_prefixes(words)
+
+    base_prefixes: dict[str, set[str]] = collections.defaultdict(set)
+
+    for w in words:
+        prefix = max((p for p in prefixes if w.startswith(p) and len(w) > len(p)), key=len, default="")
+        base_prefixes[w[len(prefix):]].add(prefix)
+
+    groups: dict[frozenset[str], list[str]] = collections.defaultdict(list)
+    for base, p in base_prefixes.items():
+        groups[frozenset(p)].append(base)
+
+    rv = [PropertyGroup(sorted(p), sorted(b)) for p, b in groups.items()]
+    rv.sort(key=lambda g: (-len(g.prefixes) * len(g.bases), g.prefixes, g.bases))
+
+    return rv
+
+
+def groups_regex(groups: list[PropertyGroup]) -> str:
+    return "(?:" + "|".join(g.to_regex() for g in groups) + ")"
+
+
+def verify_factoring(properties: list[str], groups: list[PropertyGroup], regex: str):
+    """
+    Checks that the groups, and the regex made from them, accept exactly the
+    original properties. Besides every property, this tests the near misses of
+    every property, and every combination of a prefix and a base of different
+    groups. Raises a ValueError if anything differs.
+    """
+
+    words = set(properties)
+
+    expanded = [w for g in groups for w in g.words()]
+    if len(expanded) != len(words) or set(expanded) != words:
+        raise ValueError("The factored properties do not expand to the original properties.")
+
+    compiled = re.compile(regex)
+
+    all_prefixes = {p for g in groups for p in g.prefixes}
+    all_bases = {b for g in groups for b in g.bases}
+    candidates = set(regex_trie.near_misses(sorted(words)))
+    candidates.update(p + b for p in all_prefixes for b in all_bases)
+    candidates.update(words)
+
+    for i in sorted(candidates):
+        if bool(compiled.fullmatch(i)) != (i in words):
+            raise ValueError(f"{i!r} is matched differently by the factored properties regex and the original properties.")
+
+
+def expand_regex(regex: str) -> set[str]:
+    """
+    Returns every word matched by `regex`, which is a sequence of literals and
+    (possibly optional) non-capturing groups of alternatives, like the regexes
+    in keywords.property_regexes.
+    """
+
+    parts: list[list[str]] = []
+
+    for group, optional, literal in re.findall(r"\(\?:([^()]*)\)(\??)|([^()]+)", regex):
+        if literal:
+            parts.append([literal])
+        else:
+            parts.append(group.split("|") + ([""] if optional else []))
+
+    return {"".join(i) for i in itertools.product(*parts)}
+
+
+def property_words() -> list[str]:
+    """
+    Returns keywords.properties, along with the words matched by
+    keywords.property_regexes that are not in it, like "at" and "zorder".
+    """
+
+    words = set(keywords.properties)
+
+    for i in keywords.property_regexes:
+        words.update(expand_regex(i))
+
+    return sorted(words)
+
+
+@functools.cache
+def properties_regex() -> str:
+    """
+    Returns the verified, factored regex that matches the words of
+    property_words().
+    """
+
+    words = property_words()
+    groups = factor_properties(words)
+    regex = groups_regex(groups)
+    verify_factoring(words, groups, regex)
+    return regex
+
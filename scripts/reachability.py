@@ -0,0 +1,166 @@
+import json
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+# A rule of a grammar: the scope name of the grammar, and the name of a
+# repository entry, or None for the top-level patterns of the grammar.
+Rule = tuple[str, str | None]
+
+
+@dataclass
+class Reachability:
+    # Every rule that can be reached from the roots.
+    reachable: set[Rule] = field(default_factory=set[Rule])
+
+    # The repository entries that can't be reached, in the order of the grammars.
+    unreachable: list[Rule] = field(default_factory=list[Rule])
+
+    # The includes that refer to a rule that doesn't exist, as (rule, include).
+    unresolved: list[tuple[Rule, str]] = field(default_factory=list[tuple[Rule, str]])
+
+
+def format_rule(rule: Rule) -> str:
+    scope, name = rule
+    return scope if name is None else f"{scope}#{name}"
+
+
+def iter_includes(o: Any) -> Iterator[str]:
+    """
+    Yields every include in `o`, including the includes in captures.
+    """
+
+    if isinstance(o, dict):
+        if isinstance(o.get("include"), str):
+            yield o["include"]
+
+        for v in o.values():
+            yield from iter_includes(v)
+
+    elif isinstance(o, list):
+        for v in o:
+            yield from iter_includes(v)
+
+
+def resolve_include(scope: str, include: str) -> list[Rule]:
+    """
+    Returns the rules an include in the grammar with `scope` can refer to.
+    """
+
+    if include.startswith("#"):
+        return [(scope, include[1:])]
+
+    # There is no base grammar here, so $base refers to the grammar itself, like $self.
+    if include in ("$self", "$base"):
+        return [(scope, None)]
+
+    source, _, reference = include.partition("#")
+
+    if reference:
+        return [(source, reference)]
+
+    # The token pattern generators resolve an include of a whole grammar to the
+    # repository entry named after it, so that entry is reachable as well.
+    return [(source, None), (source, source.split(".")[-1])]
+
+
+def find_reachability(grammars: dict[str, dict[str, Any]], roots: Iterable[Rule] | None = None) -> Reachability:
+    """
+    Follows the includes of the grammars, by scope name, from `roots`, or from
+    the top-level patterns of every grammar if no roots are given, since each
+    of them can be loaded on its own. Includes of grammars that aren't in
+    `grammars`, like source.python, are ignored.
+    """
+
+    rv = Reachability()
+
+    if roots is None:
+        roots = [(scope, None) for scope in grammars]
+
+    pending = list(roots)
+
+    while pending:
+        rule = pending.pop()
+
+        if rule in rv.reachable:
+            continue
+
+        scope, name = rule
+        grammar = grammars.get(scope)
+
+        if grammar is None:
+            continue
+
+        value = grammar.get("patterns", []) if name is None else grammar.get("repository", {}).get(name)
+        if value is None:
+            continue
+
+        rv.reachable.add(rule)
+
+        for include in iter_includes(value):
+            targets = resolve_include(scope, include)
+
+            # The entry named after a whole grammar is optional, but the first rule has to exist.
+            target_scope, target_name = targets[0]
+            target = grammars.get(target_scope)
+
+            if target is not None and target_name is not None and target_name not in target.get("repository", {}):
+                rv.unresolved.append((rule, include))
+
+            pending.extend(targets)
+
+    for scope, grammar in grammars.items():
+        for name in grammar.get("repository", {}):
+            if (scope, name) not in rv.reachable:
+                rv.unreachable.append((scope, name))
+
+    rv.unresolved.sort(key=lambda i: (format_rule(i[0]), i[1]))
+
+    return rv
+
+
+def strip_unreachable(grammar: dict[str, Any], reachable: set[Rule]) -> tuple[dict[str, Any], list[str]]:
+    """
+    Returns a copy of `grammar` without the repository entries that aren't in
+    `reachable`, and the names of the entries that were left out.
+    """
+
+    scope = grammar["scopeName"]
+    repository: dict[str, Any] = grammar.get("repository", {})
+
+    stripped = [name for name in repository if (scope, name) not in reachable]
+    if not stripped:
+        return (grammar, [])
+
+    return ({
+        **grammar,
+        "repository": {k: v for k, v in repository.items() if (scope, k) in reachable},
+    }, stripped)
+
+
+def find_grammar_files(syntaxes: pathlib.Path) -> list[pathlib.Path]:
+    """
+    Returns the .json file of every grammar in `syntaxes`, including the files
+    that will be generated from a .tmLanguage.yaml file but don't exist yet.
+    """
+
+    rv = {i.with_suffix(".json") for i in syntaxes.glob("*.tmLanguage.yaml")}
+    rv.update(syntaxes.glob("*.json"))
+
+    return sorted(rv)
+
+
+def load_grammars(filenames: Iterable[pathlib.Path]) -> dict[str, dict[str, Any]]:
+    """
+    Loads the .json grammars in `filenames`, by their scope name.
+    """
+
+    rv: dict[str, dict[str, Any]] = {}
+
+    for i in filenames:
+        with open(i, "r") as file:
+            grammar = json.load(file)
+
+        rv[grammar["scopeName"]] = grammar
+
+    return rv
@@ -0,0 +1,690 @@
+import functools
+import re
+import re._constants as sre_constants
+import re._parser as sre_parser
+import string
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+# A set of characters that can start a match, as a bitmask: bit i is set for the
+# ASCII character i, and bit NON_ASCII for every other character.
+NON_ASCII = 128
+ANY_CHAR = (1 << (NON_ASCII + 1)) - 1
+
+# The characters JavaScript's \s matches below NON_ASCII. It also matches some
+# characters above, like U+00A0 and U+2028.
+SPACE_CHARS = " \t\n\v\f\r"
+UPPER_CHARS = string.ascii_uppercase
+LOWER_CHARS = string.ascii_lowercase
+DIGIT_CHARS = string.digits
+WORD_CHARS = UPPER_CHARS + LOWER_CHARS + DIGIT_CHARS + "_"
+
+# Matches any single character, in the Python syntax.
+ANY_CHAR_CLASS = r"\x00-\U0010ffff"
+
+# The parts of a JavaScript regex that are rewritten by to_python(). Some of them
+# are only an approximation, that matches at least what the original matches.
+JS_SYNTAX_RE = re.compile(r"\\[pP]\{[^}]*\}|\\[1-9]\d*|\\k<\w+>|\\G|\\.|\(\?<(?=[A-Za-z_])|\[\^?\]|[\[\]]")
+
+FLAGS = {
+    "i": re.IGNORECASE,
+    "m": re.MULTILINE,
+    "s": re.DOTALL,
+}
+
+
+@dataclass(frozen=True)
+class ParsedRegex:
+    """
+    A JavaScript regex, with its parse tree as produced by the Python parser.
+    """
+
+    source: str
+    flags: str
+    tree: Any
+
+    # If the source has back references, or Unicode property escapes, which to_python() rewrites.
+    has_backrefs: bool
+    has_properties: bool
+
+
+def to_python(source: str) -> tuple[str, set[str]]:
+    """
+    Rewrites the source of a JavaScript regex to the Python syntax. Unicode
+    properties and back references become patterns that match any character,
+    or any text, and \\G becomes \\A, which is also zero width. Returns the
+    rewritten source, and which of "properties" and "backrefs" it had.
+    """
+
+    in_class = False
+    found: set[str] = set()
+
+    def replace(m: re.Match[str]) -> str:
+        nonlocal in_class
+
+        token = m.group(0)
+
+        if in_class:
+            if token.startswith(("\\p", "\\P")):
+                found.add("properties")
+                return ANY_CHAR_CLASS
+
+            # A "[" in a class is a literal, but the "]" of a "[]" or "[^]" still ends the class.
+            if token.startswith("["):
+                in_class = not token.endswith("]")
+                return "\\" + token
+
+            in_class = token != "]"
+            return token
+
+        if token.startswith(("\\p", "\\P")):
+            found.add("properties")
+            return f"[{ANY_CHAR_CLASS}]"
+
+        if token == "[^]":
+            return f"[{ANY_CHAR_CLASS}]"
+
+        if token == "[]":
+            return "(?!)"
+
+        if token == "[":
+            in_class = True
+            return token
+
+        if token[1:2].isdigit() or token.startswith("\\k"):
+            # The tokenizer replaces \0 in an end regex with the text of the begin match, but to
+            # JavaScript it is just a NUL character, so it isn't a back reference of the regex.
+            if token != "\\0":
+                found.add("backrefs")
+            return f"(?:[{ANY_CHAR_CLASS}]*)"
+
+        if token == "\\G":
+            return "\\A"
+
+        if token == "(?<":
+            return "(?P<"
+
+        return token
+
+    return (JS_SYNTAX_RE.sub(replace, source), found)
+
+
+@functools.cache
+def parse(source: str, flags: str) -> ParsedRegex | None:
+    """
+    Parses the source of a JavaScript regex with the given flags. Returns None
+    if it can't be parsed.
+    """
+
+    python_flags = 0
+    for i in flags:
+        python_flags |= FLAGS.get(i, 0)
+
+    python_source, found = to_python(source)
+
+    try:
+        tree = sre_parser.parse(python_source, python_flags)
+    except (re.error, OverflowError, RecursionError):
+        return None
+
+    return ParsedRegex(source, flags, tree, "backrefs" in found, "properties" in found)
+
+
+def parse_literal(literal: str) -> ParsedRegex | None:
+    """
+    Parses a regex literal, like "/abc/gm".
+    """
+
+    end = literal.rindex("/")
+    return parse(literal[1:end], literal[end + 1:])
+
+
+def char_set(chars: str) -> int:
+    rv = 0
+    for c in chars:
+        rv |= 1 << ord(c)
+    return rv
+
+
+def char_range(lo: int, hi: int) -> int:
+    """
+    Returns the set of the characters from `lo` to `hi`, inclusive.
+    """
+
+    rv = 0
+
+    if lo < NON_ASCII:
+        rv |= ((1 << (min(hi, NON_ASCII - 1) + 1)) - 1) & ~((1 << lo) - 1)
+
+    if hi >= NON_ASCII:
+        rv |= 1 << NON_ASCII
+
+    return rv
+
+
+def ignore_case(chars: int) -> int:
+    """
+    Adds the other case of every ASCII letter in `chars`. Characters above
+    NON_ASCII can fold to letters (like U+212A, the Kelvin sign, to "k"), so a
+    set with letters also gets the NON_ASCII bit.
+    """
+
+    upper = chars & char_set(UPPER_CHARS)
+    lower = chars & char_set(LOWER_CHARS)
+
+    if not upper and not lower:
+        return chars
+
+    # The lower case letters are 32 above the upper case ones.
+    return chars | upper << 32 | lower >> 32 | 1 << NON_ASCII
+
+
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: char_set(DIGIT_CHARS),
+    sre_constants.CATEGORY_NOT_DIGIT: ANY_CHAR & ~char_set(DIGIT_CHARS),
+    sre_constants.CATEGORY_WORD: char_set(WORD_CHARS),
+    sre_constants.CATEGORY_NOT_WORD: ANY_CHAR & ~char_set(WORD_CHARS),
+    sre_constants.CATEGORY_SPACE: char_set(SPACE_CHARS) | 1 << NON_ASCII,
+    sre_constants.CATEGORY_NOT_SPACE: ANY_CHAR & ~char_set(SPACE_CHARS),
+}
+
+
+def class_chars(items: list[tuple[Any, Any]]) -> int:
+    """
+    Returns the characters matched by the items of a character class.
+    """
+
+    rv = 0
+    negate = False
+
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            rv |= char_range(av, av)
+        elif op is sre_constants.RANGE:
+            rv |= char_range(av[0], av[1])
+        elif op is sre_constants.CATEGORY:
+            rv |= CATEGORIES.get(av, ANY_CHAR)
+        else:
+            rv = ANY_CHAR
+
+    if negate:
+        # A negated class matches every character above NON_ASCII it doesn't list, so that bit stays set.
+        rv = (ANY_CHAR & ~rv) | 1 << NON_ASCII
+
+    return rv
+
+
+def first_chars_of(items: Any, flags: int) -> tuple[int, bool]:
+    """
+    Returns the characters that can start a match of a sequence of parsed items,
+    and if the sequence can match the empty string.
+    """
+
+    rv = 0
+
+    for op, av in items:
+        chars, nullable = first_chars_of_item(op, av, flags)
+        rv |= chars
+
+        if not nullable:
+            return (rv, False)
+
+    return (rv, True)
+
+
+def first_chars_of_item(op: Any, av: Any, flags: int) -> tuple[int, bool]:
+    if op is sre_constants.LITERAL:
+        chars = char_range(av, av)
+        return (ignore_case(chars) if flags & re.IGNORECASE else chars, False)
+
+    if op is sre_constants.IN:
+        chars = class_chars(av)
+        return (ignore_case(chars) if flags & re.IGNORECASE else chars, False)
+
+    if op is sre_constants.NOT_LITERAL:
+        return (ANY_CHAR, False)
+
+    if op is sre_constants.ANY:
+        # Outside of the s flag, . doesn't match line terminators.
+        return (ANY_CHAR if flags & re.DOTALL else ANY_CHAR & ~char_set("\n\r"), False)
+
+    if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        return (0, True)
+
+    if op is sre_constants.SUBPATTERN:
+        _, add_flags, del_flags, items = av
+        return first_chars_of(items, (flags | add_flags) & ~del_flags)
+
+    if op is sre_constants.ATOMIC_GROUP:
+        return first_chars_of(av, flags)
+
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+        lo, _, items = av
+        chars, nullable = first_chars_of(items, flags)
+        return (chars, nullable or lo == 0)
+
+    if op is sre_constants.BRANCH:
+        rv = 0
+        nullable = False
+
+        for items in av[1]:
+            chars, branch_nullable = first_chars_of(items, flags)
+            rv |= chars
+            nullable = nullable or branch_nullable
+
+        return (rv, nullable)
+
+    # Back references, conditionals, and anything else that isn't known.
+    return (ANY_CHAR, True)
+
+
+def first_chars(regex: ParsedRegex) -> int:
+    """
+    Returns the set of characters that a match of `regex` can start with. A
+    regex that can match the empty string can match before any character, so
+    that is ANY_CHAR.
+    """
+
+    chars, nullable = first_chars_of(regex.tree, regex.tree.state.flags)
+    return ANY_CHAR if nullable else chars
+
+
+@dataclass(frozen=True)
+class LiteralInfo:
+    """
+    The literal text that every match of a part of a regex contains.
+    """
+
+    # The text every match is exactly equal to, or None if matches can differ.
+    exact: str | None
+
+    # The text every match starts with, and ends with.
+    prefix: str
+    suffix: str
+
+    # The longest text every match contains.
+    required: str
+
+
+UNKNOWN_LITERAL = LiteralInfo(None, "", "", "")
+EMPTY_LITERAL = LiteralInfo("", "", "", "")
+
+# Repeats of an exact literal are only expanded up to this many times.
+MAX_LITERAL_REPEAT = 16
+
+
+def longest(*texts: str) -> str:
+    return max(texts, key=len)
+
+
+def exact_literal(text: str) -> LiteralInfo:
+    return LiteralInfo(text, text, text, text)
+
+
+def concat_literals(a: LiteralInfo, b: LiteralInfo) -> LiteralInfo:
+    """
+    Returns the literal info of a match of `a` followed by a match of `b`.
+    """
+
+    if a.exact is not None and b.exact is not None:
+        return exact_literal(a.exact + b.exact)
+
+    prefix = a.exact + b.prefix if a.exact is not None else a.prefix
+    suffix = a.suffix + b.exact if b.exact is not None else b.suffix
+
+    return LiteralInfo(None, prefix, suffix, longest(a.required, b.required, a.suffix + b.prefix, prefix, suffix))
+
+
+def common_prefix(texts: list[str]) -> str:
+    rv = texts[0]
+    for i in texts[1:]:
+        while not i.startswith(rv):
+            rv = rv[:-1]
+    return rv
+
+
+def common_suffix(texts: list[str]) -> str:
+    return common_prefix([i[::-1] for i in texts])[::-1]
+
+
+def literal_of(items: Any, flags: int) -> LiteralInfo:
+    rv = EMPTY_LITERAL
+
+    for op, av in items:
+        rv = concat_literals(rv, literal_of_item(op, av, flags))
+
+    return rv
+
+
+def literal_of_item(op: Any, av: Any, flags: int) -> LiteralInfo:
+    if op is sre_constants.LITERAL:
+        # With the i flag, a letter matches more than one character, so it can't be searched for as is.
+        if flags & re.IGNORECASE and not (av < NON_ASCII and not chr(av).isalpha()):
+            return UNKNOWN_LITERAL
+
+        return exact_literal(chr(av))
+
+    if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        # Assertions don't consume anything, so the text around them is still contiguous.
+        return EMPTY_LITERAL
+
+    if op is sre_constants.SUBPATTERN:
+        _, add_flags, del_flags, items = av
+        return literal_of(items, (flags | add_flags) & ~del_flags)
+
+    if op is sre_constants.ATOMIC_GROUP:
+        return literal_of(av, flags)
+
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+        lo, hi, items = av
+        info = literal_of(items, flags)
+
+        if lo == 0:
+            return EMPTY_LITERAL if hi == 0 else UNKNOWN_LITERAL
+
+        if info.exact is not None and lo == hi and lo <= MAX_LITERAL_REPEAT:
+            return exact_literal(info.exact * lo)
+
+        return LiteralInfo(None, info.prefix, info.suffix, info.required)
+
+    if op is sre_constants.BRANCH:
+        infos = [literal_of(items, flags) for items in av[1]]
+
+        exact = {i.exact for i in infos}
+        if len(exact) == 1 and None not in exact:
+            return infos[0]
+
+        prefix = common_prefix([i.exact if i.exact is not None else i.prefix for i in infos])
+        suffix = common_suffix([i.exact if i.exact is not None else i.suffix for i in infos])
+        return LiteralInfo(None, prefix, suffix, longest(prefix, suffix))
+
+    return UNKNOWN_LITERAL
+
+
+def required_literal(regex: ParsedRegex) -> str:
+    """
+    Returns the longest literal text that every match of `regex` contains, or
+    an empty string if there is none. Lookarounds are skipped, so the text is
+    always part of the match itself.
+    """
+
+    return literal_of(regex.tree, regex.tree.state.flags).required
+
+
+def walk(items: Any) -> Iterator[tuple[Any, Any]]:
+    """
+    Yields every item of a parse tree, including the items of groups,
+    lookarounds, repeats and alternatives, but not those of character classes.
+    """
+
+    for op, av in items:
+        yield (op, av)
+
+        if op is sre_constants.SUBPATTERN:
+            yield from walk(av[3])
+        elif op is sre_constants.ATOMIC_GROUP:
+            yield from walk(av)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            yield from walk(av[1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            yield from walk(av[2])
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from walk(branch)
+        elif op is sre_constants.GROUPREF_EXISTS:
+            yield from walk(av[1])
+            if av[2] is not None:
+                yield from walk(av[2])
+
+
+def group_count(regex: ParsedRegex) -> int:
+    """
+    Returns the number of capture groups of `regex`.
+    """
+
+    return regex.tree.state.groups - 1
+
+
+def has_line_anchors(regex: ParsedRegex) -> bool:
+    """
+    Returns if `regex` has a ^ or $ outside of a character class, which needs
+    the m flag to match at the start and end of every line.
+    """
+
+    return any(op is sre_constants.AT and av in (sre_constants.AT_BEGINNING, sre_constants.AT_END) for op, av in walk(regex.tree))
+
+
+def is_indentation(items: Any) -> bool:
+    """
+    Returns if the parsed items are a ^ followed by spaces and tabs, like the
+    (?<=^[ \\t]*) lookbehind the grammars use to match at the start of a line.
+    """
+
+    items = list(items)
+    if not items or items[0] != (sre_constants.AT, sre_constants.AT_BEGINNING):
+        return False
+
+    for op, av in items[1:]:
+        if op not in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT) or len(av[2]) != 1:
+            return False
+
+        chars, nullable = first_chars_of(av[2], 0)
+        if nullable or chars & ~char_set(" \t"):
+            return False
+
+    return True
+
+
+def is_line_anchored(regex: ParsedRegex) -> bool:
+    """
+    Returns if every match of `regex` starts at the start of a line, or at the
+    first character of a line that isn't a space or a tab. A tokenizer that
+    works a line at a time only has to try such a regex at that one position,
+    in sticky mode, instead of searching the line for it.
+    """
+
+    items = list(regex.tree)
+    flags = regex.tree.state.flags
+
+    for i, (op, av) in enumerate(items):
+        if op is sre_constants.AT and av is sre_constants.AT_BEGINNING:
+            return True
+
+        if op is sre_constants.ASSERT and av[0] == -1 and is_indentation(av[1]):
+            # The match can start anywhere in the indentation, unless it can't start with a space or a line break.
+            chars, nullable = first_chars_of(items[i + 1:], flags)
+            return not nullable and not chars & char_set(" \t\n\r")
+
+        # Lookarounds before the anchor don't change where the match starts.
+        if op not in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return False
+
+    return False
+
+
+def chars_of(items: Any, flags: int) -> int:
+    """
+    Returns every character a match of a sequence of parsed items can contain.
+    Lookarounds don't consume anything, so their characters aren't included.
+    """
+
+    rv = 0
+
+    for op, av in items:
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub_items = av
+            rv |= chars_of(sub_items, (flags | add_flags) & ~del_flags)
+        elif op is sre_constants.ATOMIC_GROUP:
+            rv |= chars_of(av, flags)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            rv |= chars_of(av[2], flags)
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                rv |= chars_of(branch, flags)
+        else:
+            rv |= first_chars_of_item(op, av, flags)[0]
+
+    return rv
+
+
+# The characters pick_char() prefers, since they make readable examples.
+PREFERRED_CHARS = LOWER_CHARS + DIGIT_CHARS + " _" + UPPER_CHARS + string.punctuation + "\t\n"
+
+
+def pick_char(chars: int) -> str | None:
+    """
+    Returns a character from a set of characters, or None if it's empty.
+    """
+
+    for c in PREFERRED_CHARS:
+        if chars & 1 << ord(c):
+            return c
+
+    for i in range(NON_ASCII):
+        if chars & 1 << i:
+            return chr(i)
+
+    # Any character above NON_ASCII, that isn't a space or a letter.
+    return "¶" if chars & 1 << NON_ASCII else None
+
+
+def example_of(items: Any, flags: int) -> str:
+    """
+    Returns a short text that a sequence of parsed items could match, ignoring
+    lookarounds and anchors. It's used to lead up to a part of a regex.
+    """
+
+    rv = ""
+
+    for op, av in items:
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub_items = av
+            rv += example_of(sub_items, (flags | add_flags) & ~del_flags)
+        elif op is sre_constants.ATOMIC_GROUP:
+            rv += example_of(av, flags)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            rv += example_of(av[2], flags) * min(av[0], MAX_LITERAL_REPEAT)
+        elif op is sre_constants.BRANCH:
+            rv += example_of(av[1][0], flags)
+        elif op not in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            rv += pick_char(first_chars_of_item(op, av, flags)[0]) or ""
+
+    return rv
+
+
+@dataclass(frozen=True)
+class BacktrackingHazard:
+    """
+    A part of a regex that can match the same text in more than one way, so a
+    match that fails after it backtracks through every one of them.
+    """
+
+    # "nested quantifier", "overlapping alternation" or "adjacent quantifiers".
+    kind: str
+
+    # A text that leads up to the hazard, and a character it can match in more than one way.
+    prefix: str
+    pump: str
+
+
+# The repeats that backtrack. A possessive repeat never gives back what it matched.
+BACKTRACKING_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+
+def backtracking_hazards(regex: ParsedRegex) -> list[BacktrackingHazard]:
+    """
+    Returns the parts of `regex` whose backtracking can take more than linear
+    time in the length of the text:
+
+    * An unbounded repeat inside another unbounded repeat, where the inner
+      repeat can match what comes after it in the outer one, like (\\w+\\s*)+.
+    * An alternation inside an unbounded repeat, where more than one
+      alternative can start with the same character, like (?:\\w|\\d)+.
+    * Two unbounded repeats with only optional items between them, where the
+      second can start with a character the first can match, like \\s*.*$.
+
+    This is a conservative check, so not every hazard it finds is slow. Each
+    hazard comes with a text to try it with, see check_redos.py. The parse
+    tree is Python's, which merges alternatives of single characters into a
+    class and factors out common prefixes, so (?:\\w|\\d)+ isn't found. Back
+    references are parsed as any text, so regexes that have them should be
+    skipped.
+    """
+
+    rv: dict[BacktrackingHazard, None] = {}
+
+    def add(kind: str, prefix: str, chars: int):
+        pump = pick_char(chars)
+        if pump is not None:
+            rv[BacktrackingHazard(kind, prefix, pump)] = None
+
+    def visit(items: Any, flags: int, prefix: str, follow: int, in_loop: bool):
+        """
+        Visits a sequence of items. `follow` is the set of characters that can
+        come after the sequence, within the innermost unbounded repeat it's in,
+        if `in_loop` is True.
+        """
+
+        items = list(items)
+
+        for i, (op, av) in enumerate(items):
+            rest_chars, rest_nullable = first_chars_of(items[i + 1:], flags)
+            item_follow = rest_chars | (follow if rest_nullable else 0)
+
+            if op is sre_constants.SUBPATTERN:
+                _, add_flags, del_flags, sub_items = av
+                visit(sub_items, (flags | add_flags) & ~del_flags, prefix, item_follow, in_loop)
+
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                # A lookaround is matched on its own, so what comes after it doesn't matter.
+                visit(av[1], flags, prefix, 0, False)
+
+            elif op in BACKTRACKING_REPEATS:
+                lo, hi, body = av
+                body_chars = chars_of(body, flags)
+                body_first, _ = first_chars_of(body, flags)
+                unbounded = hi == sre_constants.MAXREPEAT
+
+                if unbounded and in_loop and body_chars & item_follow:
+                    add("nested quantifier", prefix, body_chars & item_follow)
+
+                if unbounded:
+                    for next_op, next_av in items[i + 1:]:
+                        if next_op in BACKTRACKING_REPEATS and next_av[1] == sre_constants.MAXREPEAT:
+                            overlap = body_chars & first_chars_of(next_av[2], flags)[0]
+
+                            if overlap:
+                                add("adjacent quantifiers", prefix, overlap)
+                                break
+
+                        if not first_chars_of([(next_op, next_av)], flags)[1]:
+                            break
+
+                visit(body, flags, prefix, body_first | item_follow, in_loop or unbounded)
+
+            elif op is sre_constants.BRANCH:
+                if in_loop:
+                    seen = 0
+
+                    for branch in av[1]:
+                        branch_first, _ = first_chars_of(branch, flags)
+
+                        if seen & branch_first:
+                            add("overlapping alternation", prefix, seen & branch_first)
+                            break
+
+                        seen |= branch_first
+
+                for branch in av[1]:
+                    visit(branch, flags, prefix, item_follow, in_loop)
+
+            prefix += example_of([(op, av)], flags)
+
+    visit(regex.tree, regex.tree.state.flags, "", 0, False)
+
+    return list(rv)
@@ -0,0 +1,196 @@
+import functools
+import itertools
+import re
+
+# A regex made of literal words and flat, non-capturing alternations of words,
+# like "side_(?:|hover_|idle_)(?:align|alt)". This is the shape of the regexes in
+# keywords.py, and the only shape factor_regex() rewrites.
+SEGMENTS_RE = re.compile(r"(?:[A-Za-z0-9_]+|\(\?:[A-Za-z0-9_|]*\))*")
+SEGMENT_RE = re.compile(r"[A-Za-z0-9_]+|\(\?:([A-Za-z0-9_|]*)\)")
+
+
+class Trie:
+    def __init__(self):
+        self.children: dict[str, Trie] = {}
+        self.terminal = False
+
+    def add(self, word: str):
+        node = self
+        for c in word:
+            node = node.children.setdefault(c, Trie())
+        node.terminal = True
+
+    def to_regex(self) -> str:
+        """
+        Returns a regex matching the suffixes stored below this node. The
+        result is either a single atom (a character, a class or a group), or
+        a sequence that does not need to be grouped to be concatenated.
+        """
+
+        if not self.children:
+            return ""
+
+        # A chain of single children is emitted as a plain literal.
+        if not self.terminal and len(self.children) == 1:
+            [(c, child)] = self.children.items()
+            return re.escape(c) + child.to_regex()
+
+        singles = [re.escape(c) for c, child in sorted(self.children.items()) if not child.children]
+        others = [re.escape(c) + child.to_regex() for c, child in sorted(self.children.items()) if child.children]
+
+        alternatives = list(others)
+        if len(singles) == 1:
+            alternatives.append(singles[0])
+        elif singles:
+            alternatives.append("[" + "".join(singles) + "]")
+
+        if len(alternatives) == 1 and (len(singles) > 0 or len(others[0]) == 1):
+            body = alternatives[0]
+        else:
+            body = "(?:" + "|".join(alternatives) + ")"
+
+        if self.terminal:
+            body += "?"
+
+        return body
+
+
+def factor_words(words: list[str]) -> str:
+    """
+    Returns a non-capturing group that matches exactly `words`, with common
+    prefixes factored out, so that "(?:xalign|xanchor|xpos)" becomes
+    "(?:x(?:a(?:lign|nchor)|pos))".
+    """
+
+    trie = Trie()
+    for i in words:
+        trie.add(i)
+
+    body = trie.to_regex()
+
+    if is_group(body):
+        return body
+
+    return "(?:" + body + ")"
+
+
+def is_group(regex: str) -> bool:
+    """
+    Returns True if `regex` is a single, possibly optional, group.
+    """
+
+    if not regex.startswith("(?:"):
+        return False
+
+    depth = 0
+    escaped = False
+
+    for i, c in enumerate(regex):
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+
+            if depth == 0:
+                return regex[i + 1:] in ("", "?")
+
+    return False
+
+
+def parse_segments(regex: str) -> list[list[str]] | None:
+    """
+    Splits a regex in the shape described by SEGMENTS_RE into a list of
+    segments, each of which is the list of words it matches. Returns None if
+    the regex has any other shape.
+    """
+
+    if not SEGMENTS_RE.fullmatch(regex):
+        return None
+
+    rv: list[list[str]] = []
+
+    for m in SEGMENT_RE.finditer(regex):
+        if m.group(1) is None:
+            rv.append([m.group(0)])
+        else:
+            rv.append(m.group(1).split("|"))
+
+    return rv
+
+
+def expand(segments: list[list[str]]) -> list[str]:
+    """
+    Returns every word matched by a list of segments.
+    """
+
+    return sorted({"".join(i) for i in itertools.product(*segments)})
+
+
+def near_misses(words: list[str]) -> list[str]:
+    """
+    Returns strings that are close to, but usually not, one of `words`: each
+    word with its last character removed, changed, or with a character added.
+    """
+
+    rv: set[str] = set()
+
+    for i in words:
+        rv.add(i[:-1])
+        rv.add(i + "_")
+        rv.add(i + "x")
+        rv.add("_" + i)
+        if i:
+            rv.add(i[:-1] + ("z" if i[-1] != "z" else "y"))
+
+    return sorted(rv)
+
+
+def verify_equivalent(original: str, factored: str, words: list[str]):
+    """
+    Checks that `original` and `factored` accept the same strings, by testing
+    every word in `words` (which should be everything `original` matches) and
+    the near misses of those words. Raises a ValueError if they differ.
+    """
+
+    original_re = re.compile(original)
+    factored_re = re.compile(factored)
+
+    for i in words:
+        if not original_re.fullmatch(i):
+            raise ValueError(f"{i!r} is not matched by {original}")
+
+        if not factored_re.fullmatch(i):
+            raise ValueError(f"{i!r} is not matched by the factored form of {original}")
+
+    for i in near_misses(words):
+        if bool(original_re.fullmatch(i)) != bool(factored_re.fullmatch(i)):
+            raise ValueError(f"{i!r} is matched differently by {original} and its factored form {factored}")
+
+
+@functools.cache
+def factor_regex(regex: str) -> str:
+    """
+    Rewrites each alternation in a regex in the shape described by SEGMENTS_RE
+    into its prefix-factored form, and verifies the result matches exactly the
+    same words. Regexes of any other shape are returned unchanged.
+    """
+
+    segments = parse_segments(regex)
+    if segments is None:
+        return regex
+
+    rv = ""
+
+    for m, words in zip(SEGMENT_RE.finditer(regex), segments):
+        if m.group(1) is None:
+            rv += m.group(0)
+        else:
+            rv += factor_words(words)
+
+    verify_equivalent(regex, rv, expand(segments))
+
+    return rv
@@ -1,20 +1,91 @@
 from datetime import datetime, timezone
+import functools
+import hashlib
 import json
 import pathlib
 import re
 from typing import Any
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+
+import reachability
+import regex_ast
+
+from build_graph import BuildGraph, BuildStep
+from build_manifest import BuildManifest
 
 ROOT = pathlib.Path(__file__).parent.parent
 
+# The grammars to generate token patterns for, as (language, source, output). The
+# order of this list is the order the external includes are written to index.ts.
+TOKEN_PATTERN_SOURCES = [
+    ("renpy", "syntaxes/renpy.tmLanguage.json", "src/tokenizer/generated/renpy-token-patterns.g.ts"),
+    ("atl", "syntaxes/renpy.atl.tmLanguage.json", "src/tokenizer/generated/atl-token-patterns.g.ts"),
+    ("screen", "syntaxes/renpy.screen.tmLanguage.json", "src/tokenizer/generated/screen-token-patterns.g.ts"),
+    ("style", "syntaxes/renpy.style.tmLanguage.json", "src/tokenizer/generated/style-token-patterns.g.ts"),
+    ("python", "syntaxes/renpy.python.tmLanguage.json", "src/tokenizer/generated/python-token-patterns.g.ts"),
+]
+
+INDEX_FILE = "src/tokenizer/generated/index.ts"
+PATTERN_IDS_FILE = "src/tokenizer/generated/pattern-ids.g.ts"
+
+# The patterns that are identical in more than one place, written once, see find_shared_patterns().
+SHARED_FILE = "src/tokenizer/generated/shared-token-patterns.g.ts"
+
+# The version of the pattern state that is precomputed for the tokenizer. This must
+# match EXPECTED_PATTERN_STATE_VERSION in src/tokenizer/tokenizer.ts, and be bumped
+# whenever get_pattern_state() changes what it computes.
+PATTERN_STATE_VERSION = 1
+
+# Changes to these files invalidate every generated token pattern file.
+GENERATOR_INPUTS = [
+    pathlib.Path(__file__),
+    pathlib.Path(__file__).parent / "reachability.py",
+    pathlib.Path(__file__).parent / "regex_ast.py",
+]
+
+# Runs of at least this many adjacent match patterns are fused into one, see fuse_patterns().
+MIN_FUSED_PATTERNS = 2
+
+# Required literals shorter than this aren't emitted, since almost every text contains them.
+MIN_REQUIRED_LITERAL_LENGTH = 2
+
+# Match patterns that use these can't be fused, because the groups of the fused
+# regex are numbered differently, and group names have to be unique.
+UNFUSABLE_RE = re.compile(r"\\[1-9]|\\k<|\(\?<[A-Za-z_]")
+
 @dataclass
 class GeneratorState:
     defined_variables: list[str] = field(default_factory=list[str])
-    used_token_types: list[str] = field(default_factory=list[str])
+    # Used as an ordered set, so the imports are written in the order the token types are first used.
+    used_token_types: dict[str, None] = field(default_factory=dict[str, None])
     pattern_include_entries: list[str] = field(default_factory=list[str])
     external_pattern_include_entries: list[str] = field(default_factory=list[str])
     source_imports: list[str] = field(default_factory=list[str])
+    unmapped_scopes: list[str] = field(default_factory=list[str])
+
+    # The number of pattern ids used by this file, see get_pattern_state()
+    pattern_count: int = 0
+
+    # If runs of sibling match patterns are fused into a single regex, see fuse_patterns()
+    fuse_patterns: bool = False
+
+    # The number of match and begin regexes, and how many of those have a first character set, see get_first_chars_str()
+    regex_count: int = 0
+    prefilter_count: int = 0
+
+    # How many of the match and begin regexes have a required literal, see get_required_literal_str()
+    literal_count: int = 0
+
+    # How many of the match and begin regexes could run in sticky mode, see regex_ast.is_line_anchored()
+    sticky_count: int = 0
+
+    # The expressions that refer to the shared patterns, by share key, see find_shared_patterns()
+    shared_patterns: dict[str, str] = field(default_factory=dict[str, str])
+    uses_shared_patterns: bool = False
+
+def get_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime('%d/%m/%Y %H:%M:%S')
 
 def get_indent(indent: int) -> str:
     return " " * indent
@@ -26,601 +97,1149 @@ def camelCase(st: str):
 def titleCase(st: str):
     return ''.join(x for x in st.title() if x.isalnum())
 
-def convert_token_type_split(name: str) -> str:
-    token_parts = name.split(".")
-    if len(token_parts) <= 1:
-        return "Error"
+# The rules that map a scope name to a token type. The first rule whose pattern
+# matches the start of the scope decides the token type. A "*" matches any
+# segment, including a missing one. A rule without a token type marks the scopes
+# it matches as unmapped, which stops them from falling through to later rules.
+#
+# In a token type, {i} is replaced by segment i of the scope, and {i:j} by the
+# segments in the slice [i:j], both in title case.
+TOKEN_TYPE_RULES: list[tuple[str, str | None]] = [
+    ("string.quoted.docstring", "MetaTokenType.Docstring"),
+    ("string", "LiteralTokenType.String"),
+
+    ("variable", "EntityTokenType.Identifier"),
+
+    ("storage.type.string", "MetaTokenType.StringStorageType"),
+    ("storage.type.format", "MetaTokenType.FormatStorageType"),
+    ("storage.type.class", "KeywordTokenType.Class"),
+    ("storage.type.style", "KeywordTokenType.Style"),
+    ("storage.type.screen", "KeywordTokenType.Screen"),
+    ("storage.type.imaginary", "MetaTokenType.ImaginaryNumberStorageType"),
+    ("storage.type.number", "MetaTokenType.NumberStorageType"),
+    ("storage.type.function.lambda", "KeywordTokenType.Lambda"),
+    ("storage.type.function.async", "KeywordTokenType.Async"),
+    ("storage.type.function.label", "KeywordTokenType.Label"),
+    ("storage.type.function", "KeywordTokenType.Def"),
+    ("storage.modifier.declaration", "KeywordTokenType.{3:-1}"),
+    ("storage.modifier.flag", "MetaTokenType.ModifierFlagStorageType"),
+    ("storage", None),
+
+    ("constant.numeric.integer", "LiteralTokenType.Integer"),
+    ("constant.numeric.float", "LiteralTokenType.Float"),
+    ("constant.numeric.boolean", "LiteralTokenType.Boolean"),
+    ("constant.numeric.character", "LiteralTokenType.Character"),
+    ("constant.numeric.escape", "LiteralTokenType.Escape"),
+    ("constant.numeric", "MetaTokenType.ConstantNumeric"),
+    ("constant.language", "MetaTokenType.ConstantLiteral"),
+    ("constant.color", "LiteralTokenType.Color"),
+    ("constant.character.escape.python", "MetaTokenType.EscapeSequence"),
+    ("constant.character.escape.regexp", "MetaTokenType.EscapeSequence"),
+    ("constant.character.escape", "EscapedCharacterTokenType.Esc{3:-2}"),
+    ("constant.character.unicode", "MetaTokenType.EscapeSequence"),
+    ("constant.character.set", "MetaTokenType.CharacterSet"),
+    ("constant.character.format.placeholder", "MetaTokenType.Placeholder"),
+    ("constant.other", "MetaTokenType.ConstantCaps"),
+    ("constant", None),
+
+    ("invalid.deprecated", "MetaTokenType.Deprecated"),
+    ("invalid", "MetaTokenType.Invalid"),
+
+    ("debug", "MetaTokenType.Invalid"),
+
+    ("punctuation.definition.tag.begin", "CharacterTokenType.OpenBracket"),
+    ("punctuation.definition.tag.end", "CharacterTokenType.CloseBracket"),
+    ("punctuation.definition.tag.region", "MetaTokenType.CommentRegionTag"),
+    ("punctuation.definition.dict.begin", "CharacterTokenType.OpenBracket"),
+    ("punctuation.definition.dict.end", "CharacterTokenType.CloseBracket"),
+    ("punctuation.definition.dict.region", "MetaTokenType.CommentRegionTag"),
+    ("punctuation.definition.inheritance.begin", "CharacterTokenType.OpenBracket"),
+    ("punctuation.definition.inheritance.end", "CharacterTokenType.CloseBracket"),
+    ("punctuation.definition.inheritance.region", "MetaTokenType.CommentRegionTag"),
+    ("punctuation.definition.list.begin", "CharacterTokenType.OpenSquareBracket"),
+    ("punctuation.definition.list.end", "CharacterTokenType.CloseSquareBracket"),
+    ("punctuation.definition.arguments.begin", "CharacterTokenType.OpenParentheses"),
+    ("punctuation.definition.arguments.end", "CharacterTokenType.CloseParentheses"),
+    ("punctuation.definition.parameters.begin", "CharacterTokenType.OpenParentheses"),
+    ("punctuation.definition.parameters.end", "CharacterTokenType.CloseParentheses"),
+    ("punctuation.definition.string.begin", "MetaTokenType.StringBegin"),
+    ("punctuation.definition.string.end", "MetaTokenType.StringEnd"),
+    ("punctuation.definition.comment", "CharacterTokenType.Hashtag"),
+    ("punctuation.definition.decorator", "CharacterTokenType.AtSymbol"),
+    ("punctuation.definition.interpolate", "CharacterTokenType.ExclamationMark"),
+    ("punctuation.definition", None),
+    ("punctuation.parenthesis.begin", "CharacterTokenType.OpenParentheses"),
+    ("punctuation.parenthesis.end", "CharacterTokenType.CloseParentheses"),
+    ("punctuation.parenthesis", None),
+    ("punctuation.bracket.begin", "CharacterTokenType.OpenBracket"),
+    ("punctuation.bracket.end", "CharacterTokenType.CloseBracket"),
+    ("punctuation.bracket", None),
+    ("punctuation.square-bracket.begin", "CharacterTokenType.OpenSquareBracket"),
+    ("punctuation.square-bracket.end", "CharacterTokenType.CloseSquareBracket"),
+    ("punctuation.square-bracket", None),
+    ("punctuation.section.*.begin", "CharacterTokenType.Colon"),
+    ("punctuation.section.*.*.begin", "CharacterTokenType.Colon"),
+    ("punctuation.section", None),
+    ("punctuation.separator.parameters", "CharacterTokenType.Comma"),
+    ("punctuation.separator.arguments", "CharacterTokenType.Comma"),
+    ("punctuation.separator.element", "CharacterTokenType.Comma"),
+    ("punctuation.separator.inheritance", "CharacterTokenType.Comma"),
+    ("punctuation.separator.dict", "CharacterTokenType.Colon"),
+    ("punctuation.separator.annotation", "CharacterTokenType.Colon"),
+    ("punctuation.separator.slice", "CharacterTokenType.Colon"),
+    ("punctuation.separator.continuation", "CharacterTokenType.Backslash"),
+    ("punctuation.separator.key-value", "CharacterTokenType.EqualsSymbol"),
+    ("punctuation.separator", "CharacterTokenType.{2}"),
+    ("punctuation.character.set.begin", "CharacterTokenType.OpenSquareBracket"),
+    ("punctuation.character.set.end", "CharacterTokenType.CloseSquareBracket"),
+    ("punctuation.character", None),
+    ("punctuation.comment.begin", "MetaTokenType.CommentBegin"),
+    ("punctuation.comment.end", "MetaTokenType.CommentEnd"),
+    ("punctuation.comment", None),
+    ("punctuation", "CharacterTokenType.{1}"),
+
+    ("support.type.property-name", "EntityTokenType.PropertyName"),
+    ("support.type.class", "EntityTokenType.ClassName"),
+    ("support.type.function", "EntityTokenType.FunctionName"),
+    ("support.type.variable", "EntityTokenType.Identifier"),
+    ("support.type.namespace", "EntityTokenType.NamespaceName"),
+    ("support.type.metaclass", "MetaTokenType.Metaclass"),
+    ("support.type.exception", "MetaTokenType.BuiltinExceptionType"),
+    ("support.type", "MetaTokenType.BuiltinType"),
+    ("support.variable", "EntityTokenType.Identifier"),
+    ("support.function.event", "EntityTokenType.EventName"),
+    ("support.function", "EntityTokenType.FunctionName"),
+    ("support.other.match.any", "CharacterTokenType.Dot"),
+    ("support.other.match.begin", "CharacterTokenType.Caret"),
+    ("support.other.match.end", "CharacterTokenType.DollarSymbol"),
+    ("support.other.escape", "MetaTokenType.EscapeSequence"),
+    ("support", None),
+
+    ("comment.typehint", "MetaTokenType.Typehint{2}"),
+    ("comment", "MetaTokenType.Comment"),
+
+    ("keyword.operator.arithmetic.python", "MetaTokenType.ArithmeticOperator"),
+    ("keyword.operator.arithmetic.renpy", "MetaTokenType.ArithmeticOperator"),
+    ("keyword.operator.arithmetic", "OperatorTokenType.{3}"),
+    ("keyword.operator.logical.python", "MetaTokenType.LogicalOperatorKeyword"),
+    ("keyword.operator.logical.renpy", "MetaTokenType.LogicalOperatorKeyword"),
+    ("keyword.operator.logical", "OperatorTokenType.{3}"),
+    ("keyword.operator.bitwise", "MetaTokenType.BitwiseOperatorKeyword"),
+    ("keyword.operator.comparison", "MetaTokenType.ComparisonOperatorKeyword"),
+    ("keyword.operator.python", "MetaTokenType.Operator"),
+    ("keyword.operator.unpacking", "OperatorTokenType.Unpacking"),
+    ("keyword.operator", "OperatorTokenType.{2:-1}"),
+    ("keyword.codetag", "MetaTokenType.CommentCodeTag"),
+    ("keyword.control.flow.python", "MetaTokenType.ControlFlowKeyword"), # TODO
+    ("keyword.control.flow.renpy", "MetaTokenType.ControlFlowKeyword"),
+    ("keyword.control.flow", "KeywordTokenType.{3}"),
+    ("keyword.control.import", "KeywordTokenType.Import"),
+    ("keyword.control.conditional", "KeywordTokenType.If"),
+    ("keyword.control", None),
+    ("keyword.illegal.name", "MetaTokenType.Invalid"),
+    ("keyword", "KeywordTokenType.{1:-1}"),
+
+    ("entity.name.type", "EntityTokenType.{3}Name"),
+    ("entity.name", "EntityTokenType.{2}Name"),
+    ("entity.other.inherited-class", "EntityTokenType.InheritedClassName"),
+    ("entity", None),
+
+    ("meta.embedded.block", "MetaTokenType.PythonBlock"),
+    ("meta.embedded.line", "MetaTokenType.PythonLine"),
+    ("meta.embedded", None),
+    ("meta.arguments", "MetaTokenType.Arguments"),
+    ("meta.*.arguments", "MetaTokenType.Arguments"),
+    ("meta.*.*.arguments", "MetaTokenType.Arguments"),
+    ("meta.function-call.label", "MetaTokenType.LabelCall"),
+    ("meta.function-call", "MetaTokenType.FunctionCall"),
+    ("meta.member.access.label", "MetaTokenType.LabelAccess"),
+    ("meta.member.access", "MetaTokenType.MemberAccess"),
+    ("meta.member", None),
+    ("meta.string.tag", "MetaTokenType.StringTag"),
+    ("meta.string.character", "MetaTokenType.CharacterNameString"),
+    ("meta.string", None),
+    ("meta.class.inheritance", "MetaTokenType.{1:-1}"),
+    ("meta.function.inheritance", "MetaTokenType.{1:-1}"),
+    ("meta.class", "MetaTokenType.ClassDefinition"),
+    ("meta.function", "MetaTokenType.FunctionDefinition"),
+    ("meta", "MetaTokenType.{1:-1}"),
+]
+
+TOKEN_TYPE_FIELD_RE = re.compile(r"\{(\d+)(?::(-?\d+))?\}")
+
+class ScopeTrie:
+    """
+    The token type rules, compiled into a trie over the segments of a scope.
+    Every node has already decided which rules could still match first, so a
+    lookup walks down a single path, without backtracking.
+    """
+
+    def __init__(self, rules: list[tuple[list[str], str | None]], depth: int = 0):
+        self.leaf = False
+        self.token_type: str | None = None
+        self.children: dict[str, ScopeTrie] = {}
+        self.default: ScopeTrie | None = None
+
+        # The first remaining rule has matched all of its segments, or nothing matches.
+        if not rules or len(rules[0][0]) <= depth:
+            self.leaf = True
+            self.token_type = rules[0][1] if rules else None
+            return
+
+        def remaining(segment: str) -> list[tuple[list[str], str | None]]:
+            return [i for i in rules if len(i[0]) <= depth or i[0][depth] in (segment, "*")]
+
+        for pattern, _ in rules:
+            if len(pattern) > depth and pattern[depth] != "*" and pattern[depth] not in self.children:
+                self.children[pattern[depth]] = ScopeTrie(remaining(pattern[depth]), depth + 1)
+
+        self.default = ScopeTrie(remaining("*"), depth + 1)
+
+    def lookup(self, segments: list[str]) -> str | None:
+        node = self
+        depth = 0
+
+        while not node.leaf:
+            segment = segments[depth] if depth < len(segments) else ""
+            node = node.children.get(segment, node.default)
+            depth += 1
+
+        return node.token_type
+
+@functools.cache
+def get_scope_trie() -> ScopeTrie:
+    return ScopeTrie([(pattern.split("."), token_type) for pattern, token_type in TOKEN_TYPE_RULES])
+
+@functools.lru_cache(maxsize=None)
+def convert_token_type(scope: str) -> str | None:
+    """
+    Returns the token type for a single scope name, or None if there is no
+    rule for it.
+    """
+
+    segments = scope.split(".")
+    if len(segments) <= 1:
+        return None
+
+    token_type = get_scope_trie().lookup(segments)
+    if token_type is None:
+        return None
+
+    def field(m: re.Match[str]) -> str:
+        start = int(m.group(1))
+
+        if m.group(2) is None:
+            return titleCase(segments[start] if start < len(segments) else "")
+
+        return titleCase(".".join(segments[start:int(m.group(2))]))
+
+    return TOKEN_TYPE_FIELD_RE.sub(field, token_type).replace("Atl", "ATL") # Upper case ATL
+
+def get_token_type(state: GeneratorState, name: str, access_str: str) -> str:
+    scope = name.split(" ")[-1] # Multi-tokens are not yet supported. For now assume the last token is the important one
+    token = convert_token_type(scope)
+
+    if token is None:
+        state.unmapped_scopes.append(f"{scope} (in {access_str})")
+        return "Error /*Error: Could not convert token type*/"
+
+    state.used_token_types.setdefault(token.split(".")[0], None)
+    return token
+
+def get_match_str(match: str, captures: dict[str, Any] | None, is_end: bool = False) -> tuple[str, bool]:
+    match = match.replace("/", "\\/") # Escape forward slashes
 
-    def get_part(index: int) -> str:
-        if index >= len(token_parts):
-            return ""
-        return token_parts[index]
+    if is_end:
+        # JavaScript has no end of input anchors, so these are emulated using a lookahead
+        match = match.replace("\\Z", "$(?!\\r\\n|\\r|\\n)")
+        match = match.replace("\\R", "(?!\\r\\n|\\r|\\n)")
+    elif "\\G" in match:
+        raise ValueError(f"The \\G anchor is only supported as (?!\\G) at the start of end patterns: {match}")
 
-    def get_parts(range: slice) -> str:
-        if range.start >= len(token_parts):
-            return ""
-        return ".".join(token_parts[range])
+    iFlagSet = False
+    if "(?i)" in match:
+        iFlagSet = True
+        match = match.replace("(?i)", "")
 
-    if get_part(0) == "string":
-        if get_part(1) == "quoted" and get_part(2) == "docstring":
-            return "MetaTokenType.Docstring"
-        else:
-            return "LiteralTokenType.String"
-
-    elif get_part(0) == "variable":
-        return "EntityTokenType.Identifier"
-
-    elif get_part(0) == "storage":
-        if get_part(1) == "type":
-            if get_part(2) == "string":
-                return "MetaTokenType.StringStorageType"
-            elif get_part(2) == "format":
-                return "MetaTokenType.FormatStorageType"
-            elif get_part(2) == "class":
-                return "KeywordTokenType.Class"
-            elif get_part(2) == "style":
-                return "KeywordTokenType.Style"
-            elif get_part(2) == "screen":
-                return "KeywordTokenType.Screen"
-            elif get_part(2) == "imaginary":
-                return "MetaTokenType.ImaginaryNumberStorageType"
-            elif get_part(2) == "number":
-                return "MetaTokenType.NumberStorageType"
-            elif get_part(2) == "function":
-                if get_part(3) == "lambda":
-                    return "KeywordTokenType.Lambda"
-                elif get_part(3) == "async":
-                    return "KeywordTokenType.Async"
-                elif get_part(3) == "label":
-                    return "KeywordTokenType.Label"
-                else:
-                    return "KeywordTokenType.Def"
-
-        elif get_part(1) == "modifier":
-            if get_part(2) == "declaration":
-                return "KeywordTokenType." + titleCase(get_parts(slice(3, -1)))
-            elif get_part(2) == "flag":
-                return "MetaTokenType.ModifierFlagStorageType"
-
-    elif get_part(0) == "constant":
-        if get_part(1) == "numeric":
-            if get_part(2) == "integer":
-                return "LiteralTokenType.Integer"
-            elif get_part(2) == "float":
-                return "LiteralTokenType.Float"
-            elif get_part(2) == "boolean":
-                return "LiteralTokenType.Boolean"
-            elif get_part(2) == "character":
-                return "LiteralTokenType.Character"
-            elif get_part(2) == "escape":
-                return "LiteralTokenType.Escape"
-            else:
-                return "MetaTokenType.ConstantNumeric"
+    match = match.replace("[:alpha:]", "a-zA-Z")
+    match = match.replace("[:alnum:]", "a-zA-Z0-9")
+    match = match.replace("[:upper:]", "A-Z")
 
-        elif get_part(1) == "language":
-            return "MetaTokenType.ConstantLiteral"
+    parsed = regex_ast.parse(match, "i" if iFlagSet else "")
 
-        elif get_part(1) == "color":
-            return "LiteralTokenType.Color"
+    if parsed is None:
+        # Fall back to guessing from the source, for the regexes the parser doesn't understand
+        hasBackrefs = re.search("(\\\\[1-9]\\d?)", match) != None
+        needsLineAnchors = re.search("(?<!\\[)[\\^$]", match) != None
+        needsIndices = captures != None and len(captures) > 0
+        hasProperties = re.search("\\\\p", match) != None
+    else:
+        hasBackrefs = parsed.has_backrefs
+        needsLineAnchors = regex_ast.has_line_anchors(parsed)
+        needsIndices = get_needs_indices(captures, regex_ast.group_count(parsed))
+        hasProperties = parsed.has_properties
 
-        elif get_part(1) == "character":
-            if get_part(2) == "escape":
-                if get_part(3) == "python" or get_part(3) == "regexp":
-                    return "MetaTokenType.EscapeSequence"
-                else:
-                    return "EscapedCharacterTokenType.Esc" + titleCase(get_parts(slice(3, -2)))
+    iFlag: str = "i" if iFlagSet else ""
+    mFlag: str = "m" if needsLineAnchors else ""
+    dFlag: str = "d" if needsIndices else ""
+    uFlag: str = "u" if hasProperties else ""
 
-            elif get_part(2) == "unicode":
-                return "MetaTokenType.EscapeSequence"
+    return (f"/{match}/{dFlag}g{iFlag}{mFlag}{uFlag}", hasBackrefs)
 
-            elif get_part(2) == "set":
-                return "MetaTokenType.CharacterSet"
+def get_needs_indices(captures: dict[str, Any] | None, group_count: int) -> bool:
+    """
+    Returns if a regex needs the d flag for its captures. Capture 0 is the
+    whole match, and the tokenizer takes its position from the match itself, so
+    only the captures of groups that exist in the regex need the indices.
+    """
 
-            elif get_part(2) == "format" and get_part(3) == "placeholder":
-                return "MetaTokenType.Placeholder"
+    if captures is None:
+        return False
 
+    return any(key.isdigit() and 1 <= int(key) <= group_count for key in captures)
 
-        elif get_part(1) == "other":
-            return "MetaTokenType.ConstantCaps"
+def get_end_state(end: str) -> tuple[bool, bool]:
+    """
+    Returns if the end regex literal of a range pattern has back references,
+    and if it starts with (?!\\G), as the tokenizer checks them.
+    """
 
-    elif get_part(0) == "invalid":
-        if get_part(1) == "deprecated":
-            return "MetaTokenType.Deprecated"
-        else:
-            return "MetaTokenType.Invalid"
-
-    elif get_part(0) == "debug":
-        return "MetaTokenType.Invalid"
-
-    elif get_part(0) == "punctuation":
-        if get_part(1) == "definition":
-            if get_part(2) == "tag" or get_part(2) == "dict" or get_part(2) == "inheritance":
-                if get_part(3) == "begin":
-                    return "CharacterTokenType.OpenBracket"
-                elif get_part(3) == "end":
-                    return "CharacterTokenType.CloseBracket"
-                elif get_part(3) == "region":
-                    return "MetaTokenType.CommentRegionTag"
-
-            elif get_part(2) == "list":
-                if get_part(3) == "begin":
-                    return "CharacterTokenType.OpenSquareBracket"
-                elif get_part(3) == "end":
-                    return "CharacterTokenType.CloseSquareBracket"
-
-            elif get_part(2) == "arguments" or get_part(2) == "parameters":
-                if get_part(3) == "begin":
-                    return "CharacterTokenType.OpenParentheses"
-                elif get_part(3) == "end":
-                    return "CharacterTokenType.CloseParentheses"
-
-            elif get_part(2) == "string":
-                if get_part(3) == "begin":
-                    return "MetaTokenType.StringBegin"
-                elif get_part(3) == "end":
-                    return "MetaTokenType.StringEnd"
-
-            elif get_part(2) == "comment":
-                return "CharacterTokenType.Hashtag"
-
-            elif get_part(2) == "decorator":
-                return "CharacterTokenType.AtSymbol"
-
-            elif get_part(2) == "interpolate":
-                return "CharacterTokenType.ExclamationMark"
-
-        elif get_part(1) == "parenthesis":
-            if get_part(2) == "begin":
-                return "CharacterTokenType.OpenParentheses"
-            elif get_part(2) == "end":
-                return "CharacterTokenType.CloseParentheses"
-
-        elif get_part(1) == "bracket":
-            if get_part(2) == "begin":
-                return "CharacterTokenType.OpenBracket"
-            elif get_part(2) == "end":
-                return "CharacterTokenType.CloseBracket"
-
-        elif get_part(1) == "square-bracket":
-            if get_part(2) == "begin":
-                return "CharacterTokenType.OpenSquareBracket"
-            elif get_part(2) == "end":
-                return "CharacterTokenType.CloseSquareBracket"
-
-        elif get_part(1) == "section":
-            if get_part(3) == "begin" or get_part(4) == "begin":
-                return "CharacterTokenType.Colon"
-
-        elif get_part(1) == "separator":
-            if get_part(2) == "parameters" or get_part(2) == "arguments" or get_part(2) == "element" or get_part(2) == "inheritance":
-                return "CharacterTokenType.Comma"
-            elif get_part(2) == "dict" or get_part(2) == "annotation" or get_part(2) == "slice":
-                return "CharacterTokenType.Colon"
-            elif get_part(2) == "continuation":
-                return "CharacterTokenType.Backslash"
-            elif get_part(2) == "key-value":
-                return "CharacterTokenType.EqualsSymbol"
-            else:
-                return "CharacterTokenType." + titleCase(get_part(2))
+    end_source = end[1:end.rindex("/")]
+
+    has_backref = re.search(r"\\\d+", end_source) is not None
+    end_not_g = end_source.startswith("(?!\\G)")
+
+    return (has_backref, end_not_g)
+
+def count_groups(source: str) -> int:
+    """
+    Returns the number of capture groups in the source of a JavaScript regex.
+    """
+
+    rv = 0
+    i = 0
+    in_class = False
 
-        elif get_part(1) == "character":
-            if get_part(2) == "set":
-                if get_part(3) == "begin":
-                    return "CharacterTokenType.OpenSquareBracket"
-                elif get_part(3) == "end":
-                    return "CharacterTokenType.CloseSquareBracket"
+    while i < len(source):
+        c = source[i]
 
-        elif get_part(1) == "comment":
-            if get_part(2) == "begin":
-                return "MetaTokenType.CommentBegin"
-            elif get_part(2) == "end":
-                return "MetaTokenType.CommentEnd"
+        if c == "\\":
+            i += 1
+        elif in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(" and (not source.startswith("?", i + 1) or source.startswith("?<", i + 1) and source[i + 3] not in "=!"):
+            rv += 1
 
+        i += 1
+
+    return rv
+
+def get_fusion_key(value: dict[str, Any]) -> tuple[str, str] | None:
+    """
+    Returns the flags a match pattern needs to share with the patterns it's
+    fused with, or None if it can't be fused.
+    """
+
+    if "match" not in value or UNFUSABLE_RE.search(value["match"]):
+        return None
+
+    match, _ = get_match_str(value["match"], value.get("captures"))
+    flags = match[match.rindex("/") + 1:]
+
+    # The d flag is left out of the fused regex, and it only needs the m flag if one of the patterns does.
+    return ("i" if "i" in flags else "", "u" if "u" in flags else "")
+
+def fuse_patterns(patterns: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Replaces each run of at least MIN_FUSED_PATTERNS adjacent match patterns
+    with the same flags by a single pattern, whose "fused" list holds the
+    patterns of the run.
+
+    The tokenizer scans the patterns of a list one by one, and takes the
+    earliest match, or the first pattern of those that match at the same
+    position. The regex of a fused pattern is an alternation of the regexes of
+    its patterns, which finds the same match, with a single exec.
+    """
+
+    rv: list[dict[str, Any]] = []
+    run: list[dict[str, Any]] = []
+    run_key: tuple[str, str] | None = None
+
+    def end_run():
+        if len(run) >= MIN_FUSED_PATTERNS:
+            rv.append({"fused": list(run)})
         else:
-            return "CharacterTokenType." + titleCase(get_part(1))
-
-    elif get_part(0) == "support":
-        if get_part(1) == "type":
-            if get_part(2) == "property-name":
-                return "EntityTokenType.PropertyName"
-            elif get_part(2) == "class":
-                return "EntityTokenType.ClassName"
-            elif get_part(2) == "function":
-                return "EntityTokenType.FunctionName"
-            elif get_part(2) == "variable":
-                return "EntityTokenType.Identifier"
-            elif get_part(2) == "namespace":
-                return "EntityTokenType.NamespaceName"
-            elif get_part(2) == "metaclass":
-                return "MetaTokenType.Metaclass"
-            elif get_part(2) == "exception":
-                return "MetaTokenType.BuiltinExceptionType"
-            else:
-                return "MetaTokenType.BuiltinType"
+            rv.extend(run)
 
-        elif get_part(1) == "variable":
-            return "EntityTokenType.Identifier"
+        run.clear()
 
-        elif get_part(1) == "function":
-            if get_part(2) == "event":
-                return "EntityTokenType.EventName"
-            else:
-                return "EntityTokenType.FunctionName"
-
-        elif get_part(1) == "other":
-            if get_part(2) == "match":
-                if get_part(3) == "any":
-                    return "CharacterTokenType.Dot"
-                elif get_part(3) == "begin":
-                    return "CharacterTokenType.Caret"
-                elif get_part(3) == "end":
-                    return "CharacterTokenType.DollarSymbol"
-
-            elif get_part(2) == "escape":
-                return "MetaTokenType.EscapeSequence"
-
-    elif get_part(0) == "comment":
-        if get_part(1) == "typehint":
-            return "MetaTokenType.Typehint" + titleCase(get_part(2))
+    for pattern in patterns:
+        key = get_fusion_key(pattern)
+
+        if key is None or key != run_key:
+            end_run()
+
+        if key is None:
+            rv.append(pattern)
         else:
-            return "MetaTokenType.Comment"
+            run.append(pattern)
 
-    elif get_part(0) == "keyword":
-        if get_part(1) == "operator":
-            if get_part(2) == "arithmetic":
-                if get_part(3) == "python" or get_part(3) == "renpy":
-                    return "MetaTokenType.ArithmeticOperator"
-                else:
-                    return "OperatorTokenType." + titleCase(get_part(3))
+        run_key = key
 
-            elif get_part(2) == "logical":
-                    if get_part(3) != "python" and get_part(3) != "renpy":
-                        return "OperatorTokenType." + titleCase(get_part(3))
+    end_run()
+    return rv
 
-                    return "MetaTokenType.LogicalOperatorKeyword"
+def get_fused_match_str(patterns: list[dict[str, Any]]) -> tuple[str, list[int]]:
+    """
+    Returns the regex literal of a fused pattern, and the index of the group
+    that holds the regex of each of its patterns.
+    """
 
-            elif get_part(2) == "bitwise":
-                    return "MetaTokenType.BitwiseOperatorKeyword"
+    sources: list[str] = []
+    groups: list[int] = []
+    flags = ""
 
-            elif get_part(2) == "comparison":
-                    return "MetaTokenType.ComparisonOperatorKeyword"
+    group_count = 0
+    for pattern in patterns:
+        match, _ = get_match_str(pattern["match"], pattern.get("captures"))
+        source = match[1:match.rindex("/")]
 
-            elif get_part(2) == "python":
-                    return "MetaTokenType.Operator"
+        sources.append(f"({source})")
+        flags += match[match.rindex("/") + 1:]
 
-            elif get_part(2) == "unpacking":
-                return "OperatorTokenType." + titleCase(get_part(2))
+        groups.append(group_count + 1)
+        group_count += 1 + count_groups(source)
 
-            else:
-                return "OperatorTokenType." + titleCase(get_parts(slice(2, -1)))
+    fused_flags = "".join(i for i in "gimu" if i in flags)
+    return (f"/{'|'.join(sources)}/{fused_flags}", groups)
 
-        elif get_part(1) == "codetag":
-            return "MetaTokenType.CommentCodeTag"
+def has_include(o: Any) -> bool:
+    if isinstance(o, dict):
+        return "include" in o or any(has_include(v) for v in o.values())
 
-        elif get_part(1) == "control":
-            if get_part(2) == "flow":
-                if get_part(3) == "python" or get_part(3) == "renpy": # TODO
-                    return "MetaTokenType.ControlFlowKeyword"
-                else:
-                    return "KeywordTokenType." + titleCase(get_part(3))
+    if isinstance(o, list):
+        return any(has_include(v) for v in o)
 
-            elif get_part(2) == "import":
-                return "KeywordTokenType.Import"
+    return False
 
-            elif get_part(2) == "conditional":
-                return "KeywordTokenType.If"
+def strip_comments(o: Any) -> Any:
+    if isinstance(o, dict):
+        return {k: strip_comments(v) for k, v in o.items() if k != "comment"}
 
-        elif get_part(1) == "illegal" and get_part(2) == "name":
-            return "MetaTokenType.Invalid"
-        else:
-            return "KeywordTokenType." + titleCase(get_parts(slice(1, -1)))
+    if isinstance(o, list):
+        return [strip_comments(v) for v in o]
 
-    elif get_part(0) == "entity":
-        if get_part(1) == "name":
-            if get_part(2) == "type":
-                return "EntityTokenType." + titleCase(get_part(3)) + "Name"
-            else:
-                return "EntityTokenType." + titleCase(get_part(2)) + "Name"
+    return o
+
+def get_share_key(value: dict[str, Any]) -> str | None:
+    """
+    Returns a key that is the same for patterns with the same content, apart from
+    comments, or None if the pattern can't be shared. Patterns with includes
+    can't be shared, since an include refers to a pattern of its own grammar.
+    """
+
+    if not ("match" in value or "begin" in value or "patterns" in value) or has_include(value):
+        return None
+
+    content = json.dumps(strip_comments(value), sort_keys=True)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+@dataclass
+class SharedPattern:
+    key: str
+    name: str
+    value: dict[str, Any]
+
+    # Where the pattern is used, as "language access_str".
+    uses: list[str] = field(default_factory=list[str])
+
+def get_shared_name(pattern: SharedPattern) -> str:
+    """
+    Returns the name of a shared pattern, before it's made unique. A pattern
+    that is the same repository entry everywhere it's used keeps the name of
+    the entry. Other patterns belong to none of their uses, so they're named
+    after their scope without the language, like "entityNameTypeImage" for
+    entity.name.type.image.renpy, or "pattern" if they have none.
+    """
+
+    entries = {i.split(" ")[1] for i in pattern.uses}
+    if len(entries) == 1 and "." not in next(iter(entries)):
+        return entries.pop()
+
+    scope = (pattern.value.get("name") or pattern.value.get("contentName") or "").split(" ")[0]
+    parts = scope.split(".")[:-1]
+
+    return camelCase(" ".join(parts)) if parts else "pattern"
+
+def find_shared_patterns(grammars: list[tuple[str, dict[str, Any]]]) -> list[SharedPattern]:
+    """
+    Returns the patterns that would be written more than once, ordered so every
+    shared pattern comes after the shared patterns it contains.
+
+    A pattern is counted once for every place it would be written: once for
+    each time its parent is written, and only once for the patterns inside a
+    shared pattern, since that is written once. Captures are not shared, since
+    the tokenizer doesn't give most of them an id.
+    """
+
+    found: dict[str, SharedPattern] = {}
+
+    def visit(value: dict[str, Any], language: str, access_str: str, is_capture: bool = False):
+        key = None if is_capture else get_share_key(value)
+
+        if key is not None:
+            if key in found:
+                found[key].uses.append(f"{language} {access_str}")
+                return
+
+            found[key] = SharedPattern(key, "", value, [f"{language} {access_str}"])
+
+        for captures_key in ("captures", "beginCaptures", "endCaptures"):
+            for group, capture in value.get(captures_key, {}).items():
+                visit(capture, language, f"{access_str}.{captures_key}![{group}]", True)
+
+        for i, pattern in enumerate(value.get("patterns", [])):
+            if "include" not in pattern:
+                visit(pattern, language, f"{access_str}.patterns![{i}]")
 
-        elif get_part(1) == "other":
-            if get_part(2) == "inherited-class":
-                return "EntityTokenType.InheritedClassName"
+    for language, grammar in grammars:
+        for key, value in grammar.get("repository", {}).items():
+            visit(value, language, camelCase(key))
 
-    elif get_part(0) == "meta":
-        if get_part(1) == "embedded":
-            if get_part(2) == "block":
-                return "MetaTokenType.PythonBlock"
-            elif get_part(2) == "line":
-                return "MetaTokenType.PythonLine"
+    shared = {k: v for k, v in found.items() if len(v.uses) > 1}
 
-        elif get_part(1) == "arguments" or get_part(2) == "arguments" or get_part(3) == "arguments":
-            return "MetaTokenType.Arguments"
+    names: set[str] = set()
+    for pattern in shared.values():
+        base = get_shared_name(pattern)
 
-        elif get_part(1) == "function-call":
-            if get_part(2) == "label":
-                return "MetaTokenType.LabelCall"
+        pattern.name = base
+        n = 2
+        while pattern.name in names:
+            pattern.name = f"{base}{n}"
+            n += 1
+
+        names.add(pattern.name)
+
+    rv: list[SharedPattern] = []
+    written: set[str] = set()
+
+    def add_contained(value: dict[str, Any]):
+        for captures_key in ("captures", "beginCaptures", "endCaptures"):
+            for capture in value.get(captures_key, {}).values():
+                add_contained(capture)
+
+        for pattern in value.get("patterns", []):
+            key = get_share_key(pattern)
+            if key in shared:
+                add(shared[key])
             else:
-                return "MetaTokenType.FunctionCall"
+                add_contained(pattern)
 
-        elif get_part(1) == "member":
-            if get_part(2) == "access":
-                if get_part(3) == "label":
-                    return "MetaTokenType.LabelAccess"
-                else:
-                    return "MetaTokenType.MemberAccess"
+    def add(pattern: SharedPattern):
+        if pattern.key in written:
+            return
 
-        elif get_part(1) == "string":
-            if get_part(2) == "tag":
-                return "MetaTokenType.StringTag"
-            elif get_part(2) == "character":
-                return "MetaTokenType.CharacterNameString"
+        written.add(pattern.key)
+        add_contained(pattern.value)
+        rv.append(pattern)
 
-        elif (get_part(1) == "class" or get_part(1) == "function") and get_part(2) != "inheritance":
-            return "MetaTokenType." + titleCase(get_part(1)) + "Definition"
+    for pattern in shared.values():
+        add(pattern)
 
-        else:
-            return "MetaTokenType." + titleCase(get_parts(slice(1, -1)))
+    return rv
 
-    return "Error" + " /*Error: Could not convert token type*/"
+def get_first_chars_str(state: GeneratorState, literal: str) -> str | None:
+    """
+    Returns the set of characters a match of a regex literal can start with, as
+    five 32 bit words: a bit for each ASCII character, and a last word that is 1
+    if it can start with any other character. Returns None if it can start with
+    any character, or can't be analyzed.
+    """
 
-def get_token_type(state: GeneratorState, name: str) -> str:
-    token = name.split(" ")[-1] # Multi-tokens are not yet supported. For now assume the last token is the important one
-    token = convert_token_type_split(token)
+    state.regex_count += 1
 
-    import_token_type = token.split(".")[0]
-    if not import_token_type in state.used_token_types:
-        state.used_token_types.append(import_token_type)
+    parsed = regex_ast.parse_literal(literal)
+    if parsed is None:
+        return None
 
-    return token.replace("Atl", "ATL") # Upper case ATL
+    chars = regex_ast.first_chars(parsed)
+    if chars == regex_ast.ANY_CHAR:
+        return None
 
-def get_match_str(match: str, captures: dict[str, Any] | None) -> tuple[str, bool]:
-    match = match.replace("/", "\\/") # Escape forward slashes
+    state.prefilter_count += 1
 
-    iFlagSet = False
-    if "(?i)" in match:
-        iFlagSet = True
-        match = match.replace("(?i)", "")
+    words = [(chars >> (32 * i)) & 0xFFFFFFFF for i in range(4)] + [chars >> regex_ast.NON_ASCII]
+    return f"[{', '.join(hex(i) for i in words)}]"
 
-    match = match.replace("[:alpha:]", "a-zA-Z")
-    match = match.replace("[:alnum:]", "a-zA-Z0-9")
-    match = match.replace("[:upper:]", "A-Z")
+def get_required_literal_str(state: GeneratorState, literal: str) -> str | None:
+    """
+    Returns the longest text every match of a regex literal contains, as a
+    string literal, or None if there is no such text of at least
+    MIN_REQUIRED_LITERAL_LENGTH characters.
+    """
 
-    hasBackrefs: bool = re.search("(\\\\[1-9]\\d?)", match) != None
+    parsed = regex_ast.parse_literal(literal)
+    if parsed is None:
+        return None
 
-    iFlag: str = "i" if iFlagSet else ""
-    mFlag: str = "m" if re.search("(?<!\\[)[\\^$]", match) != None else ""
-    dFlag: str = "d" if captures != None and len(captures) > 0 else ""
-    uFlag: str = "u" if re.search("\\\\p", match) != None else ""
+    required = regex_ast.required_literal(parsed)
+    if len(required) < MIN_REQUIRED_LITERAL_LENGTH:
+        return None
 
-    return (f"/{match}/{dFlag}g{iFlag}{mFlag}{uFlag}", hasBackrefs)
+    state.literal_count += 1
+    return json.dumps(required)
+
+def get_regex_fields(state: GeneratorState, literal: str) -> list[str]:
+    """
+    Returns the fields the tokenizer uses to skip scanning a match or begin
+    regex literal, as "name: value" strings.
+    """
+
+    fields: list[str] = []
+
+    first_chars = get_first_chars_str(state, literal)
+    if first_chars:
+        fields.append(f"firstChars: {first_chars}")
 
-def transform_captures(state: GeneratorState, indent: int, captures: dict[str, Any], access_str: str) -> str:
-    typescript_entry = "{\n"
+    required_literal = get_required_literal_str(state, literal)
+    if required_literal:
+        fields.append(f"requiredLiteral: {required_literal}")
+
+    parsed = regex_ast.parse_literal(literal)
+    if parsed is not None and regex_ast.is_line_anchored(parsed):
+        state.sticky_count += 1
+
+    return fields
+
+def get_pattern_state(state: GeneratorState, value: dict[str, Any], end: str | None, is_capture: bool) -> str | None:
+    """
+    Returns the properties that Tokenizer.setupAndValidatePatterns() would
+    otherwise compute for the pattern when the tokenizer first runs, or None
+    for captures that the tokenizer doesn't scan as a pattern of their own.
+    """
+
+    if is_capture and "patterns" not in value:
+        return None
+
+    properties = [f"_patternId: PATTERN_ID_BASE + {state.pattern_count}"]
+    state.pattern_count += 1
+
+    if "begin" in value:
+        assert end is not None
+        has_backref, end_not_g = get_end_state(end)
+
+        properties.append("_patternType: TokenPatternType.RangePattern")
+        properties.append(f"_hasBackref: {str(has_backref).lower()}")
+        properties.append(f"_endNotG: {str(end_not_g).lower()}")
+
+        # The id after the range pattern is used by the repo pattern that holds its patterns
+        if "patterns" in value:
+            state.pattern_count += 1
+
+    elif "match" in value or "fused" in value:
+        properties.append("_patternType: TokenPatternType.MatchPattern")
+
+    elif "patterns" in value:
+        properties.append("_patternType: TokenPatternType.RepoPattern")
+
+    return ", ".join(properties) + ","
+
+def transform_captures(state: GeneratorState, out: list[str], indent: int, captures: dict[str, Any], access_str: str, prefix: str):
+    out.append(f"{prefix}{{")
     indent += 4
 
     for key, value in captures.items():
         capture_access_str = f"{access_str}[{key}]"
-        typescript_entry += f"{get_indent(indent)}{key}: {transform_pattern(state, indent, value, capture_access_str)},\n"
+        transform_pattern(state, out, indent, value, capture_access_str, f"{get_indent(indent)}{key}: ", ",", inline=True, is_capture=True)
 
     indent -= 4
-    typescript_entry += f"{get_indent(indent)}}},\n"
-    return typescript_entry
-
-def transform_pattern(state: GeneratorState, indent: int, value: dict[str, Any], access_str: str) -> str:
-    typescript_entry = "{\n"
+    out.append(f"{get_indent(indent)}}},")
+
+def transform_pattern(state: GeneratorState, out: list[str], indent: int, value: dict[str, Any], access_str: str, prefix: str = "", suffix: str = "", inline: bool = False, is_capture: bool = False, shareable: bool = True):
+    """
+    Appends the lines of the token pattern for `value` to `out`. The first line
+    starts with `prefix` and the last line ends with `suffix`. If `inline` is
+    True, a pattern with a single line body is written on one line. If
+    `shareable` is True, and the pattern is shared, it's written as a reference
+    to the shared pattern instead.
+    """
+
+    if state.shared_patterns and shareable and not is_capture:
+        shared = state.shared_patterns.get(get_share_key(value) or "")
+
+        if shared is not None:
+            state.uses_shared_patterns = True
+            out.append(f"{prefix}{shared}{suffix}")
+            return
+
+    out.append(f"{prefix}{{")
+    body_start = len(out)
     indent += 4
 
+    fused_info = get_fused_match_str(value["fused"]) if "fused" in value else None
+    match_info = get_match_str(value["match"], value.get("captures")) if "match" in value else fused_info
+    begin_info = get_match_str(value["begin"], value.get("beginCaptures")) if "begin" in value else None
+    end_info = get_match_str(value["end"], value.get("endCaptures"), is_end=True) if "end" in value else None
+
+    pattern_state = get_pattern_state(state, value, end_info[0] if end_info else None, is_capture)
+
     # Add debugName for patterns with regex
-    if "match" in value or "begin" in value or "end" in value:
-        typescript_entry += f"{get_indent(indent)}debugName: \"{access_str}\",\n\n"
+    if match_info or begin_info or end_info:
+        out.append(f"{get_indent(indent)}debugName: \"{access_str}\",")
+
+    if pattern_state:
+        out.append(f"{get_indent(indent)}{pattern_state}")
+
+    if match_info or begin_info or end_info:
+        out.append("")
 
     # Add comments
     if "comment" in value:
-        comment = value["comment"].replace("\n", f"\n{get_indent(indent)}// ")
-        typescript_entry += f"{get_indent(indent)}// {comment}\n"
+        out.extend(f"{get_indent(indent)}// {line}" for line in value["comment"].split("\n"))
 
     # Add token type
     if "name" in value:
         name = value["name"]
-        token = get_token_type(state, name)
-        typescript_entry += f"{get_indent(indent)}token: {token}, /*{name}*/\n"
+        token = get_token_type(state, name, access_str)
+        out.append(f"{get_indent(indent)}token: {token}, /*{name}*/")
 
     if "contentName" in value:
         name = value["contentName"]
-        token = get_token_type(state, name)
-        typescript_entry += f"{get_indent(indent)}contentToken: {token}, /*{name}*/\n"
+        token = get_token_type(state, name, access_str)
+        out.append(f"{get_indent(indent)}contentToken: {token}, /*{name}*/")
 
     # Add match
-    if "match" in value:
-        match_info = get_match_str(value["match"], value["captures"] if "captures" in value else None)
-        typescript_entry += f"{get_indent(indent)}match: {match_info[0]},\n"
+    if match_info:
+        out.append(f"{get_indent(indent)}match: {match_info[0]},")
+
+        out.extend(f"{get_indent(indent)}{i}," for i in get_regex_fields(state, match_info[0]))
+
+    # The patterns of a fused pattern, and the group of each of them in the fused regex
+    if fused_info:
+        out.append(f"{get_indent(indent)}fusedGroups: [{', '.join(str(i) for i in fused_info[1])}],")
+        out.append(f"{get_indent(indent)}fused: [")
+
+        for i, pattern in enumerate(value["fused"]):
+            transform_pattern(state, out, indent + 4, pattern, f"{access_str}.fused![{i}]", get_indent(indent + 4), ",")
+
+        out.append(f"{get_indent(indent)}],")
 
     # Iterate through the captures in the value
     if "captures" in value:
-        typescript_entry += f"{get_indent(indent)}captures: "
-        typescript_entry += transform_captures(state, indent, value["captures"], f"{access_str}.captures!")
+        transform_captures(state, out, indent, value["captures"], f"{access_str}.captures!", f"{get_indent(indent)}captures: ")
 
-    if "begin" in value:
-        match_info = get_match_str(value["begin"], value["beginCaptures"] if "beginCaptures" in value else None)
-        typescript_entry += f"{get_indent(indent)}begin: {match_info[0]},\n"
+    if begin_info:
+        out.append(f"{get_indent(indent)}begin: {begin_info[0]},")
+
+        out.extend(f"{get_indent(indent)}{i}," for i in get_regex_fields(state, begin_info[0]))
 
     # Iterate through the beginCaptures in the value
     if "beginCaptures" in value:
-        typescript_entry += f"{get_indent(indent)}beginCaptures: "
-        typescript_entry += transform_captures(state, indent, value["beginCaptures"], f"{access_str}.beginCaptures!")
+        transform_captures(state, out, indent, value["beginCaptures"], f"{access_str}.beginCaptures!", f"{get_indent(indent)}beginCaptures: ")
 
-    if "end" in value:
-        match_info = get_match_str(value["end"], value["endCaptures"] if "endCaptures" in value else None)
+    if end_info:
+        if end_info[1]:
+            out.append(f"{get_indent(indent)}// @ts-ignore: Back references in end patterns are replaced by begin matches at runtime")
 
-        if match_info[1]:
-            typescript_entry += f"{get_indent(indent)}// @ts-ignore: Back references in end patterns are replaced by begin matches at runtime\n"
-
-        typescript_entry += f"{get_indent(indent)}end: {match_info[0]},\n"
+        out.append(f"{get_indent(indent)}end: {end_info[0]},")
 
     # Iterate through the endCaptures in the value
     if "endCaptures" in value:
-        typescript_entry += f"{get_indent(indent)}endCaptures: "
-        typescript_entry += transform_captures(state, indent, value["endCaptures"], f"{access_str}.endCaptures!")
+        transform_captures(state, out, indent, value["endCaptures"], f"{access_str}.endCaptures!", f"{get_indent(indent)}endCaptures: ")
 
     # Iterate through the patterns in the value
     if "patterns" in value:
-        patterns = value["patterns"]
-        typescript_entry += f"{get_indent(indent)}patterns: [\n"
-        indent += 4
+        transform_patterns(state, out, indent, value["patterns"], access_str)
+
+    indent -= 4
 
-        includes: list[tuple[str, int]] = []
-        external_includes: list[tuple[str, int]] = []
+    # Write a single line body on the same line as the braces
+    if inline and len(out) - body_start == 1:
+        body = out.pop().lstrip()
+        out[-1] = f"{prefix}{{ {body} }}{suffix}"
+    else:
+        out.append(f"{get_indent(indent)}}}{suffix}")
 
-        # Handle includes first to make sure they are pushed in the correct order
-        for i in range(len(patterns)):
-            pattern = patterns[i]
+def transform_patterns(state: GeneratorState, out: list[str], indent: int, patterns: list[dict[str, Any]], access_str: str):
+    # Fused before the includes are handled, since fusing changes the index of the patterns after each run
+    if state.fuse_patterns:
+        patterns = fuse_patterns(patterns)
 
-            if "include" not in pattern:
-                continue
+    includes: list[tuple[str, int]] = []
+    external_includes: list[tuple[str, int]] = []
 
-            include: str = pattern["include"]
+    # Handle includes first to make sure they are pushed in the correct order
+    for i in range(len(patterns)):
+        pattern = patterns[i]
 
-            if include.startswith("source.renpy"):
-                include_parts = include.split("#")
+        if "include" not in pattern:
+            continue
 
-                source = include_parts[0]
-                reference = include_parts[1] if len(include_parts) > 1 else None
+        include: str = pattern["include"]
 
-                language = source.split(".")[-1]
-                language_accessor = titleCase(language) + "Patterns."
+        if include.startswith("source.renpy"):
+            include_parts = include.split("#")
 
-                if reference == None:
-                    include = language_accessor + language
-                else:
-                    include = language_accessor + camelCase(reference)
+            source = include_parts[0]
+            reference = include_parts[1] if len(include_parts) > 1 else None
 
-                if language not in state.source_imports:
-                    state.source_imports.append(language)
+            language = source.split(".")[-1]
+            language_accessor = titleCase(language) + "Patterns."
 
-                external_includes.append((include, i))
+            if reference == None:
+                include = language_accessor + language
             else:
-                include = camelCase(include)
+                include = language_accessor + camelCase(reference)
 
-                # All includes that have not been defined yet, are pushed at the bottom of the file
-                if include not in state.defined_variables:
-                    includes.append((include, i))
+            if language not in state.source_imports:
+                state.source_imports.append(language)
 
-        # Add the includes to the list of includes
-        def process_includes(include_list: list[tuple[str, int]], entries_list: list[str]):
-            for i in range(len(include_list)):
-                [include, index] = include_list[i]
-                entries_list.append(f"{access_str}.patterns!.splice({index}, 1, {include});")
+            external_includes.append((include, i))
+        else:
+            include = camelCase(include)
+
+            # All includes that have not been defined yet, are pushed at the bottom of the file
+            if include not in state.defined_variables:
+                includes.append((include, i))
 
-        if len(includes) > 0:
-            process_includes(includes, state.pattern_include_entries)
+    # Add the includes to the list of includes
+    def process_includes(include_list: list[tuple[str, int]], entries_list: list[str]):
+        for i in range(len(include_list)):
+            [include, index] = include_list[i]
+            entries_list.append(f"{access_str}.patterns!.splice({index}, 1, {include});")
 
-        if len(external_includes) > 0:
-            process_includes(external_includes, state.external_pattern_include_entries)
+    if len(includes) > 0:
+        process_includes(includes, state.pattern_include_entries)
 
-        # Now write the pattern source
-        for i in range(len(patterns)):
-            pattern = patterns[i]
+    if len(external_includes) > 0:
+        process_includes(external_includes, state.external_pattern_include_entries)
 
-            # Handle includes
-            if "include" in pattern:
-                include: str = pattern["include"]
-                if include.startswith("source.renpy"):
-                    typescript_entry += f"{get_indent(indent)}placeholderPattern, // Placeholder for {include}\n"
-                    continue
+    # A single include of a defined pattern is written on one line
+    if len(patterns) == 1 and "include" in patterns[0] and not patterns[0]["include"].startswith("source.renpy"):
+        include = camelCase(patterns[0]["include"])
+        if include in state.defined_variables:
+            out.append(f"{get_indent(indent)}patterns: [{include}]")
+            return
 
-                include = camelCase(include)
-                if include in state.defined_variables:
-                    typescript_entry += f"{get_indent(indent)}{include},\n"
-                else:
-                    typescript_entry += f"{get_indent(indent)}placeholderPattern, // Placeholder for {include}\n"
+    out.append(f"{get_indent(indent)}patterns: [")
+    indent += 4
 
+    # Now write the pattern source
+    for i in range(len(patterns)):
+        pattern = patterns[i]
 
+        # Handle includes
+        if "include" in pattern:
+            include: str = pattern["include"]
+            if include.startswith("source.renpy"):
+                out.append(f"{get_indent(indent)}placeholderPattern, // Placeholder for {include}")
                 continue
 
-            typescript_entry += get_indent(indent)
-            typescript_entry += transform_pattern(state, indent, pattern, f"{access_str}.patterns![{i}]")
-            typescript_entry += ",\n"
+            include = camelCase(include)
+            if include in state.defined_variables:
+                out.append(f"{get_indent(indent)}{include},")
+            else:
+                out.append(f"{get_indent(indent)}placeholderPattern, // Placeholder for {include}")
+
+            continue
 
-        indent -= 4
-        typescript_entry += f"{get_indent(indent)}]\n"
+        transform_pattern(state, out, indent, pattern, f"{access_str}.patterns![{i}]", get_indent(indent), ",")
 
     indent -= 4
-    typescript_entry += f"{get_indent(indent)}}}"
-    return typescript_entry
+    out.append(f"{get_indent(indent)}]")
+
+def get_header(state: GeneratorState, language: str, timestamp: str | None, imports: list[str]) -> list[str]:
+    return [
+        "// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR",
+        "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.",
+        "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.",
+        f"// Last generated: {timestamp or get_timestamp()} (UTC+0)",
+        "",
+        f"import {{ {', '.join(state.used_token_types)} }} from \"src/tokenizer/renpy-tokens\";",
+        f"import {{ {', '.join(imports)} }} from \"src/tokenizer/token-pattern-types\";",
+        f"import {{ {language.upper()}_PATTERN_ID_BASE as PATTERN_ID_BASE }} from \"./pattern-ids.g\";",
+    ]
+
+def render_file(state: GeneratorState, language: str, source_file: str, timestamp: str | None = None, reachable: set[reachability.Rule] | None = None) -> str:
+    """
+    Returns the contents of the token pattern file of a grammar. If `reachable`
+    is given, the repository entries that aren't in it are left out.
+    """
 
-def generate_file(state: GeneratorState, source_file: str, output_file: str):
     # load the input data from the file
     with open(ROOT / source_file, "r") as file:
         data = json.load(file)
 
+    if reachable is not None:
+        data, _ = reachability.strip_unreachable(data, reachable)
+
     # get the repository value
     repository = data.get("repository", {})
 
+    # The lines of the file, written with "\n" between them once everything is generated
+    out: list[str] = []
+
     # Iterate through the repository entries
-    src_lines: list[str] = []
     for key, value in repository.items():
         patternName = camelCase(key)
 
         # Keep track of the defined variables to reduce the amount of variables we need to push later
         state.defined_variables.append(patternName)
 
-        typescript_entry = f"export const {patternName}: TokenPattern = "
+        transform_pattern(state, out, 0, value, patternName, f"export const {patternName}: TokenPattern = ", ";")
+        out.append("")
 
-        typescript_entry += transform_pattern(state, 0, value, patternName)
+    # Fail loudly, rather than writing token patterns with an Error token type
+    if len(state.unmapped_scopes) > 0:
+        raise ValueError(f"{source_file} uses scopes that can't be converted to a token type:\n" + "\n".join(f"    {i}" for i in state.unmapped_scopes))
 
-        typescript_entry += ";\n"
+    if len(state.pattern_include_entries) > 0:
+        out.append("// Push pattern references that were not defined on include")
+        out.extend(state.pattern_include_entries)
 
-        # Add the typescript entry to the list of entries
-        src_lines.append(typescript_entry)
+    header = get_header(state, language, timestamp, ["placeholderPattern", "TokenPattern", "TokenPatternType"])
 
-    # Write the typescript entries to a file
-    with open(ROOT / output_file, "w") as file:
-        contents: str = "// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR\n"
-        contents += "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.\n"
-        contents += "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.\n"
-        contents += f"// Last generated: {datetime.now(timezone.utc).strftime('%d/%m/%Y %H:%M:%S')} (UTC+0)\n"
-        contents += "\n"
+    if state.uses_shared_patterns:
+        header.append("import * as SharedPatterns from \"./shared-token-patterns.g\";")
+
+    return "\n".join(header + [""] + out)
 
-        contents += f"import {{ {', '.join(state.used_token_types)} }} from \"src/tokenizer/renpy-tokens\";\n"
-        contents += "import { placeholderPattern, TokenPattern } from \"src/tokenizer/token-pattern-types\";\n\n"
-        contents += "\n".join(src_lines)
+def generate_file(state: GeneratorState, language: str, source_file: str, output_file: str, timestamp: str | None = None, reachable: set[reachability.Rule] | None = None):
+    contents = render_file(state, language, source_file, timestamp, reachable)
 
-        if len(state.pattern_include_entries) > 0:
-            contents += "\n// Push pattern references that were not defined on include\n"
-            contents += "\n".join(state.pattern_include_entries)
+    # Write the typescript entries to a file
+    with open(ROOT / output_file, "w") as file:
+        file.write(contents)
 
-        # Remove any newlines from the body of a single line array
-        contents = re.sub(r':\s*\[\n\s*([^,]*),\n?\s*\]', r': [\1]', contents, flags=re.MULTILINE)
+def load_token_pattern_grammars(reachable: set[reachability.Rule] | None = None) -> list[tuple[str, dict[str, Any]]]:
+    rv: list[tuple[str, dict[str, Any]]] = []
 
-        # Remove any newlines from the body of a single line definition
-        contents = re.sub(r':\s*{\n\s*(.*)\n?\s*}', r': { \1 }', contents, flags=re.MULTILINE)
+    for language, source_file, _ in TOKEN_PATTERN_SOURCES:
+        with open(ROOT / source_file, "r") as file:
+            grammar = json.load(file)
 
-        file.write(contents)
+        if reachable is not None:
+            grammar, _ = reachability.strip_unreachable(grammar, reachable)
 
-def generate_token_patterns():
-    renpy_state = GeneratorState()
-    atl_state = GeneratorState()
-    screen_state = GeneratorState()
-    style_state = GeneratorState()
-    python_state = GeneratorState()
+        rv.append((language, grammar))
+
+    return rv
 
-    generate_file(renpy_state, "./syntaxes/renpy.tmLanguage.json", "src/tokenizer/generated/renpy-token-patterns.g.ts")
-    generate_file(atl_state, "./syntaxes/renpy.atl.tmLanguage.json", "src/tokenizer/generated/atl-token-patterns.g.ts")
-    generate_file(screen_state, "./syntaxes/renpy.screen.tmLanguage.json", "src/tokenizer/generated/screen-token-patterns.g.ts")
-    generate_file(style_state, "./syntaxes/renpy.style.tmLanguage.json", "src/tokenizer/generated/style-token-patterns.g.ts")
-    generate_file(python_state, "./syntaxes/renpy.python.tmLanguage.json", "src/tokenizer/generated/python-token-patterns.g.ts")
+def get_grammar_files() -> list[pathlib.Path]:
+    return reachability.find_grammar_files(ROOT / "syntaxes")
+
+def find_reachable_rules(step: BuildStep) -> set[reachability.Rule] | None:
+    """
+    Returns the grammar rules that can be reached from any grammar, if the step
+    leaves out the rest, or None if it keeps everything.
+    """
+
+    if not step.settings.get("strip_unreachable", False):
+        return None
 
+    return reachability.find_reachability(reachability.load_grammars(get_grammar_files())).reachable
+
+def generate_shared_file(state: GeneratorState, shared: list[SharedPattern], timestamp: str | None = None):
+    """
+    Writes the shared patterns to SHARED_FILE, each with a comment that lists
+    where it's used. Since a shared pattern is a single object wherever it's
+    used, its debugName is "shared.<name>", rather than the access path of one
+    of its uses.
+    """
+
+    state.shared_patterns = {i.key: i.name for i in shared}
+
+    out: list[str] = [
+        "// Each pattern here is the same object in every place listed above it, so its debugName",
+        "// is \"shared.<name>\" rather than the path of any one of them.",
+        "",
+    ]
+
+    for pattern in shared:
+        out.append(f"// Used by {', '.join(pattern.uses)}")
+        transform_pattern(state, out, 0, pattern.value, f"shared.{pattern.name}", f"export const {pattern.name}: TokenPattern = ", ";", shareable=False)
+        out.append("")
+
+    if len(state.unmapped_scopes) > 0:
+        raise ValueError("The shared patterns use scopes that can't be converted to a token type:\n" + "\n".join(f"    {i}" for i in state.unmapped_scopes))
+
+    header = get_header(state, "shared", timestamp, ["TokenPattern", "TokenPatternType"])
+
+    with open(ROOT / SHARED_FILE, "w") as file:
+        file.write("\n".join(header + [""] + out))
+
+def generate_file_step(step: BuildStep, input_data: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    The build action for a single token pattern file.
+    """
+
+    state = GeneratorState(fuse_patterns=step.settings.get("fuse_patterns", False))
+
+    if step.settings.get("share_patterns", False):
+        state.shared_patterns = {k: f"SharedPatterns.{v}" for k, v in input_data[SHARED_FILE]["shared_patterns"].items()}
+
+    generate_file(state, step.options["language"], step.options["source_file"], step.options["output_file"], step.options["timestamp"], find_reachable_rules(step))
+
+    return {
+        "state": asdict(state),
+        "regex_count": state.regex_count,
+        "prefilter_count": state.prefilter_count,
+        "literal_count": state.literal_count,
+        "sticky_count": state.sticky_count,
+        "size": (ROOT / step.options["output_file"]).stat().st_size,
+    }
+
+def generate_shared_file_step(step: BuildStep, input_data: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """
+    The build action for the shared patterns. Also records the pattern count and
+    size that every token pattern file together would have without sharing, for
+    the report.
+    """
+
+    fuse = step.settings.get("fuse_patterns", False)
+    reachable = find_reachable_rules(step)
+    shared = find_shared_patterns(load_token_pattern_grammars(reachable))
+
+    state = GeneratorState(fuse_patterns=fuse)
+    generate_shared_file(state, shared, step.options["timestamp"])
+
+    unshared_pattern_count = 0
+    unshared_size = 0
+
+    for language, source_file, _ in TOKEN_PATTERN_SOURCES:
+        unshared = GeneratorState(fuse_patterns=fuse)
+        unshared_size += len(render_file(unshared, language, source_file, step.options["timestamp"], reachable))
+        unshared_pattern_count += unshared.pattern_count
+
+    return {
+        "state": asdict(state),
+        "shared_patterns": state.shared_patterns,
+        "shared_uses": sum(len(i.uses) for i in shared),
+        "unshared_pattern_count": unshared_pattern_count,
+        "unshared_size": unshared_size,
+        "regex_count": state.regex_count,
+        "prefilter_count": state.prefilter_count,
+        "literal_count": state.literal_count,
+        "sticky_count": state.sticky_count,
+        "size": (ROOT / SHARED_FILE).stat().st_size,
+    }
+
+def generate_index_step(step: BuildStep, input_data: dict[str, dict[str, Any]]):
+    """
+    The build action for index.ts, which is built from the states that were
+    recorded for each token pattern file.
+    """
+
+    states = [
+        (language, GeneratorState(**input_data[output_file]["state"]))
+        for language, _, output_file in TOKEN_PATTERN_SOURCES
+    ]
+
+    generate_index(states, step.options["timestamp"])
+
+def generate_pattern_ids_step(step: BuildStep, input_data: dict[str, dict[str, Any]]):
+    """
+    The build action for pattern-ids.g.ts, which is built from the pattern
+    counts that were recorded for each token pattern file.
+    """
+
+    states = [
+        (language, GeneratorState(**input_data[output_file]["state"]))
+        for language, _, output_file in TOKEN_PATTERN_SOURCES
+    ]
+
+    # The shared patterns always have a base, so a shared file left over from an earlier build still compiles.
+    shared = GeneratorState(**input_data[SHARED_FILE]["state"]) if SHARED_FILE in input_data else GeneratorState()
+    states.insert(0, ("shared", shared))
+
+    generate_pattern_ids(states, step.options["timestamp"])
+
+def create_build_steps(fuse_patterns: bool = False, share_patterns: bool = False, strip_unreachable: bool = False) -> list[BuildStep]:
+    """
+    Returns the build steps that generate the token pattern files from the
+    .tmLanguage.json grammars, and index.ts and pattern-ids.g.ts from the token
+    pattern files. If `fuse_patterns` is True, runs of sibling match patterns
+    are fused, see fuse_patterns(). If `share_patterns` is True, patterns that
+    would be written more than once are written once to SHARED_FILE, see
+    find_shared_patterns(). If `strip_unreachable` is True, the repository
+    entries that no grammar can reach are left out.
+    """
+
+    # Use the same timestamp for every file, so the output does not depend on how the work was scheduled.
+    timestamp = get_timestamp()
+
+    settings = {"fuse_patterns": fuse_patterns, "share_patterns": share_patterns, "strip_unreachable": strip_unreachable}
+
+    steps: list[BuildStep] = []
+    shared_inputs: list[pathlib.Path] = []
+
+    # Whether a rule can be reached depends on every grammar.
+    grammar_inputs = get_grammar_files() if strip_unreachable else []
+
+    # The shared patterns depend on every grammar, so a change to any grammar regenerates every token pattern file.
+    if share_patterns:
+        steps.append(BuildStep(
+            output=ROOT / SHARED_FILE,
+            inputs=[*dict.fromkeys([*(ROOT / source_file for _, source_file, _ in TOKEN_PATTERN_SOURCES), *grammar_inputs]), *GENERATOR_INPUTS],
+            action=generate_shared_file_step,
+            options={"timestamp": timestamp},
+            settings=settings,
+        ))
+
+        shared_inputs.append(ROOT / SHARED_FILE)
+
+    for language, source_file, output_file in TOKEN_PATTERN_SOURCES:
+        steps.append(BuildStep(
+            output=ROOT / output_file,
+            inputs=[ROOT / source_file, *(i for i in grammar_inputs if i != ROOT / source_file), *GENERATOR_INPUTS, *shared_inputs],
+            action=generate_file_step,
+            options={"language": language, "source_file": source_file, "output_file": output_file, "timestamp": timestamp},
+            settings=settings,
+        ))
+
+    steps.append(BuildStep(
+        output=ROOT / INDEX_FILE,
+        inputs=[ROOT / output_file for _, _, output_file in TOKEN_PATTERN_SOURCES],
+        action=generate_index_step,
+        options={"timestamp": timestamp},
+    ))
+
+    steps.append(BuildStep(
+        output=ROOT / PATTERN_IDS_FILE,
+        inputs=[*(ROOT / output_file for _, _, output_file in TOKEN_PATTERN_SOURCES), *shared_inputs],
+        action=generate_pattern_ids_step,
+        options={"timestamp": timestamp},
+    ))
+
+    return steps
+
+def generate_token_patterns(manifest: BuildManifest | None = None, jobs: int | None = None) -> bool:
+    """
+    Generate the token pattern files for every grammar in TOKEN_PATTERN_SOURCES,
+    and the index.ts that links them together. When a manifest is given, files
+    whose inputs are unchanged are skipped. Stale files are generated in
+    parallel, one worker per grammar. Returns True if anything was written.
+    """
+
+    if manifest is None:
+        manifest = BuildManifest()
+        manifest.entries.clear()
+
+    return len(BuildGraph(create_build_steps()).run(manifest, jobs)) > 0
+
+def generate_index(states: list[tuple[str, GeneratorState]], timestamp: str | None = None):
     # Write the typescript entries to a file
-    output_file = "src/tokenizer/generated/index.ts"
-    with open(ROOT / output_file, "w") as file:
+    with open(ROOT / INDEX_FILE, "w") as file:
         contents = "// THIS FILE HAS BEEN GENERATED BY THE `syntax_to_token_pattern.py` GENERATOR\n"
         contents += "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.\n"
         contents += "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.\n"
-        contents += f"// Last generated: {datetime.now(timezone.utc).strftime('%d/%m/%Y %H:%M:%S')} (UTC+0)\n"
+        contents += f"// Last generated: {timestamp or get_timestamp()} (UTC+0)\n"
         contents += "\n"
 
         # Add all source import from all states, but only the unique ones
-        source_imports = list(dict.fromkeys(renpy_state.source_imports + atl_state.source_imports + screen_state.source_imports + style_state.source_imports + python_state.source_imports))
+        source_imports = list(dict.fromkeys(i for _, state in states for i in state.source_imports))
 
         for source_import in source_imports:
             contents += f"import * as {titleCase(source_import)}Patterns from \"./{source_import}-token-patterns.g\";\n"
@@ -634,16 +1253,42 @@ def generate_token_patterns():
 
             return contents
 
-        contents += add_entries(renpy_state.external_pattern_include_entries, "RenpyPatterns")
-        contents += add_entries(atl_state.external_pattern_include_entries, "AtlPatterns")
-        contents += add_entries(screen_state.external_pattern_include_entries, "ScreenPatterns")
-        contents += add_entries(style_state.external_pattern_include_entries, "StylePatterns")
-        contents += add_entries(python_state.external_pattern_include_entries, "PythonPatterns")
+        for language, state in states:
+            contents += add_entries(state.external_pattern_include_entries, f"{titleCase(language)}Patterns")
 
         exports: list[str] = []
         for source_import in source_imports:
             exports.append(f"{titleCase(source_import)}Patterns")
 
-        contents += f"\n\nexport {{ {', '.join(exports)} }};"
+        contents += "\n\nexport { PATTERN_STATE_VERSION, UNIQUE_PATTERN_COUNT } from \"./pattern-ids.g\";"
+        contents += f"\nexport {{ {', '.join(exports)} }};"
 
         file.write(contents)
+
+def generate_pattern_ids(states: list[tuple[str, GeneratorState]], timestamp: str | None = None):
+    """
+    Writes the first pattern id of each token pattern file, so the ids are unique
+    across all files, and the total number of pattern ids.
+    """
+
+    lines = [
+        "// THIS FILE HAS BEEN GENERATED BY THE `syntax_to_token_pattern.py` GENERATOR",
+        "// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.",
+        "// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.",
+        f"// Last generated: {timestamp or get_timestamp()} (UTC+0)",
+        "",
+        f"export const PATTERN_STATE_VERSION = {PATTERN_STATE_VERSION};",
+        "",
+    ]
+
+    pattern_count = 0
+    for language, state in states:
+        lines.append(f"export const {language.upper()}_PATTERN_ID_BASE = {pattern_count};")
+        pattern_count += state.pattern_count
+
+    lines.append("")
+    lines.append(f"export const UNIQUE_PATTERN_COUNT = {pattern_count};")
+    lines.append("")
+
+    with open(ROOT / PATTERN_IDS_FILE, "w") as file:
+        file.write("\n".join(lines))
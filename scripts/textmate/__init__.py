@@ -0,0 +1,43 @@
+"""
+A TextMate tokenizer that runs without VS Code, on the grammars in syntaxes/.
+It follows what vscode-textmate does, with the regex module standing in for
+Oniguruma. Injections aren't supported.
+"""
+
+from typing import Iterable, Iterator
+
+from .document import Document, split_lines
+from .grammar import Grammar, Registry, RulePath
+from .onig import CompileError, Regex
+from .stack import RuleStack, Scopes, StackTable
+from .tokenizer import Token, tokenize_line
+
+
+def tokenize_lines(grammar: Grammar, lines: Iterable[str]) -> Iterator[tuple[list[Token], RuleStack]]:
+    """
+    Tokenizes the lines of a document in order, yielding the tokens of each
+    line and the stack it ended with.
+    """
+
+    stack: RuleStack | None = None
+
+    for line in lines:
+        tokens, stack = tokenize_line(grammar, line, stack)
+        yield (tokens, stack)
+
+
+__all__ = [
+    "CompileError",
+    "Document",
+    "Grammar",
+    "Regex",
+    "Registry",
+    "RulePath",
+    "RuleStack",
+    "Scopes",
+    "StackTable",
+    "Token",
+    "split_lines",
+    "tokenize_line",
+    "tokenize_lines",
+]
@@ -0,0 +1,110 @@
+import re
+
+from .grammar import Grammar
+from .stack import RuleStack
+from .tokenizer import Token, tokenize_line
+
+# How VS Code splits a document into lines.
+LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+
+
+def split_lines(text: str) -> list[str]:
+    return LINE_BREAK_RE.split(text)
+
+
+class Document:
+    """
+    The lines of a document, with the tokens of each line and the stack each
+    line ended with.
+
+    After an edit, the lines are tokenized again from the first line that
+    changed, and that stops at the first line after the edit that ends with the
+    same stack as before, since every line after it begins with the same stack,
+    and so has the same tokens. The stacks are interned, so that is a
+    comparison by identity. Most edits only tokenize the lines they change.
+    """
+
+    def __init__(self, grammar: Grammar, text: str = ""):
+        self.grammar = grammar
+
+        self.lines: list[str] = []
+        self.tokens: list[list[Token]] = []
+
+        # The stack each line ended with, or None for a line that wasn't tokenized yet.
+        self.stacks: list[RuleStack | None] = []
+
+        self.set_text(text)
+
+    def edit(self, start: int, end: int, lines: list[str]) -> range:
+        """
+        Replaces the lines from `start` up to `end` with `lines`, and tokenizes
+        the lines that can have changed. Returns the range of the lines that
+        were tokenized.
+        """
+
+        count = len(lines)
+
+        self.lines[start:end] = lines
+        self.tokens[start:end] = [[] for _ in range(count)]
+        self.stacks[start:end] = [None] * count
+
+        return self.retokenize(start, start + count)
+
+    def replace(self, start_line: int, start_column: int, end_line: int, end_column: int, text: str) -> range:
+        """
+        Replaces the text between two positions with `text`, which may have line
+        breaks, like a change event of an editor. Returns the range of the lines
+        that were tokenized.
+        """
+
+        prefix = self.lines[start_line][:start_column]
+        suffix = self.lines[end_line][end_column:]
+
+        return self.edit(start_line, end_line + 1, split_lines(prefix + text + suffix))
+
+    def set_text(self, text: str) -> range:
+        """
+        Replaces the text of the document, as when a file was saved. Only the
+        lines between the first and the last line that differ are replaced.
+        Returns the range of the lines that were tokenized.
+        """
+
+        lines = split_lines(text)
+        limit = min(len(lines), len(self.lines))
+
+        prefix = 0
+        while prefix < limit and lines[prefix] == self.lines[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while suffix < limit - prefix and lines[-1 - suffix] == self.lines[-1 - suffix]:
+            suffix += 1
+
+        return self.edit(prefix, len(self.lines) - suffix, lines[prefix:len(lines) - suffix])
+
+    def retokenize(self, start: int, end: int) -> range:
+        """
+        Tokenizes the lines from `start`, at least up to `end`, and then until a
+        line ends with the same stack as it did before. Returns the range of the
+        lines that were tokenized.
+        """
+
+        stack = self.stacks[start - 1] if start > 0 else None
+        i = start
+
+        while i < len(self.lines):
+            tokens, stack = tokenize_line(self.grammar, self.lines[i], stack)
+
+            old = self.stacks[i]
+            self.tokens[i] = tokens
+            self.stacks[i] = stack
+
+            i += 1
+
+            if i >= end and old is stack:
+                break
+
+        return range(start, i)
+
+    def text(self) -> str:
+        return "\n".join(self.lines)
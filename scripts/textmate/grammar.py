@@ -0,0 +1,357 @@
+import json
+import pathlib
+from typing import Any
+
+import regex
+
+from .onig import CompileError, Regex
+from .rules import END_RULE_ID, WHILE_RULE_ID, BeginEndRule, BeginWhileRule, CaptureRule, Captures, IncludeOnlyRule, MatchRule, Rule
+from .stack import RuleStack, StackTable
+
+# The regexes a rule scans for, with the id of the rule each belongs to.
+Scanner = list[tuple[int, Regex]]
+
+# A scanner compiled for where \A and \G can match: the id of the rule of each
+# regex, the compiled regex, and if a match of an earlier search of the same
+# text can be reused, which it can't when the regex has an anchor.
+CompiledScanner = list[tuple[int, regex.Pattern[str], bool]]
+
+# Where the pattern of a rule is: the scope of its grammar, the repository entry
+# it's in, or None if it's in the top-level patterns, and the path to it from
+# there, like ".patterns![2].captures![1]", as in the debugName of the token
+# patterns.
+RulePath = tuple[str, str | None, str]
+
+
+class Registry:
+    """
+    The grammars that can be tokenized and included, by scope name.
+    """
+
+    def __init__(self, grammars: dict[str, dict[str, Any]]):
+        self.raw_grammars = grammars
+        self._grammars: dict[str, Grammar] = {}
+
+    @classmethod
+    def from_directory(cls, path: pathlib.Path) -> "Registry":
+        """
+        Loads every .json grammar in `path`.
+        """
+
+        grammars: dict[str, dict[str, Any]] = {}
+
+        for i in sorted(path.glob("*.json")):
+            with open(i, "r", encoding="utf-8") as file:
+                grammar = json.load(file)
+
+            if "scopeName" in grammar:
+                grammars[grammar["scopeName"]] = grammar
+
+        return cls(grammars)
+
+    def grammar(self, scope: str) -> "Grammar":
+        """
+        Returns the grammar with `scope`, ready to tokenize. Raises KeyError if
+        there is none.
+        """
+
+        rv = self._grammars.get(scope)
+
+        if rv is None:
+            rv = self._grammars[scope] = Grammar(self, scope)
+
+        return rv
+
+
+class Grammar:
+    """
+    A grammar, with its patterns compiled into rules. The patterns of other
+    grammars it includes are compiled into the same rules, the way
+    vscode-textmate does, so $base refers to this grammar.
+    """
+
+    def __init__(self, registry: Registry, scope: str):
+        self.registry = registry
+        self.scope = scope
+
+        # The rules by id, and the id of the pattern each rule was compiled from.
+        self.rules: list[Rule] = []
+        self._rule_ids: dict[int, int] = {}
+
+        # Where the pattern of each rule is, by rule id. A pattern that is
+        # included from several places has the path of its definition.
+        self.rule_paths: list[RulePath] = []
+
+        # Keeps the patterns alive, since their ids are only unique while they are.
+        self._patterns: list[dict[str, Any]] = []
+
+        # The top-level patterns of each grammar, as a pattern of their own.
+        self._self_patterns: dict[str, dict[str, Any]] = {}
+
+        self._scanners: dict[int, Scanner] = {}
+        self._compiled_scanners: dict[tuple[int, str | None, bool, bool, bool], CompiledScanner] = {}
+        self._end_regexes: dict[str, Regex] = {}
+
+        # The stacks lines ended with.
+        self.stacks = StackTable()
+
+        # Includes that couldn't be resolved, and regexes that couldn't be compiled.
+        self.errors: list[str] = []
+        self._reported: set[str] = set()
+
+        self.root_id = self._rule_id(self._self_pattern(scope), scope, (scope, None, ""))
+
+    def _error(self, message: str):
+        if message not in self._reported:
+            self._reported.add(message)
+            self.errors.append(message)
+
+    def _self_pattern(self, scope: str) -> dict[str, Any] | None:
+        rv = self._self_patterns.get(scope)
+
+        if rv is None:
+            grammar = self.registry.raw_grammars.get(scope)
+            if grammar is None:
+                return None
+
+            rv = self._self_patterns[scope] = {"patterns": grammar.get("patterns", [])}
+
+        return rv
+
+    def _resolve_include(self, include: str, scope: str) -> tuple[dict[str, Any], str, RulePath] | None:
+        """
+        Returns the pattern an include in the grammar with `scope` refers to,
+        the scope of the grammar it is in, and its path.
+        """
+
+        if include in ("$self", "$base"):
+            target_scope = scope if include == "$self" else self.scope
+            reference = ""
+        elif include.startswith("#"):
+            target_scope = scope
+            reference = include[1:]
+        else:
+            target_scope, _, reference = include.partition("#")
+
+        grammar = self.registry.raw_grammars.get(target_scope)
+
+        if grammar is None:
+            pattern = None
+        elif reference:
+            pattern = grammar.get("repository", {}).get(reference)
+        else:
+            pattern = self._self_pattern(target_scope)
+
+        if pattern is None:
+            self._error(f"{scope} includes {include}, which doesn't exist.")
+            return None
+
+        return (pattern, target_scope, (target_scope, reference or None, ""))
+
+    def _rule_id(self, pattern: dict[str, Any] | None, scope: str, path: RulePath) -> int:
+        """
+        Compiles `pattern`, from the grammar with `scope`, unless it already is,
+        and returns the id of its rule.
+        """
+
+        if pattern is None:
+            pattern = {}
+
+        rv = self._rule_ids.get(id(pattern))
+        if rv is not None:
+            return rv
+
+        rv = len(self.rules)
+        self._rule_ids[id(pattern)] = rv
+        self._patterns.append(pattern)
+
+        # Reserves the id, since the patterns of a rule can include the rule itself.
+        self.rules.append(Rule(rv, None, None))
+        self.rule_paths.append(path)
+        self.rules[rv] = self._compile(rv, pattern, scope, path)
+
+        return rv
+
+    def _compile(self, rule_id: int, pattern: dict[str, Any], scope: str, path: RulePath) -> Rule:
+        name = pattern.get("name")
+        content_name = pattern.get("contentName")
+
+        if "match" in pattern:
+            return MatchRule(rule_id, name, Regex(pattern["match"]), self._compile_captures(pattern, "captures", scope, path))
+
+        patterns = self._compile_patterns(pattern.get("patterns", []), scope, path)
+
+        if "begin" not in pattern:
+            return IncludeOnlyRule(rule_id, name, content_name, patterns)
+
+        begin_captures = self._compile_captures(pattern, "beginCaptures", scope, path)
+
+        if "while" in pattern:
+            return BeginWhileRule(
+                rule_id,
+                name,
+                content_name,
+                Regex(pattern["begin"]),
+                begin_captures,
+                Regex(pattern["while"]),
+                self._compile_captures(pattern, "whileCaptures", scope, path),
+                patterns,
+            )
+
+        return BeginEndRule(
+            rule_id,
+            name,
+            content_name,
+            Regex(pattern["begin"]),
+            begin_captures,
+            # A rule without an end never ends.
+            Regex(pattern.get("end", "(?!)")),
+            self._compile_captures(pattern, "endCaptures", scope, path),
+            bool(pattern.get("applyEndPatternLast")),
+            patterns,
+        )
+
+    def _compile_patterns(self, patterns: list[dict[str, Any]], scope: str, path: RulePath) -> list[int]:
+        rv: list[int] = []
+
+        for i, pattern in enumerate(patterns):
+            if "include" in pattern:
+                resolved = self._resolve_include(pattern["include"], scope)
+
+                if resolved is not None:
+                    rv.append(self._rule_id(*resolved))
+
+            else:
+                rv.append(self._rule_id(pattern, scope, (path[0], path[1], f"{path[2]}.patterns![{i}]")))
+
+        return rv
+
+    def _compile_captures(self, pattern: dict[str, Any], key: str, scope: str, path: RulePath) -> Captures:
+        """
+        Compiles the captures of `pattern` under `key`, or its "captures" if it
+        has none.
+        """
+
+        if key not in pattern:
+            key = "captures"
+
+        captures = pattern.get(key)
+        if not captures:
+            return []
+
+        rv: Captures = [None] * (max(int(i) for i in captures) + 1)
+
+        for k, v in captures.items():
+            retokenize_rule_id = self._rule_id(v, scope, (path[0], path[1], f"{path[2]}.{key}![{k}]")) if "patterns" in v else None
+            rv[int(k)] = CaptureRule(-1, v.get("name"), v.get("contentName"), retokenize_rule_id)
+
+        return rv
+
+    def _collect_patterns(self, patterns: list[int], out: Scanner, seen: set[int]):
+        """
+        Adds the regexes that start each of `patterns` to `out`, in order,
+        flattening the rules that are only lists of patterns.
+        """
+
+        for rule_id in patterns:
+            rule = self.rules[rule_id]
+
+            if isinstance(rule, MatchRule):
+                out.append((rule_id, rule.match))
+
+            elif isinstance(rule, (BeginEndRule, BeginWhileRule)):
+                out.append((rule_id, rule.begin))
+
+            elif isinstance(rule, IncludeOnlyRule) and rule_id not in seen:
+                seen.add(rule_id)
+                self._collect_patterns(rule.patterns, out, seen)
+                seen.discard(rule_id)
+
+    def scanner(self, stack: RuleStack) -> Scanner:
+        """
+        Returns the regexes to scan for with `stack`, in the order they are
+        tried when more than one matches at the same position.
+        """
+
+        rule = self.rules[stack.rule_id]
+        rv = self._scanners.get(stack.rule_id)
+
+        if rv is None:
+            rv = []
+
+            if isinstance(rule, (IncludeOnlyRule, BeginEndRule, BeginWhileRule)):
+                self._collect_patterns(rule.patterns, rv, {stack.rule_id})
+
+            if isinstance(rule, BeginEndRule):
+                rv.insert(len(rv) if rule.apply_end_pattern_last else 0, (END_RULE_ID, rule.end))
+
+            self._scanners[stack.rule_id] = rv
+
+        if stack.end_rule is not None and isinstance(rule, BeginEndRule):
+            end = self.end_regex(stack.end_rule)
+            rv = [(END_RULE_ID, end) if rule_id == END_RULE_ID else (rule_id, regex_) for rule_id, regex_ in rv]
+
+        return rv
+
+    def while_scanner(self, stack: RuleStack) -> Scanner:
+        rule = self.rules[stack.rule_id]
+        assert isinstance(rule, BeginWhileRule)
+
+        return [(WHILE_RULE_ID, rule.while_ if stack.end_rule is None else self.end_regex(stack.end_rule))]
+
+    def compiled_scanner(self, stack: RuleStack, allow_a: bool, allow_g: bool, while_: bool = False) -> CompiledScanner:
+        """
+        Returns the scanner of `stack`, or its while scanner, compiled for
+        whether \\A and \\G can match. Regexes that can't be compiled are left
+        out.
+        """
+
+        key = (stack.rule_id, stack.end_rule, allow_a, allow_g, while_)
+        rv = self._compiled_scanners.get(key)
+
+        if rv is None:
+            scanner = self.while_scanner(stack) if while_ else self.scanner(stack)
+            rv = []
+
+            for rule_id, regex_ in scanner:
+                pattern = self.compile_regex(regex_, allow_a, allow_g)
+
+                if pattern is not None:
+                    rv.append((rule_id, pattern, not regex_.has_anchors))
+
+            self._compiled_scanners[key] = rv
+
+        return rv
+
+    def end_regex(self, source: str) -> Regex:
+        """
+        Returns an end regex with its back references replaced, compiled once
+        for every text they were replaced with.
+        """
+
+        rv = self._end_regexes.get(source)
+
+        if rv is None:
+            rv = self._end_regexes[source] = Regex(source)
+
+        return rv
+
+    def compile_regex(self, regex_: Regex, allow_a: bool, allow_g: bool) -> regex.Pattern[str] | None:
+        """
+        Returns the compiled regex, or None if it can't be compiled, which is
+        reported once.
+        """
+
+        try:
+            return regex_.compile(allow_a, allow_g)
+        except CompileError as e:
+            self._error(f"Can't compile {e}")
+            return None
+
+    def initial_stack(self) -> RuleStack:
+        """
+        Returns the stack at the start of a document.
+        """
+
+        scopes = (self.scope,)
+        return self.stacks.intern(RuleStack(None, self.root_id, -1, -1, False, None, scopes, scopes))
@@ -0,0 +1,99 @@
+import re
+
+import regex
+
+# Matches the parts of an Oniguruma regex that the scanner treats specially:
+# the \A and \G anchors, back references, and any other escape, so that an
+# escaped backslash isn't mistaken for the start of one. Like vscode-textmate,
+# \0 counts as a back reference, to the whole match of the begin regex.
+ESCAPE_RE = re.compile(r"\\(?:([AG])|(\d+)|.)", re.DOTALL)
+
+# Replaces an anchor that can't match at the current position. It never matches.
+NEVER = "(?!)"
+
+
+class CompileError(Exception):
+    """
+    Raised when a regex of a grammar can't be compiled.
+    """
+
+
+class Regex:
+    """
+    A regex of a grammar, in the Oniguruma syntax.
+
+    The regex module understands almost all of that syntax, including lookbehinds
+    of variable width and POSIX classes. What differs is where \\A and \\G can
+    match: \\A only at the start of the document, and \\G only where the rule
+    that contains the regex began, like vscode-textmate does. So a regex with
+    either is compiled in up to four variants, one for each combination.
+    """
+
+    __slots__ = ("source", "has_anchors", "has_back_references", "_compiled")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.has_anchors = False
+        self.has_back_references = False
+
+        for m in ESCAPE_RE.finditer(source):
+            if m.group(1):
+                self.has_anchors = True
+            elif m.group(2):
+                self.has_back_references = True
+
+        self._compiled: dict[tuple[bool, bool], regex.Pattern[str]] = {}
+
+    def __repr__(self) -> str:
+        return f"<Regex {self.source!r}>"
+
+    def compile(self, allow_a: bool, allow_g: bool) -> regex.Pattern[str]:
+        """
+        Returns the regex compiled for a position where \\A and \\G may or may
+        not match. Raises CompileError if the regex is invalid.
+        """
+
+        if not self.has_anchors:
+            allow_a = allow_g = True
+
+        key = (allow_a, allow_g)
+        rv = self._compiled.get(key)
+
+        if rv is None:
+
+            def replace(m: re.Match[str]) -> str:
+                anchor = m.group(1)
+
+                if (anchor == "A" and not allow_a) or (anchor == "G" and not allow_g):
+                    return NEVER
+
+                return m.group(0)
+
+            try:
+                rv = regex.compile(ESCAPE_RE.sub(replace, self.source))
+            except regex.error as e:
+                raise CompileError(f"{self.source!r}: {e}") from None
+
+            self._compiled[key] = rv
+
+        return rv
+
+    def resolve_back_references(self, match: regex.Match[str]) -> str:
+        """
+        Returns the source of this regex, with every back reference replaced by
+        the text the group matched in `match`, the match of the begin regex of
+        the same rule. A group that didn't match is replaced by nothing.
+        """
+
+        def replace(m: re.Match[str]) -> str:
+            group = m.group(2)
+            if not group:
+                return m.group(0)
+
+            index = int(group)
+            if index > len(match.groups()) or match.start(index) < 0:
+                return ""
+
+            return regex.escape(match.group(index), special_only=True)
+
+        return ESCAPE_RE.sub(replace, self.source)
@@ -0,0 +1,148 @@
+import re
+
+import regex
+
+from .onig import Regex
+
+# The ids the scanner uses for the end regex of a begin/end rule, and for the
+# while regex of a begin/while rule, which aren't rules of their own.
+END_RULE_ID = -1
+WHILE_RULE_ID = -2
+
+# A reference to a capture in a scope name: $1, or ${1:/downcase}.
+CAPTURE_REFERENCE_RE = re.compile(r"\$(\d+)|\$\{(\d+):/(downcase|upcase)\}")
+
+
+def replace_captures(name: str, match: regex.Match[str]) -> str:
+    """
+    Replaces the references to captures in a scope name with the text of those
+    captures, without leading dots.
+    """
+
+    def replace(m: re.Match[str]) -> str:
+        index = int(m.group(1) or m.group(2))
+        if index > len(match.groups()):
+            return m.group(0)
+
+        text = (match.group(index) or "").lstrip(".")
+
+        if m.group(3) == "downcase":
+            return text.lower()
+        elif m.group(3) == "upcase":
+            return text.upper()
+
+        return text
+
+    return CAPTURE_REFERENCE_RE.sub(replace, name)
+
+
+class Rule:
+    """
+    A compiled pattern of a grammar.
+    """
+
+    __slots__ = ("id", "name", "content_name", "_name_has_captures", "_content_name_has_captures")
+
+    def __init__(self, id: int, name: str | None, content_name: str | None):
+        self.id = id
+        self.name = name
+        self.content_name = content_name
+        self._name_has_captures = name is not None and CAPTURE_REFERENCE_RE.search(name) is not None
+        self._content_name_has_captures = content_name is not None and CAPTURE_REFERENCE_RE.search(content_name) is not None
+
+    def get_name(self, match: regex.Match[str]) -> str | None:
+        if self.name is None or not self._name_has_captures:
+            return self.name
+
+        return replace_captures(self.name, match)
+
+    def get_content_name(self, match: regex.Match[str]) -> str | None:
+        if self.content_name is None or not self._content_name_has_captures:
+            return self.content_name
+
+        return replace_captures(self.content_name, match)
+
+
+class CaptureRule(Rule):
+    """
+    The scope of a capture, and the rule its text is tokenized with again, if
+    it has patterns of its own.
+    """
+
+    __slots__ = ("retokenize_rule_id",)
+
+    def __init__(self, id: int, name: str | None, content_name: str | None, retokenize_rule_id: int | None):
+        super().__init__(id, name, content_name)
+        self.retokenize_rule_id = retokenize_rule_id
+
+
+# The captures of a rule, by the number of the group. Groups without a capture are None.
+Captures = list[CaptureRule | None]
+
+
+class MatchRule(Rule):
+    __slots__ = ("match", "captures")
+
+    def __init__(self, id: int, name: str | None, match: Regex, captures: Captures):
+        super().__init__(id, name, None)
+        self.match = match
+        self.captures = captures
+
+
+class IncludeOnlyRule(Rule):
+    """
+    A rule that is only a list of patterns, like a repository entry, or the
+    top-level patterns of a grammar.
+    """
+
+    __slots__ = ("patterns",)
+
+    def __init__(self, id: int, name: str | None, content_name: str | None, patterns: list[int]):
+        super().__init__(id, name, content_name)
+        self.patterns = patterns
+
+
+class BeginEndRule(Rule):
+    __slots__ = ("begin", "begin_captures", "end", "end_captures", "apply_end_pattern_last", "patterns")
+
+    def __init__(
+        self,
+        id: int,
+        name: str | None,
+        content_name: str | None,
+        begin: Regex,
+        begin_captures: Captures,
+        end: Regex,
+        end_captures: Captures,
+        apply_end_pattern_last: bool,
+        patterns: list[int],
+    ):
+        super().__init__(id, name, content_name)
+        self.begin = begin
+        self.begin_captures = begin_captures
+        self.end = end
+        self.end_captures = end_captures
+        self.apply_end_pattern_last = apply_end_pattern_last
+        self.patterns = patterns
+
+
+class BeginWhileRule(Rule):
+    __slots__ = ("begin", "begin_captures", "while_", "while_captures", "patterns")
+
+    def __init__(
+        self,
+        id: int,
+        name: str | None,
+        content_name: str | None,
+        begin: Regex,
+        begin_captures: Captures,
+        while_: Regex,
+        while_captures: Captures,
+        patterns: list[int],
+    ):
+        super().__init__(id, name, content_name)
+        self.begin = begin
+        self.begin_captures = begin_captures
+        self.while_ = while_
+        self.while_captures = while_captures
+        self.patterns = patterns
@@ -0,0 +1,206 @@
+from typing import Any
+
+# The scopes of a token, from the scope of the grammar to the innermost one.
+Scopes = tuple[str, ...]
+
+
+def push_scopes(scopes: Scopes, name: str | None) -> Scopes:
+    """
+    Returns `scopes` with the scopes of `name` added, since a name can be more
+    than one scope, separated by spaces.
+    """
+
+    if not name:
+        return scopes
+
+    return scopes + tuple(name.split())
+
+
+class RuleStack:
+    """
+    The state of the tokenizer between two lines: the rules that began and
+    haven't ended yet, innermost last. A stack is never changed; each change
+    returns a new stack that shares its parents.
+
+    Two stacks are equal if they have the same rules, with the same scopes and
+    the same resolved end regexes, so a line tokenized with either gives the
+    same tokens. The positions only matter within a line.
+
+    The stacks that lines end with are interned by a StackTable, so equal
+    stacks between lines are the same object.
+    """
+
+    __slots__ = ("parent", "rule_id", "enter_pos", "anchor_pos", "begin_rule_captured_eol", "end_rule", "name_scopes", "content_name_scopes", "depth", "interned", "_hash")
+
+    def __init__(
+        self,
+        parent: "RuleStack | None",
+        rule_id: int,
+        enter_pos: int,
+        anchor_pos: int,
+        begin_rule_captured_eol: bool,
+        end_rule: str | None,
+        name_scopes: Scopes,
+        content_name_scopes: Scopes,
+    ):
+        self.parent = parent
+        self.rule_id = rule_id
+
+        # Where in the current line the rule began, and where \G matches, or -1.
+        self.enter_pos = enter_pos
+        self.anchor_pos = anchor_pos
+
+        # If the begin regex matched the end of its line, so \G matches at the start of the next.
+        self.begin_rule_captured_eol = begin_rule_captured_eol
+
+        # The source of the end regex, if it has back references that were replaced.
+        self.end_rule = end_rule
+
+        self.name_scopes = name_scopes
+        self.content_name_scopes = content_name_scopes
+
+        self.depth = parent.depth + 1 if parent is not None else 1
+        self.interned = False
+        self._hash: int | None = None
+
+    def __repr__(self) -> str:
+        return f"<RuleStack depth={self.depth} rule={self.rule_id} scopes={' '.join(self.content_name_scopes)}>"
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, RuleStack) or self.depth != other.depth or hash(self) != hash(other):
+            return False
+
+        a: RuleStack | None = self
+        b: RuleStack | None = other
+
+        while a is not None and b is not None:
+            if a is b:
+                return True
+
+            # Interned stacks are only equal to themselves.
+            if a.interned and b.interned:
+                return False
+
+            if a.key() != b.key():
+                return False
+
+            a = a.parent
+            b = b.parent
+
+        return a is None and b is None
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.parent, *self.key()))
+
+        return self._hash
+
+    def key(self) -> tuple[int, bool, str | None, Scopes, Scopes]:
+        """
+        Returns what this element of the stack is compared by, besides its parent.
+        """
+
+        return (self.rule_id, self.begin_rule_captured_eol, self.end_rule, self.name_scopes, self.content_name_scopes)
+
+    def push(self, rule_id: int, enter_pos: int, anchor_pos: int, begin_rule_captured_eol: bool, end_rule: str | None, name_scopes: Scopes, content_name_scopes: Scopes) -> "RuleStack":
+        return RuleStack(self, rule_id, enter_pos, anchor_pos, begin_rule_captured_eol, end_rule, name_scopes, content_name_scopes)
+
+    def pop(self) -> "RuleStack":
+        assert self.parent is not None
+        return self.parent
+
+    def safe_pop(self) -> "RuleStack":
+        """
+        Pops the innermost rule, unless it's the root of the grammar.
+        """
+
+        return self.parent if self.parent is not None else self
+
+    def with_content_name_scopes(self, content_name_scopes: Scopes) -> "RuleStack":
+        if self.content_name_scopes == content_name_scopes:
+            return self
+
+        return RuleStack(self.parent, self.rule_id, self.enter_pos, self.anchor_pos, self.begin_rule_captured_eol, self.end_rule, self.name_scopes, content_name_scopes)
+
+    def with_end_rule(self, end_rule: str) -> "RuleStack":
+        if self.end_rule == end_rule:
+            return self
+
+        return RuleStack(self.parent, self.rule_id, self.enter_pos, self.anchor_pos, self.begin_rule_captured_eol, end_rule, self.name_scopes, self.content_name_scopes)
+
+    def has_same_rule_as(self, other: "RuleStack") -> bool:
+        """
+        Returns True if a rule that began where `other` began is the same rule
+        as `other`, which means a rule was pushed again without consuming any
+        input.
+        """
+
+        el: RuleStack | None = self
+
+        while el is not None and el.enter_pos == other.enter_pos:
+            if el.rule_id == other.rule_id:
+                return True
+
+            el = el.parent
+
+        return False
+
+    def reset(self) -> "RuleStack":
+        """
+        Returns this stack, with the positions within the line forgotten, for
+        the start of the next line.
+        """
+
+        parent = self.parent.reset() if self.parent is not None else None
+
+        if parent is self.parent and self.enter_pos == -1 and self.anchor_pos == -1:
+            return self
+
+        return RuleStack(parent, self.rule_id, -1, -1, self.begin_rule_captured_eol, self.end_rule, self.name_scopes, self.content_name_scopes)
+
+
+class StackTable:
+    """
+    Interns the stacks that lines end with, and their scopes, so the stacks of
+    the lines of a document share their elements, and equal stacks can be
+    compared by identity.
+    """
+
+    def __init__(self):
+        # The interned stacks, by the id of their interned parent and their key.
+        self._stacks: dict[tuple[int, tuple[int, bool, str | None, Scopes, Scopes]], RuleStack] = {}
+        self._scopes: dict[Scopes, Scopes] = {}
+
+    def __len__(self) -> int:
+        return len(self._stacks)
+
+    def scopes(self, scopes: Scopes) -> Scopes:
+        return self._scopes.setdefault(scopes, scopes)
+
+    def intern(self, stack: RuleStack) -> RuleStack:
+        """
+        Returns the interned stack that is equal to `stack`, with the positions
+        within the line forgotten.
+        """
+
+        if stack.interned:
+            return stack
+
+        parent = self.intern(stack.parent) if stack.parent is not None else None
+        key = (id(parent), stack.key())
+
+        rv = self._stacks.get(key)
+
+        if rv is None:
+            name_scopes = self.scopes(stack.name_scopes)
+            content_name_scopes = self.scopes(stack.content_name_scopes)
+
+            rv = RuleStack(parent, stack.rule_id, -1, -1, stack.begin_rule_captured_eol, stack.end_rule, name_scopes, content_name_scopes)
+            rv.interned = True
+
+            self._stacks[key] = rv
+
+        return rv
@@ -0,0 +1,287 @@
+from dataclasses import dataclass
+
+import regex
+
+from .grammar import CompiledScanner, Grammar
+from .rules import END_RULE_ID, WHILE_RULE_ID, BeginEndRule, BeginWhileRule, Captures, MatchRule
+from .stack import RuleStack, Scopes, push_scopes
+
+# The matches of the regexes of a text, as the position each was searched from
+# and the match, or None if there was none from there.
+ScanCache = dict[regex.Pattern[str], tuple[int, regex.Match[str] | None]]
+
+
+@dataclass(frozen=True)
+class Token:
+    start: int
+    end: int
+    scopes: Scopes
+
+
+class LineTokens:
+    """
+    Collects the tokens of a line, each ending where the next one starts.
+    """
+
+    def __init__(self):
+        self.tokens: list[Token] = []
+        self.last_end = 0
+
+    def produce(self, stack: RuleStack, end: int):
+        self.produce_from_scopes(stack.content_name_scopes, end)
+
+    def produce_from_scopes(self, scopes: Scopes, end: int):
+        if self.last_end >= end:
+            return
+
+        self.tokens.append(Token(self.last_end, end, scopes))
+        self.last_end = end
+
+
+def find_next_match(scanner: CompiledScanner, text: str, pos: int, cache: ScanCache) -> tuple[int, regex.Match[str]] | None:
+    """
+    Returns the id of the rule with the earliest match in `text` at or after
+    `pos`, and the match. When several match at the same position, the first
+    in `scanner` wins.
+    """
+
+    best: tuple[int, regex.Match[str]] | None = None
+
+    for rule_id, pattern, cacheable in scanner:
+        # A search from an earlier position is still good if its match doesn't
+        # start before this one.
+        cached = cache.get(pattern) if cacheable else None
+
+        if cached is not None and cached[0] <= pos and (cached[1] is None or cached[1].start() >= pos):
+            m = cached[1]
+        else:
+            m = pattern.search(text, pos)
+
+            if cacheable:
+                cache[pattern] = (pos, m)
+
+        if m is None:
+            continue
+
+        if best is None or m.start() < best[1].start():
+            best = (rule_id, m)
+
+            # Nothing can match earlier.
+            if m.start() == pos:
+                break
+
+    return best
+
+
+def handle_captures(grammar: Grammar, text: str, is_first_line: bool, stack: RuleStack, tokens: LineTokens, captures: Captures, m: regex.Match[str]):
+    """
+    Produces the tokens for the captures of a match, up to its end. A capture
+    within another capture gets the scopes of both.
+    """
+
+    if not captures:
+        return
+
+    count = min(len(captures), len(m.groups()) + 1)
+    max_end = m.end()
+
+    # The scopes of the enclosing captures, and where each ends.
+    local_stack: list[tuple[Scopes, int]] = []
+
+    for i in range(count):
+        capture = captures[i]
+        if capture is None:
+            continue
+
+        start, end = m.span(i)
+        if start == end:
+            continue
+
+        if start > max_end:
+            break
+
+        while local_stack and local_stack[-1][1] <= start:
+            tokens.produce_from_scopes(*local_stack.pop())
+
+        if local_stack:
+            tokens.produce_from_scopes(local_stack[-1][0], start)
+        else:
+            tokens.produce(stack, start)
+
+        if capture.retokenize_rule_id is not None:
+            name_scopes = push_scopes(stack.content_name_scopes, capture.get_name(m))
+            content_name_scopes = push_scopes(name_scopes, capture.get_content_name(m))
+            capture_stack = stack.push(capture.retokenize_rule_id, start, -1, False, None, name_scopes, content_name_scopes)
+
+            tokenize_string(grammar, text[:end], is_first_line and start == 0, start, capture_stack, tokens, False)
+            continue
+
+        name = capture.get_name(m)
+
+        if name is not None:
+            base = local_stack[-1][0] if local_stack else stack.content_name_scopes
+            local_stack.append((push_scopes(base, name), end))
+
+    while local_stack:
+        tokens.produce_from_scopes(*local_stack.pop())
+
+
+def check_while_conditions(grammar: Grammar, text: str, is_first_line: bool, pos: int, stack: RuleStack, tokens: LineTokens) -> tuple[RuleStack, int, bool, int]:
+    """
+    Checks the while regexes of the begin/while rules on the stack, outermost
+    first, and pops the first rule whose while regex doesn't match, with every
+    rule inside it. Returns the stack, the position, if it's still the first
+    line, and the anchor position.
+    """
+
+    anchor_pos = 0 if stack.begin_rule_captured_eol else -1
+
+    while_stacks: list[RuleStack] = []
+    node: RuleStack | None = stack
+
+    while node is not None:
+        if isinstance(grammar.rules[node.rule_id], BeginWhileRule):
+            while_stacks.append(node)
+
+        node = node.parent
+
+    cache: ScanCache = {}
+
+    for while_stack in reversed(while_stacks):
+        rule = grammar.rules[while_stack.rule_id]
+        assert isinstance(rule, BeginWhileRule)
+
+        found = find_next_match(grammar.compiled_scanner(while_stack, is_first_line, pos == anchor_pos, while_=True), text, pos, cache)
+
+        if found is None or found[0] != WHILE_RULE_ID:
+            stack = while_stack.pop()
+            break
+
+        m = found[1]
+
+        tokens.produce(while_stack, m.start())
+        handle_captures(grammar, text, is_first_line, while_stack, tokens, rule.while_captures, m)
+        tokens.produce(while_stack, m.end())
+
+        anchor_pos = m.end()
+
+        if m.end() > pos:
+            pos = m.end()
+            is_first_line = False
+
+    return (stack, pos, is_first_line, anchor_pos)
+
+
+def tokenize_string(grammar: Grammar, text: str, is_first_line: bool, pos: int, stack: RuleStack, tokens: LineTokens, check_while: bool) -> RuleStack:
+    """
+    Tokenizes `text` from `pos`, the way vscode-textmate does. Returns the stack
+    at the end of the text.
+    """
+
+    length = len(text)
+    anchor_pos = -1
+    cache: ScanCache = {}
+
+    if check_while:
+        stack, pos, is_first_line, anchor_pos = check_while_conditions(grammar, text, is_first_line, pos, stack, tokens)
+
+    while True:
+        found = find_next_match(grammar.compiled_scanner(stack, is_first_line, pos == anchor_pos), text, pos, cache)
+
+        if found is None:
+            tokens.produce(stack, length)
+            return stack
+
+        rule_id, m = found
+        start, end = m.span()
+        has_advanced = end > pos
+
+        if rule_id == END_RULE_ID:
+            popped_rule = grammar.rules[stack.rule_id]
+            assert isinstance(popped_rule, BeginEndRule)
+
+            tokens.produce(stack, start)
+            stack = stack.with_content_name_scopes(stack.name_scopes)
+            handle_captures(grammar, text, is_first_line, stack, tokens, popped_rule.end_captures, m)
+            tokens.produce(stack, end)
+
+            popped = stack
+            stack = stack.pop()
+            anchor_pos = popped.anchor_pos
+
+            # The rule began and ended at the same position, so it would begin again.
+            if not has_advanced and popped.enter_pos == pos:
+                tokens.produce(popped, length)
+                return popped
+
+        else:
+            rule = grammar.rules[rule_id]
+
+            tokens.produce(stack, start)
+            before_push = stack
+
+            name_scopes = push_scopes(stack.content_name_scopes, rule.get_name(m))
+            stack = stack.push(rule_id, pos, anchor_pos, end == length, None, name_scopes, name_scopes)
+
+            if isinstance(rule, (BeginEndRule, BeginWhileRule)):
+                handle_captures(grammar, text, is_first_line, stack, tokens, rule.begin_captures, m)
+                tokens.produce(stack, end)
+                anchor_pos = end
+
+                stack = stack.with_content_name_scopes(push_scopes(name_scopes, rule.get_content_name(m)))
+
+                other = rule.end if isinstance(rule, BeginEndRule) else rule.while_
+                if other.has_back_references:
+                    stack = stack.with_end_rule(other.resolve_back_references(m))
+
+                # The same rule was pushed again without consuming anything.
+                if not has_advanced and before_push.has_same_rule_as(stack):
+                    stack = stack.pop()
+                    tokens.produce(stack, length)
+                    return stack
+
+            else:
+                assert isinstance(rule, MatchRule)
+
+                handle_captures(grammar, text, is_first_line, stack, tokens, rule.captures, m)
+                tokens.produce(stack, end)
+                stack = stack.pop()
+
+                # Nothing was consumed, nor pushed or popped, so the same match would be found again.
+                if not has_advanced:
+                    stack = stack.safe_pop()
+                    tokens.produce(stack, length)
+                    return stack
+
+        if end > pos:
+            pos = end
+            is_first_line = False
+
+
+def tokenize_line(grammar: Grammar, line: str, stack: RuleStack | None = None) -> tuple[list[Token], RuleStack]:
+    """
+    Tokenizes a line, without its line ending, starting with the stack the
+    previous line ended with, or None for the first line of a document.
+    Returns the tokens of the line and the stack it ended with, interned by
+    the grammar, so the stacks of two lines are equal only if they are the
+    same object.
+
+    Positions are in code points, where vscode-textmate counts UTF-16 code
+    units, so they differ after a character outside the BMP.
+    """
+
+    if stack is None:
+        is_first_line = True
+        stack = grammar.initial_stack()
+    else:
+        is_first_line = False
+        stack = stack.reset()
+
+    tokens = LineTokens()
+    stack = tokenize_string(grammar, line + "\n", is_first_line, 0, stack, tokens, True)
+
+    # The line ending isn't part of the line.
+    length = len(line)
+    rv = [Token(i.start, min(i.end, length), i.scopes) for i in tokens.tokens if i.start < length]
+
+    return (rv, grammar.stacks.intern(stack))
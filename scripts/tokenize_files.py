@@ -0,0 +1,151 @@
+import argparse
+import pathlib
+import time
+from dataclasses import dataclass, field
+
+import textmate
+
+from parallel import default_jobs, parallel_map
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+# The grammar each kind of file is tokenized with.
+EXTENSION_SCOPES = {
+    ".rpy": "source.renpy",
+    ".rpym": "source.renpy",
+}
+
+# The registry of each worker process, loaded by the first file it tokenizes.
+registries: dict[pathlib.Path, textmate.Registry] = {}
+
+
+@dataclass
+class FileResult:
+    path: pathlib.Path
+    lines: int = 0
+    tokens: int = 0
+
+    # The tokens with an invalid.* scope, as (line, column, text).
+    invalid: list[tuple[int, int, str]] = field(default_factory=list[tuple[int, int, str]])
+
+    time: float = 0.0
+
+    # The lines of --dump, if it was given.
+    dump: list[str] = field(default_factory=list[str])
+
+    # The grammar problems found while tokenizing, like includes that don't exist.
+    errors: list[str] = field(default_factory=list[str])
+
+
+@dataclass(frozen=True)
+class Job:
+    path: pathlib.Path
+    scope: str
+    syntaxes: pathlib.Path
+    dump: bool
+
+
+def get_registry(syntaxes: pathlib.Path) -> textmate.Registry:
+    rv = registries.get(syntaxes)
+
+    if rv is None:
+        rv = registries[syntaxes] = textmate.Registry.from_directory(syntaxes)
+
+    return rv
+
+
+def tokenize_file(job: Job) -> FileResult:
+    grammar = get_registry(job.syntaxes).grammar(job.scope)
+    rv = FileResult(job.path)
+
+    with open(job.path, "r", encoding="utf-8", errors="replace") as file:
+        lines = textmate.split_lines(file.read())
+
+    start = time.perf_counter()
+
+    for lineno, (tokens, _) in enumerate(textmate.tokenize_lines(grammar, lines), start=1):
+        line = lines[lineno - 1]
+        rv.tokens += len(tokens)
+
+        for token in tokens:
+            if any(i.startswith("invalid.") for i in token.scopes):
+                rv.invalid.append((lineno, token.start + 1, line[token.start:token.end]))
+
+            if job.dump:
+                rv.dump.append(f"{lineno}:{token.start + 1}-{token.end + 1} {line[token.start:token.end]!r} {' '.join(token.scopes)}")
+
+    rv.time = time.perf_counter() - start
+    rv.lines = len(lines)
+    rv.errors = list(grammar.errors)
+
+    return rv
+
+
+def find_files(paths: list[pathlib.Path]) -> list[pathlib.Path]:
+    """
+    Returns the files in `paths`, and the files with a known extension in the
+    directories in `paths`, recursively.
+    """
+
+    rv: list[pathlib.Path] = []
+
+    for path in paths:
+        if path.is_dir():
+            rv.extend(sorted(i for i in path.rglob("*") if i.suffix in EXTENSION_SCOPES and i.is_file()))
+        else:
+            rv.append(path)
+
+    return rv
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tokenize Ren'Py files with the TextMate grammars, without VS Code")
+    ap.add_argument("paths", nargs="*", type=pathlib.Path, help="The files, or game directories, to tokenize (default: examples/)")
+    ap.add_argument("-j", "--jobs", type=int, default=default_jobs(), help="The number of worker processes to use (default: %(default)s)")
+    ap.add_argument("--scope", help="The scope name of the grammar to use, instead of the one for the extension of each file")
+    ap.add_argument("--syntaxes", type=pathlib.Path, default=ROOT / "syntaxes", help="The directory of the .json grammars (default: %(default)s)")
+    ap.add_argument("--dump", action="store_true", help="Print every token, with its scopes")
+    ap.add_argument("--fail-on-invalid", action="store_true", help="Fail if any token has an invalid.* scope")
+    args = ap.parse_args()
+
+    files = find_files(args.paths or [ROOT / "examples"])
+    jobs: list[Job] = []
+
+    for path in files:
+        scope = args.scope or EXTENSION_SCOPES.get(path.suffix)
+        if scope is None:
+            raise SystemExit(f"Error: don't know which grammar to tokenize {path} with. Pass --scope.")
+
+        jobs.append(Job(path, scope, args.syntaxes.resolve(), args.dump))
+
+    start = time.perf_counter()
+    results = parallel_map(tokenize_file, jobs, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    errors: list[str] = []
+
+    for result in results:
+        for line in result.dump:
+            print(f"{result.path}:{line}")
+
+        for lineno, column, text in result.invalid:
+            print(f"{result.path}:{lineno}:{column}: invalid token {text!r}")
+
+        errors.extend(i for i in result.errors if i not in errors)
+
+    for i in errors:
+        print(f"Warning: {i}")
+
+    lines = sum(i.lines for i in results)
+    tokens = sum(i.tokens for i in results)
+    invalid = sum(len(i.invalid) for i in results)
+    cpu_time = sum(i.time for i in results)
+
+    print(f"{len(results)} files, {lines} lines, {tokens} tokens, {invalid} invalid, in {elapsed:.2f}s ({lines / max(cpu_time, 1e-9):.0f} lines/s per worker).")
+
+    if args.fail_on_invalid and invalid:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import json
+import pathlib
+import shutil
+import subprocess
+from typing import Any
+
+from syntax_to_token_pattern import ROOT, TOKEN_PATTERN_SOURCES, fuse_patterns, get_fused_match_str, get_match_str
+
+# Scans every text with each fused pattern the way DocumentTokenizer.scanPattern()
+# scans a list of patterns, once with the fused regex, and once with the regexes of
+# its patterns, and reports every position where the results differ.
+CHECK_SCRIPT = r"""
+const input = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const result = { steps: 0, unfusedExecs: 0, fusedExecs: 0, mismatches: [] };
+
+const describe = (m) => m === null ? null : JSON.stringify([m.index, m[0], m.indices ?? null]);
+
+for (const group of input.groups) {
+    const patterns = group.patterns.map((p) => new RegExp(p.source, p.flags));
+    const fused = new RegExp(group.fused.source, group.fused.flags);
+
+    for (const [name, text] of input.texts) {
+        let offset = 0;
+
+        while (offset <= text.length) {
+            result.steps++;
+
+            let best = null;
+            let bestIndex = -1;
+
+            for (let i = 0; i < patterns.length; i++) {
+                patterns[i].lastIndex = offset;
+                const m = patterns[i].exec(text);
+                result.unfusedExecs++;
+
+                if (m !== null && (best === null || m.index < best.index)) {
+                    best = m;
+                    bestIndex = i;
+                }
+            }
+
+            fused.lastIndex = offset;
+            let m = fused.exec(text);
+            let mIndex = -1;
+            result.fusedExecs++;
+
+            if (m !== null) {
+                mIndex = group.groups.findIndex((g) => m[g] !== undefined);
+
+                if (patterns[mIndex].hasIndices) {
+                    patterns[mIndex].lastIndex = m.index;
+                    m = patterns[mIndex].exec(text);
+                    result.fusedExecs++;
+                }
+            }
+
+            if (bestIndex !== mIndex || describe(best) !== describe(m)) {
+                result.mismatches.push(`${group.name} at ${name}:${offset}: pattern ${bestIndex} ${describe(best)}, fused pattern ${mIndex} ${describe(m)}`);
+                break;
+            }
+
+            if (best === null) {
+                break;
+            }
+
+            offset = best.index + Math.max(best[0].length, 1);
+        }
+    }
+}
+
+console.log(JSON.stringify(result));
+"""
+
+
+def split_literal(literal: str) -> dict[str, str]:
+    """
+    Splits a regex literal into the source and flags of a JavaScript RegExp.
+    """
+
+    end = literal.rindex("/")
+    return {"source": literal[1:end], "flags": literal[end + 1:]}
+
+
+def find_fused_patterns(o: Any, name: str, rv: list[dict[str, Any]]):
+    """
+    Adds every fused pattern that fuse_patterns() creates in the patterns lists
+    in `o` to `rv`.
+    """
+
+    if isinstance(o, dict):
+        if isinstance(o.get("patterns"), list):
+            for i, pattern in enumerate(fuse_patterns(o["patterns"])):
+                if "fused" not in pattern:
+                    continue
+
+                fused, groups = get_fused_match_str(pattern["fused"])
+
+                rv.append({
+                    "name": f"{name}.patterns![{i}]",
+                    "patterns": [split_literal(get_match_str(p["match"], p.get("captures"))[0]) for p in pattern["fused"]],
+                    "fused": split_literal(fused),
+                    "groups": groups,
+                })
+
+        for k, v in o.items():
+            find_fused_patterns(v, f"{name}.{k}", rv)
+
+    elif isinstance(o, list):
+        for i, v in enumerate(o):
+            find_fused_patterns(v, f"{name}[{i}]", rv)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Check that fusing sibling match patterns doesn't change how the text is tokenized")
+    ap.add_argument("corpus", nargs="*", type=pathlib.Path, help="The files to scan (default: the .rpy files in examples/)")
+    args = ap.parse_args()
+
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("Error: node is required to run the JavaScript regexes.")
+
+    corpus: list[pathlib.Path] = args.corpus or sorted(ROOT.glob("examples/**/*.rpy"))
+    texts = [(i.name, i.read_text(encoding="utf-8")) for i in corpus]
+
+    print(f"{'grammar':<10} {'fused':>6} {'patterns':>9} {'steps':>9} {'execs':>10} {'fused execs':>12} {'ratio':>6}")
+
+    failed = False
+
+    for language, source_file, _ in TOKEN_PATTERN_SOURCES:
+        with open(ROOT / source_file, "r") as file:
+            grammar = json.load(file)
+
+        groups: list[dict[str, Any]] = []
+        find_fused_patterns(grammar.get("repository", {}), language, groups)
+
+        result = json.loads(subprocess.run(
+            [node, "-e", CHECK_SCRIPT],
+            input=json.dumps({"groups": groups, "texts": texts}),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout)
+
+        pattern_count = sum(len(i["patterns"]) for i in groups)
+        ratio = result["unfusedExecs"] / max(result["fusedExecs"], 1)
+
+        print(f"{language:<10} {len(groups):>6} {pattern_count:>9} {result['steps']:>9} {result['unfusedExecs']:>10} {result['fusedExecs']:>12} {ratio:>5.1f}x")
+
+        for i in result["mismatches"]:
+            print(f"Error: {i}")
+            failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
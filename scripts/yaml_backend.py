@@ -0,0 +1,24 @@
+import yaml
+
+# The libyaml based loader and dumper are much faster than the pure Python ones,
+# but are only available if PyYAML was built with libyaml.
+HAS_LIBYAML: bool = getattr(yaml, "__with_libyaml__", False)
+
+PurePythonLoader = yaml.SafeLoader
+PurePythonDumper = yaml.SafeDumper
+
+SafeLoader = getattr(yaml, "CSafeLoader", PurePythonLoader) if HAS_LIBYAML else PurePythonLoader
+SafeDumper = getattr(yaml, "CSafeDumper", PurePythonDumper) if HAS_LIBYAML else PurePythonDumper
+
+# libyaml and PyYAML fold long scalars at different points. Disabling folding
+# (the width is passed to libyaml as a C int) makes both dumpers produce the same
+# bytes, and keeps long regexes on a single line.
+DUMP_WIDTH = 2**31 - 1
+
+
+def load(text: str, loader: type = SafeLoader):
+    return yaml.load(text, Loader=loader)
+
+
+def dump(data, dumper: type = SafeDumper) -> str:
+    return yaml.dump(data, Dumper=dumper, indent=2, sort_keys=False, width=DUMP_WIDTH)
@@ -0,0 +1,490 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import { KeywordTokenType, EntityTokenType, MetaTokenType, CharacterTokenType } from "src/tokenizer/renpy-tokens";
+import { placeholderPattern, TokenPattern, TokenPatternType } from "src/tokenizer/token-pattern-types";
+import { ATL_PATTERN_ID_BASE as PATTERN_ID_BASE } from "./pattern-ids.g";
+
+export const atl: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 0, _patternType: TokenPatternType.RepoPattern,
+    // https://www.renpy.org/doc/html/atl.html#atl-syntax-and-semantics
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#conditionals
+        placeholderPattern, // Placeholder for atlKeywords
+        placeholderPattern, // Placeholder for atlWarper
+        placeholderPattern, // Placeholder for atlStatements
+        placeholderPattern, // Placeholder for atlSimpleExpression
+        placeholderPattern, // Placeholder for atlEvent
+        placeholderPattern, // Placeholder for atlFunction
+        placeholderPattern, // Placeholder for atlFallback
+    ]
+};
+
+export const atlBuildInProperties: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 1, _patternType: TokenPatternType.RepoPattern,
+    // https://www.renpy.org/doc/html/atl.html#list-of-transform-properties
+    patterns: [
+        {
+            debugName: "atlBuildInProperties.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 2, _patternType: TokenPatternType.MatchPattern,
+
+            // Special manipulation keywords
+            match: /\b(?<!\.)(?:(warp)|(circles)|(clockwise)|(counterclockwise)|(knot))\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x800808, 0x0],
+            captures: {
+                1: { token: KeywordTokenType.Warp, /*keyword.warp.renpy*/ },
+                2: { token: KeywordTokenType.Circles, /*keyword.circles.renpy*/ },
+                3: { token: KeywordTokenType.Clockwise, /*keyword.clockwise.renpy*/ },
+                4: { token: KeywordTokenType.Counterclockwise, /*keyword.counterclockwise.renpy*/ },
+                5: { token: KeywordTokenType.Knot, /*keyword.knot.renpy*/ },
+            },
+        },
+        {
+            debugName: "atlBuildInProperties.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 3, _patternType: TokenPatternType.MatchPattern,
+
+            // ATL properties.
+            token: EntityTokenType.TagName, /*entity.other.attribute-name.atl.renpy support.type.property-name.atl.renpy entity.name.tag.css.atl.renpy*/
+            match: /\b(?<!\.)(?:_reset|a(?:dditive|l(?:ign(?:around)?|pha)|n(?:chor(?:a(?:ngle|round)|radius)?|gle)|round)|bl(?:end|ur)|c(?:orner[12]|rop(?:_relative)?)|de(?:bug|lay)|events|f(?:it|ps)|gl_(?:anisotropic|blend_func|c(?:olor_mask|ull_face)|d(?:epth|rawable_resolution)|mipmap|pixel_perfect|texture_(?:scaling|wrap(?:_tex[0123])?))|m(?:a(?:trix(?:anchor|color|transform)|xsize)|esh(?:_pad)?)|nearest|o(?:ffset|rientation)|p(?:erspective|o(?:int_to|s))|r(?:adius|otate(?:_pad)?)|s(?:h(?:ader|ow_cancels_hide)|ize|ubpixel)|transform_anchor|u_(?:lod_bias|renpy_(?:alpha|blur_log2|dissolve(?:_(?:multiplier|offset))?|ma(?:sk_(?:multiplier|offset)|trixcolor)|over|solid_color))|x(?:a(?:lign|nchor(?:around)?|round)|center|offset|p(?:an|os)|rotate|size|tile|y(?:center|size)|zoom)|y(?:a(?:lign|nchor(?:around)?|round)|center|offset|p(?:an|os)|rotate|size|tile|zoom)|z(?:oom|pos|rotate|zoom))\b/g,
+            firstChars: [0x0, 0x0, 0x80000000, 0x73de0fe, 0x0],
+        },
+    ]
+};
+
+export const atlSimpleExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 4, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#renpy-only-expressions
+        atlBuildInProperties,
+        placeholderPattern, // Placeholder for source.renpy.python#member-access
+        placeholderPattern, // Placeholder for source.renpy.python#illegal-operator
+        placeholderPattern, // Placeholder for source.renpy.python#operator
+        placeholderPattern, // Placeholder for source.renpy.python#curly-braces
+        placeholderPattern, // Placeholder for source.renpy.python#item-access
+        placeholderPattern, // Placeholder for source.renpy.python#list
+        placeholderPattern, // Placeholder for source.renpy.python#odd-function-call
+        placeholderPattern, // Placeholder for source.renpy.python#round-braces
+        placeholderPattern, // Placeholder for source.renpy.python#function-call
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-functions
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-types
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-exceptions
+        placeholderPattern, // Placeholder for source.renpy.python#magic-names
+        placeholderPattern, // Placeholder for source.renpy.python#special-names
+        placeholderPattern, // Placeholder for source.renpy.python#illegal-names
+        placeholderPattern, // Placeholder for source.renpy.python#special-variables
+        placeholderPattern, // Placeholder for source.renpy.python#ellipsis
+        placeholderPattern, // Placeholder for source.renpy.python#punctuation
+        placeholderPattern, // Placeholder for source.renpy.python#line-continuation
+        {
+            debugName: "atlSimpleExpression.patterns![21]",
+            _patternId: PATTERN_ID_BASE + 5, _patternType: TokenPatternType.MatchPattern,
+
+            // Tokenize identifiers
+            token: EntityTokenType.Identifier, /*variable.name.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy#whitespace
+    ]
+};
+
+export const atlExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 6, _patternType: TokenPatternType.RepoPattern,
+    // https://www.renpy.org/doc/html/atl.html#expression-statement
+    patterns: [
+        atlSimpleExpression,
+        {
+            debugName: "atlExpression.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 7, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\b(with)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x800000, 0x0],
+            requiredLiteral: "with",
+            beginCaptures: {
+                1: { token: KeywordTokenType.With, /*keyword.with.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [atlSimpleExpression]
+        },
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+    ]
+};
+
+export const atlKeywords: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 9, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "atlKeywords.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 10, _patternType: TokenPatternType.MatchPattern,
+
+            // https://www.renpy.org/doc/html/atl.html#animation-statement
+            match: /(?<=^[ \t]*)(animation)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+            requiredLiteral: "animation",
+            captures: {
+                1: { token: KeywordTokenType.Animation, /*keyword.animation.renpy*/ },
+            },
+        },
+        {
+            debugName: "atlKeywords.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 11, _patternType: TokenPatternType.MatchPattern,
+
+            // https://www.renpy.org/doc/html/atl.html#pass-statement
+            match: /(?<=^[ \t]*)(pass)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+            requiredLiteral: "pass",
+            captures: {
+                1: { token: KeywordTokenType.Pass, /*keyword.control.flow.pass.renpy*/ },
+            },
+        },
+        {
+            debugName: "atlKeywords.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 12, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // https://www.renpy.org/doc/html/atl.html#repeat-statement and https://www.renpy.org/doc/html/atl.html#time-statement
+            begin: /(?<=^[ \t]*)(?:(repeat)|(time)|(pause))\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x150000, 0x0],
+            beginCaptures: {
+                1: { token: KeywordTokenType.Repeat, /*keyword.control.flow.repeat.renpy*/ },
+                2: { token: KeywordTokenType.Time, /*keyword.control.flow.time.renpy*/ },
+                3: { token: KeywordTokenType.Pause, /*keyword.control.flow.pause.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [atlSimpleExpression]
+        },
+        {
+            debugName: "atlKeywords.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 14, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // https://www.renpy.org/doc/html/atl.html#expression-statement
+            contentToken: MetaTokenType.ATLWith, /*meta.atl.with.renpy*/
+            begin: /(?<=^[ \t]*)(with)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x800000, 0x0],
+            requiredLiteral: "with",
+            beginCaptures: {
+                1: { token: KeywordTokenType.With, /*keyword.with.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [atlSimpleExpression]
+        },
+        {
+            debugName: "atlKeywords.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 16, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // https://www.renpy.org/doc/html/atl.html#contains-statement
+            contentToken: MetaTokenType.ATLContains, /*meta.atl.contains.renpy*/
+            begin: /(?<=^[ \t]*)(contains)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+            requiredLiteral: "contains",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Contains, /*keyword.control.flow.contains.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [atlExpression]
+        },
+        placeholderPattern, // Placeholder for source.renpy#keywords
+    ]
+};
+
+export const atlBuildInEvents: TokenPattern = {
+    debugName: "atlBuildInEvents",
+    _patternId: PATTERN_ID_BASE + 18, _patternType: TokenPatternType.MatchPattern,
+
+    // Pre-defined events (https://www.renpy.org/doc/html/atl.html#external-events)
+    token: EntityTokenType.EventName, /*support.function.event.renpy*/
+    match: /\b(?<!\.)(?:start|show|replace|hide|replaced|update|hover|idle|selected_hover|selected_idle)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0x2c0300, 0x0],
+};
+
+export const atlEventName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 19, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        atlBuildInEvents,
+        {
+            debugName: "atlEventName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 20, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FunctionCall, /*entity.name.function.event.renpy meta.function-call.generic.renpy*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const atlEventDefName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 21, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        atlBuildInEvents,
+        {
+            debugName: "atlEventDefName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 22, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.FunctionName, /*entity.name.function.event.def.renpy*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const atlEvent: TokenPattern = {
+    debugName: "atlEvent",
+    _patternId: PATTERN_ID_BASE + 23, _patternType: TokenPatternType.MatchPattern,
+
+    // https://www.renpy.org/doc/html/atl.html#event-statement
+    token: MetaTokenType.ATLEvent, /*meta.atl.event.renpy*/
+    match: /^[ \t]*(event)\b[ \t]*\b([a-zA-Z_]\w*)\b/dgm,
+    firstChars: [0x200, 0x1, 0x0, 0x20, 0x0],
+    requiredLiteral: "event",
+    captures: {
+        1: { token: KeywordTokenType.Event, /*keyword.event.renpy*/ },
+        2: {
+            _patternId: PATTERN_ID_BASE + 24, _patternType: TokenPatternType.RepoPattern,
+            patterns: [atlEventName]
+        },
+    },
+};
+
+export const atlOn: TokenPattern = {
+    debugName: "atlOn",
+    _patternId: PATTERN_ID_BASE + 25, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // https://www.renpy.org/doc/html/atl.html#on-statement
+    token: MetaTokenType.ATLOnStatement, /*meta.atl.on.statement.renpy*/
+    contentToken: MetaTokenType.ATLOnParameters, /*meta.atl.on.parameters.renpy*/
+    begin: /(?<=^[ \t]*)(on)\b[ \t]*/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x8000, 0x0],
+    requiredLiteral: "on",
+    beginCaptures: {
+        1: { token: KeywordTokenType.On, /*keyword.control.flow.on.renpy*/ },
+    },
+    end: /(?=#|:)|$/gm,
+    patterns: [
+        atlEventName,
+        {
+            debugName: "atlOn.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 27, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Comma, /*punctuation.separator.parameters.renpy*/
+            match: /[ \t]*,[ \t]*/g,
+            firstChars: [0x200, 0x1001, 0x0, 0x0, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy#comments
+    ]
+};
+
+export const atlFunction: TokenPattern = {
+    debugName: "atlFunction",
+    _patternId: PATTERN_ID_BASE + 28, _patternType: TokenPatternType.MatchPattern,
+
+    // https://www.renpy.org/doc/html/atl.html#function-statement
+    token: MetaTokenType.ATLFunction, /*meta.atl.function.renpy*/
+    match: /^[ \t]*(function)\b[ \t]*\b([a-zA-Z_]\w*)\b/dgm,
+    firstChars: [0x200, 0x1, 0x0, 0x40, 0x0],
+    requiredLiteral: "function",
+    captures: {
+        1: { token: KeywordTokenType.Function, /*keyword.function.renpy*/ },
+        2: {
+            _patternId: PATTERN_ID_BASE + 29, _patternType: TokenPatternType.RepoPattern,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+                {
+                    debugName: "atlFunction.captures![2].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 30, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.FunctionCall, /*entity.name.function.atl-function.renpy meta.function-call.generic.renpy*/
+                    match: /\b([a-zA-Z_]\w*)\b/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+            ]
+        },
+    },
+};
+
+export const atlBuildInWarpers: TokenPattern = {
+    debugName: "atlBuildInWarpers",
+    _patternId: PATTERN_ID_BASE + 31, _patternType: TokenPatternType.MatchPattern,
+
+    // Pre-defined warpers (https://www.renpy.org/doc/html/atl.html#warpers)
+    token: EntityTokenType.FunctionName, /*support.function.renpy*/
+    match: /\b(?<!\.)(?:linear|ease|easein|easeout|ease_back|ease_bounce|ease_circ|ease_cubic|ease_elastic|ease_expo|ease_quad|ease_quart|ease_quint|easein_back|easein_bounce|easein_circ|easein_cubic|easein_elastic|easein_expo|easein_quad|easein_quart|easein_quint|easeout_back|easeout_bounce|easeout_circ|easeout_cubic|easeout_elastic|easeout_expo|easeout_quad|easeout_quart|easeout_quint)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0x1020, 0x0],
+};
+
+export const atlWarperName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 32, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        atlBuildInWarpers,
+        atlBuildInProperties,
+        {
+            debugName: "atlWarperName.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 33, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FunctionCall, /*entity.name.function.warper.renpy meta.function-call.generic.renpy*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const atlWarperBroken: TokenPattern = {
+    debugName: "atlWarperBroken",
+    _patternId: PATTERN_ID_BASE + 34, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // TODO: This doesn't work right now, we can't assume all identifiers are warpers
+    token: MetaTokenType.ATLWarper, /*meta.atl.warper.renpy*/
+    begin: /(?<=^[ \t]*)([a-zA-Z_]\w*)\b/dgm,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+    beginCaptures: {
+        1: {
+            _patternId: PATTERN_ID_BASE + 36, _patternType: TokenPatternType.RepoPattern,
+            patterns: [atlWarperName]
+        },
+    },
+    end: /(?=[ \t]*#)|$/gm,
+    patterns: [atlSimpleExpression]
+};
+
+export const atlWarper: TokenPattern = {
+    debugName: "atlWarper",
+    _patternId: PATTERN_ID_BASE + 37, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // (TODO: For now we only support build-in warper highlighting) https://www.renpy.org/doc/html/atl.html#warpers
+    token: MetaTokenType.ATLWarper, /*meta.atl.warper.renpy*/
+    begin: /(?<=^[ \t]*)(linear|ease|easein|easeout|ease_back|ease_bounce|ease_circ|ease_cubic|ease_elastic|ease_expo|ease_quad|ease_quart|ease_quint|easein_back|easein_bounce|easein_circ|easein_cubic|easein_elastic|easein_expo|easein_quad|easein_quart|easein_quint|easeout_back|easeout_bounce|easeout_circ|easeout_cubic|easeout_elastic|easeout_expo|easeout_quad|easeout_quart|easeout_quint)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x1020, 0x0],
+    beginCaptures: {
+        1: {
+            _patternId: PATTERN_ID_BASE + 39, _patternType: TokenPatternType.RepoPattern,
+            patterns: [atlWarperName]
+        },
+    },
+    end: /(?=[ \t]*#)|$/gm,
+    patterns: [atlSimpleExpression]
+};
+
+export const atlFallback: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 40, _patternType: TokenPatternType.RepoPattern,
+    // TODO: This is a temp fix for missing pattern references
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#base-patterns
+    ]
+};
+
+export const atlChoice: TokenPattern = {
+    debugName: "atlChoice",
+    _patternId: PATTERN_ID_BASE + 41, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // https://www.renpy.org/doc/html/atl.html#choice-statement
+    token: MetaTokenType.ATLChoiceStatement, /*meta.atl.choice.statement.renpy*/
+    contentToken: MetaTokenType.ATLChoiceParameters, /*meta.atl.choice.parameters.renpy*/
+    begin: /(?<=^[ \t]*)(choice)\b[ \t]*/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+    requiredLiteral: "choice",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Choice, /*keyword.choice.renpy*/ },
+    },
+    end: /(?=#|:)|$/gm,
+    patterns: [atlSimpleExpression]
+};
+
+export const atlStatements: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 43, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "atlStatements.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 44, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ATLBlockStatement, /*meta.atl.block.statement.renpy*/
+            match: /(?<=^[ \t]*)(block)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x4, 0x0],
+            requiredLiteral: "block",
+            captures: {
+                1: { token: KeywordTokenType.Block, /*keyword.block.renpy*/ },
+            },
+        },
+        {
+            debugName: "atlStatements.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 45, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ATLParallelStatement, /*meta.atl.parallel.statement.renpy*/
+            match: /(?<=^[ \t]*)(parallel)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+            requiredLiteral: "parallel",
+            captures: {
+                1: { token: KeywordTokenType.Parallel, /*keyword.parallel.renpy*/ },
+            },
+        },
+        {
+            debugName: "atlStatements.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 46, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ATLContainsStatement, /*meta.atl.contains.statement.renpy*/
+            match: /(?<=^[ \t]*)(contains)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+            requiredLiteral: "contains",
+            captures: {
+                1: { token: KeywordTokenType.Contains, /*keyword.contains.renpy*/ },
+            },
+        },
+        atlChoice,
+        atlOn,
+    ]
+};
+
+export const atlBlockTester: TokenPattern = {
+    debugName: "atlBlockTester",
+    _patternId: PATTERN_ID_BASE + 47, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    contentToken: MetaTokenType.ATLBlock, /*meta.atl-block.renpy*/
+    begin: /(?<=(^[ \t]*)(?:camera|image|show|scene|transform|on|block|parallel|contains|choice)\b.*?)(:)/dgm,
+    firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        2: { token: CharacterTokenType.Colon, /*punctuation.section.atl.begin.renpy*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.atl
+    ]
+};
+
+export const transform: TokenPattern = {
+    debugName: "transform",
+    _patternId: PATTERN_ID_BASE + 49, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.TransformStatement, /*meta.transform.statement.renpy*/
+    contentToken: MetaTokenType.TransformParameters, /*meta.transform.parameters.renpy*/
+    begin: /(?<=^[ \t]*)(transform)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x100000, 0x0],
+    requiredLiteral: "transform",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Transform, /*keyword.transform.renpy*/ },
+    },
+    end: /(?=#|:)|$/gm,
+    patterns: [
+        {
+            debugName: "transform.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 51, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.TransformName, /*entity.name.type.transform.renpy*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy.python#parameters
+        placeholderPattern, // Placeholder for source.renpy#whitespace
+    ]
+};
+
+// Push pattern references that were not defined on include
+atl.patterns!.splice(1, 1, atlKeywords);
+atl.patterns!.splice(2, 1, atlWarper);
+atl.patterns!.splice(3, 1, atlStatements);
+atl.patterns!.splice(4, 1, atlSimpleExpression);
+atl.patterns!.splice(5, 1, atlEvent);
+atl.patterns!.splice(6, 1, atlFunction);
+atl.patterns!.splice(7, 1, atlFallback);
\ No newline at end of file
@@ -0,0 +1,155 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax_to_token_pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import * as PythonPatterns from "./python-token-patterns.g";
+import * as AtlPatterns from "./atl-token-patterns.g";
+import * as ScreenPatterns from "./screen-token-patterns.g";
+import * as StylePatterns from "./style-token-patterns.g";
+import * as TestPatterns from "./test-token-patterns.g";
+import * as RenpyPatterns from "./renpy-token-patterns.g";
+
+// Push all RenpyPatterns external includes
+RenpyPatterns.literal.patterns!.splice(1, 1, PythonPatterns.literal);
+RenpyPatterns.parenthesizedPython.patterns![0].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.parenthesizedPython.patterns![1].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.parenthesizedPython.patterns![2].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.simpleExpression.patterns!.splice(0, 1, PythonPatterns.string);
+RenpyPatterns.simpleExpression.patterns!.splice(3, 1, PythonPatterns.memberAccess);
+RenpyPatterns.simpleExpression.patterns!.splice(4, 1, PythonPatterns.functionCall);
+RenpyPatterns.constantPlaceholder.patterns!.splice(1, 1, PythonPatterns.expression);
+RenpyPatterns.pythonStatements.patterns![1].patterns!.splice(0, 1, PythonPatterns.python);
+RenpyPatterns.pythonBlockTester.patterns![0].patterns!.splice(0, 1, PythonPatterns.python);
+RenpyPatterns.pythonBlockTester.patterns![1].patterns!.splice(0, 1, PythonPatterns.python);
+RenpyPatterns.define.patterns!.splice(2, 1, PythonPatterns.expression);
+RenpyPatterns.define.patterns![3].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.defaultStatement.patterns!.splice(1, 1, PythonPatterns.expression);
+RenpyPatterns.defaultStatement.patterns![2].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.oneLinePython.patterns!.splice(1, 1, PythonPatterns.expression);
+RenpyPatterns.sayStatements.patterns![0].patterns!.splice(1, 1, PythonPatterns.oddFunctionCall);
+RenpyPatterns.sayStatements.patterns![1].patterns!.splice(1, 1, PythonPatterns.oddFunctionCall);
+RenpyPatterns.conditionals.patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.image.patterns![0].patterns![4].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.labelName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+RenpyPatterns.labelCall.patterns!.splice(0, 1, PythonPatterns.specialVariables);
+RenpyPatterns.labelCall.patterns!.splice(2, 1, PythonPatterns.functionArguments);
+RenpyPatterns.labelDefName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+RenpyPatterns.label.patterns!.splice(2, 1, PythonPatterns.parameters);
+RenpyPatterns.returnStatements.patterns!.splice(1, 1, PythonPatterns.expression);
+RenpyPatterns.callJumpExpression.patterns!.splice(1, 1, PythonPatterns.expression);
+RenpyPatterns.callJumpPass.patterns!.splice(0, 1, PythonPatterns.functionArguments);
+RenpyPatterns.menuOption.beginCaptures![3].patterns!.splice(0, 1, PythonPatterns.oddFunctionCall);
+RenpyPatterns.menuOption.beginCaptures![3].patterns![1].patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.menuSet.patterns!.splice(0, 1, PythonPatterns.expression);
+RenpyPatterns.menu.beginCaptures![3].patterns![1].patterns!.splice(0, 1, PythonPatterns.functionArguments);
+RenpyPatterns.audioParams.patterns!.splice(1, 1, PythonPatterns.number);
+RenpyPatterns.play.patterns![0].patterns!.splice(2, 1, PythonPatterns.expression);
+RenpyPatterns.queue.patterns![0].patterns!.splice(2, 1, PythonPatterns.expression);
+RenpyPatterns.stop.patterns![0].patterns!.splice(1, 1, PythonPatterns.number);
+RenpyPatterns.renpyStatements.patterns!.splice(8, 1, AtlPatterns.transform);
+RenpyPatterns.renpyStatements.patterns!.splice(9, 1, AtlPatterns.atlBlockTester);
+RenpyPatterns.renpyStatements.patterns!.splice(16, 1, ScreenPatterns.screen);
+RenpyPatterns.renpyStatements.patterns!.splice(17, 1, StylePatterns.style);
+RenpyPatterns.renpyStatements.patterns!.splice(18, 1, TestPatterns.testcase);
+RenpyPatterns.renpyStatements.patterns!.splice(19, 1, TestPatterns.testsuite);
+RenpyPatterns.renpyStatements.patterns!.splice(20, 1, TestPatterns.testBlockTester);
+RenpyPatterns.renpyStatements.patterns!.splice(21, 1, PythonPatterns.pythonBlockTester);
+
+// Push all AtlPatterns external includes
+AtlPatterns.atl.patterns!.splice(0, 1, RenpyPatterns.conditionals);
+AtlPatterns.atlSimpleExpression.patterns!.splice(0, 1, RenpyPatterns.renpyOnlyExpressions);
+AtlPatterns.atlSimpleExpression.patterns!.splice(2, 1, PythonPatterns.memberAccess);
+AtlPatterns.atlSimpleExpression.patterns!.splice(3, 1, PythonPatterns.illegalOperator);
+AtlPatterns.atlSimpleExpression.patterns!.splice(4, 1, PythonPatterns.operator);
+AtlPatterns.atlSimpleExpression.patterns!.splice(5, 1, PythonPatterns.curlyBraces);
+AtlPatterns.atlSimpleExpression.patterns!.splice(6, 1, PythonPatterns.itemAccess);
+AtlPatterns.atlSimpleExpression.patterns!.splice(7, 1, PythonPatterns.list);
+AtlPatterns.atlSimpleExpression.patterns!.splice(8, 1, PythonPatterns.oddFunctionCall);
+AtlPatterns.atlSimpleExpression.patterns!.splice(9, 1, PythonPatterns.roundBraces);
+AtlPatterns.atlSimpleExpression.patterns!.splice(10, 1, PythonPatterns.functionCall);
+AtlPatterns.atlSimpleExpression.patterns!.splice(11, 1, PythonPatterns.builtinFunctions);
+AtlPatterns.atlSimpleExpression.patterns!.splice(12, 1, PythonPatterns.builtinTypes);
+AtlPatterns.atlSimpleExpression.patterns!.splice(13, 1, PythonPatterns.builtinExceptions);
+AtlPatterns.atlSimpleExpression.patterns!.splice(14, 1, PythonPatterns.magicNames);
+AtlPatterns.atlSimpleExpression.patterns!.splice(15, 1, PythonPatterns.specialNames);
+AtlPatterns.atlSimpleExpression.patterns!.splice(16, 1, PythonPatterns.illegalNames);
+AtlPatterns.atlSimpleExpression.patterns!.splice(17, 1, PythonPatterns.specialVariables);
+AtlPatterns.atlSimpleExpression.patterns!.splice(18, 1, PythonPatterns.ellipsis);
+AtlPatterns.atlSimpleExpression.patterns!.splice(19, 1, PythonPatterns.punctuation);
+AtlPatterns.atlSimpleExpression.patterns!.splice(20, 1, PythonPatterns.lineContinuation);
+AtlPatterns.atlSimpleExpression.patterns!.splice(22, 1, RenpyPatterns.whitespace);
+AtlPatterns.atlExpression.patterns!.splice(2, 1, PythonPatterns.expression);
+AtlPatterns.atlKeywords.patterns!.splice(5, 1, RenpyPatterns.keywords);
+AtlPatterns.atlEventName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+AtlPatterns.atlEventDefName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+AtlPatterns.atlOn.patterns!.splice(2, 1, RenpyPatterns.comments);
+AtlPatterns.atlFunction.captures![2].patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+AtlPatterns.atlWarperName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+AtlPatterns.atlFallback.patterns!.splice(0, 1, RenpyPatterns.basePatterns);
+AtlPatterns.atlBlockTester.patterns!.splice(0, 1, AtlPatterns.atl);
+AtlPatterns.transform.patterns!.splice(1, 1, PythonPatterns.parameters);
+AtlPatterns.transform.patterns!.splice(2, 1, RenpyPatterns.whitespace);
+
+// Push all ScreenPatterns external includes
+ScreenPatterns.screenDefName.patterns!.splice(0, 1, PythonPatterns.builtinPossibleCallables);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(0, 1, RenpyPatterns.renpyOnlyExpressions);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(2, 1, PythonPatterns.memberAccess);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(3, 1, PythonPatterns.illegalOperator);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(4, 1, PythonPatterns.operator);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(5, 1, PythonPatterns.curlyBraces);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(6, 1, PythonPatterns.itemAccess);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(7, 1, PythonPatterns.list);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(8, 1, PythonPatterns.oddFunctionCall);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(9, 1, PythonPatterns.roundBraces);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(10, 1, PythonPatterns.functionCall);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(11, 1, PythonPatterns.builtinFunctions);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(12, 1, PythonPatterns.builtinTypes);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(13, 1, PythonPatterns.builtinExceptions);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(14, 1, PythonPatterns.magicNames);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(15, 1, PythonPatterns.specialNames);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(16, 1, PythonPatterns.illegalNames);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(17, 1, PythonPatterns.specialVariables);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(18, 1, PythonPatterns.ellipsis);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(19, 1, PythonPatterns.punctuation);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(20, 1, PythonPatterns.lineContinuation);
+ScreenPatterns.screenSimpleExpression.patterns!.splice(22, 1, RenpyPatterns.whitespace);
+ScreenPatterns.screenBlockTester.patterns![1].patterns!.splice(1, 1, AtlPatterns.atl);
+ScreenPatterns.screenText.patterns!.splice(0, 1, RenpyPatterns.strings);
+ScreenPatterns.screenText.patterns!.splice(2, 1, RenpyPatterns.atStatement);
+ScreenPatterns.screenText.patterns!.splice(5, 1, RenpyPatterns.fallbackPatterns);
+ScreenPatterns.screen.patterns![0].patterns!.splice(1, 1, PythonPatterns.parameters);
+ScreenPatterns.screen.patterns![0].patterns!.splice(3, 1, RenpyPatterns.fallbackPatterns);
+ScreenPatterns.screenFallback.patterns!.splice(0, 1, RenpyPatterns.basePatterns);
+ScreenPatterns.screenLanguage.patterns!.splice(0, 1, RenpyPatterns.define);
+ScreenPatterns.screenLanguage.patterns!.splice(1, 1, RenpyPatterns.defaultStatement);
+ScreenPatterns.screenLanguage.patterns!.splice(2, 1, RenpyPatterns.conditionals);
+ScreenPatterns.screenLanguage.patterns!.splice(3, 1, RenpyPatterns.pythonStatements);
+
+// Push all StylePatterns external includes
+StylePatterns.styleBlockTester.patterns![0].patterns!.splice(1, 1, RenpyPatterns.fallbackPatterns);
+StylePatterns.styleClause.patterns![0].patterns!.splice(1, 1, RenpyPatterns.fallbackPatterns);
+StylePatterns.styleClause.patterns![2].patterns!.splice(0, 1, RenpyPatterns.name);
+StylePatterns.styleClause.patterns![2].patterns!.splice(1, 1, RenpyPatterns.fallbackPatterns);
+StylePatterns.styleClause.patterns![4].patterns!.splice(0, 1, RenpyPatterns.simpleExpression);
+StylePatterns.styleClause.patterns![5].patterns!.splice(0, 1, RenpyPatterns.simpleExpression);
+StylePatterns.style.patterns!.splice(4, 1, RenpyPatterns.fallbackPatterns);
+
+// Push all PythonPatterns external includes
+PythonPatterns.comments.patterns!.splice(0, 1, RenpyPatterns.regionComment);
+PythonPatterns.comments.patterns!.splice(2, 1, RenpyPatterns.commentsBase);
+PythonPatterns.docstring.patterns![0].patterns!.splice(1, 1, RenpyPatterns.codetags);
+PythonPatterns.docstring.patterns![1].patterns!.splice(2, 1, RenpyPatterns.codetags);
+PythonPatterns.docstring.patterns![2].patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.docstring.patterns![3].patterns!.splice(1, 1, RenpyPatterns.codetags);
+PythonPatterns.stringUnicodeGuts.patterns!.splice(0, 1, RenpyPatterns.stringsInterior);
+PythonPatterns.commentsStringSingleThree.patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.commentsStringDoubleThree.patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.singleOneRegexpComments.patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.singleThreeRegexpComments.patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.doubleOneRegexpComments.patterns!.splice(0, 1, RenpyPatterns.codetags);
+PythonPatterns.doubleThreeRegexpComments.patterns!.splice(0, 1, RenpyPatterns.codetags);
+
+
+export { PATTERN_STATE_VERSION, UNIQUE_PATTERN_COUNT } from "./pattern-ids.g";
+export { PythonPatterns, AtlPatterns, ScreenPatterns, StylePatterns, TestPatterns, RenpyPatterns };
\ No newline at end of file
@@ -0,0 +1,15 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax_to_token_pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+export const PATTERN_STATE_VERSION = 1;
+
+export const SHARED_PATTERN_ID_BASE = 0;
+export const RENPY_PATTERN_ID_BASE = 0;
+export const ATL_PATTERN_ID_BASE = 282;
+export const SCREEN_PATTERN_ID_BASE = 334;
+export const STYLE_PATTERN_ID_BASE = 371;
+export const PYTHON_PATTERN_ID_BASE = 397;
+
+export const UNIQUE_PATTERN_COUNT = 804;
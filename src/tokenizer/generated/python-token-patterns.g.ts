@@ -0,0 +1,4113 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import { MetaTokenType, KeywordTokenType, CharacterTokenType, EntityTokenType, OperatorTokenType, LiteralTokenType } from "src/tokenizer/renpy-tokens";
+import { placeholderPattern, TokenPattern, TokenPatternType } from "src/tokenizer/token-pattern-types";
+import { PYTHON_PATTERN_ID_BASE as PATTERN_ID_BASE } from "./pattern-ids.g";
+
+export const python: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 0, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for statement
+        placeholderPattern, // Placeholder for expression
+    ]
+};
+
+export const impossible: TokenPattern = {
+    debugName: "impossible",
+    _patternId: PATTERN_ID_BASE + 1, _patternType: TokenPatternType.MatchPattern,
+
+    // This is a special rule that should be used where no match is desired. It is not a good idea to match something like '1{0}' because in some cases that can result in infinite loops in token generation. So the rule instead matches and impossible expression to allow a match to fail and move to the next token.
+    match: /$.^/gm,
+    firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const statement: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 2, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for importStatement
+        placeholderPattern, // Placeholder for classDeclaration
+        placeholderPattern, // Placeholder for functionDeclaration
+        placeholderPattern, // Placeholder for generator
+        placeholderPattern, // Placeholder for statementKeyword
+        placeholderPattern, // Placeholder for assignmentOperator
+        placeholderPattern, // Placeholder for decorator
+        placeholderPattern, // Placeholder for docstringStatement
+        placeholderPattern, // Placeholder for semicolon
+    ]
+};
+
+export const semicolon: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 3, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "semicolon.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 4, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Deprecated, /*invalid.deprecated.semicolon.python*/
+            match: /\;$/gm,
+            firstChars: [0x0, 0x8000000, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const comments: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 5, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#region-comment
+        {
+            debugName: "comments.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 6, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.Comment, /*comment.line.number-sign.python*/
+            contentToken: MetaTokenType.TypehintComment, /*meta.typehint.comment.python*/
+            begin: /(?:\#\s*(type:)\s*(?!$|\#))/dgm,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+            requiredLiteral: "type:",
+            beginCaptures: {
+                0: { token: MetaTokenType.TypehintComment, /*meta.typehint.comment.python*/ },
+                1: { token: MetaTokenType.TypehintDirective, /*comment.typehint.directive.notation.python*/ },
+            },
+            end: /(?:$|(?=\#))/gm,
+            patterns: [
+                {
+                    debugName: "comments.patterns![1].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 8, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.TypehintIgnore, /*comment.typehint.ignore.notation.python*/
+                    match: /ignore(?=\s*(?:$|\#))/gm,
+                    firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+                    requiredLiteral: "ignore",
+                },
+                {
+                    debugName: "comments.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 9, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.TypehintType, /*comment.typehint.type.notation.python*/
+                    match: /\b(?<!\.)(bool|bytes|float|int|object|str|List|Dict|Iterable|Sequence|Set|FrozenSet|Callable|Union|Tuple|Any|None)\b/g,
+                    firstChars: [0x0, 0x0, 0x38525a, 0x88244, 0x0],
+                },
+                {
+                    debugName: "comments.patterns![1].patterns![2]",
+                    _patternId: PATTERN_ID_BASE + 10, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.TypehintPunctuation, /*comment.typehint.punctuation.notation.python*/
+                    match: /([\[\]\(\),\.\=\*]|(->))/g,
+                    firstChars: [0x0, 0x20007700, 0x28000000, 0x0, 0x0],
+                },
+                {
+                    debugName: "comments.patterns![1].patterns![3]",
+                    _patternId: PATTERN_ID_BASE + 11, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.TypehintVariable, /*comment.typehint.variable.notation.python*/
+                    match: /([a-zA-Z_]\w*)/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+            ]
+        },
+        placeholderPattern, // Placeholder for source.renpy#comments-base
+    ]
+};
+
+export const docstringStatement: TokenPattern = {
+    debugName: "docstringStatement",
+    _patternId: PATTERN_ID_BASE + 12, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    // the string either terminates correctly or by the beginning of a new line (this is for single line docstrings that aren't terminated) AND it's not followed by another docstring
+    begin: /(?<=^[ \t]*)(?=[rR]?(\'\'\'|\"\"\"|\'|\"))/gm,
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /((?<=\1)|^)(?!\s*[rR]?(\'\'\'|\"\"\"|\'|\"))/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for docstring
+    ]
+};
+
+export const docstring: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 14, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "docstring.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 15, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            token: MetaTokenType.Docstring, /*string.quoted.docstring.multi.python*/
+            begin: /(\'\'\'|\"\"\")/dg,
+            firstChars: [0x0, 0x84, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /(\1)/dg,
+            endCaptures: {
+                1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for docstringPrompt
+                placeholderPattern, // Placeholder for source.renpy#codetags
+                placeholderPattern, // Placeholder for docstringGutsUnicode
+            ]
+        },
+        {
+            debugName: "docstring.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 17, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            token: MetaTokenType.Docstring, /*string.quoted.docstring.raw.multi.python*/
+            begin: /([rR])(\'\'\'|\"\"\")/dg,
+            firstChars: [0x0, 0x0, 0x40000, 0x40000, 0x0],
+            beginCaptures: {
+                1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+                2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /(\2)/dg,
+            endCaptures: {
+                1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for stringConsumeEscape
+                placeholderPattern, // Placeholder for docstringPrompt
+                placeholderPattern, // Placeholder for source.renpy#codetags
+            ]
+        },
+        {
+            debugName: "docstring.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 19, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            token: MetaTokenType.Docstring, /*string.quoted.docstring.single.python*/
+            begin: /(\'|\")/dg,
+            firstChars: [0x0, 0x84, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /(\1)|(\n)/dg,
+            endCaptures: {
+                1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy#codetags
+                placeholderPattern, // Placeholder for docstringGutsUnicode
+            ]
+        },
+        {
+            debugName: "docstring.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 21, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            token: MetaTokenType.Docstring, /*string.quoted.docstring.raw.single.python*/
+            begin: /([rR])(\'|\")/dg,
+            firstChars: [0x0, 0x0, 0x40000, 0x40000, 0x0],
+            beginCaptures: {
+                1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+                2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /(\2)|(\n)/dg,
+            endCaptures: {
+                1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for stringConsumeEscape
+                placeholderPattern, // Placeholder for source.renpy#codetags
+            ]
+        },
+    ]
+};
+
+export const docstringGutsUnicode: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 23, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for escapeSequenceUnicode
+        placeholderPattern, // Placeholder for escapeSequence
+        placeholderPattern, // Placeholder for stringLineContinuation
+    ]
+};
+
+export const docstringPrompt: TokenPattern = {
+    debugName: "docstringPrompt",
+    _patternId: PATTERN_ID_BASE + 24, _patternType: TokenPatternType.MatchPattern,
+
+    match: /(?:\s*((?:>>>|\.\.\.)\s)(?=\s*\S))/dg,
+    firstChars: [0x3e00, 0x40004001, 0x0, 0x0, 0x1],
+    captures: {
+        1: { token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.python*/ },
+    },
+};
+
+export const statementKeyword: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 25, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "statementKeyword.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 26, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Def, /*storage.type.function.python*/
+            match: /\b((async\s+)?\s*def)\b/g,
+            firstChars: [0x3e00, 0x1, 0x0, 0x12, 0x1],
+            requiredLiteral: "def",
+        },
+        {
+            debugName: "statementKeyword.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 27, _patternType: TokenPatternType.MatchPattern,
+
+            // if `as` is eventually followed by `:` or line continuation, it's probably control flow like:    with foo as bar, \
+            //          Foo as Bar:      try:        do_stuff()      except Exception as e:        pass
+            token: KeywordTokenType.As, /*keyword.control.flow.as.python*/
+            match: /\b(?<!\.)as\b(?=.*[:\\])/g,
+            firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+            requiredLiteral: "as",
+        },
+        {
+            debugName: "statementKeyword.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 28, _patternType: TokenPatternType.MatchPattern,
+
+            // other legal use of `as` is in an import
+            token: KeywordTokenType.Import, /*keyword.control.import.python*/
+            match: /\b(?<!\.)as\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+            requiredLiteral: "as",
+        },
+        {
+            debugName: "statementKeyword.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 29, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.python*/
+            match: /\b(?<!\.)(async|continue|del|assert|break|finally|for|from|elif|else|if|except|pass|raise|return|try|while|with)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x95027e, 0x0],
+        },
+        {
+            debugName: "statementKeyword.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 30, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\b(?<!\.)(?:(global)|(nonlocal))\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x4080, 0x0],
+            requiredLiteral: "al",
+            captures: {
+                1: { token: KeywordTokenType.Global, /*storage.modifier.declaration.global.python*/ },
+                2: { token: KeywordTokenType.Nonlocal, /*storage.modifier.declaration.nonlocal.python*/ },
+            },
+        },
+        {
+            debugName: "statementKeyword.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 31, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Class, /*storage.type.class.python*/
+            match: /\b(?<!\.)(class)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+            requiredLiteral: "class",
+        },
+        {
+            debugName: "statementKeyword.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 32, _patternType: TokenPatternType.MatchPattern,
+
+            match: /^\s*(case|match)(?=\s*([-+\w\d(\[{'":#]|$))\b/dgm,
+            firstChars: [0x3e00, 0x1, 0x0, 0x2008, 0x1],
+            captures: {
+                1: { token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.python*/ },
+            },
+        },
+    ]
+};
+
+export const newLine: TokenPattern = {
+    debugName: "newLine",
+    _patternId: PATTERN_ID_BASE + 33, _patternType: TokenPatternType.MatchPattern,
+
+    token: CharacterTokenType.NewLine, /*punctuation.new-line.renpy*/
+    match: /\r\n|\r|\n/g,
+    firstChars: [0x2400, 0x0, 0x0, 0x0, 0x0],
+};
+
+export const whitespace: TokenPattern = {
+    debugName: "whitespace",
+    _patternId: PATTERN_ID_BASE + 34, _patternType: TokenPatternType.MatchPattern,
+
+    token: CharacterTokenType.Whitespace, /*punctuation.whitespace.python*/
+    match: /[ \t]+/g,
+    firstChars: [0x200, 0x1, 0x0, 0x0, 0x0],
+};
+
+export const expressionBare: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 35, _patternType: TokenPatternType.RepoPattern,
+    // valid Python expressions w/o comments and line continuation
+    patterns: [
+        placeholderPattern, // Placeholder for backticks
+        placeholderPattern, // Placeholder for illegalAnno
+        placeholderPattern, // Placeholder for literal
+        placeholderPattern, // Placeholder for regexp
+        placeholderPattern, // Placeholder for string
+        placeholderPattern, // Placeholder for lambda
+        placeholderPattern, // Placeholder for generator
+        placeholderPattern, // Placeholder for illegalOperator
+        placeholderPattern, // Placeholder for operator
+        placeholderPattern, // Placeholder for curlyBraces
+        placeholderPattern, // Placeholder for itemAccess
+        placeholderPattern, // Placeholder for list
+        placeholderPattern, // Placeholder for oddFunctionCall
+        placeholderPattern, // Placeholder for roundBraces
+        placeholderPattern, // Placeholder for functionCall
+        placeholderPattern, // Placeholder for builtinFunctions
+        placeholderPattern, // Placeholder for builtinTypes
+        placeholderPattern, // Placeholder for builtinExceptions
+        placeholderPattern, // Placeholder for magicNames
+        placeholderPattern, // Placeholder for specialNames
+        placeholderPattern, // Placeholder for illegalNames
+        placeholderPattern, // Placeholder for specialVariables
+        placeholderPattern, // Placeholder for ellipsis
+        placeholderPattern, // Placeholder for punctuation
+        placeholderPattern, // Placeholder for lineContinuation
+        whitespace,
+        newLine,
+    ]
+};
+
+export const expressionBase: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 36, _patternType: TokenPatternType.RepoPattern,
+    // valid Python expressions with comments and line continuation
+    patterns: [
+        comments,
+        expressionBare,
+        placeholderPattern, // Placeholder for lineContinuation
+    ]
+};
+
+export const expression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 37, _patternType: TokenPatternType.RepoPattern,
+    // All valid Python expressions
+    patterns: [
+        expressionBase,
+        placeholderPattern, // Placeholder for memberAccess
+        {
+            debugName: "expression.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 38, _patternType: TokenPatternType.MatchPattern,
+
+            // Tokenize identifiers to help linters
+            token: EntityTokenType.Identifier, /*variable.name.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const memberAccess: TokenPattern = {
+    debugName: "memberAccess",
+    _patternId: PATTERN_ID_BASE + 39, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.MemberAccess, /*meta.member.access.python*/
+    contentToken: EntityTokenType.Identifier, /*variable.name.python*/
+    begin: /(\.)\s*(?!\.)/dg,
+    firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.python*/ },
+    },
+    end: /(?<=\S)(?=\W)|(^|(?<=\s))(?=[^\\\w\s])|$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for functionCall
+        placeholderPattern, // Placeholder for memberAccessBase
+        placeholderPattern, // Placeholder for memberAccessAttribute
+    ]
+};
+
+export const memberAccessBase: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 41, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for magicNames
+        placeholderPattern, // Placeholder for illegalNames
+        placeholderPattern, // Placeholder for illegalObjectName
+        placeholderPattern, // Placeholder for specialNames
+        placeholderPattern, // Placeholder for lineContinuation
+        placeholderPattern, // Placeholder for itemAccess
+    ]
+};
+
+export const memberAccessAttribute: TokenPattern = {
+    debugName: "memberAccessAttribute",
+    _patternId: PATTERN_ID_BASE + 42, _patternType: TokenPatternType.MatchPattern,
+
+    // Highlight attribute access in otherwise non-specialized cases.
+    token: MetaTokenType.DataAttribute, /*variable.name.python meta.data.attribute.python*/
+    match: /\b([a-zA-Z_]\w*)\b/g,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+};
+
+export const specialNames: TokenPattern = {
+    debugName: "specialNames",
+    _patternId: PATTERN_ID_BASE + 43, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantCaps, /*constant.other.caps.python*/
+    match: /\b(_*[A-Z][_\d]*[A-Z])[A-Z\d]*(_\w*)?\b/g,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x0, 0x0],
+};
+
+export const curlyBraces: TokenPattern = {
+    debugName: "curlyBraces",
+    _patternId: PATTERN_ID_BASE + 44, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\{/g,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.dict.begin.python*/ },
+    },
+    end: /\}/g,
+    endCaptures: {
+        0: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.dict.end.python*/ },
+    },
+    patterns: [
+        {
+            debugName: "curlyBraces.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 46, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Colon, /*punctuation.separator.dict.python*/
+            match: /:/g,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+        },
+        expression,
+    ]
+};
+
+export const list: TokenPattern = {
+    debugName: "list",
+    _patternId: PATTERN_ID_BASE + 47, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\[/g,
+    firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenSquareBracket, /*punctuation.definition.list.begin.python*/ },
+    },
+    end: /\]/g,
+    endCaptures: {
+        0: { token: CharacterTokenType.CloseSquareBracket, /*punctuation.definition.list.end.python*/ },
+    },
+    patterns: [expression]
+};
+
+export const oddFunctionCall: TokenPattern = {
+    debugName: "oddFunctionCall",
+    _patternId: PATTERN_ID_BASE + 49, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // A bit obscured function call where there may have been an arbitrary number of other operations to get the function.E.g. "arr[idx](args)"
+    token: MetaTokenType.FunctionCall, /*meta.function-call.python*/
+    begin: /(?<=[\]\)"])\s*(?=\()/g,
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for functionArguments
+    ]
+};
+
+export const roundBraces: TokenPattern = {
+    debugName: "roundBraces",
+    _patternId: PATTERN_ID_BASE + 51, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.python*/ },
+    },
+    end: /\)/g,
+    endCaptures: {
+        0: { token: CharacterTokenType.CloseParentheses, /*punctuation.parenthesis.end.python*/ },
+    },
+    patterns: [expression]
+};
+
+export const lineContinuation: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 53, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "lineContinuation.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 54, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(\\)\s*(\S.*$\n?)/dgm,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.Backslash, /*punctuation.separator.continuation.line.python*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.line.continuation.python*/ },
+            },
+        },
+        {
+            debugName: "lineContinuation.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 55, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /(\\)\s*$\n?/dgm,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: CharacterTokenType.Backslash, /*punctuation.separator.continuation.line.python*/ },
+            },
+            end: /(?=^\s*$)|(?!(\s*[rR]?(\'\'\'|\"\"\"|\'|\"))|((?<=\\\s*)$))/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for regexp
+                placeholderPattern, // Placeholder for string
+            ]
+        },
+    ]
+};
+
+export const assignmentOperator: TokenPattern = {
+    debugName: "assignmentOperator",
+    _patternId: PATTERN_ID_BASE + 57, _patternType: TokenPatternType.MatchPattern,
+
+    token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/
+    match: /<<=|>>=|\/\/=|\*\*=|\+=|-=|\/=|@=|\*=|%=|~=|\^=|&=|\|=|=(?!=)/g,
+    firstChars: [0x0, 0x7000ac60, 0x40000001, 0x50000000, 0x0],
+};
+
+export const operator: TokenPattern = {
+    debugName: "operator",
+    _patternId: PATTERN_ID_BASE + 58, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b(?<!\.)(?:(and|or|not|in|is)|(for|if|else|await|(?:yield(?:\s+from)?)))(?!\s*:)\b|(<<|>>|&|\||\^|~)|(\*\*|\*|\+|-|%|\/\/|\/|@)|(!=|==|>=|<=|<|>)|(:=)/dg,
+    firstChars: [0x0, 0x7400ac62, 0x40000001, 0x5200c262, 0x0],
+    captures: {
+        1: { token: MetaTokenType.LogicalOperatorKeyword, /*keyword.operator.logical.python*/ },
+        2: { token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.python*/ },
+        3: { token: MetaTokenType.BitwiseOperatorKeyword, /*keyword.operator.bitwise.python*/ },
+        4: { token: MetaTokenType.ArithmeticOperator, /*keyword.operator.arithmetic.python*/ },
+        5: { token: MetaTokenType.ComparisonOperatorKeyword, /*keyword.operator.comparison.python*/ },
+        6: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/ },
+    },
+};
+
+export const punctuation: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 59, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "punctuation.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 60, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Colon, /*punctuation.separator.colon.python*/
+            match: /:/g,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "punctuation.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 61, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Comma, /*punctuation.separator.element.python*/
+            match: /,/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const literal: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 62, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "literal.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 63, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ConstantLiteral, /*constant.language.python*/
+            match: /\b(True|False|None|NotImplemented|Ellipsis)\b/g,
+            firstChars: [0x0, 0x0, 0x104060, 0x0, 0x0],
+        },
+        placeholderPattern, // Placeholder for number
+    ]
+};
+
+export const number: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 64, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for numberFloat
+        placeholderPattern, // Placeholder for numberDec
+        placeholderPattern, // Placeholder for numberHex
+        placeholderPattern, // Placeholder for numberOct
+        placeholderPattern, // Placeholder for numberBin
+        placeholderPattern, // Placeholder for numberLong
+        {
+            debugName: "number.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 65, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.name.python*/
+            match: /\b[0-9]+\w+/g,
+            firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const numberFloat: TokenPattern = {
+    debugName: "numberFloat",
+    _patternId: PATTERN_ID_BASE + 66, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.Float, /*constant.numeric.float.python*/
+    match: /(?<!\w)(?:(?:\.[0-9](?:_?[0-9])*|[0-9](?:_?[0-9])*\.[0-9](?:_?[0-9])*|[0-9](?:_?[0-9])*\.)(?:[eE][+-]?[0-9](?:_?[0-9])*)?|[0-9](?:_?[0-9])*(?:[eE][+-]?[0-9](?:_?[0-9])*))([jJ])?\b/dg,
+    firstChars: [0x0, 0x3ff4000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.ImaginaryNumberStorageType, /*storage.type.imaginary.number.python*/ },
+    },
+};
+
+export const numberDec: TokenPattern = {
+    debugName: "numberDec",
+    _patternId: PATTERN_ID_BASE + 67, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantNumeric, /*constant.numeric.dec.python*/
+    match: /(?<![\w.])(?:[1-9](?:_?[0-9])*|0+|[0-9](?:_?[0-9])*([jJ])|0([0-9]+)(?![eE.]))\b/dg,
+    firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.ImaginaryNumberStorageType, /*storage.type.imaginary.number.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.dec.python*/ },
+    },
+};
+
+export const numberHex: TokenPattern = {
+    debugName: "numberHex",
+    _patternId: PATTERN_ID_BASE + 68, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantNumeric, /*constant.numeric.hex.python*/
+    match: /(?<![\w.])(0[xX])(?:_?[0-9a-fA-F])+\b/dg,
+    firstChars: [0x0, 0x10000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.NumberStorageType, /*storage.type.number.python*/ },
+    },
+};
+
+export const numberOct: TokenPattern = {
+    debugName: "numberOct",
+    _patternId: PATTERN_ID_BASE + 69, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantNumeric, /*constant.numeric.oct.python*/
+    match: /(?<![\w.])(0[oO])(?:_?[0-7])+\b/dg,
+    firstChars: [0x0, 0x10000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.NumberStorageType, /*storage.type.number.python*/ },
+    },
+};
+
+export const numberBin: TokenPattern = {
+    debugName: "numberBin",
+    _patternId: PATTERN_ID_BASE + 70, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantNumeric, /*constant.numeric.bin.python*/
+    match: /(?<![\w.])(0[bB])(?:_?[01])+\b/dg,
+    firstChars: [0x0, 0x10000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.NumberStorageType, /*storage.type.number.python*/ },
+    },
+};
+
+export const numberLong: TokenPattern = {
+    debugName: "numberLong",
+    _patternId: PATTERN_ID_BASE + 71, _patternType: TokenPatternType.MatchPattern,
+
+    // this is to support python2 syntax for long ints
+    token: MetaTokenType.ConstantNumeric, /*constant.numeric.bin.python*/
+    match: /(?<![\w.])(?:[1-9][0-9]*|0)([lL])\b/dg,
+    firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.NumberStorageType, /*storage.type.number.python*/ },
+    },
+};
+
+export const regexp: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 72, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for regexpSingleThreeLine
+        placeholderPattern, // Placeholder for regexpDoubleThreeLine
+        placeholderPattern, // Placeholder for regexpSingleOneLine
+        placeholderPattern, // Placeholder for regexpDoubleOneLine
+    ]
+};
+
+export const string: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 73, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for stringQuotedMultiLine
+        placeholderPattern, // Placeholder for stringQuotedSingleLine
+        placeholderPattern, // Placeholder for stringBinQuotedMultiLine
+        placeholderPattern, // Placeholder for stringBinQuotedSingleLine
+        placeholderPattern, // Placeholder for stringRawQuotedMultiLine
+        placeholderPattern, // Placeholder for stringRawQuotedSingleLine
+        placeholderPattern, // Placeholder for stringRawBinQuotedMultiLine
+        placeholderPattern, // Placeholder for stringRawBinQuotedSingleLine
+        placeholderPattern, // Placeholder for fstringFnormQuotedMultiLine
+        placeholderPattern, // Placeholder for fstringFnormQuotedSingleLine
+        placeholderPattern, // Placeholder for fstringNormfQuotedMultiLine
+        placeholderPattern, // Placeholder for fstringNormfQuotedSingleLine
+        placeholderPattern, // Placeholder for fstringRawQuotedMultiLine
+        placeholderPattern, // Placeholder for fstringRawQuotedSingleLine
+    ]
+};
+
+export const stringUnicodeGuts: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 74, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#strings-interior
+        placeholderPattern, // Placeholder for escapeSequenceUnicode
+        placeholderPattern, // Placeholder for stringEntity
+        placeholderPattern, // Placeholder for stringBraceFormatting
+    ]
+};
+
+export const stringConsumeEscape: TokenPattern = {
+    debugName: "stringConsumeEscape",
+    _patternId: PATTERN_ID_BASE + 75, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\\['"\n\\]/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const stringRawGuts: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 76, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        stringConsumeEscape,
+        placeholderPattern, // Placeholder for stringFormatting
+        placeholderPattern, // Placeholder for stringBraceFormatting
+    ]
+};
+
+export const stringRawBinGuts: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 77, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        stringConsumeEscape,
+        placeholderPattern, // Placeholder for stringFormatting
+    ]
+};
+
+export const stringEntity: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 78, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for escapeSequence
+        placeholderPattern, // Placeholder for stringLineContinuation
+        placeholderPattern, // Placeholder for stringFormatting
+    ]
+};
+
+export const fstringGuts: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 79, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for escapeSequenceUnicode
+        placeholderPattern, // Placeholder for escapeSequence
+        placeholderPattern, // Placeholder for stringLineContinuation
+        placeholderPattern, // Placeholder for fstringFormatting
+    ]
+};
+
+export const fstringRawGuts: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 80, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        stringConsumeEscape,
+        placeholderPattern, // Placeholder for fstringFormatting
+    ]
+};
+
+export const fstringIllegalSingleBrace: TokenPattern = {
+    debugName: "fstringIllegalSingleBrace",
+    _patternId: PATTERN_ID_BASE + 81, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // it is illegal to have a multiline brace inside a single-line string
+    begin: /(\{)(?=[^\n}]*$\n?)/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    end: /(\})|(?=\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for fstringTerminatorSingle
+        placeholderPattern, // Placeholder for fExpression
+    ]
+};
+
+export const fstringIllegalMultiBrace: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 83, _patternType: TokenPatternType.RepoPattern,
+    patterns: [impossible]
+};
+
+export const fExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 84, _patternType: TokenPatternType.RepoPattern,
+    // All valid Python expressions, except comments and line continuation
+    patterns: [
+        expressionBare,
+        memberAccess,
+        {
+            debugName: "fExpression.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 85, _patternType: TokenPatternType.MatchPattern,
+
+            // Tokenize identifiers to help linters
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const escapeSequenceUnicode: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 86, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "escapeSequenceUnicode.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 87, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.EscapeSequence, /*constant.character.escape.python*/
+            match: /\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|N\{[\w\s]+?\})/g,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+        },
+    ]
+};
+
+export const escapeSequence: TokenPattern = {
+    debugName: "escapeSequence",
+    _patternId: PATTERN_ID_BASE + 88, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.EscapeSequence, /*constant.character.escape.python*/
+    match: /\\(x[0-9A-Fa-f]{2}|[0-7]{1,3}|[\\"'abfnrtv])/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const stringLineContinuation: TokenPattern = {
+    debugName: "stringLineContinuation",
+    _patternId: PATTERN_ID_BASE + 89, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantLiteral, /*constant.language.python*/
+    match: /\\$/gm,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const stringFormatting: TokenPattern = {
+    debugName: "stringFormatting",
+    _patternId: PATTERN_ID_BASE + 90, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.FormatPercent, /*meta.format.percent.python*/
+    match: /(%(?:\([\w\s]*\))?[-+#0 ]*(?:\d+|\*)?(?:\.(?:\d+|\*))?(?:[hlL])?[diouxXeEfFgGcrsab%])/dg,
+    firstChars: [0x0, 0x20, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+};
+
+export const stringBraceFormatting: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 91, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "stringBraceFormatting.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 92, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatBrace, /*meta.format.brace.python*/
+            match: /({{|}}|(?:{\w*(\.[a-zA-Z_]\w*|\[[^\]'"]+\])*(![rsa])?(:\w?[<>=^]?[-+ ]?\#?\d*,?(\.\d+)?[bcdeEfFgGnosxX%]?)?}))/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x28000000, 0x0],
+            captures: {
+                1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+                3: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+                4: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+            },
+        },
+        {
+            debugName: "stringBraceFormatting.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 93, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatBrace, /*meta.format.brace.python*/
+            match: /({\w*(\.[a-zA-Z_]\w*|\[[^\]'"]+\])*(![rsa])?(:)[^'"{}\n]*(?:\{[^'"}\n]*?\}[^'"{}\n]*)*})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+                3: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+                4: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+            },
+        },
+    ]
+};
+
+export const fstringFormatting: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 94, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for fstringFormattingBraces
+        placeholderPattern, // Placeholder for fstringFormattingSingeBrace
+    ]
+};
+
+export const fstringFormattingSingeBrace: TokenPattern = {
+    debugName: "fstringFormattingSingeBrace",
+    _patternId: PATTERN_ID_BASE + 95, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.Invalid, /*invalid.illegal.brace.python*/
+    match: /(}(?!}))/g,
+    firstChars: [0x0, 0x0, 0x0, 0x20000000, 0x0],
+};
+
+export const importStatement: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 96, _patternType: TokenPatternType.RepoPattern,
+    // Import statements used to correctly mark `from`, `import`, and `as`
+    patterns: [
+        {
+            debugName: "importStatement.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 97, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\b(?<!\.)(from)\b(?=.+import)/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+            requiredLiteral: "from",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Import, /*keyword.control.import.python*/ },
+            },
+            end: /$|(?=import)/gm,
+            patterns: [
+                {
+                    debugName: "importStatement.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 99, _patternType: TokenPatternType.MatchPattern,
+
+                    token: CharacterTokenType.Dot, /*punctuation.separator.dot.python*/
+                    match: /\.+/g,
+                    firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+                },
+                expression,
+            ]
+        },
+        {
+            debugName: "importStatement.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 100, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\b(?<!\.)(import)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+            requiredLiteral: "import",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Import, /*keyword.control.import.python*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                {
+                    debugName: "importStatement.patterns![1].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 102, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Import, /*keyword.control.import.python*/
+                    match: /\b(?<!\.)as\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+                    requiredLiteral: "as",
+                },
+                expression,
+            ]
+        },
+    ]
+};
+
+export const classDeclaration: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 103, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "classDeclaration.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 104, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.ClassDefinition, /*meta.class.python*/
+            begin: /\s*(class)\s+(?=[a-zA-Z_]\w*\s*(?::|\())/dg,
+            firstChars: [0x3e00, 0x1, 0x0, 0x8, 0x1],
+            requiredLiteral: "class",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Class, /*storage.type.class.python*/ },
+            },
+            end: /(:)/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.Colon, /*punctuation.section.class.begin.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for className
+                placeholderPattern, // Placeholder for classInheritance
+            ]
+        },
+    ]
+};
+
+export const className: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 106, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for illegalObjectName
+        placeholderPattern, // Placeholder for builtinPossibleCallables
+        {
+            debugName: "className.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 107, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.ClassName, /*entity.name.type.class.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const classInheritance: TokenPattern = {
+    debugName: "classInheritance",
+    _patternId: PATTERN_ID_BASE + 108, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.ClassInheritance, /*meta.class.inheritance.python*/
+    begin: /(\()/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.inheritance.begin.python*/ },
+    },
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.inheritance.end.python*/ },
+    },
+    patterns: [
+        {
+            debugName: "classInheritance.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 110, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Unpacking, /*keyword.operator.unpacking.arguments.python*/
+            match: /(\*\*|\*)/g,
+            firstChars: [0x0, 0x400, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "classInheritance.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 111, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Comma, /*punctuation.separator.inheritance.python*/
+            match: /,/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "classInheritance.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 112, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/
+            match: /=(?!=)/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "classInheritance.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 113, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Metaclass, /*support.type.metaclass.python*/
+            match: /\bmetaclass\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x2000, 0x0],
+            requiredLiteral: "metaclass",
+        },
+        placeholderPattern, // Placeholder for illegalNames
+        placeholderPattern, // Placeholder for classKwarg
+        placeholderPattern, // Placeholder for callWrapperInheritance
+        expressionBase,
+        placeholderPattern, // Placeholder for memberAccessClass
+        placeholderPattern, // Placeholder for inheritanceIdentifier
+    ]
+};
+
+export const classKwarg: TokenPattern = {
+    debugName: "classKwarg",
+    _patternId: PATTERN_ID_BASE + 114, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b([a-zA-Z_]\w*)\s*(=)(?!=)/dg,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+    captures: {
+        1: { token: EntityTokenType.Identifier, /*entity.other.inherited-class.python variable.parameter.class.python*/ },
+        2: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/ },
+    },
+};
+
+export const inheritanceIdentifier: TokenPattern = {
+    debugName: "inheritanceIdentifier",
+    _patternId: PATTERN_ID_BASE + 115, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b([a-zA-Z_]\w*)\b/dg,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+    captures: {
+        1: { token: EntityTokenType.InheritedClassName, /*entity.other.inherited-class.python*/ },
+    },
+};
+
+export const memberAccessClass: TokenPattern = {
+    debugName: "memberAccessClass",
+    _patternId: PATTERN_ID_BASE + 116, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.MemberAccess, /*meta.member.access.python*/
+    begin: /(\.)\s*(?!\.)/dg,
+    firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.python*/ },
+    },
+    end: /(?<=\S)(?=\W)|$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for callWrapperInheritance
+        memberAccessBase,
+        inheritanceIdentifier,
+    ]
+};
+
+export const lambda: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 118, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "lambda.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 119, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\b(lambda)\s*?(?=[,\n]|$)/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+            requiredLiteral: "lambda",
+            captures: {
+                1: { token: KeywordTokenType.Lambda, /*storage.type.function.lambda.python*/ },
+            },
+        },
+        {
+            debugName: "lambda.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 120, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.LambdaFunction, /*meta.lambda-function.python*/
+            contentToken: MetaTokenType.FunctionDefinition, /*meta.function.lambda.parameters.python*/
+            begin: /\b(lambda)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+            requiredLiteral: "lambda",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Lambda, /*storage.type.function.lambda.python*/ },
+            },
+            end: /(:)|(\n)/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.Colon, /*punctuation.section.function.lambda.begin.python*/ },
+            },
+            patterns: [
+                {
+                    debugName: "lambda.patterns![1].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 122, _patternType: TokenPatternType.MatchPattern,
+
+                    token: OperatorTokenType.PositionalParameter, /*keyword.operator.positional.parameter.python*/
+                    match: /\//g,
+                    firstChars: [0x0, 0x8000, 0x0, 0x0, 0x0],
+                },
+                {
+                    debugName: "lambda.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 123, _patternType: TokenPatternType.MatchPattern,
+
+                    token: OperatorTokenType.Unpacking, /*keyword.operator.unpacking.parameter.python*/
+                    match: /(\*\*|\*)/g,
+                    firstChars: [0x0, 0x400, 0x0, 0x0, 0x0],
+                },
+                placeholderPattern, // Placeholder for lambdaNestedIncomplete
+                placeholderPattern, // Placeholder for illegalNames
+                {
+                    debugName: "lambda.patterns![1].patterns![4]",
+                    _patternId: PATTERN_ID_BASE + 124, _patternType: TokenPatternType.MatchPattern,
+
+                    match: /([a-zA-Z_]\w*)\s*(?:(,)|(?=:|$))/dgm,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                    captures: {
+                        1: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.python*/ },
+                        2: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+                    },
+                },
+                comments,
+                placeholderPattern, // Placeholder for backticks
+                placeholderPattern, // Placeholder for illegalAnno
+                placeholderPattern, // Placeholder for lambdaParameterWithDefault
+                lineContinuation,
+                placeholderPattern, // Placeholder for illegalOperator
+            ]
+        },
+    ]
+};
+
+export const lambdaIncomplete: TokenPattern = {
+    debugName: "lambdaIncomplete",
+    _patternId: PATTERN_ID_BASE + 125, _patternType: TokenPatternType.MatchPattern,
+
+    token: KeywordTokenType.Lambda, /*storage.type.function.lambda.python*/
+    match: /\blambda(?=\s*[,)])/g,
+    firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+    requiredLiteral: "lambda",
+};
+
+export const lambdaNestedIncomplete: TokenPattern = {
+    debugName: "lambdaNestedIncomplete",
+    _patternId: PATTERN_ID_BASE + 126, _patternType: TokenPatternType.MatchPattern,
+
+    token: KeywordTokenType.Lambda, /*storage.type.function.lambda.python*/
+    match: /\blambda(?=\s*[:,)])/g,
+    firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+    requiredLiteral: "lambda",
+};
+
+export const lambdaParameterWithDefault: TokenPattern = {
+    debugName: "lambdaParameterWithDefault",
+    _patternId: PATTERN_ID_BASE + 127, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\b([a-zA-Z_]\w*)\s*(=)/dg,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+    beginCaptures: {
+        1: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.python*/ },
+        2: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/ },
+    },
+    end: /(,)|(?=:|$)/dgm,
+    endCaptures: {
+        1: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+    },
+    patterns: [expression]
+};
+
+export const generator: TokenPattern = {
+    debugName: "generator",
+    _patternId: PATTERN_ID_BASE + 129, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // Match "for ... in" construct used in generators and for loops to correctly identify the "in" as a control flow keyword.
+    begin: /\bfor\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+    requiredLiteral: "for",
+    beginCaptures: {
+        0: { token: KeywordTokenType.For, /*keyword.control.flow.for.python*/ },
+    },
+    end: /\bin\b/g,
+    endCaptures: {
+        0: { token: KeywordTokenType.In, /*keyword.control.flow.in.python*/ },
+    },
+    patterns: [expression]
+};
+
+export const functionDeclaration: TokenPattern = {
+    debugName: "functionDeclaration",
+    _patternId: PATTERN_ID_BASE + 131, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.FunctionDefinition, /*meta.function.python*/
+    begin: /\s*(?:\b(async)\s+)?\b(def)\s+(?=\w+\s*\()/dg,
+    firstChars: [0x3e00, 0x1, 0x0, 0x12, 0x1],
+    requiredLiteral: "def",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Async, /*storage.type.function.async.python*/ },
+        2: { token: KeywordTokenType.Def, /*storage.type.function.python*/ },
+    },
+    end: /(:|(?=[#'"\n]))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.Colon, /*punctuation.section.function.begin.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for functionDefName
+        placeholderPattern, // Placeholder for parameters
+        lineContinuation,
+        placeholderPattern, // Placeholder for returnAnnotation
+    ]
+};
+
+export const functionDefName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 133, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for illegalObjectName
+        placeholderPattern, // Placeholder for builtinPossibleCallables
+        {
+            debugName: "functionDefName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 134, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.FunctionName, /*entity.name.function.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const parameters: TokenPattern = {
+    debugName: "parameters",
+    _patternId: PATTERN_ID_BASE + 135, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.FunctionDefinition, /*meta.function.parameters.python*/
+    begin: /(\()/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.definition.parameters.begin.python*/ },
+    },
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.parameters.end.python*/ },
+    },
+    patterns: [
+        {
+            debugName: "parameters.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 137, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.PositionalParameter, /*keyword.operator.positional.parameter.python*/
+            match: /\//g,
+            firstChars: [0x0, 0x8000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "parameters.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 138, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Unpacking, /*keyword.operator.unpacking.parameter.python*/
+            match: /(\*\*|\*)/g,
+            firstChars: [0x0, 0x400, 0x0, 0x0, 0x0],
+        },
+        lambdaIncomplete,
+        placeholderPattern, // Placeholder for illegalNames
+        placeholderPattern, // Placeholder for illegalObjectName
+        placeholderPattern, // Placeholder for parameterSpecial
+        {
+            debugName: "parameters.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 139, _patternType: TokenPatternType.MatchPattern,
+
+            match: /([a-zA-Z_]\w*)\s*(?:(,)|(?=[)#\n=]))/dg,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+            captures: {
+                1: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.python*/ },
+                2: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+            },
+        },
+        comments,
+        placeholderPattern, // Placeholder for looseDefault
+        placeholderPattern, // Placeholder for annotatedParameter
+    ]
+};
+
+export const parameterSpecial: TokenPattern = {
+    debugName: "parameterSpecial",
+    _patternId: PATTERN_ID_BASE + 140, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b((self)|(cls))\b\s*(?:(,)|(?=\)))/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x80008, 0x0],
+    captures: {
+        1: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.python*/ },
+        2: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.special.self.python*/ },
+        3: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.special.cls.python*/ },
+        4: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+    },
+};
+
+export const looseDefault: TokenPattern = {
+    debugName: "looseDefault",
+    _patternId: PATTERN_ID_BASE + 141, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(=)/dg,
+    firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/ },
+    },
+    end: /(,)|(?=\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+    },
+    patterns: [expression]
+};
+
+export const annotatedParameter: TokenPattern = {
+    debugName: "annotatedParameter",
+    _patternId: PATTERN_ID_BASE + 143, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\b([a-zA-Z_]\w*)\s*(:)/dg,
+    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+    beginCaptures: {
+        1: { token: EntityTokenType.Identifier, /*variable.parameter.function.language.python*/ },
+        2: { token: CharacterTokenType.Colon, /*punctuation.separator.annotation.python*/ },
+    },
+    end: /(,)|(?=\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.Comma, /*punctuation.separator.parameters.python*/ },
+    },
+    patterns: [
+        expression,
+        {
+            debugName: "annotatedParameter.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 145, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/
+            match: /=(?!=)/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const returnAnnotation: TokenPattern = {
+    debugName: "returnAnnotation",
+    _patternId: PATTERN_ID_BASE + 146, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(->)/dg,
+    firstChars: [0x0, 0x2000, 0x0, 0x0, 0x0],
+    requiredLiteral: "->",
+    beginCaptures: {
+        1: { token: CharacterTokenType.Colon, /*punctuation.separator.annotation.result.python*/ },
+    },
+    end: /(?=:)/g,
+    patterns: [expression]
+};
+
+export const itemAccess: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 148, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "itemAccess.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 149, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.ItemAccess, /*variable.name.python meta.item-access.python*/
+            begin: /\b(?=[a-zA-Z_]\w*\s*\[)/g,
+            end: /(\])/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for itemName
+                placeholderPattern, // Placeholder for itemIndex
+                expression,
+            ]
+        },
+    ]
+};
+
+export const itemName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 151, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for specialVariables
+        placeholderPattern, // Placeholder for builtinFunctions
+        specialNames,
+        {
+            debugName: "itemName.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 152, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.IndexedName, /*meta.indexed-name.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const itemIndex: TokenPattern = {
+    debugName: "itemIndex",
+    _patternId: PATTERN_ID_BASE + 153, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    contentToken: MetaTokenType.Arguments, /*meta.item-access.arguments.python*/
+    begin: /(\[)/dg,
+    firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.definition.arguments.begin.python*/ },
+    },
+    end: /(?=\])/g,
+    patterns: [
+        {
+            debugName: "itemIndex.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 155, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Colon, /*punctuation.separator.slice.python*/
+            match: /:/g,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+        },
+        expression,
+    ]
+};
+
+export const decorator: TokenPattern = {
+    debugName: "decorator",
+    _patternId: PATTERN_ID_BASE + 156, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.FunctionDefinition, /*meta.function.decorator.python*/
+    begin: /(?<=^[ \t]*)(@)\s*(?=[a-zA-Z_]\w*)/dgm,
+    firstChars: [0x0, 0x0, 0x1, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: EntityTokenType.FunctionName, /*entity.name.function.decorator.python*/ },
+        2: { token: CharacterTokenType.AtSymbol, /*punctuation.definition.decorator.python*/ },
+    },
+    end: /(\))(?:(.*?)(?=\s*(?:\#|$)))|(?=\n|\#)/dgm,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.decorator.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for decoratorName
+        placeholderPattern, // Placeholder for functionArguments
+    ]
+};
+
+export const decoratorName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 158, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for builtinCallables
+        placeholderPattern, // Placeholder for illegalObjectName
+        {
+            debugName: "decoratorName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 159, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.FunctionName, /*entity.name.function.decorator.python*/
+            match: /(?:[a-zA-Z_]\w*)|(\.)/dg,
+            firstChars: [0x0, 0x4000, 0x87fffffe, 0x7fffffe, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.python*/ },
+            },
+        },
+        lineContinuation,
+        {
+            debugName: "decoratorName.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 160, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.decorator.python*/
+            match: /\s*([^(a-zA-Z\s_\.#\\].*?)(?=\#|$)/dgm,
+            firstChars: [0xffffffff, 0xffffbef7, 0x68000001, 0xf8000001, 0x1],
+            captures: {
+                1: { token: MetaTokenType.Invalid, /*invalid.illegal.decorator.python*/ },
+            },
+        },
+    ]
+};
+
+export const callWrapperInheritance: TokenPattern = {
+    debugName: "callWrapperInheritance",
+    _patternId: PATTERN_ID_BASE + 161, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // same as a function call, but in inheritance context
+    token: MetaTokenType.FunctionCall, /*meta.function-call.python*/
+    begin: /\b(?=[a-zA-Z_]\w*\s*\()/g,
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for inheritanceName
+        placeholderPattern, // Placeholder for functionArguments
+    ]
+};
+
+export const inheritanceName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 163, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        lambdaIncomplete,
+        placeholderPattern, // Placeholder for builtinPossibleCallables
+        inheritanceIdentifier,
+    ]
+};
+
+export const functionCall: TokenPattern = {
+    debugName: "functionCall",
+    _patternId: PATTERN_ID_BASE + 164, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // Regular function call of the type "name(args)"
+    token: MetaTokenType.FunctionCall, /*meta.function-call.python*/
+    begin: /\b(?=[a-zA-Z_]\w*\s*\()/g,
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for specialVariables
+        placeholderPattern, // Placeholder for functionName
+        placeholderPattern, // Placeholder for functionArguments
+    ]
+};
+
+export const functionName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 166, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for builtinPossibleCallables
+        {
+            debugName: "functionName.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 167, _patternType: TokenPatternType.MatchPattern,
+
+            // Some color schemas support meta.function-call.generic scope
+            token: MetaTokenType.FunctionCall, /*entity.name.function.call.python meta.function-call.generic.python*/
+            match: /\b[a-zA-Z_]\w*\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const functionArguments: TokenPattern = {
+    debugName: "functionArguments",
+    _patternId: PATTERN_ID_BASE + 168, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    contentToken: MetaTokenType.Arguments, /*meta.function-call.arguments.python*/
+    begin: /(\()/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.definition.arguments.begin.python*/ },
+    },
+    end: /(?=\))(?!\)\s*\()/g,
+    patterns: [
+        {
+            debugName: "functionArguments.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 170, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Comma, /*punctuation.separator.arguments.python*/
+            match: /(,)/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "functionArguments.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 171, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(?:(?<=[,(])|^)\s*(\*{1,2})/dgm,
+            firstChars: [0x3e00, 0x401, 0x0, 0x0, 0x1],
+            captures: {
+                1: { token: OperatorTokenType.Unpacking, /*keyword.operator.unpacking.arguments.python*/ },
+            },
+        },
+        lambdaIncomplete,
+        placeholderPattern, // Placeholder for illegalNames
+        {
+            debugName: "functionArguments.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 172, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\b([a-zA-Z_]\w*)(\s+)?(=)(?!=)/dg,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+            captures: {
+                1: { token: EntityTokenType.Identifier, /*variable.parameter.function-call.python*/ },
+                2: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.python*/ },
+                3: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/ },
+            },
+        },
+        {
+            debugName: "functionArguments.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 173, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Assignment, /*keyword.operator.assignment.python*/
+            match: /=(?!=)/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+        expression,
+        {
+            debugName: "functionArguments.patterns![7]",
+            _patternId: PATTERN_ID_BASE + 174, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\s*(\))\s*(\()/dg,
+            firstChars: [0x3e00, 0x201, 0x0, 0x0, 0x1],
+            captures: {
+                1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+                2: { token: CharacterTokenType.OpenParentheses, /*punctuation.definition.arguments.begin.python*/ },
+            },
+        },
+    ]
+};
+
+export const builtinCallables: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 175, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for illegalNames
+        placeholderPattern, // Placeholder for illegalObjectName
+        placeholderPattern, // Placeholder for builtinExceptions
+        placeholderPattern, // Placeholder for builtinFunctions
+        placeholderPattern, // Placeholder for builtinTypes
+    ]
+};
+
+export const builtinPossibleCallables: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 176, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        builtinCallables,
+        placeholderPattern, // Placeholder for magicNames
+    ]
+};
+
+export const builtinExceptions: TokenPattern = {
+    debugName: "builtinExceptions",
+    _patternId: PATTERN_ID_BASE + 177, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.BuiltinExceptionType, /*support.type.exception.python*/
+    match: /\b(?<!\.)((Arithmetic|Assertion|Attribute|Buffer|BlockingIO|BrokenPipe|ChildProcess|(Connection(Aborted|Refused|Reset)?)|EOF|Environment|FileExists|FileNotFound|FloatingPoint|IO|Import|Indentation|Index|Interrupted|IsADirectory|NotADirectory|Permission|ProcessLookup|Timeout|Key|Lookup|Memory|Name|NotImplemented|OS|Overflow|Reference|Runtime|Recursion|Syntax|System|Tab|Type|UnboundLocal|Unicode(Encode|Decode|Translate)?|Value|Windows|ZeroDivision|ModuleNotFound)Error|((Pending)?Deprecation|Runtime|Syntax|User|Future|Import|Unicode|Bytes|Resource)?Warning|SystemExit|Stop(Async)?Iteration|KeyboardInterrupt|GeneratorExit|(Base)?Exception)\b/g,
+    firstChars: [0x0, 0x0, 0x4fdfafe, 0x0, 0x0],
+};
+
+export const builtinFunctions: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 178, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "builtinFunctions.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 179, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.FunctionName, /*support.function.builtin.python*/
+            match: /\b(?<!\.)(__import__|abs|aiter|all|any|anext|ascii|bin|breakpoint|callable|chr|compile|copyright|credits|delattr|dir|divmod|enumerate|eval|exec|exit|filter|format|getattr|globals|hasattr|hash|help|hex|id|input|isinstance|issubclass|iter|len|license|locals|map|max|memoryview|min|next|oct|open|ord|pow|print|quit|range|reload|repr|reversed|round|setattr|sorted|sum|vars|zip)\b/g,
+            firstChars: [0x0, 0x0, 0x80000000, 0x44ff3fe, 0x0],
+        },
+        {
+            debugName: "builtinFunctions.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 180, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.Identifier, /*variable.legacy.builtin.python*/
+            match: /\b(?<!\.)(file|reduce|intern|raw_input|unicode|cmp|basestring|execfile|long|xrange)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x124126c, 0x0],
+        },
+    ]
+};
+
+export const builtinTypes: TokenPattern = {
+    debugName: "builtinTypes",
+    _patternId: PATTERN_ID_BASE + 181, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.BuiltinType, /*support.type.python*/
+    match: /\b(?<!\.)(bool|bytearray|bytes|classmethod|complex|dict|float|frozenset|int|list|object|property|set|slice|staticmethod|str|tuple|type|super)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0x19925c, 0x0],
+};
+
+export const magicFunctionNames: TokenPattern = {
+    debugName: "magicFunctionNames",
+    _patternId: PATTERN_ID_BASE + 182, _patternType: TokenPatternType.MatchPattern,
+
+    // these methods have magic interpretation by python and are generally calledindirectly through syntactic constructs
+    match: /\b(__(?:abs|add|aenter|aexit|aiter|and|anext|await|bool|call|ceil|class_getitem|cmp|coerce|complex|contains|copy|deepcopy|del|delattr|delete|delitem|delslice|dir|div|divmod|enter|eq|exit|float|floor|floordiv|format|ge|get|getattr|getattribute|getinitargs|getitem|getnewargs|getslice|getstate|gt|hash|hex|iadd|iand|idiv|ifloordiv||ilshift|imod|imul|index|init|instancecheck|int|invert|ior|ipow|irshift|isub|iter|itruediv|ixor|le|len|long|lshift|lt|missing|mod|mul|ne|neg|new|next|nonzero|oct|or|pos|pow|radd|rand|rdiv|rdivmod|reduce|reduce_ex|repr|reversed|rfloordiv||rlshift|rmod|rmul|ror|round|rpow|rrshift|rshift|rsub|rtruediv|rxor|set|setattr|setitem|set_name|setslice|setstate|sizeof|str|sub|subclasscheck|truediv|trunc|unicode|xor|matmul|rmatmul|imatmul|init_subclass|set_name|fspath|bytes|prepare|length_hint)__)\b/dg,
+    firstChars: [0x0, 0x0, 0x80000000, 0x0, 0x0],
+    requiredLiteral: "__",
+    captures: {
+        1: { token: EntityTokenType.FunctionName, /*support.function.magic.python*/ },
+    },
+};
+
+export const magicVariableNames: TokenPattern = {
+    debugName: "magicVariableNames",
+    _patternId: PATTERN_ID_BASE + 183, _patternType: TokenPatternType.MatchPattern,
+
+    // magic variables which a class/module may have.
+    match: /\b(__(?:all|annotations|bases|builtins|class|closure|code|debug|defaults|dict|doc|file|func|globals|kwdefaults|match_args|members|metaclass|methods|module|mro|mro_entries|name|qualname|post_init|self|signature|slots|subclasses|version|weakref|wrapped|classcell|spec|path|package|future|traceback)__)\b/dg,
+    firstChars: [0x0, 0x0, 0x80000000, 0x0, 0x0],
+    requiredLiteral: "__",
+    captures: {
+        1: { token: EntityTokenType.Identifier, /*support.variable.magic.python*/ },
+    },
+};
+
+export const magicNames: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 184, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        magicFunctionNames,
+        magicVariableNames,
+    ]
+};
+
+export const illegalNames: TokenPattern = {
+    debugName: "illegalNames",
+    _patternId: PATTERN_ID_BASE + 185, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b(?:(and|assert|async|await|break|class|continue|def|del|elif|else|except|finally|for|from|global|if|in|is|(?<=\.)lambda|lambda(?=\s*[\.=])|nonlocal|not|or|pass|raise|return|try|while|with|yield)|(as|import))\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x295d2fe, 0x0],
+    captures: {
+        1: { token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.python*/ },
+        2: { token: KeywordTokenType.Import, /*keyword.control.import.python*/ },
+    },
+};
+
+export const specialVariables: TokenPattern = {
+    debugName: "specialVariables",
+    _patternId: PATTERN_ID_BASE + 186, _patternType: TokenPatternType.MatchPattern,
+
+    match: /\b(?<!\.)(?:(self)|(cls))\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x80008, 0x0],
+    captures: {
+        1: { token: EntityTokenType.Identifier, /*variable.language.special.self.python*/ },
+        2: { token: EntityTokenType.Identifier, /*variable.language.special.cls.python*/ },
+    },
+};
+
+export const ellipsis: TokenPattern = {
+    debugName: "ellipsis",
+    _patternId: PATTERN_ID_BASE + 187, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ConstantCaps, /*constant.other.ellipsis.python*/
+    match: /\.\.\./g,
+    firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+    requiredLiteral: "...",
+};
+
+export const backticks: TokenPattern = {
+    debugName: "backticks",
+    _patternId: PATTERN_ID_BASE + 188, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Deprecated, /*invalid.deprecated.backtick.python*/
+    begin: /\`/g,
+    firstChars: [0x0, 0x0, 0x0, 0x1, 0x0],
+    end: /(?:\`|(?<!\\)(\n))/g,
+    patterns: [expression]
+};
+
+export const illegalOperator: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 190, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "illegalOperator.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 191, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.operator.python*/
+            match: /&&|\|\||--|\+\+/g,
+            firstChars: [0x0, 0x2840, 0x0, 0x10000000, 0x0],
+        },
+        {
+            debugName: "illegalOperator.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 192, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.operator.python*/
+            match: /[?$]/g,
+            firstChars: [0x0, 0x80000010, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "illegalOperator.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 193, _patternType: TokenPatternType.MatchPattern,
+
+            // We don't want `!` to flash when we're typing `!=`
+            token: MetaTokenType.Invalid, /*invalid.illegal.operator.python*/
+            match: /!\b/g,
+            firstChars: [0x0, 0x2, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const illegalObjectName: TokenPattern = {
+    debugName: "illegalObjectName",
+    _patternId: PATTERN_ID_BASE + 194, _patternType: TokenPatternType.MatchPattern,
+
+    // It's illegal to name class or function "True"
+    token: MetaTokenType.Invalid, /*keyword.illegal.name.python*/
+    match: /\b(True|False|None)\b/g,
+    firstChars: [0x0, 0x0, 0x104040, 0x0, 0x0],
+};
+
+export const illegalAnno: TokenPattern = {
+    debugName: "illegalAnno",
+    _patternId: PATTERN_ID_BASE + 195, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.Invalid, /*invalid.illegal.annotation.python*/
+    match: /->/g,
+    firstChars: [0x0, 0x2000, 0x0, 0x0, 0x0],
+    requiredLiteral: "->",
+};
+
+export const regexpBaseExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 196, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for regexpQuantifier
+        placeholderPattern, // Placeholder for regexpBaseCommon
+    ]
+};
+
+export const fregexpBaseExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 197, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for fregexpQuantifier
+        placeholderPattern, // Placeholder for fstringFormattingBraces
+        {
+            debugName: "fregexpBaseExpression.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 198, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\{.*?\}/g,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+        },
+        placeholderPattern, // Placeholder for regexpBaseCommon
+    ]
+};
+
+export const fstringFormattingBraces: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 199, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "fstringFormattingBraces.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 200, _patternType: TokenPatternType.MatchPattern,
+
+            // empty braces are illegal
+            match: /({)(\s*?)(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.brace.python*/ },
+                3: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+            },
+        },
+        {
+            debugName: "fstringFormattingBraces.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 201, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.EscapeSequence, /*constant.character.escape.python*/
+            match: /({{|}})/g,
+            firstChars: [0x0, 0x0, 0x0, 0x28000000, 0x0],
+        },
+    ]
+};
+
+export const regexpBaseCommon: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 202, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "regexpBaseCommon.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 203, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Dot, /*support.other.match.any.regexp*/
+            match: /\./g,
+            firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "regexpBaseCommon.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 204, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Caret, /*support.other.match.begin.regexp*/
+            match: /\^/g,
+            firstChars: [0x0, 0x0, 0x40000000, 0x0, 0x0],
+        },
+        {
+            debugName: "regexpBaseCommon.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 205, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.DollarSymbol, /*support.other.match.end.regexp*/
+            match: /\$/g,
+            firstChars: [0x0, 0x10, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "regexpBaseCommon.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 206, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Quantifier, /*keyword.operator.quantifier.regexp*/
+            match: /[+*?]\??/g,
+            firstChars: [0x0, 0x80000c00, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "regexpBaseCommon.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 207, _patternType: TokenPatternType.MatchPattern,
+
+            token: OperatorTokenType.Disjunction, /*keyword.operator.disjunction.regexp*/
+            match: /\|/g,
+            firstChars: [0x0, 0x0, 0x0, 0x10000000, 0x0],
+        },
+        placeholderPattern, // Placeholder for regexpEscapeSequence
+    ]
+};
+
+export const regexpQuantifier: TokenPattern = {
+    debugName: "regexpQuantifier",
+    _patternId: PATTERN_ID_BASE + 208, _patternType: TokenPatternType.MatchPattern,
+
+    token: OperatorTokenType.Quantifier, /*keyword.operator.quantifier.regexp*/
+    match: /\{(\d+|\d+,(\d+)?|,\d+)\}/g,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+};
+
+export const fregexpQuantifier: TokenPattern = {
+    debugName: "fregexpQuantifier",
+    _patternId: PATTERN_ID_BASE + 209, _patternType: TokenPatternType.MatchPattern,
+
+    token: OperatorTokenType.Quantifier, /*keyword.operator.quantifier.regexp*/
+    match: /\{\{(\d+|\d+,(\d+)?|,\d+)\}\}/g,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+    requiredLiteral: "{{",
+};
+
+export const regexpBackreferenceNumber: TokenPattern = {
+    debugName: "regexpBackreferenceNumber",
+    _patternId: PATTERN_ID_BASE + 210, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.Backreference, /*meta.backreference.regexp*/
+    match: /(\\[1-9]\d?)/dg,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+    captures: {
+        1: { token: EntityTokenType.TagName, /*entity.name.tag.backreference.regexp*/ },
+    },
+};
+
+export const regexpBackreference: TokenPattern = {
+    debugName: "regexpBackreference",
+    _patternId: PATTERN_ID_BASE + 211, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.BackreferenceNamed, /*meta.backreference.named.regexp*/
+    match: /(\()(\?P=\w+(?:\s+[a-zA-Z0-9]+)?)(\))/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?P=",
+    captures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.backreference.named.regexp*/ },
+        2: { token: EntityTokenType.TagName, /*entity.name.tag.named.backreference.regexp*/ },
+        3: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.backreference.named.regexp*/ },
+    },
+};
+
+export const regexpFlags: TokenPattern = {
+    debugName: "regexpFlags",
+    _patternId: PATTERN_ID_BASE + 212, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ModifierFlagStorageType, /*storage.modifier.flag.regexp*/
+    match: /\(\?[aiLmsux]+\)/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?",
+};
+
+export const regexpEscapeSpecial: TokenPattern = {
+    debugName: "regexpEscapeSpecial",
+    _patternId: PATTERN_ID_BASE + 213, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.EscapeSequence, /*support.other.escape.special.regexp*/
+    match: /\\([AbBdDsSwWZ])/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const regexpEscapeCharacter: TokenPattern = {
+    debugName: "regexpEscapeCharacter",
+    _patternId: PATTERN_ID_BASE + 214, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.EscapeSequence, /*constant.character.escape.regexp*/
+    match: /\\(x[0-9A-Fa-f]{2}|0[0-7]{1,2}|[0-7]{3})/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const regexpEscapeUnicode: TokenPattern = {
+    debugName: "regexpEscapeUnicode",
+    _patternId: PATTERN_ID_BASE + 215, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.EscapeSequence, /*constant.character.unicode.regexp*/
+    match: /\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8})/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const regexpEscapeCatchall: TokenPattern = {
+    debugName: "regexpEscapeCatchall",
+    _patternId: PATTERN_ID_BASE + 216, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.EscapeSequence, /*constant.character.escape.regexp*/
+    match: /\\(.|\n)/g,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+};
+
+export const regexpEscapeSequence: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 217, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regexpEscapeSpecial,
+        regexpEscapeCharacter,
+        regexpEscapeUnicode,
+        regexpBackreferenceNumber,
+        regexpEscapeCatchall,
+    ]
+};
+
+export const regexpCharecterSetEscapes: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 218, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "regexpCharecterSetEscapes.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 219, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.EscapeSequence, /*constant.character.escape.regexp*/
+            match: /\\[abfnrtv\\]/g,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+        },
+        regexpEscapeSpecial,
+        {
+            debugName: "regexpCharecterSetEscapes.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 220, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.EscapeSequence, /*constant.character.escape.regexp*/
+            match: /\\([0-7]{1,3})/g,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+        },
+        regexpEscapeCharacter,
+        regexpEscapeUnicode,
+        regexpEscapeCatchall,
+    ]
+};
+
+export const commentsStringSingleThree: TokenPattern = {
+    debugName: "commentsStringSingleThree",
+    _patternId: PATTERN_ID_BASE + 221, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.line.number-sign.python*/
+    begin: /(\#)/dg,
+    firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.Hashtag, /*punctuation.definition.comment.python*/ },
+    },
+    end: /($|(?='''))/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const commentsStringDoubleThree: TokenPattern = {
+    debugName: "commentsStringDoubleThree",
+    _patternId: PATTERN_ID_BASE + 223, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.line.number-sign.python*/
+    begin: /(\#)/dg,
+    firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.Hashtag, /*punctuation.definition.comment.python*/ },
+    },
+    end: /($|(?="""))/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const singleOneRegexpExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 225, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regexpBaseExpression,
+        placeholderPattern, // Placeholder for singleOneRegexpCharacterSet
+        placeholderPattern, // Placeholder for singleOneRegexpComments
+        regexpFlags,
+        placeholderPattern, // Placeholder for singleOneRegexpNamedGroup
+        regexpBackreference,
+        placeholderPattern, // Placeholder for singleOneRegexpLookahead
+        placeholderPattern, // Placeholder for singleOneRegexpLookaheadNegative
+        placeholderPattern, // Placeholder for singleOneRegexpLookbehind
+        placeholderPattern, // Placeholder for singleOneRegexpLookbehindNegative
+        placeholderPattern, // Placeholder for singleOneRegexpConditional
+        placeholderPattern, // Placeholder for singleOneRegexpParenthesesNonCapturing
+        placeholderPattern, // Placeholder for singleOneRegexpParentheses
+    ]
+};
+
+export const singleOneRegexpCharacterSet: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 226, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "singleOneRegexpCharacterSet.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 227, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\[\^?\](?!.*?\])/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+        },
+        {
+            debugName: "singleOneRegexpCharacterSet.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 228, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.CharacterSet, /*meta.character.set.regexp*/
+            begin: /(\[)(\^)?(\])?/dg,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: CharacterTokenType.OpenSquareBracket, /*constant.other.set.regexp punctuation.character.set.begin.regexp*/ },
+                2: { token: OperatorTokenType.Negation, /*keyword.operator.negation.regexp*/ },
+                3: { token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/ },
+            },
+            end: /(\]|(?=\'))|((?=(?<!\\)\n))/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.CloseSquareBracket, /*constant.other.set.regexp punctuation.character.set.end.regexp*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                regexpCharecterSetEscapes,
+                {
+                    debugName: "singleOneRegexpCharacterSet.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 230, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/
+                    match: /[^\n]/g,
+                },
+            ]
+        },
+    ]
+};
+
+export const singleOneRegexpNamedGroup: TokenPattern = {
+    debugName: "singleOneRegexpNamedGroup",
+    _patternId: PATTERN_ID_BASE + 231, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Named, /*meta.named.regexp*/
+    begin: /(\()(\?P<\w+(?:\s+[a-zA-Z0-9]+)?>)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?P<",
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.named.regexp*/ },
+        2: { token: EntityTokenType.TagName, /*entity.name.tag.named.group.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.named.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpComments: TokenPattern = {
+    debugName: "singleOneRegexpComments",
+    _patternId: PATTERN_ID_BASE + 233, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.regexp*/
+    begin: /\(\?#/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?#",
+    beginCaptures: {
+        0: { token: MetaTokenType.CommentBegin, /*punctuation.comment.begin.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.CommentEnd, /*punctuation.comment.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const singleOneRegexpLookahead: TokenPattern = {
+    debugName: "singleOneRegexpLookahead",
+    _patternId: PATTERN_ID_BASE + 235, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookahead, /*keyword.operator.lookahead.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpLookaheadNegative: TokenPattern = {
+    debugName: "singleOneRegexpLookaheadNegative",
+    _patternId: PATTERN_ID_BASE + 237, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookaheadNegative, /*keyword.operator.lookahead.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.negative.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpLookbehind: TokenPattern = {
+    debugName: "singleOneRegexpLookbehind",
+    _patternId: PATTERN_ID_BASE + 239, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookbehind, /*keyword.operator.lookbehind.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpLookbehindNegative: TokenPattern = {
+    debugName: "singleOneRegexpLookbehindNegative",
+    _patternId: PATTERN_ID_BASE + 241, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookbehindNegative, /*keyword.operator.lookbehind.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.negative.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpConditional: TokenPattern = {
+    debugName: "singleOneRegexpConditional",
+    _patternId: PATTERN_ID_BASE + 243, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?\((\w+(?:\s+[a-zA-Z0-9]+)?|\d+)\)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?(",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Conditional, /*keyword.operator.conditional.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.conditional.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.conditional.negative.regexp punctuation.parenthesis.end.conditional.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpParenthesesNonCapturing: TokenPattern = {
+    debugName: "singleOneRegexpParenthesesNonCapturing",
+    _patternId: PATTERN_ID_BASE + 245, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(\?:/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?:",
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.non-capturing.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.non-capturing.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleOneRegexpParentheses: TokenPattern = {
+    debugName: "singleOneRegexpParentheses",
+    _patternId: PATTERN_ID_BASE + 247, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.regexp*/ },
+    },
+    end: /(\)|(?=\'))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const singleThreeRegexpExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 249, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regexpBaseExpression,
+        placeholderPattern, // Placeholder for singleThreeRegexpCharacterSet
+        placeholderPattern, // Placeholder for singleThreeRegexpComments
+        regexpFlags,
+        placeholderPattern, // Placeholder for singleThreeRegexpNamedGroup
+        regexpBackreference,
+        placeholderPattern, // Placeholder for singleThreeRegexpLookahead
+        placeholderPattern, // Placeholder for singleThreeRegexpLookaheadNegative
+        placeholderPattern, // Placeholder for singleThreeRegexpLookbehind
+        placeholderPattern, // Placeholder for singleThreeRegexpLookbehindNegative
+        placeholderPattern, // Placeholder for singleThreeRegexpConditional
+        placeholderPattern, // Placeholder for singleThreeRegexpParenthesesNonCapturing
+        placeholderPattern, // Placeholder for singleThreeRegexpParentheses
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpCharacterSet: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 250, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "singleThreeRegexpCharacterSet.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 251, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\[\^?\](?!.*?\])/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+        },
+        {
+            debugName: "singleThreeRegexpCharacterSet.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 252, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.CharacterSet, /*meta.character.set.regexp*/
+            begin: /(\[)(\^)?(\])?/dg,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: CharacterTokenType.OpenSquareBracket, /*constant.other.set.regexp punctuation.character.set.begin.regexp*/ },
+                2: { token: OperatorTokenType.Negation, /*keyword.operator.negation.regexp*/ },
+                3: { token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/ },
+            },
+            end: /(\]|(?=\'\'\'))/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.CloseSquareBracket, /*constant.other.set.regexp punctuation.character.set.end.regexp*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                regexpCharecterSetEscapes,
+                {
+                    debugName: "singleThreeRegexpCharacterSet.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 254, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/
+                    match: /[^\n]/g,
+                },
+            ]
+        },
+    ]
+};
+
+export const singleThreeRegexpNamedGroup: TokenPattern = {
+    debugName: "singleThreeRegexpNamedGroup",
+    _patternId: PATTERN_ID_BASE + 255, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Named, /*meta.named.regexp*/
+    begin: /(\()(\?P<\w+(?:\s+[a-zA-Z0-9]+)?>)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?P<",
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.named.regexp*/ },
+        2: { token: EntityTokenType.TagName, /*entity.name.tag.named.group.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.named.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpComments: TokenPattern = {
+    debugName: "singleThreeRegexpComments",
+    _patternId: PATTERN_ID_BASE + 257, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.regexp*/
+    begin: /\(\?#/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?#",
+    beginCaptures: {
+        0: { token: MetaTokenType.CommentBegin, /*punctuation.comment.begin.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.CommentEnd, /*punctuation.comment.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const singleThreeRegexpLookahead: TokenPattern = {
+    debugName: "singleThreeRegexpLookahead",
+    _patternId: PATTERN_ID_BASE + 259, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookahead, /*keyword.operator.lookahead.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpLookaheadNegative: TokenPattern = {
+    debugName: "singleThreeRegexpLookaheadNegative",
+    _patternId: PATTERN_ID_BASE + 261, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookaheadNegative, /*keyword.operator.lookahead.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.negative.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpLookbehind: TokenPattern = {
+    debugName: "singleThreeRegexpLookbehind",
+    _patternId: PATTERN_ID_BASE + 263, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookbehind, /*keyword.operator.lookbehind.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpLookbehindNegative: TokenPattern = {
+    debugName: "singleThreeRegexpLookbehindNegative",
+    _patternId: PATTERN_ID_BASE + 265, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookbehindNegative, /*keyword.operator.lookbehind.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.negative.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpConditional: TokenPattern = {
+    debugName: "singleThreeRegexpConditional",
+    _patternId: PATTERN_ID_BASE + 267, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?\((\w+(?:\s+[a-zA-Z0-9]+)?|\d+)\)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?(",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Conditional, /*keyword.operator.conditional.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.conditional.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.conditional.negative.regexp punctuation.parenthesis.end.conditional.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpParenthesesNonCapturing: TokenPattern = {
+    debugName: "singleThreeRegexpParenthesesNonCapturing",
+    _patternId: PATTERN_ID_BASE + 269, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(\?:/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?:",
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.non-capturing.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.non-capturing.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const singleThreeRegexpParentheses: TokenPattern = {
+    debugName: "singleThreeRegexpParentheses",
+    _patternId: PATTERN_ID_BASE + 271, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.regexp*/ },
+    },
+    end: /(\)|(?=\'\'\'))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        singleThreeRegexpExpression,
+        commentsStringSingleThree,
+    ]
+};
+
+export const doubleOneRegexpExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 273, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regexpBaseExpression,
+        placeholderPattern, // Placeholder for doubleOneRegexpCharacterSet
+        placeholderPattern, // Placeholder for doubleOneRegexpComments
+        regexpFlags,
+        placeholderPattern, // Placeholder for doubleOneRegexpNamedGroup
+        regexpBackreference,
+        placeholderPattern, // Placeholder for doubleOneRegexpLookahead
+        placeholderPattern, // Placeholder for doubleOneRegexpLookaheadNegative
+        placeholderPattern, // Placeholder for doubleOneRegexpLookbehind
+        placeholderPattern, // Placeholder for doubleOneRegexpLookbehindNegative
+        placeholderPattern, // Placeholder for doubleOneRegexpConditional
+        placeholderPattern, // Placeholder for doubleOneRegexpParenthesesNonCapturing
+        placeholderPattern, // Placeholder for doubleOneRegexpParentheses
+    ]
+};
+
+export const doubleOneRegexpCharacterSet: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 274, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "doubleOneRegexpCharacterSet.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 275, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\[\^?\](?!.*?\])/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+        },
+        {
+            debugName: "doubleOneRegexpCharacterSet.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 276, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.CharacterSet, /*meta.character.set.regexp*/
+            begin: /(\[)(\^)?(\])?/dg,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: CharacterTokenType.OpenSquareBracket, /*constant.other.set.regexp punctuation.character.set.begin.regexp*/ },
+                2: { token: OperatorTokenType.Negation, /*keyword.operator.negation.regexp*/ },
+                3: { token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/ },
+            },
+            end: /(\]|(?="))|((?=(?<!\\)\n))/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.CloseSquareBracket, /*constant.other.set.regexp punctuation.character.set.end.regexp*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                regexpCharecterSetEscapes,
+                {
+                    debugName: "doubleOneRegexpCharacterSet.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 278, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/
+                    match: /[^\n]/g,
+                },
+            ]
+        },
+    ]
+};
+
+export const doubleOneRegexpNamedGroup: TokenPattern = {
+    debugName: "doubleOneRegexpNamedGroup",
+    _patternId: PATTERN_ID_BASE + 279, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Named, /*meta.named.regexp*/
+    begin: /(\()(\?P<\w+(?:\s+[a-zA-Z0-9]+)?>)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?P<",
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.named.regexp*/ },
+        2: { token: EntityTokenType.TagName, /*entity.name.tag.named.group.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.named.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpComments: TokenPattern = {
+    debugName: "doubleOneRegexpComments",
+    _patternId: PATTERN_ID_BASE + 281, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.regexp*/
+    begin: /\(\?#/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?#",
+    beginCaptures: {
+        0: { token: MetaTokenType.CommentBegin, /*punctuation.comment.begin.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.CommentEnd, /*punctuation.comment.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const doubleOneRegexpLookahead: TokenPattern = {
+    debugName: "doubleOneRegexpLookahead",
+    _patternId: PATTERN_ID_BASE + 283, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookahead, /*keyword.operator.lookahead.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpLookaheadNegative: TokenPattern = {
+    debugName: "doubleOneRegexpLookaheadNegative",
+    _patternId: PATTERN_ID_BASE + 285, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookaheadNegative, /*keyword.operator.lookahead.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.negative.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpLookbehind: TokenPattern = {
+    debugName: "doubleOneRegexpLookbehind",
+    _patternId: PATTERN_ID_BASE + 287, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookbehind, /*keyword.operator.lookbehind.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpLookbehindNegative: TokenPattern = {
+    debugName: "doubleOneRegexpLookbehindNegative",
+    _patternId: PATTERN_ID_BASE + 289, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookbehindNegative, /*keyword.operator.lookbehind.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.negative.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpConditional: TokenPattern = {
+    debugName: "doubleOneRegexpConditional",
+    _patternId: PATTERN_ID_BASE + 291, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?\((\w+(?:\s+[a-zA-Z0-9]+)?|\d+)\)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?(",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Conditional, /*keyword.operator.conditional.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.conditional.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.conditional.negative.regexp punctuation.parenthesis.end.conditional.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpParenthesesNonCapturing: TokenPattern = {
+    debugName: "doubleOneRegexpParenthesesNonCapturing",
+    _patternId: PATTERN_ID_BASE + 293, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(\?:/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?:",
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.non-capturing.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.non-capturing.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleOneRegexpParentheses: TokenPattern = {
+    debugName: "doubleOneRegexpParentheses",
+    _patternId: PATTERN_ID_BASE + 295, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.regexp*/ },
+    },
+    end: /(\)|(?="))|((?=(?<!\\)\n))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const doubleThreeRegexpExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 297, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regexpBaseExpression,
+        placeholderPattern, // Placeholder for doubleThreeRegexpCharacterSet
+        placeholderPattern, // Placeholder for doubleThreeRegexpComments
+        regexpFlags,
+        placeholderPattern, // Placeholder for doubleThreeRegexpNamedGroup
+        regexpBackreference,
+        placeholderPattern, // Placeholder for doubleThreeRegexpLookahead
+        placeholderPattern, // Placeholder for doubleThreeRegexpLookaheadNegative
+        placeholderPattern, // Placeholder for doubleThreeRegexpLookbehind
+        placeholderPattern, // Placeholder for doubleThreeRegexpLookbehindNegative
+        placeholderPattern, // Placeholder for doubleThreeRegexpConditional
+        placeholderPattern, // Placeholder for doubleThreeRegexpParenthesesNonCapturing
+        placeholderPattern, // Placeholder for doubleThreeRegexpParentheses
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpCharacterSet: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 298, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "doubleThreeRegexpCharacterSet.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 299, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\[\^?\](?!.*?\])/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+        },
+        {
+            debugName: "doubleThreeRegexpCharacterSet.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 300, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.CharacterSet, /*meta.character.set.regexp*/
+            begin: /(\[)(\^)?(\])?/dg,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+            beginCaptures: {
+                1: { token: CharacterTokenType.OpenSquareBracket, /*constant.other.set.regexp punctuation.character.set.begin.regexp*/ },
+                2: { token: OperatorTokenType.Negation, /*keyword.operator.negation.regexp*/ },
+                3: { token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/ },
+            },
+            end: /(\]|(?="""))/dg,
+            endCaptures: {
+                1: { token: CharacterTokenType.CloseSquareBracket, /*constant.other.set.regexp punctuation.character.set.end.regexp*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+            },
+            patterns: [
+                regexpCharecterSetEscapes,
+                {
+                    debugName: "doubleThreeRegexpCharacterSet.patterns![1].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 302, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.CharacterSet, /*constant.character.set.regexp*/
+                    match: /[^\n]/g,
+                },
+            ]
+        },
+    ]
+};
+
+export const doubleThreeRegexpNamedGroup: TokenPattern = {
+    debugName: "doubleThreeRegexpNamedGroup",
+    _patternId: PATTERN_ID_BASE + 303, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Named, /*meta.named.regexp*/
+    begin: /(\()(\?P<\w+(?:\s+[a-zA-Z0-9]+)?>)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?P<",
+    beginCaptures: {
+        1: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.named.regexp*/ },
+        2: { token: EntityTokenType.TagName, /*entity.name.tag.named.group.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.named.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpComments: TokenPattern = {
+    debugName: "doubleThreeRegexpComments",
+    _patternId: PATTERN_ID_BASE + 305, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.regexp*/
+    begin: /\(\?#/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?#",
+    beginCaptures: {
+        0: { token: MetaTokenType.CommentBegin, /*punctuation.comment.begin.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.CommentEnd, /*punctuation.comment.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#codetags
+    ]
+};
+
+export const doubleThreeRegexpLookahead: TokenPattern = {
+    debugName: "doubleThreeRegexpLookahead",
+    _patternId: PATTERN_ID_BASE + 307, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookahead, /*keyword.operator.lookahead.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpLookaheadNegative: TokenPattern = {
+    debugName: "doubleThreeRegexpLookaheadNegative",
+    _patternId: PATTERN_ID_BASE + 309, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookaheadNegative, /*keyword.operator.lookahead.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookahead.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookahead.negative.regexp punctuation.parenthesis.end.lookahead.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpLookbehind: TokenPattern = {
+    debugName: "doubleThreeRegexpLookbehind",
+    _patternId: PATTERN_ID_BASE + 311, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<=/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<=",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Lookbehind, /*keyword.operator.lookbehind.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpLookbehindNegative: TokenPattern = {
+    debugName: "doubleThreeRegexpLookbehindNegative",
+    _patternId: PATTERN_ID_BASE + 313, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?<!/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?<!",
+    beginCaptures: {
+        0: { token: OperatorTokenType.LookbehindNegative, /*keyword.operator.lookbehind.negative.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.lookbehind.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.lookbehind.negative.regexp punctuation.parenthesis.end.lookbehind.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpConditional: TokenPattern = {
+    debugName: "doubleThreeRegexpConditional",
+    _patternId: PATTERN_ID_BASE + 315, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(\()\?\((\w+(?:\s+[a-zA-Z0-9]+)?|\d+)\)/dg,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?(",
+    beginCaptures: {
+        0: { token: OperatorTokenType.Conditional, /*keyword.operator.conditional.regexp*/ },
+        1: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.conditional.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*keyword.operator.conditional.negative.regexp punctuation.parenthesis.end.conditional.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpParenthesesNonCapturing: TokenPattern = {
+    debugName: "doubleThreeRegexpParenthesesNonCapturing",
+    _patternId: PATTERN_ID_BASE + 317, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(\?:/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    requiredLiteral: "(?:",
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.non-capturing.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.non-capturing.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const doubleThreeRegexpParentheses: TokenPattern = {
+    debugName: "doubleThreeRegexpParentheses",
+    _patternId: PATTERN_ID_BASE + 319, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\(/g,
+    firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.OpenParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.begin.regexp*/ },
+    },
+    end: /(\)|(?="""))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*support.other.parenthesis.regexp punctuation.parenthesis.end.regexp*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        doubleThreeRegexpExpression,
+        commentsStringDoubleThree,
+    ]
+};
+
+export const regexpSingleOneLine: TokenPattern = {
+    debugName: "regexpSingleOneLine",
+    _patternId: PATTERN_ID_BASE + 321, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.regexp.quoted.single.python*/
+    begin: /\b(?:([uU]r)|([bB]r)|(r[bB]?))(\')/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x240004, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        4: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    end: /(\')|(?<!\\)(\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleOneRegexpExpression]
+};
+
+export const regexpSingleThreeLine: TokenPattern = {
+    debugName: "regexpSingleThreeLine",
+    _patternId: PATTERN_ID_BASE + 323, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.regexp.quoted.multi.python*/
+    begin: /\b(?:([uU]r)|([bB]r)|(r[bB]?))(\'\'\')/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x240004, 0x0],
+    requiredLiteral: "'''",
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        4: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    end: /(\'\'\')/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [singleThreeRegexpExpression]
+};
+
+export const regexpDoubleOneLine: TokenPattern = {
+    debugName: "regexpDoubleOneLine",
+    _patternId: PATTERN_ID_BASE + 325, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.regexp.quoted.single.python*/
+    begin: /\b(?:([uU]r)|([bB]r)|(r[bB]?))(")/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x240004, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        4: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    end: /(")|(?<!\\)(\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleOneRegexpExpression]
+};
+
+export const regexpDoubleThreeLine: TokenPattern = {
+    debugName: "regexpDoubleThreeLine",
+    _patternId: PATTERN_ID_BASE + 327, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.regexp.quoted.multi.python*/
+    begin: /\b(?:([uU]r)|([bB]r)|(r[bB]?))(""")/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x240004, 0x0],
+    requiredLiteral: "\"\"\"",
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        4: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    end: /(""")/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [doubleThreeRegexpExpression]
+};
+
+export const stringRawQuotedSingleLine: TokenPattern = {
+    debugName: "stringRawQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 329, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.raw.single.python*/
+    begin: /\b(?:([uU]R)|(R))(['"])/dg,
+    firstChars: [0x0, 0x0, 0x240000, 0x200000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\4)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for stringSingleBadBrace1FormattingRaw
+        placeholderPattern, // Placeholder for stringSingleBadBrace2FormattingRaw
+        stringRawGuts,
+    ]
+};
+
+export const stringBinQuotedSingleLine: TokenPattern = {
+    debugName: "stringBinQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 331, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.binary.single.python*/
+    begin: /(\b[bB])(['"])/dg,
+    firstChars: [0x0, 0x0, 0x4, 0x4, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [stringEntity]
+};
+
+export const stringRawBinQuotedSingleLine: TokenPattern = {
+    debugName: "stringRawBinQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 333, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.raw.binary.single.python*/
+    begin: /(\b(?:R[bB]|[bB]R))(['"])/dg,
+    firstChars: [0x0, 0x0, 0x40004, 0x4, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [stringRawBinGuts]
+};
+
+export const stringQuotedSingleLine: TokenPattern = {
+    debugName: "stringQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 335, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.single.python*/
+    begin: /(?:\b([rR])(?=[uU]))?([uU])?(['"])/dg,
+    firstChars: [0x0, 0x84, 0x240000, 0x240000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for stringSingleBadBrace1FormattingUnicode
+        stringUnicodeGuts,
+    ]
+};
+
+export const stringSingleBadBrace1FormattingUnicode: TokenPattern = {
+    debugName: "stringSingleBadBrace1FormattingUnicode",
+    _patternId: PATTERN_ID_BASE + 337, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // template using {% ... %}
+    begin: /(?=\{%(?:.*?(?!['"]|(?:(?<!\\)\n)))%\})/g,
+    end: /(?=['"]|(?:(?<!\\)\n))/g,
+    patterns: [
+        escapeSequenceUnicode,
+        escapeSequence,
+        stringLineContinuation,
+    ]
+};
+
+export const stringSingleBadBrace1FormattingRaw: TokenPattern = {
+    debugName: "stringSingleBadBrace1FormattingRaw",
+    _patternId: PATTERN_ID_BASE + 339, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // template using {% ... %}
+    begin: /(?=\{%(?:.*?(?!['"]|(?:(?<!\\)\n)))%\})/g,
+    end: /(?=['"]|(?:(?<!\\)\n))/g,
+    patterns: [stringConsumeEscape]
+};
+
+export const stringSingleBadBrace2FormattingRaw: TokenPattern = {
+    debugName: "stringSingleBadBrace2FormattingRaw",
+    _patternId: PATTERN_ID_BASE + 341, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // odd format or format-like syntax
+    begin: /(?!\{\{)(?=\{(?:\w*?(?!['"]|(?:(?<!\\)\n))[^!:\.\[}\w]).*?(?!['"]|(?:(?<!\\)\n))\})/g,
+    end: /(?=['"]|(?:(?<!\\)\n))/g,
+    patterns: [
+        stringConsumeEscape,
+        stringFormatting,
+    ]
+};
+
+export const stringRawQuotedMultiLine: TokenPattern = {
+    debugName: "stringRawQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 343, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.raw.multi.python*/
+    begin: /\b(?:([uU]R)|(R))('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x240000, 0x200000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Deprecated, /*invalid.deprecated.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\4)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for stringMultiBadBrace1FormattingRaw
+        placeholderPattern, // Placeholder for stringMultiBadBrace2FormattingRaw
+        stringRawGuts,
+    ]
+};
+
+export const stringBinQuotedMultiLine: TokenPattern = {
+    debugName: "stringBinQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 345, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.binary.multi.python*/
+    begin: /(\b[bB])('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x4, 0x4, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [stringEntity]
+};
+
+export const stringRawBinQuotedMultiLine: TokenPattern = {
+    debugName: "stringRawBinQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 347, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.raw.binary.multi.python*/
+    begin: /(\b(?:R[bB]|[bB]R))('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x40004, 0x4, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [stringRawBinGuts]
+};
+
+export const stringQuotedMultiLine: TokenPattern = {
+    debugName: "stringQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 349, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.multi.python*/
+    begin: /(?:\b([rR])(?=[uU]))?([uU])?('''|""")/dg,
+    firstChars: [0x0, 0x84, 0x240000, 0x240000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for stringMultiBadBrace1FormattingUnicode
+        placeholderPattern, // Placeholder for stringMultiBadBrace2FormattingUnicode
+        stringUnicodeGuts,
+    ]
+};
+
+export const stringMultiBadBrace1FormattingUnicode: TokenPattern = {
+    debugName: "stringMultiBadBrace1FormattingUnicode",
+    _patternId: PATTERN_ID_BASE + 351, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // template using {% ... %}
+    begin: /(?=\{%(.*?(?!'''|"""))%\})/g,
+    end: /(?='''|""")/g,
+    patterns: [
+        escapeSequenceUnicode,
+        escapeSequence,
+        stringLineContinuation,
+    ]
+};
+
+export const stringMultiBadBrace1FormattingRaw: TokenPattern = {
+    debugName: "stringMultiBadBrace1FormattingRaw",
+    _patternId: PATTERN_ID_BASE + 353, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // template using {% ... %}
+    begin: /(?=\{%(.*?(?!'''|"""))%\})/g,
+    end: /(?='''|""")/g,
+    patterns: [stringConsumeEscape]
+};
+
+export const stringMultiBadBrace2FormattingUnicode: TokenPattern = {
+    debugName: "stringMultiBadBrace2FormattingUnicode",
+    _patternId: PATTERN_ID_BASE + 355, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // odd format or format-like syntax
+    begin: /(?!\{\{)(?=\{(\w*?(?!'''|""")[^!:\.\[}\w]).*?(?!'''|""")\})/g,
+    end: /(?='''|""")/g,
+    patterns: [
+        escapeSequenceUnicode,
+        stringEntity,
+    ]
+};
+
+export const stringMultiBadBrace2FormattingRaw: TokenPattern = {
+    debugName: "stringMultiBadBrace2FormattingRaw",
+    _patternId: PATTERN_ID_BASE + 357, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // odd format or format-like syntax
+    begin: /(?!\{\{)(?=\{(\w*?(?!'''|""")[^!:\.\[}\w]).*?(?!'''|""")\})/g,
+    end: /(?='''|""")/g,
+    patterns: [
+        stringConsumeEscape,
+        stringFormatting,
+    ]
+};
+
+export const fstringFnormQuotedSingleLine: TokenPattern = {
+    debugName: "fstringFnormQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 359, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b[fF])([bBuU])?((['"]))/dg,
+    firstChars: [0x0, 0x0, 0x40, 0x40, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.single.python storage.type.string.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        3: { token: LiteralTokenType.String, /*punctuation.definition.string.begin.python string.interpolated.python string.quoted.single.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.single.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringGuts,
+        fstringIllegalSingleBrace,
+        placeholderPattern, // Placeholder for fstringSingleBrace
+        placeholderPattern, // Placeholder for fstringSingleCore
+    ]
+};
+
+export const fstringNormfQuotedSingleLine: TokenPattern = {
+    debugName: "fstringNormfQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 361, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b[bBuU])([fF])((['"]))/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x200004, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.single.python storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*string.quoted.single.python punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.single.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringGuts,
+        fstringIllegalSingleBrace,
+        placeholderPattern, // Placeholder for fstringSingleBrace
+        placeholderPattern, // Placeholder for fstringSingleCore
+    ]
+};
+
+export const fstringRawQuotedSingleLine: TokenPattern = {
+    debugName: "fstringRawQuotedSingleLine",
+    _patternId: PATTERN_ID_BASE + 363, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b(?:[rR][fF]|[fF][rR]))((['"]))/dg,
+    firstChars: [0x0, 0x0, 0x40040, 0x40040, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.raw.single.python storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*string.quoted.raw.single.python punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)|((?<!\\)\n)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.raw.single.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringRawGuts,
+        fstringIllegalSingleBrace,
+        placeholderPattern, // Placeholder for fstringSingleBrace
+        placeholderPattern, // Placeholder for fstringRawSingleCore
+    ]
+};
+
+export const fstringSingleCore: TokenPattern = {
+    debugName: "fstringSingleCore",
+    _patternId: PATTERN_ID_BASE + 365, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.String, /*string.interpolated.python string.quoted.single.python*/
+    match: /(.+?)(($\n?)|(?=[\\\}\{]|(['"])|((?<!\\)\n)))|\n/gm,
+    firstChars: [0xffffdfff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const fstringRawSingleCore: TokenPattern = {
+    debugName: "fstringRawSingleCore",
+    _patternId: PATTERN_ID_BASE + 366, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.String, /*string.interpolated.python string.quoted.raw.single.python*/
+    match: /(.+?)(($\n?)|(?=[\\\}\{]|(['"])|((?<!\\)\n)))|\n/gm,
+    firstChars: [0xffffdfff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const fstringSingleBrace: TokenPattern = {
+    debugName: "fstringSingleBrace",
+    _patternId: PATTERN_ID_BASE + 367, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // value interpolation using { ... }
+    begin: /(\{)/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    end: /(\})|(?=\n)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for fstringTerminatorSingle
+        fExpression,
+    ]
+};
+
+export const fstringTerminatorSingle: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 369, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "fstringTerminatorSingle.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 370, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(=(![rsa])?)(?=})/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingle.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 371, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(=?![rsa])(?=})/g,
+            firstChars: [0x0, 0x20000002, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingle.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 372, _patternType: TokenPatternType.MatchPattern,
+
+            match: /((?:=?)(?:![rsa])?)(:\w?[<>=^]?[-+ ]?\#?\d*,?(\.\d+)?[bcdeEfFgGnosxX%]?)(?=})/dg,
+            firstChars: [0x0, 0x24000002, 0x0, 0x0, 0x0],
+            captures: {
+                1: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+                2: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+            },
+        },
+        placeholderPattern, // Placeholder for fstringTerminatorSingleTail
+    ]
+};
+
+export const fstringTerminatorSingleTail: TokenPattern = {
+    debugName: "fstringTerminatorSingleTail",
+    _patternId: PATTERN_ID_BASE + 373, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /((?:=?)(?:![rsa])?)(:)(?=.*?{)/dg,
+    firstChars: [0x0, 0x24000002, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+        2: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+    },
+    end: /(?=})|(?=\n)/g,
+    patterns: [
+        fstringIllegalSingleBrace,
+        fstringSingleBrace,
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 375, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([bcdeEfFgGnosxX%])(?=})/g,
+            firstChars: [0x0, 0x20, 0x10000e0, 0x108c0fc, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 376, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\.\d+)/g,
+            firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 377, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(,)/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 378, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\d+)/g,
+            firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 379, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\#)/g,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![7]",
+            _patternId: PATTERN_ID_BASE + 380, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([-+ ])/g,
+            firstChars: [0x0, 0x2801, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![8]",
+            _patternId: PATTERN_ID_BASE + 381, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([<>=^])/g,
+            firstChars: [0x0, 0x70000000, 0x40000000, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorSingleTail.patterns![9]",
+            _patternId: PATTERN_ID_BASE + 382, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\w)/g,
+            firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const fstringFnormQuotedMultiLine: TokenPattern = {
+    debugName: "fstringFnormQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 383, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b[fF])([bBuU])?('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x40, 0x40, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.multi.python storage.type.string.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        3: { token: LiteralTokenType.String, /*punctuation.definition.string.begin.python string.interpolated.python string.quoted.multi.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.multi.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringGuts,
+        fstringIllegalMultiBrace,
+        placeholderPattern, // Placeholder for fstringMultiBrace
+        placeholderPattern, // Placeholder for fstringMultiCore
+    ]
+};
+
+export const fstringNormfQuotedMultiLine: TokenPattern = {
+    debugName: "fstringNormfQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 385, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b[bBuU])([fF])('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x200004, 0x200004, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.prefix.python*/ },
+        2: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.multi.python storage.type.string.python*/ },
+        3: { token: MetaTokenType.StringBegin, /*string.quoted.multi.python punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\3)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.multi.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringGuts,
+        fstringIllegalMultiBrace,
+        placeholderPattern, // Placeholder for fstringMultiBrace
+        placeholderPattern, // Placeholder for fstringMultiCore
+    ]
+};
+
+export const fstringRawQuotedMultiLine: TokenPattern = {
+    debugName: "fstringRawQuotedMultiLine",
+    _patternId: PATTERN_ID_BASE + 387, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.Fstring, /*meta.fstring.python*/
+    begin: /(\b(?:[rR][fF]|[fF][rR]))('''|""")/dg,
+    firstChars: [0x0, 0x0, 0x40040, 0x40040, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.StringStorageType, /*string.interpolated.python string.quoted.raw.multi.python storage.type.string.python*/ },
+        2: { token: MetaTokenType.StringBegin, /*string.quoted.raw.multi.python punctuation.definition.string.begin.python*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /(\2)/dg,
+    endCaptures: {
+        1: { token: LiteralTokenType.String, /*punctuation.definition.string.end.python string.interpolated.python string.quoted.raw.multi.python*/ },
+        2: { token: MetaTokenType.Invalid, /*invalid.illegal.newline.python*/ },
+    },
+    patterns: [
+        fstringRawGuts,
+        fstringIllegalMultiBrace,
+        placeholderPattern, // Placeholder for fstringMultiBrace
+        placeholderPattern, // Placeholder for fstringRawMultiCore
+    ]
+};
+
+export const fstringMultiCore: TokenPattern = {
+    debugName: "fstringMultiCore",
+    _patternId: PATTERN_ID_BASE + 389, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.String, /*string.interpolated.python string.quoted.multi.python*/
+    match: /(.+?)(($\n?)|(?=[\\\}\{]|'''|"""))|\n/gm,
+    firstChars: [0xffffdfff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const fstringRawMultiCore: TokenPattern = {
+    debugName: "fstringRawMultiCore",
+    _patternId: PATTERN_ID_BASE + 390, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.String, /*string.interpolated.python string.quoted.raw.multi.python*/
+    match: /(.+?)(($\n?)|(?=[\\\}\{]|'''|"""))|\n/gm,
+    firstChars: [0xffffdfff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const fstringMultiBrace: TokenPattern = {
+    debugName: "fstringMultiBrace",
+    _patternId: PATTERN_ID_BASE + 391, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // value interpolation using { ... }
+    begin: /(\{)/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    end: /(\})/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.other.python*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for fstringTerminatorMulti
+        fExpression,
+    ]
+};
+
+export const fstringTerminatorMulti: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 393, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "fstringTerminatorMulti.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 394, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(=(![rsa])?)(?=})/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMulti.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 395, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(=?![rsa])(?=})/g,
+            firstChars: [0x0, 0x20000002, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMulti.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 396, _patternType: TokenPatternType.MatchPattern,
+
+            match: /((?:=?)(?:![rsa])?)(:\w?[<>=^]?[-+ ]?\#?\d*,?(\.\d+)?[bcdeEfFgGnosxX%]?)(?=})/dg,
+            firstChars: [0x0, 0x24000002, 0x0, 0x0, 0x0],
+            captures: {
+                1: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+                2: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+            },
+        },
+        placeholderPattern, // Placeholder for fstringTerminatorMultiTail
+    ]
+};
+
+export const fstringTerminatorMultiTail: TokenPattern = {
+    debugName: "fstringTerminatorMultiTail",
+    _patternId: PATTERN_ID_BASE + 397, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /((?:=?)(?:![rsa])?)(:)(?=.*?{)/dg,
+    firstChars: [0x0, 0x24000002, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+        2: { token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/ },
+    },
+    end: /(?=})/g,
+    patterns: [
+        fstringIllegalMultiBrace,
+        fstringMultiBrace,
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 399, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([bcdeEfFgGnosxX%])(?=})/g,
+            firstChars: [0x0, 0x20, 0x10000e0, 0x108c0fc, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 400, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\.\d+)/g,
+            firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 401, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(,)/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 402, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\d+)/g,
+            firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 403, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\#)/g,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![7]",
+            _patternId: PATTERN_ID_BASE + 404, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([-+ ])/g,
+            firstChars: [0x0, 0x2801, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![8]",
+            _patternId: PATTERN_ID_BASE + 405, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /([<>=^])/g,
+            firstChars: [0x0, 0x70000000, 0x40000000, 0x0, 0x0],
+        },
+        {
+            debugName: "fstringTerminatorMultiTail.patterns![9]",
+            _patternId: PATTERN_ID_BASE + 406, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.FormatStorageType, /*storage.type.format.python*/
+            match: /(\w)/g,
+            firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+// Push pattern references that were not defined on include
+python.patterns!.splice(0, 1, statement);
+python.patterns!.splice(1, 1, expression);
+statement.patterns!.splice(0, 1, importStatement);
+statement.patterns!.splice(1, 1, classDeclaration);
+statement.patterns!.splice(2, 1, functionDeclaration);
+statement.patterns!.splice(3, 1, generator);
+statement.patterns!.splice(4, 1, statementKeyword);
+statement.patterns!.splice(5, 1, assignmentOperator);
+statement.patterns!.splice(6, 1, decorator);
+statement.patterns!.splice(7, 1, docstringStatement);
+statement.patterns!.splice(8, 1, semicolon);
+docstringStatement.patterns!.splice(0, 1, docstring);
+docstring.patterns![0].patterns!.splice(0, 1, docstringPrompt);
+docstring.patterns![0].patterns!.splice(2, 1, docstringGutsUnicode);
+docstring.patterns![1].patterns!.splice(0, 1, stringConsumeEscape);
+docstring.patterns![1].patterns!.splice(1, 1, docstringPrompt);
+docstring.patterns![2].patterns!.splice(1, 1, docstringGutsUnicode);
+docstring.patterns![3].patterns!.splice(0, 1, stringConsumeEscape);
+docstringGutsUnicode.patterns!.splice(0, 1, escapeSequenceUnicode);
+docstringGutsUnicode.patterns!.splice(1, 1, escapeSequence);
+docstringGutsUnicode.patterns!.splice(2, 1, stringLineContinuation);
+expressionBare.patterns!.splice(0, 1, backticks);
+expressionBare.patterns!.splice(1, 1, illegalAnno);
+expressionBare.patterns!.splice(2, 1, literal);
+expressionBare.patterns!.splice(3, 1, regexp);
+expressionBare.patterns!.splice(4, 1, string);
+expressionBare.patterns!.splice(5, 1, lambda);
+expressionBare.patterns!.splice(6, 1, generator);
+expressionBare.patterns!.splice(7, 1, illegalOperator);
+expressionBare.patterns!.splice(8, 1, operator);
+expressionBare.patterns!.splice(9, 1, curlyBraces);
+expressionBare.patterns!.splice(10, 1, itemAccess);
+expressionBare.patterns!.splice(11, 1, list);
+expressionBare.patterns!.splice(12, 1, oddFunctionCall);
+expressionBare.patterns!.splice(13, 1, roundBraces);
+expressionBare.patterns!.splice(14, 1, functionCall);
+expressionBare.patterns!.splice(15, 1, builtinFunctions);
+expressionBare.patterns!.splice(16, 1, builtinTypes);
+expressionBare.patterns!.splice(17, 1, builtinExceptions);
+expressionBare.patterns!.splice(18, 1, magicNames);
+expressionBare.patterns!.splice(19, 1, specialNames);
+expressionBare.patterns!.splice(20, 1, illegalNames);
+expressionBare.patterns!.splice(21, 1, specialVariables);
+expressionBare.patterns!.splice(22, 1, ellipsis);
+expressionBare.patterns!.splice(23, 1, punctuation);
+expressionBare.patterns!.splice(24, 1, lineContinuation);
+expressionBase.patterns!.splice(2, 1, lineContinuation);
+expression.patterns!.splice(1, 1, memberAccess);
+memberAccess.patterns!.splice(0, 1, functionCall);
+memberAccess.patterns!.splice(1, 1, memberAccessBase);
+memberAccess.patterns!.splice(2, 1, memberAccessAttribute);
+memberAccessBase.patterns!.splice(0, 1, magicNames);
+memberAccessBase.patterns!.splice(1, 1, illegalNames);
+memberAccessBase.patterns!.splice(2, 1, illegalObjectName);
+memberAccessBase.patterns!.splice(3, 1, specialNames);
+memberAccessBase.patterns!.splice(4, 1, lineContinuation);
+memberAccessBase.patterns!.splice(5, 1, itemAccess);
+oddFunctionCall.patterns!.splice(0, 1, functionArguments);
+lineContinuation.patterns![1].patterns!.splice(0, 1, regexp);
+lineContinuation.patterns![1].patterns!.splice(1, 1, string);
+literal.patterns!.splice(1, 1, number);
+number.patterns!.splice(0, 1, numberFloat);
+number.patterns!.splice(1, 1, numberDec);
+number.patterns!.splice(2, 1, numberHex);
+number.patterns!.splice(3, 1, numberOct);
+number.patterns!.splice(4, 1, numberBin);
+number.patterns!.splice(5, 1, numberLong);
+regexp.patterns!.splice(0, 1, regexpSingleThreeLine);
+regexp.patterns!.splice(1, 1, regexpDoubleThreeLine);
+regexp.patterns!.splice(2, 1, regexpSingleOneLine);
+regexp.patterns!.splice(3, 1, regexpDoubleOneLine);
+string.patterns!.splice(0, 1, stringQuotedMultiLine);
+string.patterns!.splice(1, 1, stringQuotedSingleLine);
+string.patterns!.splice(2, 1, stringBinQuotedMultiLine);
+string.patterns!.splice(3, 1, stringBinQuotedSingleLine);
+string.patterns!.splice(4, 1, stringRawQuotedMultiLine);
+string.patterns!.splice(5, 1, stringRawQuotedSingleLine);
+string.patterns!.splice(6, 1, stringRawBinQuotedMultiLine);
+string.patterns!.splice(7, 1, stringRawBinQuotedSingleLine);
+string.patterns!.splice(8, 1, fstringFnormQuotedMultiLine);
+string.patterns!.splice(9, 1, fstringFnormQuotedSingleLine);
+string.patterns!.splice(10, 1, fstringNormfQuotedMultiLine);
+string.patterns!.splice(11, 1, fstringNormfQuotedSingleLine);
+string.patterns!.splice(12, 1, fstringRawQuotedMultiLine);
+string.patterns!.splice(13, 1, fstringRawQuotedSingleLine);
+stringUnicodeGuts.patterns!.splice(1, 1, escapeSequenceUnicode);
+stringUnicodeGuts.patterns!.splice(2, 1, stringEntity);
+stringUnicodeGuts.patterns!.splice(3, 1, stringBraceFormatting);
+stringRawGuts.patterns!.splice(1, 1, stringFormatting);
+stringRawGuts.patterns!.splice(2, 1, stringBraceFormatting);
+stringRawBinGuts.patterns!.splice(1, 1, stringFormatting);
+stringEntity.patterns!.splice(0, 1, escapeSequence);
+stringEntity.patterns!.splice(1, 1, stringLineContinuation);
+stringEntity.patterns!.splice(2, 1, stringFormatting);
+fstringGuts.patterns!.splice(0, 1, escapeSequenceUnicode);
+fstringGuts.patterns!.splice(1, 1, escapeSequence);
+fstringGuts.patterns!.splice(2, 1, stringLineContinuation);
+fstringGuts.patterns!.splice(3, 1, fstringFormatting);
+fstringRawGuts.patterns!.splice(1, 1, fstringFormatting);
+fstringIllegalSingleBrace.patterns!.splice(0, 1, fstringTerminatorSingle);
+fstringIllegalSingleBrace.patterns!.splice(1, 1, fExpression);
+fstringFormatting.patterns!.splice(0, 1, fstringFormattingBraces);
+fstringFormatting.patterns!.splice(1, 1, fstringFormattingSingeBrace);
+classDeclaration.patterns![0].patterns!.splice(0, 1, className);
+classDeclaration.patterns![0].patterns!.splice(1, 1, classInheritance);
+className.patterns!.splice(0, 1, illegalObjectName);
+className.patterns!.splice(1, 1, builtinPossibleCallables);
+classInheritance.patterns!.splice(4, 1, illegalNames);
+classInheritance.patterns!.splice(5, 1, classKwarg);
+classInheritance.patterns!.splice(6, 1, callWrapperInheritance);
+classInheritance.patterns!.splice(8, 1, memberAccessClass);
+classInheritance.patterns!.splice(9, 1, inheritanceIdentifier);
+memberAccessClass.patterns!.splice(0, 1, callWrapperInheritance);
+lambda.patterns![1].patterns!.splice(2, 1, lambdaNestedIncomplete);
+lambda.patterns![1].patterns!.splice(3, 1, illegalNames);
+lambda.patterns![1].patterns!.splice(6, 1, backticks);
+lambda.patterns![1].patterns!.splice(7, 1, illegalAnno);
+lambda.patterns![1].patterns!.splice(8, 1, lambdaParameterWithDefault);
+lambda.patterns![1].patterns!.splice(10, 1, illegalOperator);
+functionDeclaration.patterns!.splice(0, 1, functionDefName);
+functionDeclaration.patterns!.splice(1, 1, parameters);
+functionDeclaration.patterns!.splice(3, 1, returnAnnotation);
+functionDefName.patterns!.splice(0, 1, illegalObjectName);
+functionDefName.patterns!.splice(1, 1, builtinPossibleCallables);
+parameters.patterns!.splice(3, 1, illegalNames);
+parameters.patterns!.splice(4, 1, illegalObjectName);
+parameters.patterns!.splice(5, 1, parameterSpecial);
+parameters.patterns!.splice(8, 1, looseDefault);
+parameters.patterns!.splice(9, 1, annotatedParameter);
+itemAccess.patterns![0].patterns!.splice(0, 1, itemName);
+itemAccess.patterns![0].patterns!.splice(1, 1, itemIndex);
+itemName.patterns!.splice(0, 1, specialVariables);
+itemName.patterns!.splice(1, 1, builtinFunctions);
+decorator.patterns!.splice(0, 1, decoratorName);
+decorator.patterns!.splice(1, 1, functionArguments);
+decoratorName.patterns!.splice(0, 1, builtinCallables);
+decoratorName.patterns!.splice(1, 1, illegalObjectName);
+callWrapperInheritance.patterns!.splice(0, 1, inheritanceName);
+callWrapperInheritance.patterns!.splice(1, 1, functionArguments);
+inheritanceName.patterns!.splice(1, 1, builtinPossibleCallables);
+functionCall.patterns!.splice(0, 1, specialVariables);
+functionCall.patterns!.splice(1, 1, functionName);
+functionCall.patterns!.splice(2, 1, functionArguments);
+functionName.patterns!.splice(0, 1, builtinPossibleCallables);
+functionArguments.patterns!.splice(3, 1, illegalNames);
+builtinCallables.patterns!.splice(0, 1, illegalNames);
+builtinCallables.patterns!.splice(1, 1, illegalObjectName);
+builtinCallables.patterns!.splice(2, 1, builtinExceptions);
+builtinCallables.patterns!.splice(3, 1, builtinFunctions);
+builtinCallables.patterns!.splice(4, 1, builtinTypes);
+builtinPossibleCallables.patterns!.splice(1, 1, magicNames);
+regexpBaseExpression.patterns!.splice(0, 1, regexpQuantifier);
+regexpBaseExpression.patterns!.splice(1, 1, regexpBaseCommon);
+fregexpBaseExpression.patterns!.splice(0, 1, fregexpQuantifier);
+fregexpBaseExpression.patterns!.splice(1, 1, fstringFormattingBraces);
+fregexpBaseExpression.patterns!.splice(3, 1, regexpBaseCommon);
+regexpBaseCommon.patterns!.splice(5, 1, regexpEscapeSequence);
+singleOneRegexpExpression.patterns!.splice(1, 1, singleOneRegexpCharacterSet);
+singleOneRegexpExpression.patterns!.splice(2, 1, singleOneRegexpComments);
+singleOneRegexpExpression.patterns!.splice(4, 1, singleOneRegexpNamedGroup);
+singleOneRegexpExpression.patterns!.splice(6, 1, singleOneRegexpLookahead);
+singleOneRegexpExpression.patterns!.splice(7, 1, singleOneRegexpLookaheadNegative);
+singleOneRegexpExpression.patterns!.splice(8, 1, singleOneRegexpLookbehind);
+singleOneRegexpExpression.patterns!.splice(9, 1, singleOneRegexpLookbehindNegative);
+singleOneRegexpExpression.patterns!.splice(10, 1, singleOneRegexpConditional);
+singleOneRegexpExpression.patterns!.splice(11, 1, singleOneRegexpParenthesesNonCapturing);
+singleOneRegexpExpression.patterns!.splice(12, 1, singleOneRegexpParentheses);
+singleThreeRegexpExpression.patterns!.splice(1, 1, singleThreeRegexpCharacterSet);
+singleThreeRegexpExpression.patterns!.splice(2, 1, singleThreeRegexpComments);
+singleThreeRegexpExpression.patterns!.splice(4, 1, singleThreeRegexpNamedGroup);
+singleThreeRegexpExpression.patterns!.splice(6, 1, singleThreeRegexpLookahead);
+singleThreeRegexpExpression.patterns!.splice(7, 1, singleThreeRegexpLookaheadNegative);
+singleThreeRegexpExpression.patterns!.splice(8, 1, singleThreeRegexpLookbehind);
+singleThreeRegexpExpression.patterns!.splice(9, 1, singleThreeRegexpLookbehindNegative);
+singleThreeRegexpExpression.patterns!.splice(10, 1, singleThreeRegexpConditional);
+singleThreeRegexpExpression.patterns!.splice(11, 1, singleThreeRegexpParenthesesNonCapturing);
+singleThreeRegexpExpression.patterns!.splice(12, 1, singleThreeRegexpParentheses);
+doubleOneRegexpExpression.patterns!.splice(1, 1, doubleOneRegexpCharacterSet);
+doubleOneRegexpExpression.patterns!.splice(2, 1, doubleOneRegexpComments);
+doubleOneRegexpExpression.patterns!.splice(4, 1, doubleOneRegexpNamedGroup);
+doubleOneRegexpExpression.patterns!.splice(6, 1, doubleOneRegexpLookahead);
+doubleOneRegexpExpression.patterns!.splice(7, 1, doubleOneRegexpLookaheadNegative);
+doubleOneRegexpExpression.patterns!.splice(8, 1, doubleOneRegexpLookbehind);
+doubleOneRegexpExpression.patterns!.splice(9, 1, doubleOneRegexpLookbehindNegative);
+doubleOneRegexpExpression.patterns!.splice(10, 1, doubleOneRegexpConditional);
+doubleOneRegexpExpression.patterns!.splice(11, 1, doubleOneRegexpParenthesesNonCapturing);
+doubleOneRegexpExpression.patterns!.splice(12, 1, doubleOneRegexpParentheses);
+doubleThreeRegexpExpression.patterns!.splice(1, 1, doubleThreeRegexpCharacterSet);
+doubleThreeRegexpExpression.patterns!.splice(2, 1, doubleThreeRegexpComments);
+doubleThreeRegexpExpression.patterns!.splice(4, 1, doubleThreeRegexpNamedGroup);
+doubleThreeRegexpExpression.patterns!.splice(6, 1, doubleThreeRegexpLookahead);
+doubleThreeRegexpExpression.patterns!.splice(7, 1, doubleThreeRegexpLookaheadNegative);
+doubleThreeRegexpExpression.patterns!.splice(8, 1, doubleThreeRegexpLookbehind);
+doubleThreeRegexpExpression.patterns!.splice(9, 1, doubleThreeRegexpLookbehindNegative);
+doubleThreeRegexpExpression.patterns!.splice(10, 1, doubleThreeRegexpConditional);
+doubleThreeRegexpExpression.patterns!.splice(11, 1, doubleThreeRegexpParenthesesNonCapturing);
+doubleThreeRegexpExpression.patterns!.splice(12, 1, doubleThreeRegexpParentheses);
+stringRawQuotedSingleLine.patterns!.splice(0, 1, stringSingleBadBrace1FormattingRaw);
+stringRawQuotedSingleLine.patterns!.splice(1, 1, stringSingleBadBrace2FormattingRaw);
+stringQuotedSingleLine.patterns!.splice(0, 1, stringSingleBadBrace1FormattingUnicode);
+stringRawQuotedMultiLine.patterns!.splice(0, 1, stringMultiBadBrace1FormattingRaw);
+stringRawQuotedMultiLine.patterns!.splice(1, 1, stringMultiBadBrace2FormattingRaw);
+stringQuotedMultiLine.patterns!.splice(0, 1, stringMultiBadBrace1FormattingUnicode);
+stringQuotedMultiLine.patterns!.splice(1, 1, stringMultiBadBrace2FormattingUnicode);
+fstringFnormQuotedSingleLine.patterns!.splice(2, 1, fstringSingleBrace);
+fstringFnormQuotedSingleLine.patterns!.splice(3, 1, fstringSingleCore);
+fstringNormfQuotedSingleLine.patterns!.splice(2, 1, fstringSingleBrace);
+fstringNormfQuotedSingleLine.patterns!.splice(3, 1, fstringSingleCore);
+fstringRawQuotedSingleLine.patterns!.splice(2, 1, fstringSingleBrace);
+fstringRawQuotedSingleLine.patterns!.splice(3, 1, fstringRawSingleCore);
+fstringSingleBrace.patterns!.splice(0, 1, fstringTerminatorSingle);
+fstringTerminatorSingle.patterns!.splice(3, 1, fstringTerminatorSingleTail);
+fstringFnormQuotedMultiLine.patterns!.splice(2, 1, fstringMultiBrace);
+fstringFnormQuotedMultiLine.patterns!.splice(3, 1, fstringMultiCore);
+fstringNormfQuotedMultiLine.patterns!.splice(2, 1, fstringMultiBrace);
+fstringNormfQuotedMultiLine.patterns!.splice(3, 1, fstringMultiCore);
+fstringRawQuotedMultiLine.patterns!.splice(2, 1, fstringMultiBrace);
+fstringRawQuotedMultiLine.patterns!.splice(3, 1, fstringRawMultiCore);
+fstringMultiBrace.patterns!.splice(0, 1, fstringTerminatorMulti);
+fstringTerminatorMulti.patterns!.splice(3, 1, fstringTerminatorMultiTail);
\ No newline at end of file
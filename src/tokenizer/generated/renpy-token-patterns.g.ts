@@ -0,0 +1,2637 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import { MetaTokenType, CharacterTokenType, LiteralTokenType, EntityTokenType, KeywordTokenType, EscapedCharacterTokenType, OperatorTokenType } from "src/tokenizer/renpy-tokens";
+import { placeholderPattern, TokenPattern, TokenPatternType } from "src/tokenizer/token-pattern-types";
+import { RENPY_PATTERN_ID_BASE as PATTERN_ID_BASE } from "./pattern-ids.g";
+
+export const statements: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 0, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for renpyStatements
+        placeholderPattern, // Placeholder for pythonStatements
+        placeholderPattern, // Placeholder for conditionals
+        placeholderPattern, // Placeholder for keywords
+        placeholderPattern, // Placeholder for sayStatements
+    ]
+};
+
+export const expressions: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 1, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for renpyPythonExpressions
+        placeholderPattern, // Placeholder for fallbackPatterns
+    ]
+};
+
+export const renpyOnlyExpressions: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 2, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for comments
+        placeholderPattern, // Placeholder for strings
+        placeholderPattern, // Placeholder for literal
+    ]
+};
+
+export const renpyPythonExpressions: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 3, _patternType: TokenPatternType.RepoPattern,
+    patterns: [renpyOnlyExpressions]
+};
+
+export const invalidToken: TokenPattern = {
+    debugName: "invalidToken",
+    _patternId: PATTERN_ID_BASE + 4, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.Invalid, /*invalid.unknown.token.renpy*/
+    match: /\b\w+\b|.+?/g,
+    firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+};
+
+export const newLine: TokenPattern = {
+    debugName: "newLine",
+    _patternId: PATTERN_ID_BASE + 5, _patternType: TokenPatternType.MatchPattern,
+
+    token: CharacterTokenType.NewLine, /*punctuation.new-line.renpy*/
+    match: /\r\n|\r|\n/g,
+    firstChars: [0x2400, 0x0, 0x0, 0x0, 0x0],
+};
+
+export const whitespace: TokenPattern = {
+    debugName: "whitespace",
+    _patternId: PATTERN_ID_BASE + 6, _patternType: TokenPatternType.MatchPattern,
+
+    token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/
+    match: /[ \t]+/g,
+    firstChars: [0x200, 0x1, 0x0, 0x0, 0x0],
+};
+
+export const singleCharacters: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 7, _patternType: TokenPatternType.RepoPattern,
+    // NOTE: Having these patterns separated increases performance. Benchmark before making a change!
+    patterns: [
+        newLine,
+        whitespace,
+        {
+            debugName: "singleCharacters.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 8, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.renpy*/
+            match: /\(/g,
+            firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 9, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.CloseParentheses, /*punctuation.parenthesis.end.renpy*/
+            match: /\)/g,
+            firstChars: [0x0, 0x200, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 10, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.OpenBracket, /*punctuation.bracket.begin.renpy*/
+            match: /{/g,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 11, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.CloseBracket, /*punctuation.bracket.end.renpy*/
+            match: /}/g,
+            firstChars: [0x0, 0x0, 0x0, 0x20000000, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 12, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.OpenSquareBracket, /*punctuation.square-bracket.begin.renpy*/
+            match: /\[/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![7]",
+            _patternId: PATTERN_ID_BASE + 13, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.CloseSquareBracket, /*punctuation.square-bracket.end.renpy*/
+            match: /\]/g,
+            firstChars: [0x0, 0x0, 0x20000000, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![8]",
+            _patternId: PATTERN_ID_BASE + 14, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Dot, /*punctuation.dot.renpy*/
+            match: /\./g,
+            firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![9]",
+            _patternId: PATTERN_ID_BASE + 15, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Colon, /*punctuation.colon.renpy*/
+            match: /:/g,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![10]",
+            _patternId: PATTERN_ID_BASE + 16, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Semicolon, /*punctuation.semicolon.renpy*/
+            match: /;/g,
+            firstChars: [0x0, 0x8000000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![11]",
+            _patternId: PATTERN_ID_BASE + 17, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Comma, /*punctuation.comma.renpy*/
+            match: /,/g,
+            firstChars: [0x0, 0x1000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![12]",
+            _patternId: PATTERN_ID_BASE + 18, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Hashtag, /*punctuation.hashtag.renpy*/
+            match: /#/g,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![13]",
+            _patternId: PATTERN_ID_BASE + 19, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Quote, /*punctuation.quote.renpy*/
+            match: /'/g,
+            firstChars: [0x0, 0x80, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![14]",
+            _patternId: PATTERN_ID_BASE + 20, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.DoubleQuote, /*punctuation.double-quote.renpy*/
+            match: /"/g,
+            firstChars: [0x0, 0x4, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![15]",
+            _patternId: PATTERN_ID_BASE + 21, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.BackQuote, /*punctuation.back-quote.renpy*/
+            match: /`/g,
+            firstChars: [0x0, 0x0, 0x0, 0x1, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![16]",
+            _patternId: PATTERN_ID_BASE + 22, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Backslash, /*punctuation.backslash.renpy*/
+            match: /\\/g,
+            firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![17]",
+            _patternId: PATTERN_ID_BASE + 23, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.ForwardSlash, /*punctuation.forward-slash.renpy*/
+            match: /\//g,
+            firstChars: [0x0, 0x8000, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "singleCharacters.patterns![18]",
+            _patternId: PATTERN_ID_BASE + 24, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.EqualsSymbol, /*punctuation.equals-symbol.renpy*/
+            match: /=/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+        },
+    ]
+};
+
+export const fallbackPatterns: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 25, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for comments
+        singleCharacters,
+        {
+            debugName: "fallbackPatterns.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 26, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*debug.invalid.illegal.unmatched.renpy*/
+            match: /\b\w+\b/g,
+            firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+        {
+            debugName: "fallbackPatterns.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 27, _patternType: TokenPatternType.MatchPattern,
+
+            token: CharacterTokenType.Unknown, /*punctuation.unknown.renpy*/
+            match: /./g,
+            firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+        },
+    ]
+};
+
+export const fallbackPatternsWithError: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 28, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for comments
+        singleCharacters,
+        invalidToken,
+    ]
+};
+
+export const literal: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 29, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "literal.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 30, _patternType: TokenPatternType.MatchPattern,
+
+            // Python literals
+            token: MetaTokenType.ConstantLiteral, /*constant.language.renpy*/
+            match: /\b(?<!\.)(True|False|None)\b/g,
+            firstChars: [0x0, 0x0, 0x104040, 0x0, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy.python#literal
+    ]
+};
+
+export const numFloat: TokenPattern = {
+    debugName: "numFloat",
+    _patternId: PATTERN_ID_BASE + 31, _patternType: TokenPatternType.MatchPattern,
+
+    match: /([\+\-])?(\d+\.?\d*|\.\d+)([eE][\-\+]?\d+)?/dg,
+    firstChars: [0x0, 0x3ff6800, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.ArithmeticOperator, /*keyword.operator.arithmetic.renpy*/ },
+        2: { token: LiteralTokenType.Float, /*constant.numeric.float.renpy*/ },
+        3: { token: LiteralTokenType.Float, /*constant.numeric.float.renpy*/ },
+    },
+};
+
+export const numInt: TokenPattern = {
+    debugName: "numInt",
+    _patternId: PATTERN_ID_BASE + 32, _patternType: TokenPatternType.MatchPattern,
+
+    token: LiteralTokenType.Integer, /*constant.numeric.integer.renpy*/
+    match: /(?<![\w.])(?:[1-9]+|0+|0([0-9]+)(?![eE.]))\b/dg,
+    firstChars: [0x0, 0x3ff0000, 0x0, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.integer.renpy*/ },
+    },
+};
+
+export const parenthesizedPython: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 33, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "parenthesizedPython.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 34, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\(/g,
+            firstChars: [0x0, 0x100, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                0: { token: CharacterTokenType.OpenParentheses, /*punctuation.parenthesis.begin.python.renpy*/ },
+            },
+            end: /\)/g,
+            endCaptures: {
+                0: { token: CharacterTokenType.CloseParentheses, /*punctuation.parenthesis.end.python.renpy*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+            ]
+        },
+        {
+            debugName: "parenthesizedPython.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 36, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\[/g,
+            firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+            beginCaptures: {
+                0: { token: CharacterTokenType.OpenSquareBracket, /*punctuation.square-bracket.begin.python.renpy*/ },
+            },
+            end: /\]/g,
+            endCaptures: {
+                0: { token: CharacterTokenType.CloseSquareBracket, /*punctuation.square-bracket.end.python.renpy*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+            ]
+        },
+        {
+            debugName: "parenthesizedPython.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 38, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            begin: /\{/g,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            beginCaptures: {
+                0: { token: CharacterTokenType.OpenBracket, /*punctuation.bracket.begin.python.renpy*/ },
+            },
+            end: /\}/g,
+            endCaptures: {
+                0: { token: CharacterTokenType.CloseBracket, /*punctuation.bracket.end.python.renpy*/ },
+            },
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+            ]
+        },
+    ]
+};
+
+export const identifier: TokenPattern = {
+    debugName: "identifier",
+    _patternId: PATTERN_ID_BASE + 40, _patternType: TokenPatternType.MatchPattern,
+
+    token: EntityTokenType.Identifier, /*variable.name.renpy*/
+    match: /\b[\p{XID_Start}_]\p{XID_Continue}*\b/gu,
+};
+
+export const illegalIdentifiers: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 41, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "illegalIdentifiers.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 42, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.identifier.renpy*/
+            match: /\b(as|at|behind|call|expression|hide|if|in|image|init|jump|menu|onlayer|python|return|scene|show|with|while|zorder)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x48da72e, 0x0],
+        },
+    ]
+};
+
+export const name: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 43, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        illegalIdentifiers,
+        identifier,
+    ]
+};
+
+export const simpleExpression: TokenPattern = {
+    debugName: "simpleExpression",
+    _patternId: PATTERN_ID_BASE + 44, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+    token: MetaTokenType.SimpleExpression, /*meta.simple-expression.renpy*/
+    begin: /[ \t]*/g,
+    end: /(?!\G)(?![.\[\(\{])|$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#string
+        literal,
+        numFloat,
+        placeholderPattern, // Placeholder for source.renpy.python#member-access
+        placeholderPattern, // Placeholder for source.renpy.python#function-call
+        identifier,
+        parenthesizedPython,
+        placeholderPattern, // Placeholder for comments
+        whitespace,
+    ]
+};
+
+export const keywords: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 46, _patternType: TokenPatternType.RepoPattern,
+    // Fallback patterns for unmatched keywords
+    patterns: [
+        {
+            debugName: "keywords.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 47, _patternType: TokenPatternType.MatchPattern,
+
+            // Control flow keywords
+            token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.renpy*/
+            match: /\b(?<!\.)(?:pass|return|pause|if|elif|else|while|for)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x850260, 0x0],
+        },
+        {
+            debugName: "keywords.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 48, _patternType: TokenPatternType.MatchPattern,
+
+            // Python statement keywords
+            token: KeywordTokenType.OtherPython, /*keyword.other.python.renpy*/
+            match: /\b(?<!\.)(define|default|early|hide|in|init|python)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x10330, 0x0],
+        },
+        {
+            debugName: "keywords.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 49, _patternType: TokenPatternType.MatchPattern,
+
+            // Renpy keywords
+            token: KeywordTokenType.Other, /*keyword.other.renpy*/
+            match: /\b(?<!\.)(?:camera|image|label|layeredimage|menu|nvl[ \t]+clear|play|queue|scene|screen|show|transform|translate|voice(?:[ \t]+sustain)?)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x5b7208, 0x0],
+        },
+        {
+            debugName: "keywords.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 50, _patternType: TokenPatternType.MatchPattern,
+
+            // [TODO: Should probably only be a keyword in the expression] Renpy sub expression keywords
+            token: KeywordTokenType.Other, /*keyword.other.renpy*/
+            match: /\b(?<!\.)(?:set|expression|from|style_prefix|spacing|textbutton)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x180060, 0x0],
+        },
+        {
+            debugName: "keywords.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 51, _patternType: TokenPatternType.MatchPattern,
+
+            // [TODO: Should probably only be a keyword in the expression] Renpy sub expression keywords
+            token: KeywordTokenType.Other, /*keyword.control.flow.other.renpy*/
+            match: /\b(?<!\.)(?:action|at|with)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x800002, 0x0],
+        },
+    ]
+};
+
+export const regionComment: TokenPattern = {
+    debugName: "regionComment",
+    _patternId: PATTERN_ID_BASE + 52, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.Comment, /*comment.line.number-sign.renpy*/
+    match: /(?<=^[ \t]*)(#[ \t]*(?:end)?region)\b.*$/dgm,
+    firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+    requiredLiteral: "region",
+    captures: {
+        1: { token: MetaTokenType.CommentRegionTag, /*punctuation.definition.tag.region.renpy*/ },
+    },
+};
+
+export const codetags: TokenPattern = {
+    debugName: "codetags",
+    _patternId: PATTERN_ID_BASE + 53, _patternType: TokenPatternType.MatchPattern,
+
+    match: /(?:\b(NOTE|XXX|HACK|FIXME|BUG|TODO)\b)/dg,
+    firstChars: [0x0, 0x0, 0x1104144, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.CommentCodeTag, /*keyword.codetag.notation.renpy*/ },
+    },
+};
+
+export const commentsBase: TokenPattern = {
+    debugName: "commentsBase",
+    _patternId: PATTERN_ID_BASE + 54, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.Comment, /*comment.line.number-sign.renpy*/
+    begin: /#/g,
+    firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: CharacterTokenType.Hashtag, /*punctuation.definition.comment.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [codetags]
+};
+
+export const comments: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 56, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        regionComment,
+        commentsBase,
+    ]
+};
+
+export const escapedChar: TokenPattern = {
+    debugName: "escapedChar",
+    _patternId: PATTERN_ID_BASE + 57, _patternType: TokenPatternType.MatchPattern,
+
+    match: /(\\")|(\\')|(\\ )|(\\n)|(\\\\)|(\[\[)|({{)|(%%)/dg,
+    firstChars: [0x0, 0x20, 0x18000000, 0x8000000, 0x0],
+    captures: {
+        1: { token: EscapedCharacterTokenType.EscDoubleQuote, /*constant.character.escape.double-quote.python.renpy*/ },
+        2: { token: EscapedCharacterTokenType.EscQuote, /*constant.character.escape.quote.python.renpy*/ },
+        3: { token: EscapedCharacterTokenType.EscWhitespace, /*constant.character.escape.whitespace.python.renpy*/ },
+        4: { token: EscapedCharacterTokenType.EscNewline, /*constant.character.escape.newline.python.renpy*/ },
+        5: { token: EscapedCharacterTokenType.EscBackslash, /*constant.character.escape.backslash.python.renpy*/ },
+        6: { token: EscapedCharacterTokenType.EscOpenBracket, /*constant.character.escape.open.bracket.python.renpy*/ },
+        7: { token: EscapedCharacterTokenType.EscOpenSquareBracket, /*constant.character.escape.open.square-bracket.python.renpy*/ },
+        8: { token: EscapedCharacterTokenType.EscPercent, /*constant.character.escape.percent.python.renpy*/ },
+    },
+};
+
+export const constantPlaceholder: TokenPattern = {
+    debugName: "constantPlaceholder",
+    _patternId: PATTERN_ID_BASE + 58, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // Python value interpolation using [ ... ]
+    token: MetaTokenType.ConstantCaps, /*constant.other.placeholder.tags.renpy*/
+    contentToken: MetaTokenType.PythonLine, /*meta.embedded.line.python*/
+    begin: /(?<=[^\[])\[/g,
+    firstChars: [0x0, 0x0, 0x8000000, 0x0, 0x0],
+    beginCaptures: {
+        0: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.begin.renpy*/ },
+    },
+    end: /\]/g,
+    endCaptures: {
+        0: { token: MetaTokenType.Placeholder, /*constant.character.format.placeholder.end.renpy*/ },
+    },
+    patterns: [
+        {
+            debugName: "constantPlaceholder.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 60, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.InterpolateFlags, /*meta.interpolate.flags.renpy*/
+            match: /(!)([rstiqulc]+)/dg,
+            firstChars: [0x0, 0x2, 0x0, 0x0, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.ExclamationMark, /*punctuation.definition.interpolate.flags.begin.renpy*/ },
+                2: { token: MetaTokenType.ModifierFlagStorageType, /*storage.modifier.flag.renpy*/ },
+            },
+        },
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+    ]
+};
+
+export const escapedUnicodeChar: TokenPattern = {
+    debugName: "escapedUnicodeChar",
+    _patternId: PATTERN_ID_BASE + 61, _patternType: TokenPatternType.MatchPattern,
+
+    match: /(\\U[0-9A-Fa-f]{8})|(\\u[0-9A-Fa-f]{4})|(\\N\{[a-zA-Z ]+\})/dg,
+    firstChars: [0x0, 0x0, 0x10000000, 0x0, 0x0],
+    captures: {
+        1: { token: MetaTokenType.EscapeSequence, /*constant.character.unicode.16-bit-hex.python.renpy*/ },
+        2: { token: MetaTokenType.EscapeSequence, /*constant.character.unicode.32-bit-hex.python.renpy*/ },
+        3: { token: MetaTokenType.EscapeSequence, /*constant.character.unicode.name.python.renpy*/ },
+    },
+};
+
+export const hexLiteral: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 62, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "hexLiteral.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 63, _patternType: TokenPatternType.MatchPattern,
+
+            // rgb, rgba, rrggbb, rrggbbaa
+            token: LiteralTokenType.Color, /*constant.color.renpy*/
+            match: /#(?:[a-f0-9]{8}|[a-f0-9]{6}|[a-f0-9]{3,4})\b/gi,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "hexLiteral.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 64, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.unexpected-number-of-hex-values.renpy*/
+            match: /#[a-f0-9]+\b/gi,
+            firstChars: [0x0, 0x8, 0x0, 0x0, 0x0],
+        },
+        {
+            debugName: "hexLiteral.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 65, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(#[a-f0-9]*)?(.+?)\b/dgi,
+            firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+            captures: {
+                1: { token: LiteralTokenType.Color, /*constant.color.renpy*/ },
+                2: { token: MetaTokenType.Invalid, /*invalid.illegal.character-not-allowed-here.renpy*/ },
+            },
+        },
+    ]
+};
+
+export const stringsInterior: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 66, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        newLine,
+        escapedChar,
+        placeholderPattern, // Placeholder for stringTags
+        constantPlaceholder,
+    ]
+};
+
+export const stringTagsBroken: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 67, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "stringTagsBroken.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 68, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Valid tags without params (optional close)
+            contentToken: MetaTokenType.TaggedString, /*renpy.meta.${2:/downcase} meta.tagged.string.renpy*/
+            begin: /({)\s*(u|i|b|s|plain|alt|noalt|art|rb|rt)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+        {
+            debugName: "stringTagsBroken.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 70, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Valid tags with numeric params (optional close)
+            contentToken: MetaTokenType.TaggedString, /*renpy.meta.${2:/downcase} meta.tagged.string.renpy*/
+            begin: /({)\s*(alpha|cps|k)(=)(?:(\*)|(\-)|(\+))?(\d*(?:.\d+)?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: OperatorTokenType.Multiply, /*keyword.operator.arithmetic.Multiply.renpy*/ },
+                5: { token: OperatorTokenType.Minus, /*keyword.operator.arithmetic.Minus.renpy*/ },
+                6: { token: OperatorTokenType.Plus, /*keyword.operator.arithmetic.Plus.renpy*/ },
+                7: { token: MetaTokenType.ConstantNumeric, /*support.constant.property-value.renpy constant.numeric.renpy*/ },
+                8: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+        {
+            debugName: "stringTagsBroken.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 72, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Valid tags with numeric params (optional close)
+            contentToken: MetaTokenType.TaggedString, /*renpy.meta.${2:/downcase} meta.tagged.string.renpy*/
+            begin: /({)\s*(size)(=)([\-+]?)(\d+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "size=",
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: MetaTokenType.ArithmeticOperator, /*keyword.operator.arithmetic.renpy*/ },
+                5: { token: LiteralTokenType.Integer, /*support.constant.property-value.renpy constant.numeric.integer.renpy*/ },
+                6: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+        {
+            debugName: "stringTagsBroken.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 74, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Valid tags with file param (optional close)
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            begin: /({)\s*(font)(=)([\w.]+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "font=",
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/ },
+                5: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+        {
+            debugName: "stringTagsBroken.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 76, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Color tag
+            contentToken: MetaTokenType.TaggedString, /*renpy.meta.${2:/downcase}.${4:/downcase} meta.tagged.string.renpy*/
+            begin: /({)\s*(color|outlinecolor)(=)(#?[a-zA-Z0-9]+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "color=",
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: {
+                    _patternId: PATTERN_ID_BASE + 78, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [hexLiteral]
+                },
+                5: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+        {
+            debugName: "stringTagsBroken.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 79, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // a tag
+            contentToken: MetaTokenType.TaggedString, /*renpy.meta.${2:/downcase} meta.tagged.string.renpy*/
+            begin: /({)\s*(a)(=)(.*?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "a=",
+            beginCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: {
+                    _patternId: PATTERN_ID_BASE + 81, _patternType: TokenPatternType.RepoPattern,
+                    token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/
+                    patterns: [
+                    ]
+                },
+                5: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /({\/)\s*(\2)\s*(})/dg,
+            endCaptures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*punctuation.definition.tag.end.renpy*/ },
+            },
+            patterns: [stringsInterior]
+        },
+    ]
+};
+
+export const stringTags: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 82, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "stringTags.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 83, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags without params (self-closing)
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            match: /({)\s*(nw|done|fast|p|w|clear)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 84, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with numeric params (self-closing)
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            match: /({)\s*(p|w)(=)(\+)?(\d*(?:.\d+)?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: OperatorTokenType.Plus, /*keyword.operator.arithmetic.plus.renpy*/ },
+                5: { token: LiteralTokenType.Float, /*support.constant.property-value.renpy constant.numeric.float.renpy*/ },
+                6: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 85, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with numeric params (self-closing)
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            match: /({)\s*(v?space)(=)(\+)?(\d+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "space=",
+            captures: {
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: OperatorTokenType.Plus, /*keyword.operator.arithmetic.plus.renpy*/ },
+                5: { token: LiteralTokenType.Integer, /*support.constant.property-value.renpy constant.numeric.integer.renpy*/ },
+                6: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 86, _patternType: TokenPatternType.MatchPattern,
+
+            // Comment tag (self-closing)
+            token: MetaTokenType.StringTag, /*meta.string.tag.comment.self-closing.renpy*/
+            match: /({)\s*(#)\s*(.*?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: CharacterTokenType.Hashtag, /*comment.line.number-sign.renpy punctuation.definition.comment.renpy*/ },
+                3: { token: MetaTokenType.Comment, /*comment.line.number-sign.renpy*/ },
+                4: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 87, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with file param
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            match: /({)\s*(image)(=)([\w.]+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "image=",
+            captures: {
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/ },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 88, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags without params (optional close)
+            match: /({)\s*(u|i|b|s|plain|alt|noalt|art|rb|rt)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 89, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with numeric params (optional close)
+            match: /({)\s*(alpha|cps|k)(=)(?:(\*)|(\-)|(\+))?(\d*(?:.\d+)?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: OperatorTokenType.Multiply, /*keyword.operator.arithmetic.Multiply.renpy*/ },
+                5: { token: OperatorTokenType.Minus, /*keyword.operator.arithmetic.Minus.renpy*/ },
+                6: { token: OperatorTokenType.Plus, /*keyword.operator.arithmetic.Plus.renpy*/ },
+                7: { token: MetaTokenType.ConstantNumeric, /*support.constant.property-value.renpy constant.numeric.renpy*/ },
+                8: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![7]",
+            _patternId: PATTERN_ID_BASE + 90, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with numeric params (optional close)
+            match: /({)\s*(size)(=)([\-+]?)(\d+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "size=",
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: MetaTokenType.ArithmeticOperator, /*keyword.operator.arithmetic.renpy*/ },
+                5: { token: LiteralTokenType.Integer, /*support.constant.property-value.renpy constant.numeric.integer.renpy*/ },
+                6: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![8]",
+            _patternId: PATTERN_ID_BASE + 91, _patternType: TokenPatternType.MatchPattern,
+
+            // Valid tags with file param (optional close)
+            token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.self-closing.renpy*/
+            match: /({)\s*(font)(=)([\w.]+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "font=",
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/ },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![9]",
+            _patternId: PATTERN_ID_BASE + 92, _patternType: TokenPatternType.MatchPattern,
+
+            // Color tag
+            match: /({)\s*(color|outlinecolor)(=)(#?[a-zA-Z0-9]+)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "color=",
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: {
+                    _patternId: PATTERN_ID_BASE + 93, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [hexLiteral]
+                },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![10]",
+            _patternId: PATTERN_ID_BASE + 94, _patternType: TokenPatternType.MatchPattern,
+
+            // a tag
+            match: /({)\s*(a)(=)(.*?)\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "a=",
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: {
+                    _patternId: PATTERN_ID_BASE + 95, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [
+                        {
+                            debugName: "stringTags.patterns![10].captures![4].patterns![0]",
+                            _patternId: PATTERN_ID_BASE + 96, _patternType: TokenPatternType.MatchPattern,
+
+                            match: /\b(jump)\b(:)([a-zA-Z_]\w*)/dg,
+                            firstChars: [0x0, 0x0, 0x0, 0x400, 0x0],
+                            requiredLiteral: "jump:",
+                            captures: {
+                                1: { token: KeywordTokenType.Jump, /*keyword.control.flow.jump.renpy*/ },
+                                2: { token: CharacterTokenType.Colon, /*keyword.operator.jump.renpy punctuation.colon.renpy*/ },
+                                3: {
+                                    _patternId: PATTERN_ID_BASE + 97, _patternType: TokenPatternType.RepoPattern,
+                                    patterns: [
+                                        placeholderPattern, // Placeholder for labelName
+                                        fallbackPatterns,
+                                    ]
+                                },
+                            },
+                        },
+                        {
+                            debugName: "stringTags.patterns![10].captures![4].patterns![1]",
+                            _patternId: PATTERN_ID_BASE + 98, _patternType: TokenPatternType.MatchPattern,
+
+                            token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/
+                            match: /.*/g,
+                        },
+                    ]
+                },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![11]",
+            _patternId: PATTERN_ID_BASE + 99, _patternType: TokenPatternType.MatchPattern,
+
+            // Close tags
+            match: /({\/)\s*([a-zA-Z_]\w*)?(=)?(.*?)?\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            requiredLiteral: "{/",
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.end.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/ },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+        {
+            debugName: "stringTags.patterns![12]",
+            _patternId: PATTERN_ID_BASE + 100, _patternType: TokenPatternType.MatchPattern,
+
+            // Custom tags (optional close)
+            match: /({)\s*([a-zA-Z_]\w*)?(=)?(.*?)?\s*(})/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x8000000, 0x0],
+            captures: {
+                0: { token: MetaTokenType.StringTag, /*meta.string.tag.${2:/downcase}.start.renpy*/ },
+                1: { token: CharacterTokenType.OpenBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.begin.renpy*/ },
+                2: { token: EntityTokenType.TagName, /*entity.name.tag.${2:/downcase}.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*punctuation.separator.key-value.renpy keyword.operator.assignment.renpy*/ },
+                4: { token: LiteralTokenType.String, /*support.constant.property-value.renpy string.unquoted.renpy*/ },
+                5: { token: CharacterTokenType.CloseBracket, /*constant.character.format.placeholder.other.renpy punctuation.definition.tag.end.renpy*/ },
+            },
+        },
+    ]
+};
+
+export const strings: TokenPattern = {
+    debugName: "strings",
+    _patternId: PATTERN_ID_BASE + 101, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: LiteralTokenType.String, /*string.quoted.renpy*/
+    begin: /"""|"|'''|'|```|`/g,
+    firstChars: [0x0, 0x84, 0x0, 0x1, 0x0],
+    beginCaptures: {
+        0: { token: MetaTokenType.StringBegin, /*punctuation.definition.string.begin.renpy*/ },
+    },
+    end: /(?<![^\\]\\)(((?<=\0)\0)|\0)/dg,
+    endCaptures: {
+        1: { token: MetaTokenType.StringEnd, /*punctuation.definition.string.end.renpy*/ },
+        2: { token: MetaTokenType.EmptyString, /*meta.empty-string.renpy*/ },
+    },
+    patterns: [stringsInterior]
+};
+
+export const pythonStatements: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 103, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "pythonStatements.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 104, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(?<=^[ \t]*)(init)([ \t]+)(offset)([ \t]*)(=)([ \t]*)(-)?([^#]*?)$/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+            requiredLiteral: "offset",
+            captures: {
+                1: { token: KeywordTokenType.Init, /*keyword.init.renpy*/ },
+                2: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/ },
+                3: { token: KeywordTokenType.Offset, /*keyword.offset.renpy*/ },
+                4: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/ },
+                5: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.renpy*/ },
+                6: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/ },
+                7: { token: OperatorTokenType.Minus, /*keyword.operator.arithmetic.minus.renpy*/ },
+                8: {
+                    _patternId: PATTERN_ID_BASE + 105, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [
+                        numInt,
+                        invalidToken,
+                    ]
+                },
+            },
+        },
+        {
+            debugName: "pythonStatements.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 106, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Renpy python block
+            contentToken: MetaTokenType.PythonBlock, /*meta.embedded.block.python*/
+            begin: /(?<=(^[ \t]*))(?:(init)(?:([ \t]+)(-)?(\d+))?([ \t]+))?(python)(.*)?(:)/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x10200, 0x0],
+            requiredLiteral: "python",
+            beginCaptures: {
+                2: { token: KeywordTokenType.Init, /*keyword.init.renpy*/ },
+                3: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/ },
+                4: { token: OperatorTokenType.Minus, /*keyword.operator.arithmetic.minus.renpy*/ },
+                5: { token: LiteralTokenType.Integer, /*constant.numeric.integer.renpy*/ },
+                6: { token: CharacterTokenType.Whitespace, /*punctuation.whitespace.renpy*/ },
+                7: { token: KeywordTokenType.Python, /*keyword.python.renpy*/ },
+                8: {
+                    _patternId: PATTERN_ID_BASE + 108, _patternType: TokenPatternType.RepoPattern,
+                    token: MetaTokenType.Arguments, /*meta.python.block.arguments.renpy*/
+                    patterns: [
+                        {
+                            debugName: "pythonStatements.patterns![1].beginCaptures![8].patterns![0]",
+                            _patternId: PATTERN_ID_BASE + 109, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+                            // in statement
+                            begin: /\b(in)\b/dg,
+                            firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+                            requiredLiteral: "in",
+                            beginCaptures: {
+                                1: { token: KeywordTokenType.In, /*keyword.control.flow.in.renpy*/ },
+                            },
+                            end: /(?!\G)(?<=[^ \t])|$/gm,
+                            patterns: [
+                                {
+                                    debugName: "pythonStatements.patterns![1].beginCaptures![8].patterns![0].patterns![0]",
+                                    _patternId: PATTERN_ID_BASE + 111, _patternType: TokenPatternType.MatchPattern,
+
+                                    token: EntityTokenType.NamespaceName, /*entity.name.namespace*/
+                                    match: /\b[\p{XID_Start}_]\p{XID_Continue}*\b/gu,
+                                },
+                                fallbackPatterns,
+                            ]
+                        },
+                        {
+                            debugName: "pythonStatements.patterns![1].beginCaptures![8].patterns![1]",
+                            _patternId: PATTERN_ID_BASE + 112, _patternType: TokenPatternType.MatchPattern,
+
+                            // keywords
+                            match: /\b(hide)|(early)|(in)\b/dg,
+                            firstChars: [0x0, 0x0, 0x0, 0x320, 0x0],
+                            captures: {
+                                1: { token: KeywordTokenType.Hide, /*keyword.hide.renpy*/ },
+                                2: { token: KeywordTokenType.Early, /*keyword.early.renpy*/ },
+                                3: { token: KeywordTokenType.In, /*keyword.control.flow.in.renpy*/ },
+                            },
+                        },
+                    ]
+                },
+                9: { token: CharacterTokenType.Colon, /*punctuation.section.python.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python
+            ]
+        },
+        placeholderPattern, // Placeholder for define
+        placeholderPattern, // Placeholder for defaultStatement
+        placeholderPattern, // Placeholder for oneLinePython
+        placeholderPattern, // Placeholder for pythonBlockTester
+    ]
+};
+
+export const pythonBlockTester: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 113, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "pythonBlockTester.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 114, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            // Check for assignments that support python expressions
+            contentToken: MetaTokenType.PythonExpression, /*meta.python.expression.renpy*/
+            begin: /(?<=(^[ \t]*)(?:image)\b.*?)(=)/dgm,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python
+            ]
+        },
+        {
+            debugName: "pythonBlockTester.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 116, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            contentToken: MetaTokenType.PythonBlock, /*meta.embedded.block.python*/
+            begin: /(?<=(^[ \t]*).*?python\b\s*)(:)/dgm,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: CharacterTokenType.Colon, /*punctuation.section.python.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python
+            ]
+        },
+    ]
+};
+
+export const define: TokenPattern = {
+    debugName: "define",
+    _patternId: PATTERN_ID_BASE + 118, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(?<=^[ \t]*)(define)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x10, 0x0],
+    requiredLiteral: "define",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Define, /*keyword.define.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [
+        numInt,
+        strings,
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+        {
+            debugName: "define.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 120, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            contentToken: MetaTokenType.PythonExpression, /*meta.python.expression.renpy*/
+            begin: /(\+=)|(\|=)|(=)/dg,
+            firstChars: [0x0, 0x20000800, 0x0, 0x10000000, 0x0],
+            beginCaptures: {
+                1: { token: OperatorTokenType.PlusAssign, /*keyword.operator.plus.assign.renpy*/ },
+                2: { token: MetaTokenType.BitwiseOperatorKeyword, /*keyword.operator.bitwise.or.assign.renpy*/ },
+                3: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+                whitespace,
+            ]
+        },
+        fallbackPatterns,
+    ]
+};
+
+export const defaultStatement: TokenPattern = {
+    debugName: "defaultStatement",
+    _patternId: PATTERN_ID_BASE + 122, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(?<=^[ \t]*)(default)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x10, 0x0],
+    requiredLiteral: "default",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Default, /*keyword.default.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [
+        strings,
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+        {
+            debugName: "defaultStatement.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 124, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            contentToken: MetaTokenType.PythonExpression, /*meta.python.expression.renpy*/
+            begin: /=/g,
+            firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                0: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+                whitespace,
+            ]
+        },
+        whitespace,
+    ]
+};
+
+export const oneLinePython: TokenPattern = {
+    debugName: "oneLinePython",
+    _patternId: PATTERN_ID_BASE + 126, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(?<=^[ \t]*)(\$)/dgm,
+    firstChars: [0x0, 0x10, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: KeywordTokenType.DollarSign, /*keyword.dollar.sign.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [
+        strings,
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+        fallbackPatterns,
+    ]
+};
+
+export const sayStatements: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 128, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "sayStatements.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 129, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.SayStatement, /*meta.say.statement.renpy*/
+            contentToken: LiteralTokenType.String, /*renpy.meta.say.$1 string.quoted.renpy*/
+            begin: /(?<=^[ \t]*)(?:((?:character\.)?[a-zA-Z_]\w*)\b|"([a-zA-Z_]\w*)\b")((?:[ \t]+(?:@|\w+))*)?(?=[ \t]*r?(?:"|'|`))/dgm,
+            firstChars: [0x0, 0x4, 0x87fffffe, 0x7fffffe, 0x0],
+            beginCaptures: {
+                1: {
+                    _patternId: PATTERN_ID_BASE + 131, _patternType: TokenPatternType.RepoPattern,
+                    token: EntityTokenType.Identifier, /*renpy.meta.character.$1 variable.other.renpy*/
+                    patterns: [
+                        {
+                            debugName: "sayStatements.patterns![0].beginCaptures![1].patterns![0]",
+                            _patternId: PATTERN_ID_BASE + 132, _patternType: TokenPatternType.MatchPattern,
+
+                            token: KeywordTokenType.Extend, /*keyword.extend.renpy*/
+                            match: /extend/g,
+                            firstChars: [0x0, 0x0, 0x0, 0x20, 0x0],
+                            requiredLiteral: "extend",
+                        },
+                        {
+                            debugName: "sayStatements.patterns![0].beginCaptures![1].patterns![1]",
+                            _patternId: PATTERN_ID_BASE + 133, _patternType: TokenPatternType.MatchPattern,
+
+                            token: KeywordTokenType.Voice, /*keyword.voice.renpy*/
+                            match: /voice/g,
+                            firstChars: [0x0, 0x0, 0x0, 0x400000, 0x0],
+                            requiredLiteral: "voice",
+                        },
+                        {
+                            debugName: "sayStatements.patterns![0].beginCaptures![1].patterns![2]",
+                            _patternId: PATTERN_ID_BASE + 134, _patternType: TokenPatternType.MatchPattern,
+
+                            // Match special characters
+                            token: EntityTokenType.Identifier, /*variable.other.constant.renpy*/
+                            match: /adv|nvl|narrator|name_only|centered|vcentered/g,
+                            firstChars: [0x0, 0x0, 0x0, 0x40400a, 0x0],
+                        },
+                    ]
+                },
+                2: { token: MetaTokenType.CharacterNameString, /*meta.string.character.$2.renpy*/ },
+                3: {
+                    _patternId: PATTERN_ID_BASE + 135, _patternType: TokenPatternType.RepoPattern,
+                    token: MetaTokenType.Arguments, /*meta.arguments.renpy*/
+                    patterns: [
+                        {
+                            debugName: "sayStatements.patterns![0].beginCaptures![3].patterns![0]",
+                            _patternId: PATTERN_ID_BASE + 136, _patternType: TokenPatternType.MatchPattern,
+
+                            token: KeywordTokenType.At, /*keyword.at.renpy*/
+                            match: /@/g,
+                            firstChars: [0x0, 0x0, 0x1, 0x0, 0x0],
+                        },
+                    ]
+                },
+                4: { token: MetaTokenType.StringBegin, /*string.quoted.renpy punctuation.definition.string.begin.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                strings,
+                placeholderPattern, // Placeholder for source.renpy.python#odd-function-call
+                placeholderPattern, // Placeholder for withStatement
+                fallbackPatterns,
+            ]
+        },
+        {
+            debugName: "sayStatements.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 137, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.SayStatement, /*meta.say.narrator.renpy meta.say.statement.renpy*/
+            begin: /(?<=^[ \t]*)(?=r?(?:"|'|`))/gm,
+            end: /$/gm,
+            patterns: [
+                strings,
+                placeholderPattern, // Placeholder for source.renpy.python#odd-function-call
+                placeholderPattern, // Placeholder for withStatement
+                fallbackPatterns,
+            ]
+        },
+    ]
+};
+
+export const pause: TokenPattern = {
+    debugName: "pause",
+    _patternId: PATTERN_ID_BASE + 139, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.PauseStatement, /*meta.pause.statement.renpy*/
+    contentToken: MetaTokenType.PauseParameters, /*meta.pause.parameters.renpy*/
+    begin: /(?<=^[ \t]*)(pause)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+    requiredLiteral: "pause",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Pause, /*keyword.control.flow.pause.renpy*/ },
+    },
+    end: /(?=#)|$/gm,
+    patterns: [simpleExpression]
+};
+
+export const renpyBlockTester: TokenPattern = {
+    debugName: "renpyBlockTester",
+    _patternId: PATTERN_ID_BASE + 141, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    contentToken: MetaTokenType.RenpyBlock, /*meta.renpy.block.renpy*/
+    begin: /(?<=(^[ \t]*)(?:if|elif|else|for|while|label)\b.*?)(:)/dgm,
+    firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        2: { token: CharacterTokenType.Colon, /*punctuation.section.block.begin.renpy*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for basePatterns
+    ]
+};
+
+export const conditionals: TokenPattern = {
+    debugName: "conditionals",
+    _patternId: PATTERN_ID_BASE + 143, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(?<=^[ \t]*)(?:(if)|(elif)|(else)|(while)|(for))\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x800260, 0x0],
+    beginCaptures: {
+        1: { token: KeywordTokenType.If, /*keyword.control.flow.if.renpy*/ },
+        2: { token: KeywordTokenType.Elif, /*keyword.control.flow.elif.renpy*/ },
+        3: { token: KeywordTokenType.Else, /*keyword.control.flow.else.renpy*/ },
+        4: { token: KeywordTokenType.While, /*keyword.control.flow.while.renpy*/ },
+        5: { token: KeywordTokenType.For, /*keyword.control.flow.for.renpy*/ },
+    },
+    end: /(?=#|:)|$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+        fallbackPatterns,
+    ]
+};
+
+export const atStatement: TokenPattern = {
+    debugName: "atStatement",
+    _patternId: PATTERN_ID_BASE + 145, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.AtStatement, /*meta.at.statement.renpy*/
+    contentToken: MetaTokenType.AtParameters, /*meta.at.parameters.renpy*/
+    begin: /\b(?!\.)(at)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+    requiredLiteral: "at",
+    beginCaptures: {
+        1: { token: KeywordTokenType.At, /*keyword.control.flow.at.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [simpleExpression]
+};
+
+export const asStatement: TokenPattern = {
+    debugName: "asStatement",
+    _patternId: PATTERN_ID_BASE + 147, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.AsStatement, /*meta.as.statement.renpy*/
+    contentToken: MetaTokenType.AsParameters, /*meta.as.parameters.renpy*/
+    begin: /\b(?!\.)(as)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+    requiredLiteral: "as",
+    beginCaptures: {
+        1: { token: KeywordTokenType.As, /*keyword.control.flow.as.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [
+        whitespace,
+        simpleExpression,
+    ]
+};
+
+export const withStatement: TokenPattern = {
+    debugName: "withStatement",
+    _patternId: PATTERN_ID_BASE + 149, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.WithStatement, /*meta.with.statement.renpy*/
+    contentToken: MetaTokenType.WithParameters, /*meta.with.parameters.renpy*/
+    begin: /\b(?!\.)(with)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x800000, 0x0],
+    requiredLiteral: "with",
+    beginCaptures: {
+        1: { token: KeywordTokenType.With, /*keyword.control.flow.with.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [
+        whitespace,
+        simpleExpression,
+    ]
+};
+
+export const behind: TokenPattern = {
+    debugName: "behind",
+    _patternId: PATTERN_ID_BASE + 151, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.BehindStatement, /*meta.behind.statement.renpy*/
+    contentToken: MetaTokenType.BehindParameters, /*meta.behind.parameters.renpy*/
+    begin: /\b(?!\.)(behind)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x4, 0x0],
+    requiredLiteral: "behind",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Behind, /*keyword.control.flow.behind.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [
+        whitespace,
+        simpleExpression,
+    ]
+};
+
+export const onlayer: TokenPattern = {
+    debugName: "onlayer",
+    _patternId: PATTERN_ID_BASE + 153, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.OnlayerStatement, /*meta.onlayer.statement.renpy*/
+    contentToken: MetaTokenType.OnlayerParameters, /*meta.onlayer.parameters.renpy*/
+    begin: /\b(?!\.)(onlayer)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x8000, 0x0],
+    requiredLiteral: "onlayer",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Onlayer, /*keyword.control.flow.onlayer.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [
+        whitespace,
+        simpleExpression,
+    ]
+};
+
+export const zorder: TokenPattern = {
+    debugName: "zorder",
+    _patternId: PATTERN_ID_BASE + 155, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.ZorderStatement, /*meta.zorder.statement.renpy*/
+    contentToken: MetaTokenType.ZorderParameters, /*meta.zorder.parameters.renpy*/
+    begin: /\b(?!\.)(zorder)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x4000000, 0x0],
+    requiredLiteral: "zorder",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Zorder, /*keyword.control.flow.zorder.renpy*/ },
+    },
+    end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|=|:)|$/gm,
+    patterns: [
+        whitespace,
+        simpleExpression,
+    ]
+};
+
+export const image: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 157, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "image.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 158, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.ImageStatement, /*meta.image.statement.renpy*/
+            begin: /(?<=^[ \t]*)(image)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+            requiredLiteral: "image",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Image, /*keyword.image.renpy*/ },
+            },
+            end: /(?=:)|$/gm,
+            patterns: [
+                strings,
+                {
+                    debugName: "image.patterns![0].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 160, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.ImageName, /*entity.name.type.image.renpy*/
+                    match: /\b(?:[a-zA-Z_0-9]+)\b/g,
+                    firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                atStatement,
+                withStatement,
+                {
+                    debugName: "image.patterns![0].patterns![4]",
+                    _patternId: PATTERN_ID_BASE + 161, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+                    contentToken: MetaTokenType.PythonExpression, /*meta.python.expression.renpy*/
+                    begin: /=/g,
+                    firstChars: [0x0, 0x20000000, 0x0, 0x0, 0x0],
+                    beginCaptures: {
+                        0: { token: OperatorTokenType.Assignment, /*keyword.operator.assignment.renpy*/ },
+                    },
+                    end: /$/gm,
+                    patterns: [
+                        placeholderPattern, // Placeholder for source.renpy.python#expression
+                        whitespace,
+                    ]
+                },
+                fallbackPatterns,
+            ]
+        },
+    ]
+};
+
+export const layeredimageBlockTester: TokenPattern = {
+    debugName: "layeredimageBlockTester",
+    _patternId: PATTERN_ID_BASE + 163, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    contentToken: MetaTokenType.LayeredimageBlock, /*meta.layeredimage.block.renpy*/
+    begin: /(?<=(^[ \t]*)(?:layeredimage|group|always|attribute)\b.*?)(:)/dgm,
+    firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        2: { token: CharacterTokenType.Colon, /*punctuation.section.block.begin.renpy*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+    patterns: [
+        {
+            debugName: "layeredimageBlockTester.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 165, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Always, /*keyword.always.renpy*/
+            match: /\b(?:always)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+            requiredLiteral: "always",
+        },
+        {
+            debugName: "layeredimageBlockTester.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 166, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Always, /*keyword.always.renpy*/
+            match: /\b(?:pos)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+            requiredLiteral: "pos",
+        },
+        placeholderPattern, // Placeholder for layeredimageGroup
+        placeholderPattern, // Placeholder for layeredimageAttribute
+        placeholderPattern, // Placeholder for basePatterns
+    ]
+};
+
+export const layeredimageGroup: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 167, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "layeredimageGroup.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 168, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.LayeredimageGroupStatement, /*meta.layeredimage.group.statement.renpy*/
+            contentToken: MetaTokenType.LayeredimageGroupParameters, /*meta.layeredimage.group.parameters.renpy*/
+            begin: /(?<=^[ \t]*)(group)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80, 0x0],
+            requiredLiteral: "group",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Group, /*keyword.group.renpy*/ },
+            },
+            end: /(?=#|:)|$/gm,
+            patterns: [
+                {
+                    debugName: "layeredimageGroup.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 170, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.LayeredimageName, /*entity.name.type.layeredimage..renpy*/
+                    match: /\b([a-zA-Z_]\w*)\b/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                fallbackPatterns,
+            ]
+        },
+        layeredimageBlockTester,
+    ]
+};
+
+export const layeredimageAttribute: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 171, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "layeredimageAttribute.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 172, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.LayeredimageAttributeStatement, /*meta.layeredimage.attribute.statement.renpy*/
+            contentToken: MetaTokenType.LayeredimageAttributeParameters, /*meta.layeredimage.attribute.parameters.renpy*/
+            begin: /(?<=^[ \t]*)(attribute)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+            requiredLiteral: "attribute",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Attribute, /*keyword.attribute.renpy*/ },
+            },
+            end: /(?=#|:)|$/gm,
+            patterns: [
+                {
+                    debugName: "layeredimageAttribute.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 174, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Default, /*keyword.default.renpy*/
+                    match: /\b(default)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x10, 0x0],
+                    requiredLiteral: "default",
+                },
+                {
+                    debugName: "layeredimageAttribute.patterns![0].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 175, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.LayeredimageName, /*entity.name.type.layeredimage.attribute.renpy*/
+                    match: /\b([a-zA-Z_]\w*)\b/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                fallbackPatterns,
+            ]
+        },
+        layeredimageBlockTester,
+    ]
+};
+
+export const layeredimage: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 176, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "layeredimage.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 177, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.LayeredimageStatement, /*meta.layeredimage.statement.renpy*/
+            contentToken: MetaTokenType.LayeredimageParameters, /*meta.layeredimage.parameters.renpy*/
+            begin: /(?<=^[ \t]*)(layeredimage)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+            requiredLiteral: "layeredimage",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Layeredimage, /*keyword.layeredimage.renpy*/ },
+            },
+            end: /(?=#|:)|$/gm,
+            patterns: [
+                {
+                    debugName: "layeredimage.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 179, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.LayeredimageName, /*entity.name.type.layeredimage.renpy*/
+                    match: /\b([a-zA-Z_]\w*)\b/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                fallbackPatterns,
+            ]
+        },
+        layeredimageBlockTester,
+    ]
+};
+
+export const translateBlockTester: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 180, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "translateBlockTester.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 181, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            contentToken: MetaTokenType.TranslateBlock, /*meta.translate.block.renpy*/
+            begin: /(?<=(^[ \t]*)(?:translate)\b.*?)(:)/dgm,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: CharacterTokenType.Colon, /*punctuation.section.block.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for basePatterns
+            ]
+        },
+    ]
+};
+
+export const translate: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 183, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "translate.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 184, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.TranslateStatement, /*meta.translate.statement.renpy*/
+            contentToken: MetaTokenType.TranslateParameters, /*meta.translate.parameters.renpy*/
+            begin: /(?<=^[ \t]*)(translate)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x100000, 0x0],
+            requiredLiteral: "translate",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Translate, /*keyword.translate.renpy*/ },
+            },
+            end: /(?=#|:)|$/gm,
+            patterns: [
+                {
+                    debugName: "translate.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 186, _patternType: TokenPatternType.MatchPattern,
+
+                    token: MetaTokenType.ConstantLiteral, /*constant.language.renpy*/
+                    match: /\b(?<!\.)(None)\b/g,
+                    firstChars: [0x0, 0x0, 0x4000, 0x0, 0x0],
+                    requiredLiteral: "None",
+                },
+                {
+                    debugName: "translate.patterns![0].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 187, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Other, /*keyword.other.renpy*/
+                    match: /\b(?<!\.)(strings|style|default|python)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x90010, 0x0],
+                },
+                {
+                    debugName: "translate.patterns![0].patterns![2]",
+                    _patternId: PATTERN_ID_BASE + 188, _patternType: TokenPatternType.MatchPattern,
+
+                    // Only the first word is the language name
+                    token: EntityTokenType.LanguageName, /*entity.name.type.language.translate.renpy*/
+                    match: /(?<=translate[ \t]+)\b([a-zA-Z_]\w*)\b/g,
+                    firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                placeholderPattern, // Placeholder for labelAccess
+                placeholderPattern, // Placeholder for labelName
+                fallbackPatterns,
+            ]
+        },
+        pythonBlockTester,
+        translateBlockTester,
+    ]
+};
+
+export const show: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 189, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "show.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 190, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.ShowStatement, /*meta.show.statement.renpy*/
+            begin: /(?<=^[ \t]*)(show)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+            requiredLiteral: "show",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Show, /*keyword.control.flow.show.renpy*/ },
+            },
+            end: /(?=#|:)|$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for screenCall
+                strings,
+                {
+                    debugName: "show.patterns![0].patterns![2]",
+                    _patternId: PATTERN_ID_BASE + 192, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Layer, /*keyword.layer.renpy*/
+                    match: /\b(layer)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+                    requiredLiteral: "layer",
+                },
+                {
+                    debugName: "show.patterns![0].patterns![3]",
+                    _patternId: PATTERN_ID_BASE + 193, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Nopredict, /*keyword.nopredict.renpy*/
+                    match: /\b(nopredict)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x4000, 0x0],
+                    requiredLiteral: "nopredict",
+                },
+                atStatement,
+                asStatement,
+                withStatement,
+                behind,
+                onlayer,
+                zorder,
+                {
+                    debugName: "show.patterns![0].patterns![10]",
+                    _patternId: PATTERN_ID_BASE + 194, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.ImageName, /*entity.name.type.image.renpy*/
+                    match: /\b(?:[a-zA-Z_0-9]+)\b/g,
+                    firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                fallbackPatterns,
+            ]
+        },
+    ]
+};
+
+export const window: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 195, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "window.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 196, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.WindowStatement, /*meta.window.statement.renpy*/
+            begin: /(?<=^[ \t]*)(window)/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x800000, 0x0],
+            requiredLiteral: "window",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Window, /*keyword.window.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                {
+                    debugName: "window.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 198, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Auto, /*keyword.auto.renpy*/
+                    match: /(?<=window[ \t]+)\b(auto)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x2, 0x0],
+                    requiredLiteral: "auto",
+                },
+                {
+                    debugName: "window.patterns![0].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 199, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Show, /*keyword.control.flow.show.renpy*/
+                    match: /(?<=(?:window|auto)[ \t]+)\b(show)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+                    requiredLiteral: "show",
+                },
+                {
+                    debugName: "window.patterns![0].patterns![2]",
+                    _patternId: PATTERN_ID_BASE + 200, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Hide, /*keyword.control.flow.hide.renpy*/
+                    match: /(?<=window[ \t]+)\b(hide)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x100, 0x0],
+                    requiredLiteral: "hide",
+                },
+                whitespace,
+                simpleExpression,
+            ]
+        },
+    ]
+};
+
+export const hide: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 201, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "hide.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 202, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.HideStatement, /*meta.hide.statement.renpy*/
+            begin: /(?<=^[ \t]*)(hide)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x100, 0x0],
+            requiredLiteral: "hide",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Hide, /*keyword.control.flow.hide.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for screenCall
+                strings,
+                withStatement,
+                behind,
+                zorder,
+                {
+                    debugName: "hide.patterns![0].patterns![5]",
+                    _patternId: PATTERN_ID_BASE + 204, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.ImageName, /*entity.name.type.image.renpy*/
+                    match: /\b(?:[a-zA-Z_0-9]+)\b[ \t]*/g,
+                    firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                fallbackPatterns,
+            ]
+        },
+    ]
+};
+
+export const scene: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 205, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "scene.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 206, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.SceneStatement, /*meta.scene.statement.renpy*/
+            begin: /(?<=^[ \t]*)(scene)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+            requiredLiteral: "scene",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Scene, /*keyword.scene.renpy*/ },
+            },
+            end: /(?=\b(at|as|behind|onlayer|expression|with|zorder)\b|#|:)|$/gm,
+            patterns: [
+                strings,
+                {
+                    debugName: "scene.patterns![0].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 208, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.ImageName, /*entity.name.type.image.renpy*/
+                    match: /\b(?:[a-zA-Z_0-9]+)\b[ \t]*/g,
+                    firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+            ]
+        },
+        withStatement,
+        behind,
+        onlayer,
+        zorder,
+    ]
+};
+
+export const camera: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 209, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "camera.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 210, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.CameraStatement, /*meta.camera.statement.renpy*/
+            begin: /(?<=^[ \t]*)(camera)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+            requiredLiteral: "camera",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Camera, /*keyword.camera.renpy*/ },
+            },
+            end: /(?=\b(at|with)\b|#|:)|$/gm,
+            patterns: [
+                {
+                    debugName: "camera.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 212, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.ImageName, /*entity.name.type.image.renpy*/
+                    match: /\b(?:[a-zA-Z_0-9]+)\b[ \t]*/g,
+                    firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+            ]
+        },
+        atStatement,
+        withStatement,
+    ]
+};
+
+export const screenCall: TokenPattern = {
+    debugName: "screenCall",
+    _patternId: PATTERN_ID_BASE + 213, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+    token: MetaTokenType.ScreenCall, /*meta.screen.call.renpy*/
+    begin: /(?<=(?:call|show|hide)[ \t]+)(screen)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+    requiredLiteral: "screen",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Screen, /*keyword.screen.renpy*/ },
+    },
+    end: /(?!\G)(?<=[^ \t])/g,
+    patterns: [
+        {
+            debugName: "screenCall.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 215, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // Label expression
+            begin: /(?<=screen[ \t]+)(?=[a-zA-Z_.])/g,
+            end: /(?![a-zA-Z_.])(?![ \t]*\.[ \t]*)/g,
+            patterns: [
+                placeholderPattern, // Placeholder for labelCall
+                placeholderPattern, // Placeholder for labelAccess
+                placeholderPattern, // Placeholder for labelName
+            ]
+        },
+        withStatement,
+        whitespace,
+    ]
+};
+
+export const builtinLabels: TokenPattern = {
+    debugName: "builtinLabels",
+    _patternId: PATTERN_ID_BASE + 217, _patternType: TokenPatternType.MatchPattern,
+
+    token: EntityTokenType.FunctionName, /*support.function.builtin.renpy*/
+    match: /(?<!\.)\b(?:start|quit|after_load|splashscreen|before_main_menu|main_menu|after_warp|hide_windows)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0xa2106, 0x0],
+};
+
+export const labelName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 218, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        builtinLabels,
+        {
+            debugName: "labelName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 219, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.FunctionName, /*entity.name.function.label.renpy*/
+            match: /\b(?:[a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+    ]
+};
+
+export const labelCall: TokenPattern = {
+    debugName: "labelCall",
+    _patternId: PATTERN_ID_BASE + 220, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // Note: label params are only allowed at the end of the access expression
+    token: MetaTokenType.LabelCall, /*meta.function-call.label.renpy*/
+    begin: /\b(?=([a-zA-Z_]\w*)\s*(\())/g,
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.renpy*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#special-variables
+        labelName,
+        placeholderPattern, // Placeholder for source.renpy.python#function-arguments
+    ]
+};
+
+export const labelAccess: TokenPattern = {
+    debugName: "labelAccess",
+    _patternId: PATTERN_ID_BASE + 222, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // Note: Labels can't be nested twice in a row!
+    token: MetaTokenType.LabelAccess, /*meta.member.access.label.renpy*/
+    begin: /(\.)\s*(?!\.)/dg,
+    firstChars: [0x0, 0x4000, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        1: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.renpy*/ },
+    },
+    end: /(?<=\S)(?=\W)|(^|(?<=\s))(?=[^\\\w\s])|$/gm,
+    patterns: [
+        labelCall,
+        labelName,
+    ]
+};
+
+export const labelDefName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 224, _patternType: TokenPatternType.RepoPattern,
+    // Note: Labels can't be nested twice in a row!
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        builtinLabels,
+        {
+            debugName: "labelDefName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 225, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(?<=^|[ \t])(\b(?:[a-zA-Z_]\w*)\b)?(\.)?(\b(?:[a-zA-Z_]\w*)\b)/dgm,
+            firstChars: [0x0, 0x4000, 0x87fffffe, 0x7fffffe, 0x0],
+            captures: {
+                1: { token: EntityTokenType.FunctionName, /*entity.name.function.label.renpy*/ },
+                2: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.renpy*/ },
+                3: { token: EntityTokenType.FunctionName, /*entity.name.function.label.renpy*/ },
+            },
+        },
+    ]
+};
+
+export const label: TokenPattern = {
+    debugName: "label",
+    _patternId: PATTERN_ID_BASE + 226, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.LabelStatement, /*meta.label.statement.renpy*/
+    begin: /(?<=^[ \t]*)(label)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x1000, 0x0],
+    requiredLiteral: "label",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Label, /*storage.type.function.label.renpy*/ },
+    },
+    end: /(?=:)|$/gm,
+    patterns: [
+        {
+            debugName: "label.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 228, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Hide, /*keyword.control.flow.hide.renpy*/
+            match: /\b(?<!\.)(hide)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x100, 0x0],
+            requiredLiteral: "hide",
+        },
+        labelDefName,
+        placeholderPattern, // Placeholder for source.renpy.python#parameters
+        fallbackPatterns,
+    ]
+};
+
+export const returnStatements: TokenPattern = {
+    debugName: "returnStatements",
+    _patternId: PATTERN_ID_BASE + 229, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /(?<=^[ \t]*)(return)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x40000, 0x0],
+    requiredLiteral: "return",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Return, /*keyword.control.flow.return.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [
+        renpyOnlyExpressions,
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+    ]
+};
+
+export const callJumpExpression: TokenPattern = {
+    debugName: "callJumpExpression",
+    _patternId: PATTERN_ID_BASE + 231, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\b(?<!\.)(expression)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x20, 0x0],
+    requiredLiteral: "expression",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Expression, /*keyword.expression.renpy*/ },
+    },
+    end: /(?=\b(?<!\.)(?:pass|from)\b)|$/gm,
+    patterns: [
+        renpyOnlyExpressions,
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+    ]
+};
+
+export const jump: TokenPattern = {
+    debugName: "jump",
+    _patternId: PATTERN_ID_BASE + 233, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.JumpStatement, /*meta.jump.statement.renpy*/
+    begin: /(?<=^[ \t]*)(jump)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x400, 0x0],
+    requiredLiteral: "jump",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Jump, /*keyword.control.flow.jump.renpy*/ },
+    },
+    end: /(?=#)|$/gm,
+    endCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.renpy*/ },
+    },
+    patterns: [
+        callJumpExpression,
+        placeholderPattern, // Placeholder for callJumpPass
+        {
+            debugName: "jump.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 235, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // Label expression
+            begin: /(?=[a-zA-Z_.])/g,
+            end: /(?![a-zA-Z_.])(?![ \t]*\.[ \t]*)/g,
+            patterns: [
+                labelAccess,
+                labelName,
+            ]
+        },
+        whitespace,
+    ]
+};
+
+export const callJumpPass: TokenPattern = {
+    debugName: "callJumpPass",
+    _patternId: PATTERN_ID_BASE + 237, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    begin: /\b(?<!\.)(pass)\b(?=[ \t]*\()/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+    requiredLiteral: "pass",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Pass, /*keyword.control.flow.pass.renpy*/ },
+    },
+    end: /(\))/dg,
+    endCaptures: {
+        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.renpy*/ },
+    },
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#function-arguments
+        whitespace,
+    ]
+};
+
+export const callFrom: TokenPattern = {
+    debugName: "callFrom",
+    _patternId: PATTERN_ID_BASE + 239, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+    token: MetaTokenType.FromClause, /*meta.from.clause.renpy*/
+    contentToken: MetaTokenType.Arguments, /*meta.from.arguments.renpy*/
+    begin: /\b(?<!\.)(from)\b/dg,
+    firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+    requiredLiteral: "from",
+    beginCaptures: {
+        1: { token: KeywordTokenType.From, /*keyword.control.flow.from.renpy*/ },
+    },
+    end: /(?!\G)(?<=[^ \t])|$/gm,
+    patterns: [
+        labelName,
+        fallbackPatterns,
+    ]
+};
+
+export const call: TokenPattern = {
+    debugName: "call",
+    _patternId: PATTERN_ID_BASE + 241, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.CallStatement, /*meta.call.statement.renpy*/
+    contentToken: MetaTokenType.Arguments, /*meta.call.arguments.renpy*/
+    begin: /(?<=^[ \t]*)(call)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+    requiredLiteral: "call",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Call, /*keyword.control.flow.call.renpy*/ },
+    },
+    end: /$/gm,
+    endCaptures: {
+        1: { token: MetaTokenType.Invalid, /*invalid.illegal.renpy*/ },
+    },
+    patterns: [
+        callJumpExpression,
+        callJumpPass,
+        callFrom,
+        screenCall,
+        {
+            debugName: "call.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 243, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Nopredict, /*keyword.nopredict.renpy*/
+            match: /\b(nopredict)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x4000, 0x0],
+            requiredLiteral: "nopredict",
+        },
+        withStatement,
+        {
+            debugName: "call.patterns![6]",
+            _patternId: PATTERN_ID_BASE + 244, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // Label expression
+            begin: /(?<=call[ \t]+)(?=[a-zA-Z_.])/g,
+            end: /(?![a-zA-Z_.])(?![ \t]*\.[ \t]*)/g,
+            patterns: [
+                labelCall,
+                labelAccess,
+                labelName,
+            ]
+        },
+        whitespace,
+        comments,
+        {
+            debugName: "call.patterns![9]",
+            _patternId: PATTERN_ID_BASE + 246, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.Invalid, /*invalid.illegal.unexpected-characters-call-arguments.renpy*/
+            match: /[^ \t]+/g,
+            firstChars: [0xfffffdff, 0xfffffffe, 0xffffffff, 0xffffffff, 0x1],
+        },
+    ]
+};
+
+export const menuOption: TokenPattern = {
+    debugName: "menuOption",
+    _patternId: PATTERN_ID_BASE + 247, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    contentToken: MetaTokenType.MenuOptionBlock, /*meta.menu-option.block.renpy*/
+    begin: /(?<=(^[ \t]*))((?:".*")|(?:'.*')|(?:""".*"""))(.+)?(:)/dgm,
+    firstChars: [0x0, 0x84, 0x0, 0x0, 0x0],
+    beginCaptures: {
+        2: {
+            _patternId: PATTERN_ID_BASE + 249, _patternType: TokenPatternType.RepoPattern,
+            token: MetaTokenType.MenuOption, /*meta.menu-option.renpy*/
+            patterns: [strings]
+        },
+        3: {
+            _patternId: PATTERN_ID_BASE + 250, _patternType: TokenPatternType.RepoPattern,
+            token: MetaTokenType.PythonLine, /*meta.embedded.line.python*/
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy.python#odd-function-call
+                {
+                    debugName: "menuOption.beginCaptures![3].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 251, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+                    // if condition
+                    begin: /\b(if)\b/dg,
+                    firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+                    requiredLiteral: "if",
+                    beginCaptures: {
+                        1: { token: KeywordTokenType.If, /*keyword.control.conditional.renpy*/ },
+                    },
+                    end: /(?=#|:)|$/gm,
+                    patterns: [
+                        placeholderPattern, // Placeholder for source.renpy.python#expression
+                    ]
+                },
+            ]
+        },
+        4: { token: CharacterTokenType.Colon, /*punctuation.section.menu-option.begin.renpy*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for basePatterns
+    ]
+};
+
+export const menuSet: TokenPattern = {
+    debugName: "menuSet",
+    _patternId: PATTERN_ID_BASE + 253, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    contentToken: MetaTokenType.PythonLine, /*meta.embedded.line.python*/
+    begin: /(?<=^[ \t]*)(set)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+    requiredLiteral: "set",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Set, /*keyword.set.renpy*/ },
+    },
+    end: /$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#expression
+    ]
+};
+
+export const menu: TokenPattern = {
+    debugName: "menu",
+    _patternId: PATTERN_ID_BASE + 255, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+    token: MetaTokenType.MenuStatement, /*meta.menu.statement.renpy*/
+    contentToken: MetaTokenType.MenuBlock, /*meta.menu.block.renpy*/
+    begin: /(?<=(^[ \t]*))(menu)[ \t]*(.+)?(:)/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x2000, 0x0],
+    requiredLiteral: "menu",
+    beginCaptures: {
+        2: { token: KeywordTokenType.Def, /*storage.type.function.renpy*/ },
+        3: {
+            _patternId: PATTERN_ID_BASE + 257, _patternType: TokenPatternType.RepoPattern,
+            patterns: [
+                {
+                    debugName: "menu.beginCaptures![3].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 258, _patternType: TokenPatternType.MatchPattern,
+
+                    // Menu name
+                    token: EntityTokenType.FunctionName, /*entity.name.function.menu.renpy*/
+                    match: /[a-zA-Z_.]\w*/g,
+                    firstChars: [0x0, 0x4000, 0x87fffffe, 0x7fffffe, 0x0],
+                },
+                {
+                    debugName: "menu.beginCaptures![3].patterns![1]",
+                    _patternId: PATTERN_ID_BASE + 259, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+                    token: MetaTokenType.FunctionCall, /*meta.function-call.python*/
+                    begin: /(?<=\bmenu\s*)(?=\()/g,
+                    end: /(\))/dg,
+                    endCaptures: {
+                        1: { token: CharacterTokenType.CloseParentheses, /*punctuation.definition.arguments.end.python*/ },
+                    },
+                    patterns: [
+                        placeholderPattern, // Placeholder for source.renpy.python#function-arguments
+                    ]
+                },
+            ]
+        },
+        4: { token: CharacterTokenType.Colon, /*punctuation.section.menu.begin.renpy*/ },
+    },
+    // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+    end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+    patterns: [
+        comments,
+        menuOption,
+        sayStatements,
+        menuSet,
+        fallbackPatterns,
+    ]
+};
+
+export const builtinAudioChannels: TokenPattern = {
+    debugName: "builtinAudioChannels",
+    _patternId: PATTERN_ID_BASE + 261, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.BuiltinType, /*support.type.audio.channel.renpy*/
+    match: /(?<!\.)\b(?:music|sound|voice|audio)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0x482002, 0x0],
+};
+
+export const audioChannel: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 262, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        builtinAudioChannels,
+        {
+            debugName: "audioChannel.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 263, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.AudioName, /*entity.name.type.audio.channel.renpy*/
+            match: /.+/g,
+            firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+        },
+    ]
+};
+
+export const audioParams: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 264, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "audioParams.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 265, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.OtherAudio, /*keyword.other.audio.renpy*/
+            match: /\b(?<!\.)(?:fadeout|fadein|volume|loop|noloop)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x405040, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy.python#number
+    ]
+};
+
+export const play: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 266, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "play.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 267, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.PlayAudioStatement, /*meta.play.audio.statement.renpy*/
+            begin: /(?<=^[ \t]*)(play)\b[ \t]+\b([a-zA-Z_0-9]*)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+            requiredLiteral: "play",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Play, /*keyword.play.renpy*/ },
+                2: {
+                    _patternId: PATTERN_ID_BASE + 269, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [audioChannel]
+                },
+            },
+            end: /(?=#)|$/gm,
+            patterns: [
+                strings,
+                audioParams,
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+                whitespace,
+            ]
+        },
+    ]
+};
+
+export const queue: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 270, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "queue.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 271, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.QueueAudioStatement, /*meta.queue.audio.statement.renpy*/
+            begin: /(?<=^[ \t]*)(queue)\b[ \t]+\b([a-zA-Z_0-9]*)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x20000, 0x0],
+            requiredLiteral: "queue",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Queue, /*keyword.queue.renpy*/ },
+                2: {
+                    _patternId: PATTERN_ID_BASE + 273, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [audioChannel]
+                },
+            },
+            end: /(?=#)|$/gm,
+            patterns: [
+                strings,
+                audioParams,
+                placeholderPattern, // Placeholder for source.renpy.python#expression
+                whitespace,
+            ]
+        },
+    ]
+};
+
+export const stop: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 274, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "stop.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 275, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            token: MetaTokenType.StopAudioStatement, /*meta.stop.audio.statement.renpy*/
+            begin: /(?<=^[ \t]*)(stop)\b[ \t]+\b([a-zA-Z_0-9]*)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+            requiredLiteral: "stop",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Stop, /*keyword.stop.renpy*/ },
+                2: {
+                    _patternId: PATTERN_ID_BASE + 277, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [audioChannel]
+                },
+            },
+            end: /(?=#)|$/gm,
+            patterns: [
+                {
+                    debugName: "stop.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 278, _patternType: TokenPatternType.MatchPattern,
+
+                    token: KeywordTokenType.Fadeout, /*keyword.fadeout.renpy*/
+                    match: /\b(?<!\.)(?:fadeout)\b/g,
+                    firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+                    requiredLiteral: "fadeout",
+                },
+                placeholderPattern, // Placeholder for source.renpy.python#number
+                whitespace,
+            ]
+        },
+    ]
+};
+
+export const audio: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 279, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        play,
+        queue,
+        stop,
+    ]
+};
+
+export const renpyStatements: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 280, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        label,
+        menu,
+        image,
+        layeredimage,
+        translate,
+        audio,
+        pause,
+        renpyBlockTester,
+        placeholderPattern, // Placeholder for source.renpy.atl#transform
+        placeholderPattern, // Placeholder for source.renpy.atl#atl-block-tester
+        scene,
+        camera,
+        window,
+        show,
+        hide,
+        withStatement,
+        placeholderPattern, // Placeholder for source.renpy.screen#screen
+        placeholderPattern, // Placeholder for source.renpy.style#style
+        placeholderPattern, // Placeholder for source.renpy.test#testcase
+        placeholderPattern, // Placeholder for source.renpy.test#testsuite
+        placeholderPattern, // Placeholder for source.renpy.test#test-block-tester
+        placeholderPattern, // Placeholder for source.renpy.python#python-block-tester
+        returnStatements,
+        jump,
+        call,
+    ]
+};
+
+export const basePatterns: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 281, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        statements,
+        expressions,
+    ]
+};
+
+// Push pattern references that were not defined on include
+statements.patterns!.splice(0, 1, renpyStatements);
+statements.patterns!.splice(1, 1, pythonStatements);
+statements.patterns!.splice(2, 1, conditionals);
+statements.patterns!.splice(3, 1, keywords);
+statements.patterns!.splice(4, 1, sayStatements);
+expressions.patterns!.splice(0, 1, renpyPythonExpressions);
+expressions.patterns!.splice(1, 1, fallbackPatterns);
+renpyOnlyExpressions.patterns!.splice(0, 1, comments);
+renpyOnlyExpressions.patterns!.splice(1, 1, strings);
+renpyOnlyExpressions.patterns!.splice(2, 1, literal);
+fallbackPatterns.patterns!.splice(0, 1, comments);
+fallbackPatternsWithError.patterns!.splice(0, 1, comments);
+simpleExpression.patterns!.splice(7, 1, comments);
+stringsInterior.patterns!.splice(2, 1, stringTags);
+stringTags.patterns![10].captures![4].patterns![0].captures![3].patterns!.splice(0, 1, labelName);
+pythonStatements.patterns!.splice(2, 1, define);
+pythonStatements.patterns!.splice(3, 1, defaultStatement);
+pythonStatements.patterns!.splice(4, 1, oneLinePython);
+pythonStatements.patterns!.splice(5, 1, pythonBlockTester);
+sayStatements.patterns![0].patterns!.splice(2, 1, withStatement);
+sayStatements.patterns![1].patterns!.splice(2, 1, withStatement);
+renpyBlockTester.patterns!.splice(0, 1, basePatterns);
+layeredimageBlockTester.patterns!.splice(2, 1, layeredimageGroup);
+layeredimageBlockTester.patterns!.splice(3, 1, layeredimageAttribute);
+layeredimageBlockTester.patterns!.splice(4, 1, basePatterns);
+translateBlockTester.patterns![0].patterns!.splice(0, 1, basePatterns);
+translate.patterns![0].patterns!.splice(3, 1, labelAccess);
+translate.patterns![0].patterns!.splice(4, 1, labelName);
+show.patterns![0].patterns!.splice(0, 1, screenCall);
+hide.patterns![0].patterns!.splice(0, 1, screenCall);
+screenCall.patterns![0].patterns!.splice(0, 1, labelCall);
+screenCall.patterns![0].patterns!.splice(1, 1, labelAccess);
+screenCall.patterns![0].patterns!.splice(2, 1, labelName);
+jump.patterns!.splice(1, 1, callJumpPass);
+menuOption.patterns!.splice(0, 1, basePatterns);
\ No newline at end of file
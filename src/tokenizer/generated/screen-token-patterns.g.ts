@@ -0,0 +1,385 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import { EntityTokenType, CharacterTokenType, KeywordTokenType, MetaTokenType } from "src/tokenizer/renpy-tokens";
+import { placeholderPattern, TokenPattern, TokenPatternType } from "src/tokenizer/token-pattern-types";
+import { SCREEN_PATTERN_ID_BASE as PATTERN_ID_BASE } from "./pattern-ids.g";
+
+export const builtinScreens: TokenPattern = {
+    debugName: "builtinScreens",
+    _patternId: PATTERN_ID_BASE + 0, _patternType: TokenPatternType.MatchPattern,
+
+    token: EntityTokenType.FunctionName, /*support.function.builtin.screen.renpy*/
+    match: /(?<!\.)\b(?:start|quit|after_load|splashscreen|before_main_menu|main_menu|after_warp|hide_windows)\b/g,
+    firstChars: [0x0, 0x0, 0x0, 0xa2106, 0x0],
+};
+
+export const screenDefName: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 1, _patternType: TokenPatternType.RepoPattern,
+    // TODO: Should combine this with label-def-name
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-possible-callables
+        builtinScreens,
+        {
+            debugName: "screenDefName.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 2, _patternType: TokenPatternType.MatchPattern,
+
+            match: /(?<=^|[ \t])(\b(?:[a-zA-Z_]\w*)\b)?(\.)?(\b(?:[a-zA-Z_]\w*)\b)/dgm,
+            firstChars: [0x0, 0x4000, 0x87fffffe, 0x7fffffe, 0x0],
+            captures: {
+                1: { token: EntityTokenType.FunctionName, /*entity.name.function.renpy*/ },
+                2: { token: CharacterTokenType.Dot, /*punctuation.separator.dot.renpy*/ },
+                3: { token: EntityTokenType.FunctionName, /*entity.name.function.renpy*/ },
+            },
+        },
+    ]
+};
+
+export const screenBuildInProperties: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 3, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "screenBuildInProperties.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 4, _patternType: TokenPatternType.MatchPattern,
+
+            // Special ATL keywords.
+            match: /\b(?<!\.)(?:(warp)|(circles)|(clockwise)|(counterclockwise)|(knot))\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x800808, 0x0],
+            captures: {
+                1: { token: KeywordTokenType.Warp, /*keyword.warp.renpy*/ },
+                2: { token: KeywordTokenType.Circles, /*keyword.circles.renpy*/ },
+                3: { token: KeywordTokenType.Clockwise, /*keyword.clockwise.renpy*/ },
+                4: { token: KeywordTokenType.Counterclockwise, /*keyword.counterclockwise.renpy*/ },
+                5: { token: KeywordTokenType.Knot, /*keyword.knot.renpy*/ },
+            },
+        },
+        {
+            debugName: "screenBuildInProperties.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 5, _patternType: TokenPatternType.MatchPattern,
+
+            // Special manipulation keywords
+            token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.renpy*/
+            match: /\b(?<!\.)(?:action|at|(?:un)?hovered|alt|value|dragged|released)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x640112, 0x0],
+        },
+        {
+            debugName: "screenBuildInProperties.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 6, _patternType: TokenPatternType.MatchPattern,
+
+            // Special manipulation keywords
+            match: /\b(?<!\.)(key|default|input|(?:text|image)?button|grid|auto|mousearea|side|timer|[vh]?bar|action|viewport|(?:vp)?grid|imagemap|hotspot|hotbar|transclude)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x582b96, 0x0],
+            captures: {
+                1: { token: KeywordTokenType.Other, /*keyword.other.renpy*/ },
+            },
+        },
+        placeholderPattern, // Placeholder for screenProperties
+        {
+            debugName: "screenBuildInProperties.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 7, _patternType: TokenPatternType.MatchPattern,
+
+            // Transform properties.
+            token: EntityTokenType.PropertyName, /*entity.other.attribute-name.transform.renpy support.type.property-name.transform.renpy*/
+            match: /\b(?<!\.)(?:_reset|a(?:dditive|l(?:ign(?:around)?|pha)|n(?:chor(?:a(?:ngle|round)|radius)?|gle)|round)|bl(?:end|ur)|c(?:orner[12]|rop(?:_relative)?)|de(?:bug|lay)|events|f(?:it|ps)|gl_(?:anisotropic|blend_func|c(?:olor_mask|ull_face)|d(?:epth|rawable_resolution)|mipmap|pixel_perfect|texture_(?:scaling|wrap(?:_tex[0123])?))|m(?:a(?:trix(?:anchor|color|transform)|xsize)|esh(?:_pad)?)|nearest|o(?:ffset|rientation)|p(?:erspective|o(?:int_to|s))|r(?:adius|otate(?:_pad)?)|s(?:h(?:ader|ow_cancels_hide)|ize|ubpixel)|transform_anchor|u_(?:lod_bias|renpy_(?:alpha|blur_log2|dissolve(?:_(?:multiplier|offset))?|ma(?:sk_(?:multiplier|offset)|trixcolor)|over|solid_color))|x(?:a(?:lign|nchor(?:around)?|round)|center|offset|p(?:an|os)|rotate|size|tile|y(?:center|size)|zoom)|y(?:a(?:lign|nchor(?:around)?|round)|center|offset|p(?:an|os)|rotate|size|tile|zoom)|z(?:oom|pos|rotate|zoom))\b/g,
+            firstChars: [0x0, 0x0, 0x80000000, 0x73de0fe, 0x0],
+        },
+    ]
+};
+
+export const screenProperties: TokenPattern = {
+    debugName: "screenProperties",
+    _patternId: PATTERN_ID_BASE + 8, _patternType: TokenPatternType.MatchPattern,
+
+    // Every screen property in keywords.py, factored by property_factoring.py.
+    token: EntityTokenType.TagName, /*support.constant.property-key.renpy entity.name.tag.css.style.renpy*/
+    match: /\b(?<!\.)(?:(?:activate_|hover_|i(?:dle_|nsensitive_)|s(?:crollbar_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?|elected_(?:activate_|hover_|i(?:dle_|nsensitive_))?|ide_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?)|text_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?|v(?:iewport_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?|scrollbar_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?))?(?:a(?:l(?:ign|t)|nchor|rea)|clipping|debug|m(?:aximum|inimum)|offset|pos|x(?:a(?:lign|nchor)|center|fill|m(?:aximum|inimum)|offset|pos|size|y(?:center|size))|y(?:a(?:lign|nchor)|center|fill|m(?:aximum|inimum)|offset|pos|size))|(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?(?:_reset|a(?:dditive|l(?:ignaround|pha)|n(?:chor(?:a(?:ngle|round)|radius)|gle)|round)|b(?:ackground|l(?:end|ur)|o(?:ttom_(?:margin|padding)|x_(?:align|justify|layout|reverse|wrap(?:_spacing)?)))|c(?:aret|hild|orner[12]|rop(?:_relative)?)|delay|events|f(?:i(?:rst_spacing|t(?:_first)?)|o(?:cus_mask|reground)|ps)|gl_(?:anisotropic|blend_func|c(?:olor_mask|ull_face)|d(?:epth|rawable_resolution)|mipmap|pixel_perfect|texture_(?:scaling|wrap(?:_tex[0123])?))|key(?:_events|board_focus_insets)|left_(?:margin|padding)|m(?:a(?:rgin|trix(?:anchor|color|transform)|xsize)|esh(?:_pad)?|odal)|nearest|or(?:der_reverse|ientation)|p(?:adding|erspective|oint_to)|r(?:adius|ight_(?:margin|padding)|otate(?:_pad)?)|s(?:h(?:ader|ow_cancels_hide)|ize_group|ound|ubpixel)|t(?:op_(?:margin|padding)|ransform_anchor)|x(?:a(?:nchoraround|round)|fit|margin|pa(?:dding|n)|rotate|spacing|tile|zoom)|y(?:a(?:nchoraround|round)|fit|margin|pa(?:dding|n)|rotate|spacing|tile|zoom)|z(?:oom|pos|rotate|zoom))|(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?|text_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?)?(?:a(?:djust_spacing|ntialias|xis)|b(?:lack_color|old)|color|drop_shadow(?:_color)?|emoji_font|f(?:irst_indent|ont(?:_features)?)|h(?:inting|yperlink_functions)|i(?:nstance|talic)|justify|kerning|l(?:a(?:nguage|yout)|ine_(?:leading|overlap_split|spacing))|mi(?:n(?:_width|width)|pmap)|newline_indent|outline(?:_scaling|s)|prefer_emoji|r(?:est_indent|uby_style)|s(?:haper|ize|low_(?:abortable|cps(?:_multiplier)?)|trikethrough)|text(?:align|shader)|underline|vertical)|(?:activate_|hover_|i(?:dle_|nsensitive_)|s(?:crollbar_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?|elected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)|vscrollbar_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?)?(?:b(?:a(?:r_(?:invert|resizing|vertical)|se_bar)|ottom_(?:bar|gutter))|keyboard_focus|left_(?:bar|gutter)|mouse|right_(?:bar|gutter)|t(?:humb(?:_(?:align|offset|shadow))?|op_(?:bar|gutter))|unscrollable)|(?:)(?:a(?:cti(?:on|vated)|djustment|l(?:low(?:_underfull)?|ternate(?:_keysym)?)|r(?:guments|rowkeys)|uto|t)|bottom_to_top|c(?:a(?:che|pt(?:ion|ure)|ret_blink)|h(?:anged|ild_size)|licked|o(?:ls|pypaste))|d(?:efault(?:_focus)?|r(?:ag(?:_(?:handle|joined|name|offscreen|raise)|g(?:able|ed|ing))|op(?:_allowable|p(?:able|ed))))|e(?:dgescroll|xclude)|f(?:inished|ocus)|ground|h(?:eight|overed)|i(?:con_(?:extra_alt|group_alt|tooltip)|mage_style|nvert_offsets|d)|keysym|l(?:ayer|ength)|m(?:ask|in_overlap|ouse(?:_drop|wheel)|ultiline)|p(?:agekeys|ersist|ixel_width|osition|r(?:e(?:dict|f(?:er(?:_(?:screen_to_id|top)|red_side)|ix))|operties))|r(?:ange|e(?:ct|leased|peat)|ight_to_left|o(?:ll_forward|ws))|s(?:c(?:ope|rollbars)|e(?:lected|nsitive)|low(?:_done)?|napped|tyle_(?:group|prefix|suffix)|u(?:bstitute|ffix))|transpose|unhovered|va(?:lue|riant)|width|x(?:adjustment|initial)|y(?:adjustment|initial)|zorder)|(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?|text_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?)(?:text_(?:align|y_fudge))|(?:activate_|hover_|i(?:dle_|nsensitive_)|s(?:elected_(?:activate_|hover_|i(?:dle_|nsensitive_))?|ide_(?:activate_|hover_|i(?:dle_|nsensitive_)|selected_(?:activate_|hover_|i(?:dle_|nsensitive_))?)?))?(?:spacing)|(?:text_)?(?:extra_alt|group_alt|style|tooltip)|(?:selected_)?(?:hover|i(?:dle|nsensitive))|(?:text_)(?:y_fudge))\b/g,
+    firstChars: [0x0, 0x0, 0x80000000, 0x7fdfffe, 0x0],
+};
+
+export const screenSimpleExpression: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 9, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#renpy-only-expressions
+        screenBuildInProperties,
+        placeholderPattern, // Placeholder for source.renpy.python#member-access
+        placeholderPattern, // Placeholder for source.renpy.python#illegal-operator
+        placeholderPattern, // Placeholder for source.renpy.python#operator
+        placeholderPattern, // Placeholder for source.renpy.python#curly-braces
+        placeholderPattern, // Placeholder for source.renpy.python#item-access
+        placeholderPattern, // Placeholder for source.renpy.python#list
+        placeholderPattern, // Placeholder for source.renpy.python#odd-function-call
+        placeholderPattern, // Placeholder for source.renpy.python#round-braces
+        placeholderPattern, // Placeholder for source.renpy.python#function-call
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-functions
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-types
+        placeholderPattern, // Placeholder for source.renpy.python#builtin-exceptions
+        placeholderPattern, // Placeholder for source.renpy.python#magic-names
+        placeholderPattern, // Placeholder for source.renpy.python#special-names
+        placeholderPattern, // Placeholder for source.renpy.python#illegal-names
+        placeholderPattern, // Placeholder for source.renpy.python#special-variables
+        placeholderPattern, // Placeholder for source.renpy.python#ellipsis
+        placeholderPattern, // Placeholder for source.renpy.python#punctuation
+        placeholderPattern, // Placeholder for source.renpy.python#line-continuation
+        {
+            debugName: "screenSimpleExpression.patterns![21]",
+            _patternId: PATTERN_ID_BASE + 10, _patternType: TokenPatternType.MatchPattern,
+
+            // Tokenize identifiers
+            token: EntityTokenType.Identifier, /*variable.name.python*/
+            match: /\b([a-zA-Z_]\w*)\b/g,
+            firstChars: [0x0, 0x0, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy#whitespace
+    ]
+};
+
+export const screenKeywords: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 11, _patternType: TokenPatternType.RepoPattern,
+    // https://www.renpy.org/doc/html/screens.html#screen-statement
+    patterns: [
+        {
+            debugName: "screenKeywords.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 12, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            contentToken: MetaTokenType.ScreenSensitive, /*meta.screen.sensitive.renpy*/
+            begin: /(?<=^[ \t]*)(sensitive)\b[ \t]*/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+            requiredLiteral: "sensitive",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Sensitive, /*keyword.sensitive.renpy*/ },
+            },
+            end: /$/gm,
+            patterns: [screenSimpleExpression]
+        },
+        {
+            debugName: "screenKeywords.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 14, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ControlFlowKeyword, /*keyword.control.flow.renpy*/
+            match: /\b(?<!\.)(?:showif|has|on|use)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x288100, 0x0],
+        },
+        {
+            debugName: "screenKeywords.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 15, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Other, /*keyword.other.renpy*/
+            match: /\b(?<!\.)(?:sensitive|tag|text|drag|draggroup|id|test|style)\b[^\.]/g,
+            firstChars: [0x0, 0x0, 0x0, 0x180210, 0x0],
+        },
+        {
+            debugName: "screenKeywords.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 16, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.TagName, /*entity.other.attribute-name.transform.renpy entity.name.tag.css.transform.renpy*/
+            match: /\b(?<!\.)(?:modal|style_group|style_prefix|zorder|tooltip|variant|layer|roll_forward)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x45c3000, 0x0],
+        },
+        {
+            debugName: "screenKeywords.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 17, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Other, /*keyword.other.renpy*/
+            match: /\b(?<!\.)(?:vbox|hbox|label|add|null)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x405102, 0x0],
+        },
+    ]
+};
+
+export const screenBlockTester: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 18, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "screenBlockTester.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 19, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            contentToken: MetaTokenType.ScreenBlock, /*meta.screen.block.renpy*/
+            begin: /(?<=(^[ \t]*)(?:screen|frame|fixed|window|viewport|drag|draggroup|(?:vp)?grid|vbox|hbox|imagemap)\b.*?)(:)/dgm,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: CharacterTokenType.Colon, /*punctuation.section.screen.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for screenLanguage
+            ]
+        },
+        {
+            debugName: "screenBlockTester.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 21, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            contentToken: MetaTokenType.ATLBlock, /*meta.atl.block.renpy*/
+            begin: /(?<=(^[ \t]*)(?:text)\b.*?)(:)/dgm,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: CharacterTokenType.Colon, /*punctuation.section.atl.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for screenLanguage
+                placeholderPattern, // Placeholder for source.renpy.atl
+            ]
+        },
+    ]
+};
+
+export const screenFrame: TokenPattern = {
+    debugName: "screenFrame",
+    _patternId: PATTERN_ID_BASE + 23, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ScreenFrameStatement, /*meta.screen.frame.statement.renpy*/
+    match: /(?<=^[ \t]*)(frame)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+    requiredLiteral: "frame",
+    captures: {
+        1: { token: KeywordTokenType.Frame, /*keyword.frame.renpy*/ },
+    },
+};
+
+export const screenFixed: TokenPattern = {
+    debugName: "screenFixed",
+    _patternId: PATTERN_ID_BASE + 24, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ScreenFixedStatement, /*meta.screen.fixed.statement.renpy*/
+    match: /(?<=^[ \t]*)(fixed)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x40, 0x0],
+    requiredLiteral: "fixed",
+    captures: {
+        1: { token: KeywordTokenType.Fixed, /*keyword.fixed.renpy*/ },
+    },
+};
+
+export const screenWindow: TokenPattern = {
+    debugName: "screenWindow",
+    _patternId: PATTERN_ID_BASE + 25, _patternType: TokenPatternType.MatchPattern,
+
+    token: MetaTokenType.ScreenWindowStatement, /*meta.screen.window.statement.renpy*/
+    match: /(?<=^[ \t]*)(window)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x800000, 0x0],
+    requiredLiteral: "window",
+    captures: {
+        1: { token: KeywordTokenType.Window, /*keyword.window.renpy*/ },
+    },
+};
+
+export const screenText: TokenPattern = {
+    debugName: "screenText",
+    _patternId: PATTERN_ID_BASE + 26, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    token: MetaTokenType.ScreenText, /*meta.screen.text.renpy*/
+    begin: /(?<=^[ \t]*)(text)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x100000, 0x0],
+    requiredLiteral: "text",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Text, /*keyword.text.renpy*/ },
+    },
+    end: /(?=:)|$/gm,
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#strings
+        {
+            debugName: "screenText.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 28, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.TextName, /*entity.name.type.text.renpy*/
+            match: /(?<=text[ \t]*)\b(?:[a-zA-Z_0-9]+)\b(?=[ \t]+|$)/gm,
+            firstChars: [0x0, 0x3ff0000, 0x87fffffe, 0x7fffffe, 0x0],
+        },
+        placeholderPattern, // Placeholder for source.renpy#at-statement
+        screenKeywords,
+        screenSimpleExpression,
+        placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+    ]
+};
+
+export const screenBox: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 29, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "screenBox.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 30, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ScreenVboxStatement, /*meta.screen.vbox.statement.renpy*/
+            match: /(?<=^[ \t]*)(vbox)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x400000, 0x0],
+            requiredLiteral: "vbox",
+            captures: {
+                1: { token: KeywordTokenType.Vbox, /*keyword.vbox.renpy*/ },
+            },
+        },
+        {
+            debugName: "screenBox.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 31, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.ScreenHboxStatement, /*meta.screen.hbox.statement.renpy*/
+            match: /(?<=^[ \t]*)(hbox)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x100, 0x0],
+            requiredLiteral: "hbox",
+            captures: {
+                1: { token: KeywordTokenType.Hbox, /*keyword.hbox.renpy*/ },
+            },
+        },
+    ]
+};
+
+export const screen: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 32, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "screen.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 33, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+            // See https://www.renpy.org/doc/html/screens.html
+            contentToken: MetaTokenType.ScreenBlock, /*meta.screen.block.renpy*/
+            begin: /(?<=^[ \t]*)(screen)\b/dgm,
+            firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+            requiredLiteral: "screen",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Screen, /*storage.type.screen.renpy*/ },
+            },
+            end: /$|^/gm,
+            patterns: [
+                screenDefName,
+                placeholderPattern, // Placeholder for source.renpy.python#parameters
+                screenBlockTester,
+                placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+            ]
+        },
+    ]
+};
+
+export const screenFallback: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 35, _patternType: TokenPatternType.RepoPattern,
+    // TODO: This is a temp fix for missing pattern references
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#base-patterns
+    ]
+};
+
+export const screenLanguage: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 36, _patternType: TokenPatternType.RepoPattern,
+    // https://www.renpy.org/doc/html/screens.html#screen-language
+    patterns: [
+        placeholderPattern, // Placeholder for source.renpy#define
+        placeholderPattern, // Placeholder for source.renpy#default-statement
+        placeholderPattern, // Placeholder for source.renpy#conditionals
+        placeholderPattern, // Placeholder for source.renpy#python-statements
+        screenFrame,
+        screenFixed,
+        screenWindow,
+        screenBox,
+        screenText,
+        screenBlockTester,
+        screenKeywords,
+        screenSimpleExpression,
+        screenFallback,
+    ]
+};
+
+// Push pattern references that were not defined on include
+screenBuildInProperties.patterns!.splice(3, 1, screenProperties);
+screenBlockTester.patterns![0].patterns!.splice(0, 1, screenLanguage);
+screenBlockTester.patterns![1].patterns!.splice(0, 1, screenLanguage);
\ No newline at end of file
@@ -0,0 +1,220 @@
+// THIS FILE HAS BEEN GENERATED BY THE `syntax-to-token-pattern.py` GENERATOR
+// WHICH IS RUN BY THE BUILD PROCESS. DO NOT EDIT THIS FILE DIRECTLY!.
+// ANY MANUAL EDITS MADE TO THIS FILE WILL BE OVERWRITTEN. YOU HAVE BEEN WARNED.
+// Last generated: 17/10/2026 22:06:33 (UTC+0)
+
+import { MetaTokenType, CharacterTokenType, EntityTokenType, KeywordTokenType } from "src/tokenizer/renpy-tokens";
+import { placeholderPattern, TokenPattern, TokenPatternType } from "src/tokenizer/token-pattern-types";
+import { STYLE_PATTERN_ID_BASE as PATTERN_ID_BASE } from "./pattern-ids.g";
+
+export const builtinStyles: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 0, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "builtinStyles.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 1, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.BuiltinType, /*support.type.builtin.style.renpy*/
+            match: /\b(?<!\.)(?:(alt)?ruby_style)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x40002, 0x0],
+            requiredLiteral: "ruby_style",
+        },
+    ]
+};
+
+export const styleBlockTester: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 2, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "styleBlockTester.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 3, _patternType: TokenPatternType.RangePattern, _hasBackref: true, _endNotG: false,
+
+            contentToken: MetaTokenType.StyleBlock, /*meta.style-block.renpy*/
+            begin: /(?<=(^[ \t]*)(?:style)\b.*?)(:)/dgm,
+            firstChars: [0x0, 0x4000000, 0x0, 0x0, 0x0],
+            beginCaptures: {
+                2: { token: CharacterTokenType.Colon, /*punctuation.section.style.begin.renpy*/ },
+            },
+            // @ts-ignore: Back references in end patterns are replaced by begin matches at runtime
+            end: /^(?=(?!\1)[ \t]*[^\s#]|\1[^\s#])/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for styleClause
+                placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+            ]
+        },
+    ]
+};
+
+export const styleProperty: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 5, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "styleProperty.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 6, _patternType: TokenPatternType.MatchPattern,
+
+            // ON EDIT: If you update this list, also update it in style-clause
+            token: EntityTokenType.TagName, /*support.constant.property-key.renpy entity.name.tag.css.style.renpy*/
+            match: /\b(?<!\.)(?:(?:selected_)?(?:hover_|idle_|insensitive_|activate_)?(?:a(?:ctivate_sound|djust_spacing|ft_(?:bar|gutter)|l(?:ign|t(?:ruby_style)?)|n(?:chor|tialias)|rea|xis)|b(?:a(?:ckground|r_(?:invert|resizing|vertical)|se_bar)|lack_color|o(?:ld|ttom_(?:bar|gutter|margin|padding)|x_(?:align|first_spacing|justify|layout|reverse|spacing|wrap(?:_spacing)?)))|c(?:aret|hild|lipping|olor)|d(?:ebug|rop_shadow(?:_color)?)|e(?:moji_font|nable_hover|xtra_alt)|f(?:i(?:rst_(?:indent|spacing)|t_first)|o(?:cus_(?:mask|rect)|nt(?:_features)?|re(?:_(?:bar|gutter)|ground)))|group_alt|h(?:inting|over_sound|yperlink_functions)|i(?:nstance|talic)|justify|ke(?:rning|y(?:_events|board_focus(?:_insets)?))|l(?:a(?:nguage|yout)|eft_(?:bar|gutter|margin|padding)|ine_(?:leading|overlap_split|spacing))|m(?:a(?:rgin|ximum)|i(?:n(?:_width|imum|width)|pmap)|o(?:dal|use))|newline_indent|o(?:ffset|rder_reverse|utline(?:_scaling|s))|p(?:adding|os|refer_emoji)|r(?:e(?:ading_order|st_indent)|ight_(?:bar|gutter|margin|padding)|uby_(?:line_leading|style))|s(?:haper|ize(?:_group)?|low_(?:abortable|cps(?:_multiplier)?|speed)|pacing|trikethrough|ub(?:pixel|title_width))|t(?:ext(?:_(?:align|y_fudge)|align|shader)|humb(?:_(?:align|offset|shadow))?|ime_policy|op_(?:bar|gutter|margin|padding))|un(?:derline|scrollable)|vertical|x(?:a(?:lign|nchor)|center|fi(?:ll|t)|m(?:a(?:rgin|ximum)|inimum)|offset|p(?:adding|os)|s(?:ize|pacing)|y(?:center|size))|y(?:a(?:lign|nchor)|center|fi(?:ll|t)|m(?:a(?:rgin|ximum)|inimum)|offset|p(?:adding|os)|s(?:ize|pacing))))\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x37dfffe, 0x0],
+        },
+        {
+            debugName: "styleProperty.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 7, _patternType: TokenPatternType.MatchPattern,
+
+            token: MetaTokenType.BuiltinType, /*support.type.builtin.style.renpy*/
+            match: /\b(?<!\.)(?:(alt)?ruby_style)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x40002, 0x0],
+            requiredLiteral: "ruby_style",
+        },
+        {
+            debugName: "styleProperty.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 8, _patternType: TokenPatternType.MatchPattern,
+
+            token: EntityTokenType.TagName, /*support.constant.property-key.renpy entity.name.tag.css.style.renpy*/
+            match: /\b(?<!\.)(?:properties)\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x10000, 0x0],
+            requiredLiteral: "properties",
+        },
+        {
+            debugName: "styleProperty.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 9, _patternType: TokenPatternType.MatchPattern,
+
+            // Any other tokens are invalid
+            token: MetaTokenType.Invalid, /*invalid.illegal.style-property.name.renpy*/
+            match: /.+/g,
+            firstChars: [0xffffdbff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1],
+        },
+    ]
+};
+
+export const styleClause: TokenPattern = {
+    _patternId: PATTERN_ID_BASE + 10, _patternType: TokenPatternType.RepoPattern,
+    patterns: [
+        {
+            debugName: "styleClause.patterns![0]",
+            _patternId: PATTERN_ID_BASE + 11, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+            // is statement
+            begin: /\b(?<!\.)(is)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x200, 0x0],
+            requiredLiteral: "is",
+            beginCaptures: {
+                1: { token: MetaTokenType.LogicalOperatorKeyword, /*keyword.operator.logical.python*/ },
+            },
+            end: /(?!\G)(?<=[^ \t])|$/gm,
+            patterns: [
+                {
+                    debugName: "styleClause.patterns![0].patterns![0]",
+                    _patternId: PATTERN_ID_BASE + 13, _patternType: TokenPatternType.MatchPattern,
+
+                    token: EntityTokenType.StyleName, /*entity.name.type.style.base.renpy*/
+                    match: /\b[\p{XID_Start}_]\p{XID_Continue}*\b/gu,
+                },
+                placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+            ]
+        },
+        {
+            debugName: "styleClause.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 14, _patternType: TokenPatternType.MatchPattern,
+
+            token: KeywordTokenType.Clear, /*keyword.clear.renpy*/
+            match: /\b(?<!\.)clear\b/g,
+            firstChars: [0x0, 0x0, 0x0, 0x8, 0x0],
+            requiredLiteral: "clear",
+        },
+        {
+            debugName: "styleClause.patterns![2]",
+            _patternId: PATTERN_ID_BASE + 15, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+            begin: /\b(?<!\.)(take)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x100000, 0x0],
+            requiredLiteral: "take",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Take, /*keyword.take.renpy*/ },
+            },
+            end: /(?!\G)(?<=[^ \t])|$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy#name
+                placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+            ]
+        },
+        {
+            debugName: "styleClause.patterns![3]",
+            _patternId: PATTERN_ID_BASE + 17, _patternType: TokenPatternType.MatchPattern,
+
+            match: /\b(?<!\.)(del)\b[ \t]*(\w*)/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x10, 0x0],
+            requiredLiteral: "del",
+            captures: {
+                1: { token: KeywordTokenType.Del, /*keyword.del.renpy*/ },
+                2: {
+                    _patternId: PATTERN_ID_BASE + 18, _patternType: TokenPatternType.RepoPattern,
+                    patterns: [styleProperty]
+                },
+            },
+        },
+        {
+            debugName: "styleClause.patterns![4]",
+            _patternId: PATTERN_ID_BASE + 19, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+            begin: /\b(?<!\.)(variant)\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x400000, 0x0],
+            requiredLiteral: "variant",
+            beginCaptures: {
+                1: { token: KeywordTokenType.Variant, /*keyword.variant.renpy*/ },
+            },
+            end: /(?!\G)/g,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy#simple-expression
+            ]
+        },
+        {
+            debugName: "styleClause.patterns![5]",
+            _patternId: PATTERN_ID_BASE + 21, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: true,
+
+            // ON EDIT: If you update this list, also update it in style-property
+            begin: /\b(?<!\.)(properties|(?:(?:selected_)?(?:hover_|idle_|insensitive_|activate_)?(?:a(?:ctivate_sound|djust_spacing|ft_(?:bar|gutter)|l(?:ign|t(?:ruby_style)?)|n(?:chor|tialias)|rea|xis)|b(?:a(?:ckground|r_(?:invert|resizing|vertical)|se_bar)|lack_color|o(?:ld|ttom_(?:bar|gutter|margin|padding)|x_(?:align|first_spacing|justify|layout|reverse|spacing|wrap(?:_spacing)?)))|c(?:aret|hild|lipping|olor)|d(?:ebug|rop_shadow(?:_color)?)|e(?:moji_font|nable_hover|xtra_alt)|f(?:i(?:rst_(?:indent|spacing)|t_first)|o(?:cus_(?:mask|rect)|nt(?:_features)?|re(?:_(?:bar|gutter)|ground)))|group_alt|h(?:inting|over_sound|yperlink_functions)|i(?:nstance|talic)|justify|ke(?:rning|y(?:_events|board_focus(?:_insets)?))|l(?:a(?:nguage|yout)|eft_(?:bar|gutter|margin|padding)|ine_(?:leading|overlap_split|spacing))|m(?:a(?:rgin|ximum)|i(?:n(?:_width|imum|width)|pmap)|o(?:dal|use))|newline_indent|o(?:ffset|rder_reverse|utline(?:_scaling|s))|p(?:adding|os|refer_emoji)|r(?:e(?:ading_order|st_indent)|ight_(?:bar|gutter|margin|padding)|uby_(?:line_leading|style))|s(?:haper|ize(?:_group)?|low_(?:abortable|cps(?:_multiplier)?|speed)|pacing|trikethrough|ub(?:pixel|title_width))|t(?:ext(?:_(?:align|y_fudge)|align|shader)|humb(?:_(?:align|offset|shadow))?|ime_policy|op_(?:bar|gutter|margin|padding))|un(?:derline|scrollable)|vertical|x(?:a(?:lign|nchor)|center|fi(?:ll|t)|m(?:a(?:rgin|ximum)|inimum)|offset|p(?:adding|os)|s(?:ize|pacing)|y(?:center|size))|y(?:a(?:lign|nchor)|center|fi(?:ll|t)|m(?:a(?:rgin|ximum)|inimum)|offset|p(?:adding|os)|s(?:ize|pacing)))))\b/dg,
+            firstChars: [0x0, 0x0, 0x0, 0x37dfffe, 0x0],
+            beginCaptures: {
+                1: { token: EntityTokenType.TagName, /*support.constant.property-key.renpyx entity.name.tag.css.style.renpy*/ },
+            },
+            end: /(?!\G)|$/gm,
+            patterns: [
+                placeholderPattern, // Placeholder for source.renpy#simple-expression
+            ]
+        },
+    ]
+};
+
+export const style: TokenPattern = {
+    debugName: "style",
+    _patternId: PATTERN_ID_BASE + 23, _patternType: TokenPatternType.RangePattern, _hasBackref: false, _endNotG: false,
+
+    // See https://www.renpy.org/doc/html/styles.html
+    token: MetaTokenType.StyleStatement, /*meta.style.statement.renpy*/
+    contentToken: MetaTokenType.StyleParameters, /*meta.style.parameters.renpy*/
+    begin: /(?<=^[ \t]*)(style)\b/dgm,
+    firstChars: [0x0, 0x0, 0x0, 0x80000, 0x0],
+    requiredLiteral: "style",
+    beginCaptures: {
+        1: { token: KeywordTokenType.Style, /*storage.type.style.renpy*/ },
+    },
+    end: /$|^/gm,
+    patterns: [
+        builtinStyles,
+        {
+            debugName: "style.patterns![1]",
+            _patternId: PATTERN_ID_BASE + 25, _patternType: TokenPatternType.MatchPattern,
+
+            // Only the first identifier is a style name
+            token: EntityTokenType.StyleName, /*entity.name.type.style.renpy*/
+            match: /(?<=\bstyle[ \t]*)\b[\p{XID_Start}_]\p{XID_Continue}*\b/gu,
+        },
+        styleClause,
+        styleBlockTester,
+        placeholderPattern, // Placeholder for source.renpy#fallback-patterns
+    ]
+};
+
+// Push pattern references that were not defined on include
+styleBlockTester.patterns![0].patterns!.splice(0, 1, styleClause);
\ No newline at end of file
@@ -0,0 +1,114 @@
+import { TokenType } from "./renpy-tokens";
+import { FirstChars, TokenPattern, TokenPatternType } from "./token-pattern-types";
+
+interface PatternTableCaptures {
+    readonly [k: number]: number;
+}
+
+// A row of the table generated by scripts/pattern_table.py. Patterns refer to other patterns by their row index.
+export interface PatternTableRow {
+    readonly debugName?: string;
+    readonly token?: TokenType;
+    readonly contentToken?: TokenType;
+
+    readonly match?: RegExp;
+    readonly begin?: RegExp;
+    readonly end?: RegExp;
+    readonly firstChars?: FirstChars;
+    readonly requiredLiteral?: string;
+    readonly hasBackref?: boolean;
+    readonly endNotG?: boolean;
+
+    readonly captures?: PatternTableCaptures;
+    readonly beginCaptures?: PatternTableCaptures;
+    readonly endCaptures?: PatternTableCaptures;
+
+    // The patterns of a repo pattern, or the row of the repo pattern that holds the patterns of a range pattern.
+    readonly patterns?: readonly number[];
+    readonly patternsRepo?: number;
+}
+
+interface HydratedPattern {
+    debugName?: string;
+    token?: TokenType;
+    contentToken?: TokenType;
+    match?: RegExp;
+    begin?: RegExp;
+    end?: RegExp;
+    firstChars?: FirstChars;
+    requiredLiteral?: string;
+    captures?: { [k: number]: HydratedPattern };
+    beginCaptures?: { [k: number]: HydratedPattern };
+    endCaptures?: { [k: number]: HydratedPattern };
+    patterns?: HydratedPattern[];
+
+    _patternId?: number;
+    _patternType?: TokenPatternType;
+    _hasBackref?: boolean;
+    _endNotG?: boolean;
+    _patternsRepo?: HydratedPattern;
+}
+
+function hydrateCaptures(patterns: HydratedPattern[], captures: PatternTableCaptures) {
+    const rv: { [k: number]: HydratedPattern } = {};
+    for (const group in captures) {
+        rv[group] = patterns[captures[group]];
+    }
+    return rv;
+}
+
+/**
+ * Creates the pattern objects of a generated pattern table, and links them to each other. The rows before
+ * `patternCount` can be scanned, and their row index is their pattern id.
+ */
+export function hydratePatternTable(table: readonly PatternTableRow[], patternCount: number): TokenPattern[] {
+    const patterns: HydratedPattern[] = table.map((row, i) => {
+        const p: HydratedPattern = {};
+
+        if (row.debugName !== undefined) p.debugName = row.debugName;
+        if (row.token !== undefined) p.token = row.token;
+        if (row.contentToken !== undefined) p.contentToken = row.contentToken;
+        if (row.match !== undefined) p.match = row.match;
+        if (row.begin !== undefined) p.begin = row.begin;
+        if (row.end !== undefined) p.end = row.end;
+        if (row.firstChars !== undefined) p.firstChars = row.firstChars;
+        if (row.requiredLiteral !== undefined) p.requiredLiteral = row.requiredLiteral;
+
+        if (i < patternCount) {
+            p._patternId = i;
+
+            if (row.begin !== undefined) {
+                p._patternType = TokenPatternType.RangePattern;
+                p._hasBackref = row.hasBackref === true;
+                p._endNotG = row.endNotG === true;
+            } else if (row.match !== undefined) {
+                p._patternType = TokenPatternType.MatchPattern;
+            } else {
+                p._patternType = TokenPatternType.RepoPattern;
+            }
+        }
+
+        return p;
+    });
+
+    // The patterns of every row have to exist before the rows can be linked to each other.
+    table.forEach((row, i) => {
+        const p = patterns[i];
+
+        if (row.captures !== undefined) p.captures = hydrateCaptures(patterns, row.captures);
+        if (row.beginCaptures !== undefined) p.beginCaptures = hydrateCaptures(patterns, row.beginCaptures);
+        if (row.endCaptures !== undefined) p.endCaptures = hydrateCaptures(patterns, row.endCaptures);
+        if (row.patterns !== undefined) p.patterns = row.patterns.map((j) => patterns[j]);
+    });
+
+    // A range pattern shares the patterns array of its repo pattern, which was only filled in above.
+    table.forEach((row, i) => {
+        if (row.patternsRepo !== undefined) {
+            const repo = patterns[row.patternsRepo];
+            patterns[i]._patternsRepo = repo;
+            patterns[i].patterns = repo.patterns;
+        }
+    });
+
+    return patterns as unknown as TokenPattern[];
+}
@@ -4,7 +4,24 @@ interface TokenPatternDebugInfo {
     readonly debugName?: string;
 }
 
-export interface TokenCapturePattern extends TokenPatternDebugInfo {
+export const enum TokenPatternType {
+    RepoPattern = 0,
+    RangePattern = 1,
+    MatchPattern = 2,
+}
+
+// The characters a match of the begin or match regex can start with, as generated by scripts/regex_ast.py. The first four
+// numbers have a bit for each ASCII character, and the last one is 1 if a match can also start with any other character.
+export type FirstChars = readonly [number, number, number, number, number];
+
+// The state the tokenizer needs for each pattern. The generator precomputes this for the generated patterns,
+// otherwise it's assigned by Tokenizer.setupAndValidatePatterns() before the first document is tokenized.
+interface TokenPatternState {
+    _patternId?: number;
+    _patternType?: TokenPatternType;
+}
+
+export interface TokenCapturePattern extends TokenPatternDebugInfo, TokenPatternState {
     readonly token?: TokenType;
     readonly patterns?: TokenPatternArray;
 }
@@ -25,6 +42,10 @@ export interface TokenRepoPattern {
     captures?: never;
     beginCaptures?: never;
     endCaptures?: never;
+    fused?: never;
+    fusedGroups?: never;
+    firstChars?: never;
+    requiredLiteral?: never;
 }
 
 export interface TokenRangePattern {
@@ -33,21 +54,35 @@ export interface TokenRangePattern {
 
     begin: RegExp;
     readonly beginCaptures?: TokenPatternCapture;
+    readonly firstChars?: FirstChars;
+    readonly requiredLiteral?: string;
 
     end: RegExp;
     readonly endCaptures?: TokenPatternCapture;
 
     readonly patterns?: TokenPatternArray;
 
+    _hasBackref?: boolean;
+    _endNotG?: boolean;
+
     // These are added to prevent falsy assignment
     match?: never;
     captures?: never;
+    fused?: never;
+    fusedGroups?: never;
 }
 
 export interface TokenMatchPattern {
     readonly token?: TokenType;
     match: RegExp;
     readonly captures?: TokenPatternCapture;
+    readonly firstChars?: FirstChars;
+    readonly requiredLiteral?: string;
+
+    // A match pattern that the generator fused from a run of sibling match patterns. Its regex is an alternation of the
+    // regexes of those patterns, each in a capture group, and fusedGroups holds the index of each of these groups.
+    readonly fused?: TokenPatternArray;
+    readonly fusedGroups?: readonly number[];
 
     // These are added to prevent falsy assignment
     patterns?: never;
@@ -58,7 +93,7 @@ export interface TokenMatchPattern {
     endCaptures?: never;
 }
 
-export declare type TokenPattern = (TokenRangePattern | TokenMatchPattern | TokenRepoPattern) & TokenPatternDebugInfo;
+export declare type TokenPattern = (TokenRangePattern | TokenMatchPattern | TokenRepoPattern) & TokenPatternDebugInfo & TokenPatternState;
 export declare type TokenPatternArray = Array<TokenPattern>;
 
 /**
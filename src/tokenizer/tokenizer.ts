@@ -8,9 +8,17 @@ import { escapeRegExpCharacters } from "src/utilities";
 import { isShippingBuild } from "../extension";
 import { LogCategory, logCatMessage } from "../logger";
 
-import { RenpyPatterns } from "./generated";
+import { PATTERN_STATE_VERSION, RenpyPatterns, UNIQUE_PATTERN_COUNT } from "./generated";
 import { isMatchPattern, isRangePattern, isRepoPattern, Range, Token, TokenPosition, TokenTree, TreeNode } from "./token-definitions";
-import { TokenCapturePattern, TokenMatchPattern, TokenPatternCapture, TokenRangePattern, TokenRepoPattern } from "./token-pattern-types";
+import {
+    FirstChars,
+    TokenCapturePattern,
+    TokenMatchPattern,
+    TokenPatternCapture,
+    TokenPatternType,
+    TokenRangePattern,
+    TokenRepoPattern,
+} from "./token-pattern-types";
 
 interface MatchScanResult {
     pattern: ExTokenPattern;
@@ -34,6 +42,13 @@ type TokenCache = { readonly documentVersion: number; readonly tokens: TokenTree
 const RUN_BENCHMARKS = false;
 //const TOKENIZER_TIMEOUT = 5_000;
 
+// The version of the pattern state that syntax_to_token_pattern.py precomputes. If the generated patterns have a different
+// version, the pattern state is computed by setupAndValidatePatterns() instead.
+const EXPECTED_PATTERN_STATE_VERSION: number = 1;
+
+// The longest text that is checked for a character that can start a pattern, before the pattern is scanned, see canStartBefore()
+const MAX_PREFILTER_LENGTH = 64;
+
 export class Tokenizer {
     private static _uniquePatternCount = -1;
     private static _tokenCache = new Map<Uri, TokenCache>();
@@ -143,19 +158,30 @@ export class Tokenizer {
             return;
         }
 
+        // The generator already assigned the pattern state and validated the patterns
+        if (PATTERN_STATE_VERSION === EXPECTED_PATTERN_STATE_VERSION) {
+            this._uniquePatternCount = UNIQUE_PATTERN_COUNT;
+            return;
+        }
+
+        logCatMessage(LogLevel.Warning, LogCategory.Tokenizer, "The generated token patterns are out of date, please run the generator again.");
+
         this._uniquePatternCount = 0;
         const stack = new Stack<ExTokenPattern>(32);
         stack.push(RenpyPatterns.basePatterns as ExTokenRepoPattern);
 
-        const mFlagRe = /(?<!\[)[\^$]/g;
+        // The patterns may contain state of a different version, so it can't be used to check if a pattern was visited
+        const visited = new Set<ExTokenPattern>();
+
         const gAnchorRe = /(?:\(\?!\\G\))|(?:\\G)/g;
         while (!stack.isEmpty()) {
             const p = stack.pop()!;
             assert(p !== undefined, "This pattern is undefined! Please make sure that circular includes are added after both patterns are defined.");
 
-            if (p._patternId !== undefined && p._patternId !== -1) {
+            if (visited.has(p)) {
                 continue; // This pattern was already validated
             }
+            visited.add(p);
 
             p._patternId = this._uniquePatternCount;
             ++this._uniquePatternCount;
@@ -169,7 +195,7 @@ export class Tokenizer {
                 p._patternType = TokenPatternType.RangePattern;
                 let reBeginSource = p.begin.source;
 
-                if (reBeginSource.match(mFlagRe)) {
+                if (hasLineAnchor(reBeginSource)) {
                     assert(p.begin.multiline, "To match this pattern the 'm' flag is required on the begin RegExp!");
                 }
 
@@ -179,37 +205,39 @@ export class Tokenizer {
                 }
 
                 assert(p.begin.global && p.end.global, "To match this pattern the 'g' flag is required on the begin and end RegExp!");
-                if (p.beginCaptures) {
+                if (needsIndices(p.begin, p.beginCaptures)) {
                     assert(p.begin.hasIndices, "To match this begin pattern the 'd' flag is required!");
-
+                } else {
+                    assert(!p.begin.hasIndices, "This pattern should not have the 'd' flag set!");
+                }
+                if (p.beginCaptures) {
                     Object.entries(p.beginCaptures).forEach(([, v]) => {
                         if (v.patterns) stack.push(v as ExTokenRepoPattern);
                     });
+                }
+                if (needsIndices(p.end, p.endCaptures)) {
+                    assert(p.end.hasIndices, "To match this end pattern the 'd' flag is required!");
                 } else {
-                    assert(!p.begin.hasIndices, "This pattern should not have the 'd' flag set!");
+                    assert(!p.end.hasIndices, "This pattern should not have the 'd' flag set!");
                 }
                 if (p.endCaptures) {
-                    assert(p.end.hasIndices, "To match this end pattern the 'd' flag is required!");
-
                     Object.entries(p.endCaptures).forEach(([, v]) => {
                         if (v.patterns) stack.push(v as ExTokenRepoPattern);
                     });
-                } else {
-                    assert(!p.end.hasIndices, "This pattern should not have the 'd' flag set!");
                 }
 
                 if (p.patterns) {
-                    p._patternsRepo = {
-                        patterns: p.patterns as ExTokenPatternArray,
-                        _patternId: -1,
-                        _patternType: TokenPatternType.RepoPattern,
-                    };
-                    stack.push(p._patternsRepo!);
+                    // Reserve the next id for the patterns repo, see getPatternsRepo()
+                    ++this._uniquePatternCount;
+
+                    for (let i = 0; i < p.patterns.length; ++i) {
+                        stack.push(p.patterns[i]);
+                    }
                 }
 
                 let reEndSource = p.end.source;
 
-                if (mFlagRe.test(reEndSource)) {
+                if (hasLineAnchor(reEndSource)) {
                     assert(p.end.multiline, "To match this pattern the 'm' flag is required on the end RegExp!");
                 }
 
@@ -233,7 +261,7 @@ export class Tokenizer {
             } else if (isMatchPattern(p)) {
                 p._patternType = TokenPatternType.MatchPattern;
 
-                if (p.match.source.match(mFlagRe)) {
+                if (hasLineAnchor(p.match.source)) {
                     assert(p.match.multiline, "To match this pattern the 'm' flag is required!");
                 }
 
@@ -243,14 +271,23 @@ export class Tokenizer {
                 }
 
                 assert(p.match.global, "To match this pattern the 'g' flag is required!");
-                if (p.captures) {
-                    assert(p.match.hasIndices, "To match this pattern the 'd' flag is required!");
+                if (p.fused) {
+                    assert(p.fusedGroups?.length === p.fused.length, "A fused pattern needs the group index of each of its patterns!");
 
+                    for (let i = 0; i < p.fused.length; ++i) {
+                        stack.push(p.fused[i]);
+                    }
+                }
+
+                if (needsIndices(p.match, p.captures)) {
+                    assert(p.match.hasIndices, "To match this pattern the 'd' flag is required!");
+                } else {
+                    assert(!p.match.hasIndices, "This pattern should not have the 'd' flag set!");
+                }
+                if (p.captures) {
                     Object.entries(p.captures).forEach(([, v]) => {
                         if (v.patterns) stack.push(v as ExTokenRepoPattern);
                     });
-                } else {
-                    assert(!p.match.hasIndices, "This pattern should not have the 'd' flag set!");
                 }
             } else {
                 assert(false, "Should not get here!");
@@ -331,7 +368,7 @@ class DocumentTokenizer {
                   ? pattern.beginCaptures
                   : pattern.endCaptures;
 
-        if (captures === undefined || match.indices === undefined) {
+        if (captures === undefined) {
             return; // syntax error
         }
 
@@ -343,12 +380,15 @@ class DocumentTokenizer {
             parentNode.addChild(rootNode);
         }
 
-        for (let i = 1; i < match.indices!.length; i++) {
-            if (match.indices![i] === undefined) {
+        // The generator leaves out the 'd' flag if only capture 0 is used, which is found from the match itself
+        const indices = match.indices ?? [];
+
+        for (let i = 1; i < indices.length; i++) {
+            if (indices[i] === undefined) {
                 continue; // If the object at i is undefined, the capture is empty
             }
 
-            const [startPos, endPos] = match.indices![i];
+            const [startPos, endPos] = indices[i];
 
             if (captures[i] === undefined) {
                 if (!isShippingBuild() && !RUN_BENCHMARKS) {
@@ -410,6 +450,10 @@ class DocumentTokenizer {
     }
 
     private scanMatchPattern(pattern: ExTokenMatchPattern, source: string, sourceStartOffset: number) {
+        if (!containsLiteral(pattern.requiredLiteral, source, sourceStartOffset)) {
+            return null;
+        }
+
         const re = pattern.match;
         re.lastIndex = sourceStartOffset;
         const match = re.exec(source);
@@ -417,10 +461,47 @@ class DocumentTokenizer {
             return null;
         }
 
+        if (pattern.fused) {
+            return this.dispatchFusedMatch(pattern, match, source);
+        }
+
         return { pattern, matchBegin: match } as MatchScanResult;
     }
 
+    /**
+     * Returns the scan result of the pattern in a fused pattern whose group produced the match.
+     * @param pattern The fused pattern
+     * @param match The match of the fused regex
+     * @param source The text that was matched on
+     */
+    private dispatchFusedMatch(pattern: ExTokenMatchPattern, match: RegExpExecArray, source: string) {
+        const groups = pattern.fusedGroups!;
+
+        // The first group that took part in the match is the pattern that would have won without fusing
+        let i = 0;
+        while (match[groups[i]] === undefined) {
+            ++i;
+        }
+
+        const p = pattern.fused![i];
+        if (!p.match.hasIndices) {
+            return { pattern: p, matchBegin: match } as MatchScanResult;
+        }
+
+        // The capture indices are only computed for the winning pattern, by matching its own regex at the same position
+        const re = p.match;
+        re.lastIndex = match.index;
+        const captureMatch = re.exec(source)!;
+        assert(captureMatch?.index === match.index, "A fused pattern should match at the same position as its fused regex!");
+
+        return { pattern: p, matchBegin: captureMatch } as MatchScanResult;
+    }
+
     private scanRangePattern(pattern: ExTokenRangePattern, source: string, sourceStartOffset: number) {
+        if (!containsLiteral(pattern.requiredLiteral, source, sourceStartOffset)) {
+            return null;
+        }
+
         const reBegin = pattern.begin;
         reBegin.lastIndex = sourceStartOffset;
         const matchBegin = reBegin.exec(source);
@@ -472,14 +553,14 @@ class DocumentTokenizer {
 
         if (matchEnd) {
             // Check if any child pattern has content that would extend the currently determined end match
-            if (p._patternsRepo) {
+            if (p.patterns) {
                 const sourceRange = new Range(matchBegin.index + matchBegin[0].length, matchEnd.index);
 
                 // Scan the content for any matches that would extend beyond the current end match
                 let lastCharIndex = sourceRange.end;
                 let lastMatchIndex = sourceRange.start;
                 while (lastMatchIndex < lastCharIndex) {
-                    const bestMatch = this.scanPattern(p._patternsRepo, result.source, lastMatchIndex, cache);
+                    const bestMatch = this.scanPattern(getPatternsRepo(p), result.source, lastMatchIndex, cache);
 
                     if (!bestMatch || bestMatch.matchBegin.index >= lastCharIndex) {
                         break; // No valid match was found in the remaining text. Break the loop
@@ -590,6 +671,13 @@ class DocumentTokenizer {
                 }
             }
 
+            // A pattern that can't start a match before the best match so far can't replace it, so it doesn't need to be scanned
+            if (scanResult === null && bestResult !== null && next.firstChars !== undefined) {
+                if (!canStartBefore(next.firstChars, source, sourceStartOffset, bestMatchRating)) {
+                    continue;
+                }
+            }
+
             // The result wasn't cached or was invalidated, so we need to scan for the next match
             if (scanResult === null) {
                 switch (next._patternType) {
@@ -670,7 +758,7 @@ class DocumentTokenizer {
         }
 
         // Patterns are only applied on 'content' (see p.contentToken above)
-        if (p._patternsRepo) {
+        if (p.patterns) {
             contentNode.reserve(16);
             while (!bestMatch.contentMatches!.isEmpty()) {
                 const contentScanResult = bestMatch.contentMatches!.pop()!;
@@ -819,14 +907,102 @@ class DocumentTokenizer {
     }
 }
 
-const enum TokenPatternType {
-    RepoPattern = 0,
-    RangePattern = 1,
-    MatchPattern = 2,
+/**
+ * Returns true if the source of a regex has a ^ or $ anchor outside of a character class, which needs the 'm' flag.
+ * @param source The source of the regex
+ */
+function hasLineAnchor(source: string) {
+    let inClass = false;
+
+    for (let i = 0; i < source.length; ++i) {
+        const c = source[i];
+
+        if (c === "\\") {
+            ++i; // Skip the escaped character
+        } else if (inClass) {
+            inClass = c !== "]";
+        } else if (c === "[") {
+            inClass = true;
+        } else if (c === "^" || c === "$") {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+/**
+ * Returns true if a regex needs the 'd' flag for its captures. Capture 0 is the whole match, so only the captures of groups
+ * that exist in the regex need the indices.
+ * @param re The regex
+ * @param captures The captures of the regex
+ */
+function needsIndices(re: RegExp, captures: TokenPatternCapture | undefined) {
+    if (captures === undefined) {
+        return false;
+    }
+
+    // An empty alternative always matches, and the match has an entry for every group
+    const groupCount = new RegExp(`${re.source}|`, re.unicode ? "u" : "").exec("")!.length - 1;
+
+    return Object.keys(captures).some((k) => {
+        const group = Number(k);
+        return group >= 1 && group <= groupCount;
+    });
+}
+
+/**
+ * Returns false if none of the characters from `start` up to `end` can start a match of a regex with these first characters.
+ * Ranges longer than MAX_PREFILTER_LENGTH are assumed to contain one, since checking them costs about as much as the regex.
+ * @param firstChars The characters a match can start with
+ * @param source The text to check
+ * @param start The offset of the first character to check
+ * @param end The offset after the last character to check
+ */
+function canStartBefore(firstChars: FirstChars, source: string, start: number, end: number) {
+    if (end - start > MAX_PREFILTER_LENGTH) {
+        return true;
+    }
+
+    for (let i = start; i < end; ++i) {
+        const c = source.charCodeAt(i);
+        if (c < 128 ? (firstChars[c >> 5] & (1 << (c & 31))) !== 0 : firstChars[4] !== 0) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+/**
+ * Returns false if the text after `start` doesn't contain the literal that every match of a regex contains, so the regex can't
+ * match in the rest of the text. A scan result of null is cached as exactly that, so a missing literal is only searched for once.
+ * @param requiredLiteral The literal every match contains, if there is one
+ * @param source The text to check
+ * @param start The offset to search from
+ */
+function containsLiteral(requiredLiteral: string | undefined, source: string, start: number) {
+    return requiredLiteral === undefined || source.indexOf(requiredLiteral, start) !== -1;
+}
+
+/**
+ * Returns the repo pattern that holds the patterns of a range pattern, so they can be scanned like any other repo pattern.
+ * It's created on first use, with the id after the id of the range pattern, which is reserved for it.
+ * @param p The range pattern
+ */
+function getPatternsRepo(p: ExTokenRangePattern): ExTokenRepoPattern {
+    if (!p._patternsRepo) {
+        p._patternsRepo = {
+            patterns: p.patterns!,
+            _patternId: p._patternId + 1,
+            _patternType: TokenPatternType.RepoPattern,
+        };
+    }
+    return p._patternsRepo;
 }
 
-// These private cache properties are added to the pattern objects by the setupAndValidatePatterns() function.
-// It uses a bit of javascript magic to add them to the original objects while leaving the references in tact.
+// These private cache properties are precomputed by the generator, or added to the pattern objects by the setupAndValidatePatterns()
+// function. It uses a bit of javascript magic to add them to the original objects while leaving the references in tact.
 // The remaining interfaces are there purely for type safety.
 interface PatternStateProperties {
     _patternId: number;
@@ -861,6 +1037,7 @@ interface ExTokenRangePattern extends TokenRangePattern, PatternStateProperties
 interface ExTokenMatchPattern extends TokenMatchPattern, PatternStateProperties {
     _patternType: TokenPatternType.MatchPattern;
     readonly captures?: ExTokenPatternCapture;
+    readonly fused?: Array<ExTokenMatchPattern>;
 }
 
 type ExTokenPattern = ExTokenRangePattern | ExTokenRepoPattern | ExTokenMatchPattern;